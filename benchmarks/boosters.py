@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the size and load time of XGBoost and CatBoost models of 1,000 rounds embedded as json or natively.
+
+Boosters are embedded as the json text the libraries save models as ('advanced-params', `booster_format='json'`),
+or in their binary formats (UBJSON and `.cbm`, `booster_format='native'`) encoded in base64 or stored in archives.
+Libraries that are not installed are skipped.
+
+Usage: python benchmarks/boosters.py [n_rounds]
+"""
+
+import os
+import sys
+import tempfile
+import importlib.util
+
+from sklearn.datasets import make_classification
+
+import ml2json
+
+from timing import best_time
+
+
+def fit_models(n_rounds: int):
+    """Fit the boosters of the libraries installed."""
+    X, y = make_classification(n_samples=5_000, n_features=20, random_state=0)
+    models = {}
+    if importlib.util.find_spec('xgboost') is not None:
+        from xgboost import XGBClassifier
+
+        models['xgboost'] = XGBClassifier(n_estimators=n_rounds, max_depth=6).fit(X, y)
+    if importlib.util.find_spec('catboost') is not None:
+        from catboost import CatBoostClassifier
+
+        models['catboost'] = CatBoostClassifier(iterations=n_rounds, depth=6, verbose=False,
+                                                allow_writing_files=False).fit(X, y)
+    return models
+
+
+def main(n_rounds: int = 1_000):
+    models = fit_models(n_rounds)
+    if not models:
+        print('Neither xgboost nor catboost is installed.')
+        return
+    print(f'{"library":<10}{"format":<16}{"size (MB)":>11}{"write (s)":>11}{"load (s)":>10}')
+    with tempfile.TemporaryDirectory() as folder:
+        for library, model in models.items():
+            for booster_format, extension in (('json', 'json'), ('native', 'json'), ('native', 'zip')):
+                path = os.path.join(folder, f'model.{extension}')
+                write, read = ((ml2json.to_archive, ml2json.from_archive) if extension == 'zip'
+                               else (ml2json.to_json, ml2json.from_json))
+                with ml2json.config_context(booster_format=booster_format):
+                    write_time = best_time(lambda: write(model, path))
+                load_time = best_time(lambda: read(path))
+                size = os.path.getsize(path) / 2 ** 20
+                name = f'{booster_format} ({extension})'
+                print(f'{library:<10}{name:<16}{size:>11.2f}{write_time:>11.3f}{load_time:>10.3f}')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the time taken to write and read models with the json backends available.
+
+Usage: python benchmarks/json_backends.py
+"""
+
+import os
+import tempfile
+import importlib.util
+
+import numpy as np
+from sklearn.datasets import make_classification
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.svm import SVC
+
+import ml2json
+
+from timing import best_time
+
+
+def fit_models():
+    """Fit the models to benchmark, UMAP only if it is installed."""
+    X, y = make_classification(n_samples=10_000, n_features=50, n_informative=10, random_state=0)
+    models = {'RandomForestClassifier': RandomForestClassifier(n_estimators=100, random_state=0).fit(X, y),
+              'SVC': SVC().fit(X, y)}
+    if importlib.util.find_spec('umap') is not None:
+        from umap import UMAP
+
+        models['UMAP'] = UMAP(random_state=0).fit(X[:2_000])
+    return models
+
+
+def main():
+    backends = [backend for backend in ('json', 'orjson') if importlib.util.find_spec(backend) is not None]
+    print(f'{"model":<24}{"backend":<10}{"size (MB)":>10}{"to_json (s)":>13}{"json_to_dict (s)":>18}')
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'model.json')
+        for name, model in fit_models().items():
+            for backend in backends:
+                with ml2json.config_context(json_backend=backend):
+                    write_time = best_time(lambda: ml2json.to_json(model, path))
+                    read_time = best_time(lambda: ml2json.json_to_dict(path))
+                size = os.path.getsize(path) / 2 ** 20
+                print(f'{name:<24}{backend:<10}{size:>10.1f}{write_time:>13.3f}{read_time:>18.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the time taken to read forests of 1,000 and 10,000 trees from json with increasing numbers of processes.
+
+Usage: python benchmarks/parallel_loading.py [max_n_trees]
+"""
+
+import os
+import sys
+import tempfile
+
+from sklearn.datasets import make_classification
+from sklearn.ensemble import RandomForestClassifier
+
+import ml2json
+
+from timing import best_time
+
+
+def n_jobs_range():
+    """Obtain the numbers of processes to benchmark, doubling up to the number of CPUs."""
+    n_jobs, n_cpus = [1], os.cpu_count()
+    while n_jobs[-1] * 2 < n_cpus:
+        n_jobs.append(n_jobs[-1] * 2)
+    return n_jobs + [n_cpus] if n_cpus > 1 else n_jobs
+
+
+def main(max_n_trees: int = 10_000):
+    X, y = make_classification(n_samples=2_000, n_features=20, random_state=0)
+    print(f'{"trees":>8}{"size (MB)":>11}{"n_jobs":>8}{"from_json (s)":>15}{"speedup":>9}')
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'model.json')
+        for n_trees in (1_000, 10_000):
+            if n_trees > max_n_trees:
+                break
+            model = RandomForestClassifier(n_estimators=n_trees, max_depth=6, random_state=0).fit(X, y)
+            with ml2json.config_context(array_encoding='base64'):
+                ml2json.to_json(model, path)
+            size = os.path.getsize(path) / 2 ** 20
+            reference_time = None
+            for n_jobs in n_jobs_range():
+                read_time = best_time(lambda: ml2json.from_json(path, n_jobs=n_jobs))
+                reference_time = reference_time or read_time
+                print(f'{n_trees:>8}{size:>11.1f}{n_jobs:>8}{read_time:>15.3f}{reference_time / read_time:>9.2f}')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,471 @@
+# -*- coding: utf-8 -*-
+
+"""Measure the time taken to write and read every supported model, the size of its file and the memory needed,
+with pickle and joblib as baselines.
+
+Models are fitted at the chosen scale (number of samples, features, classes and estimators).
+Each model is benchmarked in a separate process, and the file of each format is read again in a process
+started afresh, so that the peak resident memory reported for each format is that of reading it.
+Results are saved to a json file, which can be compared with those of a previous run (e.g. of the last release)
+to detect regressions.
+
+Usage: python benchmarks/suite.py [--scale small|medium|large] [--models rf gb ...] [--repeat 3]
+                                  [--output results.json] [--compare previous.json] [--threshold 1.2]
+"""
+
+import os
+import sys
+import json
+import pickle
+import platform
+import argparse
+import datetime
+import tempfile
+import importlib
+import warnings
+import tracemalloc
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import joblib
+import numpy as np
+from sklearn.datasets import make_classification, make_regression
+
+import ml2json
+from ml2json.utils.registry import registered_metas
+
+from timing import best_time
+
+SCALES = {
+    'small': {'n_samples': 500, 'n_features': 10, 'n_classes': 2, 'n_estimators': 10},
+    'medium': {'n_samples': 5_000, 'n_features': 50, 'n_classes': 3, 'n_estimators': 100},
+    'large': {'n_samples': 50_000, 'n_features': 100, 'n_classes': 5, 'n_estimators': 500},
+}
+FORMATS = ('ml2json', 'pickle', 'joblib')
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def n_estimators(scale):
+    return scale['n_estimators']
+
+
+def n_clusters(scale):
+    return scale['n_classes']
+
+
+def estimators(scale):
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.ensemble import RandomForestClassifier
+
+    return [('rf', RandomForestClassifier(n_estimators=scale['n_estimators'], random_state=0)),
+            ('lr', LogisticRegression(max_iter=1000))]
+
+
+def regressors(scale):
+    from sklearn.linear_model import Ridge
+    from sklearn.ensemble import RandomForestRegressor
+
+    return [('rf', RandomForestRegressor(n_estimators=scale['n_estimators'], random_state=0)), ('ridge', Ridge())]
+
+
+def final_regressor(scale):
+    from sklearn.linear_model import LinearRegression
+
+    return LinearRegression()
+
+
+def steps(scale):
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.ensemble import RandomForestClassifier
+
+    return [('scaler', StandardScaler()), ('rf', RandomForestClassifier(n_estimators=scale['n_estimators']))]
+
+
+def dictionary(scale):
+    rng = np.random.default_rng(0)
+    atoms = rng.normal(size=(2 * scale['n_features'], scale['n_features']))
+    return atoms / np.linalg.norm(atoms, axis=1, keepdims=True)
+
+
+# Model types benchmarked, by tag: import path of the class, how it is fitted (see `fit_model`) and its parameters,
+# given as values or as functions of the scale
+MODELS = {
+    # Classification
+    'lr': ('sklearn.linear_model:LogisticRegression', 'classify', {'max_iter': 1000}),
+    'bernoulli-nb': ('sklearn.naive_bayes:BernoulliNB', 'classify', {}),
+    'gaussian-nb': ('sklearn.naive_bayes:GaussianNB', 'classify', {}),
+    'multinomial-nb': ('sklearn.naive_bayes:MultinomialNB', 'classify-positive', {}),
+    'complement-nb': ('sklearn.naive_bayes:ComplementNB', 'classify-positive', {}),
+    'lda': ('sklearn.discriminant_analysis:LinearDiscriminantAnalysis', 'classify', {}),
+    'qda': ('sklearn.discriminant_analysis:QuadraticDiscriminantAnalysis', 'classify', {}),
+    'svm': ('sklearn.svm:SVC', 'classify', {}),
+    'perceptron': ('sklearn.linear_model:Perceptron', 'classify', {}),
+    'decision-tree': ('sklearn.tree:DecisionTreeClassifier', 'classify', {'random_state': 0}),
+    'gb': ('sklearn.ensemble:GradientBoostingClassifier', 'classify', {'n_estimators': n_estimators}),
+    'rf': ('sklearn.ensemble:RandomForestClassifier', 'classify', {'n_estimators': n_estimators, 'random_state': 0}),
+    'mlp': ('sklearn.neural_network:MLPClassifier', 'classify', {'max_iter': 50, 'random_state': 0}),
+    'xgboost-classifier': ('xgboost:XGBClassifier', 'classify', {'n_estimators': n_estimators}),
+    'xgboost-rf-classifier': ('xgboost:XGBRFClassifier', 'classify', {'n_estimators': n_estimators}),
+    'lightgbm-classifier': ('lightgbm:LGBMClassifier', 'classify', {'n_estimators': n_estimators, 'verbose': -1}),
+    'catboost-classifier': ('catboost:CatBoostClassifier', 'classify-catboost',
+                            {'iterations': n_estimators, 'verbose': False, 'allow_writing_files': False}),
+    'adaboost-classifier': ('sklearn.ensemble:AdaBoostClassifier', 'classify', {'n_estimators': n_estimators}),
+    'bagging-classifier': ('sklearn.ensemble:BaggingClassifier', 'classify', {'n_estimators': n_estimators}),
+    'extra-tree-cls': ('sklearn.tree:ExtraTreeClassifier', 'classify', {'random_state': 0}),
+    'extratrees-classifier': ('sklearn.ensemble:ExtraTreesClassifier', 'classify', {'n_estimators': n_estimators}),
+    'isolation-forest': ('sklearn.ensemble:IsolationForest', 'fit', {'n_estimators': n_estimators}),
+    'random-trees-embedding': ('sklearn.ensemble:RandomTreesEmbedding', 'fit', {'n_estimators': n_estimators}),
+    'nearest-neighbour-classifier': ('sklearn.neighbors:KNeighborsClassifier', 'classify', {}),
+    'stacking-classifier': ('sklearn.ensemble:StackingClassifier', 'classify', {'estimators': estimators}),
+    'voting-classifier': ('sklearn.ensemble:VotingClassifier', 'classify', {'estimators': estimators}),
+    # Regression
+    'linear-regression': ('sklearn.linear_model:LinearRegression', 'regress', {}),
+    'lasso-regression': ('sklearn.linear_model:Lasso', 'regress', {}),
+    'elasticnet-regression': ('sklearn.linear_model:ElasticNet', 'regress', {}),
+    'ridge-regression': ('sklearn.linear_model:Ridge', 'regress', {}),
+    'svr': ('sklearn.svm:SVR', 'regress', {}),
+    'extra-tree-reg': ('sklearn.tree:ExtraTreeRegressor', 'regress', {'random_state': 0}),
+    'decision-tree-regression': ('sklearn.tree:DecisionTreeRegressor', 'regress', {'random_state': 0}),
+    'gb-regression': ('sklearn.ensemble:GradientBoostingRegressor', 'regress', {'n_estimators': n_estimators}),
+    'rf-regression': ('sklearn.ensemble:RandomForestRegressor', 'regress', {'n_estimators': n_estimators}),
+    'extratrees-regressor': ('sklearn.ensemble:ExtraTreesRegressor', 'regress', {'n_estimators': n_estimators}),
+    'mlp-regression': ('sklearn.neural_network:MLPRegressor', 'regress', {'max_iter': 50, 'random_state': 0}),
+    'xgboost-ranker': ('xgboost:XGBRanker', 'rank', {'n_estimators': n_estimators}),
+    'xgboost-regressor': ('xgboost:XGBRegressor', 'regress', {'n_estimators': n_estimators}),
+    'xgboost-rf-regressor': ('xgboost:XGBRFRegressor', 'regress', {'n_estimators': n_estimators}),
+    'lightgbm-regressor': ('lightgbm:LGBMRegressor', 'regress', {'n_estimators': n_estimators, 'verbose': -1}),
+    'lightgbm-ranker': ('lightgbm:LGBMRanker', 'rank', {'n_estimators': n_estimators, 'verbose': -1}),
+    'catboost-regressor': ('catboost:CatBoostRegressor', 'regress-catboost',
+                           {'iterations': n_estimators, 'verbose': False, 'allow_writing_files': False}),
+    'catboost-ranker': ('catboost:CatBoostRanker', 'rank-catboost',
+                        {'iterations': n_estimators, 'verbose': False, 'allow_writing_files': False}),
+    'adaboost-regressor': ('sklearn.ensemble:AdaBoostRegressor', 'regress', {'n_estimators': n_estimators}),
+    'bagging-regression': ('sklearn.ensemble:BaggingRegressor', 'regress', {'n_estimators': n_estimators}),
+    'nearest-neighbour-regressor': ('sklearn.neighbors:KNeighborsRegressor', 'regress', {}),
+    'stacking-regressor': ('sklearn.ensemble:StackingRegressor', 'regress',
+                           {'estimators': regressors, 'final_estimator': final_regressor}),
+    'voting-regressor': ('sklearn.ensemble:VotingRegressor', 'regress', {'estimators': regressors}),
+    # Clustering
+    'feature-agglomeration': ('sklearn.cluster:FeatureAgglomeration', 'fit', {}),
+    'affinity-propagation': ('sklearn.cluster:AffinityPropagation', 'fit', {'random_state': 0}),
+    'agglomerative-clustering': ('sklearn.cluster:AgglomerativeClustering', 'fit', {'n_clusters': n_clusters}),
+    'dbscan': ('sklearn.cluster:DBSCAN', 'fit', {}),
+    'meanshift': ('sklearn.cluster:MeanShift', 'fit', {}),
+    'bisecting-kmeans': ('sklearn.cluster:BisectingKMeans', 'fit', {'n_clusters': n_clusters, 'random_state': 0}),
+    'minibatch-kmeans': ('sklearn.cluster:MiniBatchKMeans', 'fit', {'n_clusters': n_clusters, 'n_init': 3}),
+    'kmeans': ('sklearn.cluster:KMeans', 'fit', {'n_clusters': n_clusters, 'n_init': 3}),
+    'optics': ('sklearn.cluster:OPTICS', 'fit', {}),
+    'spectral-clustering': ('sklearn.cluster:SpectralClustering', 'fit', {'n_clusters': n_clusters, 'random_state': 0}),
+    'spectral-biclustering': ('sklearn.cluster:SpectralBiclustering', 'fit-positive', {'n_clusters': n_clusters}),
+    'spectral-coclustering': ('sklearn.cluster:SpectralCoclustering', 'fit-positive', {'n_clusters': n_clusters}),
+    'kprototypes': ('kmodes.kprototypes:KPrototypes', 'fit-mixed', {'n_clusters': n_clusters}),
+    'kmodes': ('kmodes.kmodes:KModes', 'fit-categorical', {'n_clusters': n_clusters}),
+    'birch': ('sklearn.cluster:Birch', 'fit', {'n_clusters': n_clusters}),
+    'hdbscan': ('hdbscan:HDBSCAN', 'fit', {}),
+    # Cross decomposition
+    'cca': ('sklearn.cross_decomposition:CCA', 'regress', {'n_components': 1}),
+    'pls-canonical': ('sklearn.cross_decomposition:PLSCanonical', 'regress', {'n_components': 1}),
+    'pls-regression': ('sklearn.cross_decomposition:PLSRegression', 'regress', {}),
+    'pls-svd': ('sklearn.cross_decomposition:PLSSVD', 'regress', {'n_components': 1}),
+    # Decomposition
+    'pca': ('sklearn.decomposition:PCA', 'fit', {}),
+    'kernel-pca': ('sklearn.decomposition:KernelPCA', 'fit', {'fit_inverse_transform': True}),
+    'incremental-pca': ('sklearn.decomposition:IncrementalPCA', 'fit', {}),
+    'minibatch-sparse-pca': ('sklearn.decomposition:MiniBatchSparsePCA', 'fit', {'n_components': 5, 'max_iter': 10}),
+    'sparse-pca': ('sklearn.decomposition:SparsePCA', 'fit', {'n_components': 5, 'max_iter': 10}),
+    'minibatch-dictionary-learning': ('sklearn.decomposition:MiniBatchDictionaryLearning', 'fit',
+                                      {'n_components': 5, 'max_iter': 10}),
+    'dictionary-learning': ('sklearn.decomposition:DictionaryLearning', 'fit', {'n_components': 5, 'max_iter': 10}),
+    'factor-analysis': ('sklearn.decomposition:FactorAnalysis', 'fit', {}),
+    'fast-ica': ('sklearn.decomposition:FastICA', 'fit', {'whiten': 'unit-variance'}),
+    'latent-dirichlet-allocation': ('sklearn.decomposition:LatentDirichletAllocation', 'fit-positive',
+                                    {'n_components': 5, 'max_iter': 5}),
+    'minibatch-nmf': ('sklearn.decomposition:MiniBatchNMF', 'fit-positive', {'n_components': 5}),
+    'nmf': ('sklearn.decomposition:NMF', 'fit-positive', {'n_components': 5}),
+    'sparse-coder': ('sklearn.decomposition:SparseCoder', 'fit', {'dictionary': dictionary}),
+    'truncated-svd': ('sklearn.decomposition:TruncatedSVD', 'fit', {}),
+    # Manifold learning
+    'tsne': ('sklearn.manifold:TSNE', 'fit', {'random_state': 0}),
+    'mds': ('sklearn.manifold:MDS', 'fit', {'normalized_stress': 'auto', 'random_state': 0}),
+    'isomap': ('sklearn.manifold:Isomap', 'fit', {}),
+    'locally-linear-embedding': ('sklearn.manifold:LocallyLinearEmbedding', 'fit', {'random_state': 0}),
+    'spectral-embedding': ('sklearn.manifold:SpectralEmbedding', 'fit', {'random_state': 0}),
+    'umap': ('umap:UMAP', 'fit', {'random_state': 0}),
+    'openTSNE': ('openTSNE.sklearn:TSNE', 'fit', {'random_state': 0}),
+    'openTSNEEmbedding': ('openTSNE:TSNE', 'embed', {'random_state': 0}),
+    'openTSNEPartialEmbedding': ('openTSNE:TSNE', 'embed-partial', {'random_state': 0}),
+    # Neighbors
+    'nearest-neighbors': ('sklearn.neighbors:NearestNeighbors', 'fit', {}),
+    'kdtree': ('sklearn.neighbors:KDTree', 'construct', {}),
+    'kernel-density': ('sklearn.neighbors:KernelDensity', 'fit', {}),
+    'nn-descent': ('pynndescent:NNDescent', 'construct', {'random_state': 0}),
+    # Preprocessing
+    'dict-vectorizer': ('sklearn.feature_extraction:DictVectorizer', 'fit-dicts', {}),
+    'label-encoder': ('sklearn.preprocessing:LabelEncoder', 'fit-labels', {}),
+    'label-binarizer': ('sklearn.preprocessing:LabelBinarizer', 'fit-labels', {}),
+    'multilabel-binarizer': ('sklearn.preprocessing:MultiLabelBinarizer', 'fit-multilabels', {}),
+    'minmax-scaler': ('sklearn.preprocessing:MinMaxScaler', 'fit', {}),
+    'standard-scaler': ('sklearn.preprocessing:StandardScaler', 'fit', {}),
+    'robust-scaler': ('sklearn.preprocessing:RobustScaler', 'fit', {}),
+    'maxabs-scaler': ('sklearn.preprocessing:MaxAbsScaler', 'fit', {}),
+    'kernel-centerer': ('sklearn.preprocessing:KernelCenterer', 'fit-kernel', {}),
+    'onehot-encoder': ('sklearn.preprocessing:OneHotEncoder', 'fit-categorical', {}),
+    'ordinal-encoder': ('sklearn.preprocessing:OrdinalEncoder', 'fit-categorical', {}),
+    'normalizer': ('sklearn.preprocessing:Normalizer', 'fit', {}),
+    # Applicability domains
+    'bounding-box-ad': ('mlchemad.applicability_domains:BoundingBoxApplicabilityDomain', 'fit', {}),
+    'convex-hull-ad': ('mlchemad.applicability_domains:ConvexHullApplicabilityDomain', 'fit', {}),
+    'pca-bounding-box-ad': ('mlchemad.applicability_domains:PCABoundingBoxApplicabilityDomain', 'fit', {}),
+    'topkat-ad': ('mlchemad.applicability_domains:TopKatApplicabilityDomain', 'fit', {}),
+    'leverage-ad': ('mlchemad.applicability_domains:LeverageApplicabilityDomain', 'fit', {}),
+    'hotelling-t2-ad': ('mlchemad.applicability_domains:HotellingT2ApplicabilityDomain', 'fit', {}),
+    'kernel-density-ad': ('mlchemad.applicability_domains:KernelDensityApplicabilityDomain', 'fit', {}),
+    'isolation-forest-ad': ('mlchemad.applicability_domains:IsolationForestApplicabilityDomain', 'fit', {}),
+    'centroid-distance-ad': ('mlchemad.applicability_domains:CentroidDistanceApplicabilityDomain', 'fit', {}),
+    'knn-ad': ('mlchemad.applicability_domains:KNNApplicabilityDomain', 'fit', {}),
+    'standardization-approach-ad': ('mlchemad.applicability_domains:StandardizationApproachApplicabilityDomain',
+                                    'fit', {}),
+    # Over- and undersampling
+    'cluster-centroids': ('imblearn.under_sampling:ClusterCentroids', 'resample', {'random_state': 0}),
+    'condensed-nearest-neighbours': ('imblearn.under_sampling:CondensedNearestNeighbour', 'resample',
+                                     {'random_state': 0}),
+    'edited-nearest-neighbours': ('imblearn.under_sampling:EditedNearestNeighbours', 'resample', {}),
+    'repeated-edited-nearest-neighbours': ('imblearn.under_sampling:RepeatedEditedNearestNeighbours', 'resample', {}),
+    'all-knn': ('imblearn.under_sampling:AllKNN', 'resample', {}),
+    'instance-hardness-threshold': ('imblearn.under_sampling:InstanceHardnessThreshold', 'resample',
+                                    {'random_state': 0}),
+    'near-miss': ('imblearn.under_sampling:NearMiss', 'resample', {}),
+    'neighbourhood-cleaning-rule': ('imblearn.under_sampling:NeighbourhoodCleaningRule', 'resample', {}),
+    'one-sided-selection': ('imblearn.under_sampling:OneSidedSelection', 'resample', {'random_state': 0}),
+    'random-under-sampler': ('imblearn.under_sampling:RandomUnderSampler', 'resample', {'random_state': 0}),
+    'tomek-links': ('imblearn.under_sampling:TomekLinks', 'resample', {}),
+    'random-over-sampler': ('imblearn.over_sampling:RandomOverSampler', 'resample', {'random_state': 0}),
+    'smotenc': ('imblearn.over_sampling:SMOTENC', 'resample', {'categorical_features': [0], 'random_state': 0}),
+    'smoten': ('imblearn.over_sampling:SMOTEN', 'resample-categorical', {'random_state': 0}),
+    'smote': ('imblearn.over_sampling:SMOTE', 'resample', {'random_state': 0}),
+    'adasyn': ('imblearn.over_sampling:ADASYN', 'resample', {'random_state': 0}),
+    'borderline-smote': ('imblearn.over_sampling:BorderlineSMOTE', 'resample', {'random_state': 0}),
+    'kmeans-smote': ('imblearn.over_sampling:KMeansSMOTE', 'resample', {'random_state': 0}),
+    'svm-smote': ('imblearn.over_sampling:SVMSMOTE', 'resample', {'random_state': 0}),
+    'smote-enn': ('imblearn.combine:SMOTEENN', 'resample', {'random_state': 0}),
+    'smote-tomek': ('imblearn.combine:SMOTETomek', 'resample', {'random_state': 0}),
+    # Pipelines
+    'pipeline': ('sklearn.pipeline:Pipeline', 'classify', {'steps': steps}),
+}
+
+
+def make_data(scale) -> dict:
+    """Generate the datasets models are fitted to at a scale."""
+    n_samples, n_features, n_classes = scale['n_samples'], scale['n_features'], scale['n_classes']
+    X, y = make_classification(n_samples=n_samples, n_features=n_features, n_informative=min(n_features, 2 * n_classes),
+                               n_classes=n_classes, random_state=0)
+    _, y_reg = make_regression(n_samples=n_samples, n_features=n_features, random_state=0)
+    rng = np.random.default_rng(0)
+    X_categorical = rng.integers(0, 4, size=(n_samples, min(n_features, 10)))
+    return {'X': X, 'y': y, 'y_reg': y_reg, 'X_positive': np.abs(X), 'X_categorical': X_categorical,
+            'groups': [n_samples // 2, n_samples - n_samples // 2]}
+
+
+def fit_model(meta: str, scale: dict, data: dict):
+    """Fit a model of a type to the datasets at a scale.
+
+    :return: the fitted model, and the CatBoost data `Pool` it was fitted to if it is a CatBoost model
+    """
+    path, task, params = MODELS[meta]
+    module_name, _, name = path.partition(':')
+    cls = getattr(importlib.import_module(module_name), name)
+    params = {key: value(scale) if callable(value) else value for key, value in params.items()}
+    X, y, y_reg = data['X'], data['y'], data['y_reg']
+    if task == 'construct':
+        return cls(X, **params), None
+    model = cls(**params)
+    task, _, variant = task.partition('-')
+    if variant == 'catboost':
+        from catboost import Pool
+
+        pool = (Pool(X, y_reg, group_id=np.repeat([0, 1], data['groups'])) if task == 'rank'
+                else Pool(X, y if task == 'classify' else y_reg))
+        return model.fit(pool), pool
+    if task == 'classify':
+        model.fit(data['X_positive'] if variant == 'positive' else X, y)
+    elif task == 'regress':
+        model.fit(X, y_reg)
+    elif task == 'rank':
+        model.fit(X, np.digitize(y_reg, np.quantile(y_reg, [0.25, 0.5, 0.75])), group=data['groups'])
+    elif task == 'resample':
+        model.fit_resample(data['X_categorical'] if variant == 'categorical' else X, y)
+    elif task == 'embed':
+        embedding = model.fit(X)
+        return (embedding.prepare_partial(X[:10]) if variant == 'partial' else embedding), None
+    elif variant == 'positive':
+        model.fit(data['X_positive'])
+    elif variant == 'categorical':
+        model.fit(data['X_categorical'])
+    elif variant == 'mixed':
+        model.fit(np.hstack([data['X_categorical'][:, :1], X]), categorical=[0])
+    elif variant == 'labels':
+        model.fit(y)
+    elif variant == 'multilabels':
+        model.fit([[label, (label + 1) % scale['n_classes']] for label in y])
+    elif variant == 'dicts':
+        model.fit([{f'feature{i}': value for i, value in enumerate(row) if value > 0} for row in X])
+    elif variant == 'kernel':
+        model.fit(X @ X.T)
+    else:
+        model.fit(X)
+    return model, None
+
+
+def peak_memory(function) -> float:
+    """Obtain the peak memory allocated while running a function (in MB), as traced by tracemalloc."""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1] / 2 ** 20
+    finally:
+        tracemalloc.stop()
+
+
+def peak_rss():
+    """Obtain the peak resident memory of the current process (in MB), None if it cannot be measured."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 2 ** 10
+
+
+def read_rss(name: str, path: str):
+    """Obtain how much the peak resident memory of a process started afresh grows when reading a file in a format
+    (in MB), None if it cannot be measured."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+        return executor.submit(_read_peak_rss, name, path).result()
+
+
+def _read_peak_rss(name: str, path: str):
+    # Libraries are imported by then, their memory being left out
+    before = peak_rss()
+    READERS[name](path)
+    return None if before is None else peak_rss() - before
+
+
+def benchmark_model(meta: str, scale: dict, repeat: int) -> list:
+    """Benchmark writing and reading a model of a type, with ml2json and the baselines."""
+    # Convergence and deprecation warnings of the models fitted are irrelevant here
+    warnings.simplefilter('ignore')
+    try:
+        model, catboost_data = fit_model(meta, scale, make_data(scale))
+    except ImportError as error:
+        return [{'meta': meta, 'skipped': str(error)}]
+    except Exception as error:
+        return [{'meta': meta, 'error': f'fit: {type(error).__name__}: {error}'}]
+    writers = {'ml2json': lambda path: ml2json.to_json(model, path, catboost_data=catboost_data),
+               'pickle': lambda path: _dump_pickle(model, path),
+               'joblib': lambda path: joblib.dump(model, path)}
+    results = []
+    with tempfile.TemporaryDirectory() as folder:
+        for name in FORMATS:
+            path = os.path.join(folder, f'model.{name}')
+            write, read = (lambda: writers[name](path)), (lambda: READERS[name](path))
+            try:
+                write_time, read_time = best_time(write, repeat), best_time(read, repeat)
+                write_memory, read_memory = peak_memory(write), peak_memory(read)
+                # The process benchmarking the model holds the fitted model, the file is read in one of its own
+                rss = read_rss(name, path)
+            except Exception as error:
+                results.append({'meta': meta, 'format': name, 'error': f'{type(error).__name__}: {error}'})
+                continue
+            results.append({'meta': meta, 'format': name, 'write_s': write_time, 'read_s': read_time,
+                            'writes_per_s': 1 / write_time, 'reads_per_s': 1 / read_time,
+                            'size_bytes': os.path.getsize(path),
+                            'write_peak_mb': write_memory, 'read_peak_mb': read_memory, 'read_rss_mb': rss})
+    return results
+
+
+def _dump_pickle(model, path):
+    with open(path, 'wb') as file:
+        pickle.dump(model, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _load_pickle(path):
+    with open(path, 'rb') as file:
+        return pickle.load(file)
+
+
+READERS = {'ml2json': ml2json.from_json, 'pickle': _load_pickle, 'joblib': joblib.load}
+
+
+def compare(results: list, baseline: dict, threshold: float) -> int:
+    """Print how results compare to a previous run, and count the measures worse than `threshold` times as much."""
+    previous = {(result['meta'], result['format']): result for result in baseline['results'] if 'format' in result}
+    print(f'\nCompared with ml2json {baseline["ml2json_version"]} ({baseline["date"]}), ratios to the previous run:')
+    print(f'{"model":<36}{"format":<9}{"write":>8}{"read":>8}{"size":>8}')
+    n_regressions = 0
+    for result in results:
+        old = previous.get((result['meta'], result.get('format')))
+        if old is None or 'write_s' not in result or 'write_s' not in old:
+            continue
+        ratios = [result[key] / old[key] if old[key] else 1.0 for key in ('write_s', 'read_s', 'size_bytes')]
+        regressions = [ratio > threshold for ratio in ratios]
+        n_regressions += sum(regressions)
+        cells = ''.join(f'{ratio:>7.2f}{"!" if regression else " "}' for ratio, regression in zip(ratios, regressions))
+        print(f'{result["meta"]:<36}{result["format"]:<9}{cells}')
+    return n_regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--scale', choices=SCALES, default='small')
+    parser.add_argument('--models', nargs='+', metavar='META', help='tags of the model types to benchmark (all by default)')
+    parser.add_argument('--repeat', type=int, default=3, help='number of runs timings are the best of')
+    parser.add_argument('--output', help='json file results are saved to (in benchmarks/results by default)')
+    parser.add_argument('--compare', metavar='RESULTS', help='json file of previous results to compare with')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='ratio to previous results from which measures are reported as regressions')
+    args = parser.parse_args()
+
+    missing = sorted(set(registered_metas()) - set(MODELS))
+    if missing:
+        print(f'Model types not benchmarked: {", ".join(missing)}')
+    metas = args.models or list(MODELS)
+    scale = SCALES[args.scale]
+    results = []
+    print(f'{"model":<36}{"format":<9}{"write (s)":>10}{"read (s)":>10}{"size (kB)":>11}'
+          f'{"write (MB)":>12}{"read (MB)":>11}{"read RSS (MB)":>15}')
+    # A process per model, so that the models fitted do not add up in memory
+    context = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn')
+    for meta in metas:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            model_results = executor.submit(benchmark_model, meta, scale, args.repeat).result()
+        for result in model_results:
+            if 'write_s' in result:
+                rss = '' if result['read_rss_mb'] is None else f'{result["read_rss_mb"]:.0f}'
+                print(f'{meta:<36}{result["format"]:<9}{result["write_s"]:>10.4f}{result["read_s"]:>10.4f}'
+                      f'{result["size_bytes"] / 1024:>11.1f}{result["write_peak_mb"]:>12.1f}'
+                      f'{result["read_peak_mb"]:>11.1f}{rss:>15}')
+            else:
+                print(f'{meta:<36}{result.get("format", ""):<9}{result.get("error", result.get("skipped"))}')
+        results.extend(model_results)
+
+    run = {'ml2json_version': ml2json.__version__, 'date': datetime.datetime.now().isoformat(timespec='seconds'),
+           'python': platform.python_version(), 'platform': platform.platform(), 'scale': args.scale,
+           'parameters': scale, 'results': results}
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f'{ml2json.__version__}-{args.scale}-{run["date"].replace(":", "")}.json')
+    with open(output, 'w') as file:
+        json.dump(run, file, indent=1)
+    print(f'\nResults saved to {output}')
+
+    if args.compare:
+        with open(args.compare) as file:
+            n_regressions = compare(results, json.load(file), args.threshold)
+        if n_regressions:
+            print(f'{n_regressions} measures regressed by more than {args.threshold:.2f} times')
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+
+"""Timing helpers shared by the benchmarks."""
+
+import time
+
+
+def best_time(function, repeat: int = 3) -> float:
+    """Obtain the shortest time taken by a function over several runs.
+
+    :param function: function to time, called without arguments
+    :param repeat: number of runs
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 
-from .ml2json import (serialize_model, deserialize_model, to_dict, from_dict, to_json, from_json,
-                      dict_to_json, json_to_dict)
+from .ml2json import (serialize_model, deserialize_model, to_dict, from_dict, to_json, from_json, iter_json,
+                      to_json_many, from_json_many, ato_json, afrom_json, afrom_json_many, to_archive, from_archive,
+                      dict_to_json, json_to_dict, peek, verify_precision, register)
+from .utils.cache import ModelCache
+from .utils.config import get_config, set_config, config_context
+from .utils.instrumentation import Event, TimingProfile, instrument
 
 
 __version__ = '0.5.0'
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+"""Command line interface of ml2json.
+
+Usage: ml2json inspect model.json [--depth N] [--min-share FRACTION]
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+
+# Exit status of commands whose output is closed early (e.g. by `head`), as if killed by SIGPIPE
+EXIT_BROKEN_PIPE = 141
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the command line interface.
+
+    :param argv: arguments, default to those the program was called with
+    """
+    parser = argparse.ArgumentParser(prog='ml2json', description='Tools for models serialized with ml2json.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    inspect_parser = commands.add_parser(
+        'inspect', help='show the size of each part of a serialized model',
+        description='Show the size of each part of a serialized model, fields known to be redundant '
+                    'and the savings expected from binary array encoding and compression.')
+    inspect_parser.add_argument('file', help='json file, possibly compressed, or zip archive')
+    inspect_parser.add_argument('--depth', type=int, default=None, help='number of levels of paths shown')
+    inspect_parser.add_argument('--min-share', type=float, default=0.001,
+                                help='share of the size of the model below which paths are not shown (default 0.001)')
+    args = parser.parse_args(argv)
+
+    from .utils.inspection import inspect_file
+
+    try:
+        report = inspect_file(args.file)
+    except (OSError, ValueError) as error:
+        print(f'ml2json inspect: {error}', file=sys.stderr)
+        return 1
+    try:
+        print(report.format(max_depth=args.depth, min_share=args.min_share))
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Output is discarded from now on, so that flushing stdout at exit does not raise again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return EXIT_BROKEN_PIPE
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
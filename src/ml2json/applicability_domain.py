@@ -1,35 +1,26 @@
 # -*- coding: utf-8 -*-
 
+import importlib.util
+
 import ml2json
 import numpy as np
 
-# Allow additional dependencies to be optional
+from .utils.arrays import encode_array, decode_array
+
+# Allow additional dependencies to be optional, they are only imported once needed
 __optionals__ = []
-try:
-    from mlchemad.applicability_domains import (BoundingBoxApplicabilityDomain,
-                                                ConvexHullApplicabilityDomain,
-                                                PCABoundingBoxApplicabilityDomain,
-                                                TopKatApplicabilityDomain,
-                                                LeverageApplicabilityDomain,
-                                                HotellingT2ApplicabilityDomain,
-                                                KernelDensityApplicabilityDomain,
-                                                IsolationForestApplicabilityDomain,
-                                                CentroidDistanceApplicabilityDomain,
-                                                KNNApplicabilityDomain,
-                                                StandardizationApproachApplicabilityDomain)
+if importlib.util.find_spec('mlchemad') is not None:
     __optionals__.extend(['BoundingBoxApplicabilityDomain',
-                            'ConvexHullApplicabilityDomain',
-                            'PCABoundingBoxApplicabilityDomain',
-                            'TopKatApplicabilityDomain',
-                            'LeverageApplicabilityDomain',
-                            'HotellingT2ApplicabilityDomain',
-                            'KernelDensityApplicabilityDomain',
-                            'IsolationForestApplicabilityDomain',
-                            'CentroidDistanceApplicabilityDomain',
-                            'KNNApplicabilityDomain',
-                            'StandardizationApproachApplicabilityDomain'])
-except ImportError:
-    pass
+                          'ConvexHullApplicabilityDomain',
+                          'PCABoundingBoxApplicabilityDomain',
+                          'TopKatApplicabilityDomain',
+                          'LeverageApplicabilityDomain',
+                          'HotellingT2ApplicabilityDomain',
+                          'KernelDensityApplicabilityDomain',
+                          'IsolationForestApplicabilityDomain',
+                          'CentroidDistanceApplicabilityDomain',
+                          'KNNApplicabilityDomain',
+                          'StandardizationApproachApplicabilityDomain'])
 
 
 def serialize_bounding_box_applicability_domain(model):
@@ -46,8 +37,8 @@ def serialize_bounding_box_applicability_domain(model):
             {
             'num_points': model.num_points,
             'num_dims': model.num_dims,
-            'min_': model.min_.tolist(),
-            'max_': model.max_.tolist(),
+            'min_': encode_array(model.min_),
+            'max_': encode_array(model.max_),
             }
         )
 
@@ -55,6 +46,8 @@ def serialize_bounding_box_applicability_domain(model):
 
 if 'BoundingBoxApplicabilityDomain' in __optionals__:
     def deserialize_bounding_box_applicability_domain(model_dict):
+        from mlchemad.applicability_domains import BoundingBoxApplicabilityDomain
+
         model = BoundingBoxApplicabilityDomain()
         model.fitted_ = model_dict['fitted_']
         model.compute_minmax = model_dict['compute_minmax']
@@ -66,8 +59,8 @@ if 'BoundingBoxApplicabilityDomain' in __optionals__:
         if model.fitted_:
             model.num_points = model_dict['num_points']
             model.num_dims = model_dict['num_dims']
-            model.min_ = np.array(model_dict['min_'])
-            model.max_ = np.array(model_dict['max_'])
+            model.min_ = decode_array(model_dict['min_'])
+            model.max_ = decode_array(model_dict['max_'])
 
         return model
 
@@ -81,7 +74,7 @@ def serialize_convex_hull_applicability_domain(model):
             {
             'num_points': model.num_points,
             'num_dims': model.num_dims,
-            'points': model.points.tolist(),
+            'points': encode_array(model.points),
             }
         )
 
@@ -89,13 +82,15 @@ def serialize_convex_hull_applicability_domain(model):
 
 if 'ConvexHullApplicabilityDomain' in __optionals__:
     def deserialize_convex_hull_applicability_domain(model_dict):
+        from mlchemad.applicability_domains import ConvexHullApplicabilityDomain
+
         model = ConvexHullApplicabilityDomain()
         model.fitted_ = model_dict['fitted_']
 
         if model.fitted_:
             model.num_points = model_dict['num_points']
             model.num_dims = model_dict['num_dims']
-            model.points = np.array(model_dict['points'])
+            model.points = decode_array(model_dict['points'])
 
         return model
 
@@ -112,8 +107,8 @@ def serialize_pca_bounding_box_applicability_domain(model):
             {
             'num_points': model.num_points,
             'num_dims': model.num_dims,
-            'min_': model.min_.tolist(),
-            'max_': model.max_.tolist(),
+            'min_': encode_array(model.min_),
+            'max_': encode_array(model.max_),
             }
         )
 
@@ -121,6 +116,8 @@ def serialize_pca_bounding_box_applicability_domain(model):
 
 if 'PCABoundingBoxApplicabilityDomain' in __optionals__:
     def deserialize_pca_bounding_box_applicability_domain(model_dict):
+        from mlchemad.applicability_domains import PCABoundingBoxApplicabilityDomain
+
         model = PCABoundingBoxApplicabilityDomain()
         model.fitted_ = model_dict['fitted_']
         model.scaler = (ml2json.from_dict(model_dict['scaler'])
@@ -131,8 +128,8 @@ if 'PCABoundingBoxApplicabilityDomain' in __optionals__:
         if model.fitted_:
             model.num_points = model_dict['num_points']
             model.num_dims = model_dict['num_dims']
-            model.min_ = np.array(model_dict['min_'])
-            model.max_ = np.array(model_dict['max_'])
+            model.min_ = decode_array(model_dict['min_'])
+            model.max_ = decode_array(model_dict['max_'])
 
         return model
 
@@ -146,12 +143,12 @@ def serialize_topkat_applicability_domain(model):
             {
             'num_points': model.num_points,
             'num_dims': model.num_dims,
-            'X_min_' : model.X_min_.tolist(),
-            'X_max_' : model.X_max_.tolist(),
-            'eigen_val': model.eigen_val.tolist(),
-            'eigen_vec': model.eigen_vec.tolist(),
-            'OPS_min_': model.OPS_min_.tolist(),
-            'OPS_max_': model.OPS_max_.tolist(),
+            'X_min_' : encode_array(model.X_min_),
+            'X_max_' : encode_array(model.X_max_),
+            'eigen_val': encode_array(model.eigen_val),
+            'eigen_vec': encode_array(model.eigen_vec),
+            'OPS_min_': encode_array(model.OPS_min_),
+            'OPS_max_': encode_array(model.OPS_max_),
             }
         )
 
@@ -159,18 +156,20 @@ def serialize_topkat_applicability_domain(model):
 
 if 'TopKatApplicabilityDomain' in __optionals__:
     def deserialize_topkat_applicability_domain(model_dict):
+        from mlchemad.applicability_domains import TopKatApplicabilityDomain
+
         model = TopKatApplicabilityDomain()
         model.fitted_ = model_dict['fitted_']
 
         if model.fitted_:
             model.num_points = model_dict['num_points']
             model.num_dims = model_dict['num_dims']
-            model.X_min_ = np.array(model_dict['X_min_'])
-            model.X_max_ = np.array(model_dict['X_max_'])
-            model.eigen_val = np.array(model_dict['eigen_val'])
-            model.eigen_vec = np.array(model_dict['eigen_vec'])
-            model.OPS_min_ = np.array(model_dict['OPS_min_'])
-            model.OPS_max_ = np.array(model_dict['OPS_max_'])
+            model.X_min_ = decode_array(model_dict['X_min_'])
+            model.X_max_ = decode_array(model_dict['X_max_'])
+            model.eigen_val = decode_array(model_dict['eigen_val'])
+            model.eigen_vec = decode_array(model_dict['eigen_vec'])
+            model.OPS_min_ = decode_array(model_dict['OPS_min_'])
+            model.OPS_max_ = decode_array(model_dict['OPS_max_'])
 
         return model
 
@@ -186,7 +185,7 @@ def serialize_leverage_applicability_domain(model):
             {
             'num_points': model.num_points,
             'num_dims': model.num_dims,
-            'var_covar': model.var_covar.tolist(),
+            'var_covar': encode_array(model.var_covar),
             'threshold': model.threshold,
             }
         )
@@ -195,6 +194,8 @@ def serialize_leverage_applicability_domain(model):
 
 if 'LeverageApplicabilityDomain' in __optionals__:
     def deserialize_leverage_applicability_domain(model_dict):
+        from mlchemad.applicability_domains import LeverageApplicabilityDomain
+
         model = LeverageApplicabilityDomain()
         model.fitted_ = model_dict['fitted_']
         model.scaler = ml2json.from_dict(model_dict['scaler'])
@@ -202,7 +203,7 @@ if 'LeverageApplicabilityDomain' in __optionals__:
         if model.fitted_:
             model.num_points = model_dict['num_points']
             model.num_dims = model_dict['num_dims']
-            model.var_covar = np.array(model_dict['var_covar'])
+            model.var_covar = decode_array(model_dict['var_covar'])
             model.threshold = model_dict['threshold']
 
         return model
@@ -219,7 +220,7 @@ def serialize_hotelling_t2_applicability_domain(model):
             {
             'num_points': model.num_points,
             'num_dims': model.num_dims,
-            't2': model.t2.tolist(),
+            't2': encode_array(model.t2),
             }
         )
 
@@ -227,6 +228,8 @@ def serialize_hotelling_t2_applicability_domain(model):
 
 if 'HotellingT2ApplicabilityDomain' in __optionals__:
     def deserialize_hotelling_t2_applicability_domain(model_dict):
+        from mlchemad.applicability_domains import HotellingT2ApplicabilityDomain
+
         model = HotellingT2ApplicabilityDomain()
         model.fitted_ = model_dict['fitted_']
         model.alpha = model_dict['alpha']
@@ -234,7 +237,7 @@ if 'HotellingT2ApplicabilityDomain' in __optionals__:
         if model.fitted_:
             model.num_points = model_dict['num_points']
             model.num_dims = model_dict['num_dims']
-            model.t2 = np.array(model_dict['t2'])
+            model.t2 = decode_array(model_dict['t2'])
 
         return model
 
@@ -259,6 +262,8 @@ def serialize_kernel_density_applicability_domain(model):
 
 if 'KernelDensityApplicabilityDomain' in __optionals__:
     def deserialize_kernel_density_applicability_domain(model_dict):
+        from mlchemad.applicability_domains import KernelDensityApplicabilityDomain
+
         model = KernelDensityApplicabilityDomain()
         model.fitted_ = model_dict['fitted_']
         model.kde = ml2json.from_dict(model_dict['kde'])
@@ -290,6 +295,8 @@ def serialize_isolation_forest_applicability_domain(model):
 
 if 'IsolationForestApplicabilityDomain' in __optionals__:
     def deserialize_isolation_forest_applicability_domain(model_dict):
+        from mlchemad.applicability_domains import IsolationForestApplicabilityDomain
+
         model = IsolationForestApplicabilityDomain()
         model.fitted_ = model_dict['fitted_']
         model.isol = ml2json.from_dict(model_dict['isol'])
@@ -314,7 +321,7 @@ def serialize_centroid_distance_applicability_domain(model):
             {
             'num_points': model.num_points,
             'num_dims': model.num_dims,
-            'centroid': model.centroid.tolist(),
+            'centroid': encode_array(model.centroid),
             }
         )
 
@@ -322,6 +329,8 @@ def serialize_centroid_distance_applicability_domain(model):
 
 if 'CentroidDistanceApplicabilityDomain' in __optionals__:
     def deserialize_centroid_distance_applicability_domain(model_dict):
+        from mlchemad.applicability_domains import CentroidDistanceApplicabilityDomain
+
         model = CentroidDistanceApplicabilityDomain()
         model.fitted_ = model_dict['fitted_']
         model.dist = model_dict['dist']
@@ -331,7 +340,7 @@ if 'CentroidDistanceApplicabilityDomain' in __optionals__:
         if model.fitted_:
             model.num_points = model_dict['num_points']
             model.num_dims = model_dict['num_dims']
-            model.centroid = np.array(model_dict['centroid'])
+            model.centroid = decode_array(model_dict['centroid'])
 
         return model
 
@@ -352,8 +361,8 @@ def serialize_knn_applicability_domain(model):
             {
             'num_points': model.num_points,
             'num_dims': model.num_dims,
-            'X_norm': model.X_norm.tolist(),
-            'kNN_dist': model.kNN_dist.tolist(),
+            'X_norm': encode_array(model.X_norm),
+            'kNN_dist': encode_array(model.kNN_dist),
             'threshold_': model.threshold_,
             }
         )
@@ -362,6 +371,8 @@ def serialize_knn_applicability_domain(model):
 
 if 'KNNApplicabilityDomain' in __optionals__:
     def deserialize_knn_applicability_domain(model_dict):
+        from mlchemad.applicability_domains import KNNApplicabilityDomain
+
         model = KNNApplicabilityDomain()
         model.fitted_ = model_dict['fitted_']
         model.scaler = (ml2json.from_dict(model_dict['scaler'])
@@ -376,8 +387,8 @@ if 'KNNApplicabilityDomain' in __optionals__:
         if model.fitted_:
             model.num_points = model_dict['num_points']
             model.num_dims = model_dict['num_dims']
-            model.X_norm = np.array(model_dict['X_norm'])
-            model.kNN_dist = np.array(model_dict['kNN_dist'])
+            model.X_norm = decode_array(model_dict['X_norm'])
+            model.kNN_dist = decode_array(model_dict['kNN_dist'])
             model.threshold_ = model_dict['threshold_']
 
         return model
@@ -401,6 +412,8 @@ def serialize_standardization_approach_applicability_domain(model):
 
 if 'StandardizationApproachApplicabilityDomain' in __optionals__:
     def deserialize_standardization_approach_applicability_domain(model_dict):
+        from mlchemad.applicability_domains import StandardizationApproachApplicabilityDomain
+
         model = StandardizationApproachApplicabilityDomain()
         model.fitted_ = model_dict['fitted_']
         model.scaler = ml2json.from_dict(model_dict['scaler'])
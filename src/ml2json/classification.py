@@ -1,9 +1,8 @@
 # -*- coding: utf-8 -*-
 
-import os
-import uuid
 import inspect
 import importlib
+import importlib.util
 
 import numpy as np
 import scipy as sp
@@ -23,29 +22,16 @@ from sklearn.neural_network import MLPClassifier
 from sklearn.neighbors import KNeighborsClassifier
 
 
-# Allow additional dependencies to be optional
+# Allow additional dependencies to be optional, they are only imported once needed
 __optionals__ = []
-try:
-    from xgboost import XGBClassifier, XGBRFClassifier
+if importlib.util.find_spec('xgboost') is not None:
     __optionals__.extend(['XGBClassifier', 'XGBRFClassifier'])
-except:
-    pass
-try:
-    from lightgbm import LGBMClassifier, Booster as LGBMBooster
+if importlib.util.find_spec('lightgbm') is not None:
     __optionals__.append('LGBMClassifier')
-except:
-    pass
-try:
-    from catboost import CatBoostClassifier
+if importlib.util.find_spec('catboost') is not None:
     __optionals__.append('CatBoostClassifier')
-except:
-    pass
-try:
-    from imblearn.ensemble import (EasyEnsembleClassifier, RUSBoostClassifier, BalancedBaggingClassifier,
-                                   BalancedRandomForestClassifier)
+if importlib.util.find_spec('imblearn') is not None:
     __optionals__.extend(['imblearn'])
-except:
-    pass
 
 
 from . import regression
@@ -54,20 +40,25 @@ from .neighbors import serialize_kdtree, deserialize_kdtree
 from .preprocessing import (serialize_label_binarizer, deserialize_label_binarizer,
                             serialize_label_encoder, deserialize_label_encoder,
                             serialize_onehot_encoder, deserialize_onehot_encoder)
+from .utils.boosters import (serialize_xgboost_booster, deserialize_xgboost_booster,
+                             serialize_catboost_booster, deserialize_catboost_booster)
+from .utils.arrays import encode_array, decode_array, is_serialized_array
+from .utils.parallel import serialize_members, deserialize_members
+from .utils.trees import serialize_nodes, deserialize_nodes, serialize_forest, deserialize_forest
 
 
 def serialize_logistic_regression(model):
     serialized_model = {
         'meta': 'lr',
-        'classes_': model.classes_.tolist(),
-        'coef_': model.coef_.tolist(),
-        'intercept_': model.intercept_.tolist(),
-        'n_iter_': model.n_iter_.tolist(),
+        'classes_': encode_array(model.classes_),
+        'coef_': encode_array(model.coef_),
+        'intercept_': encode_array(model.intercept_),
+        'n_iter_': encode_array(model.n_iter_),
         'params': model.get_params()
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -75,13 +66,13 @@ def serialize_logistic_regression(model):
 def deserialize_logistic_regression(model_dict):
     model = LogisticRegression(model_dict['params'])
 
-    model.classes_ = np.array(model_dict['classes_'])
-    model.coef_ = np.array(model_dict['coef_'])
-    model.intercept_ = np.array(model_dict['intercept_'])
-    model.n_iter_ = np.array(model_dict['intercept_'])
+    model.classes_ = decode_array(model_dict['classes_'])
+    model.coef_ = decode_array(model_dict['coef_'])
+    model.intercept_ = decode_array(model_dict['intercept_'])
+    model.n_iter_ = decode_array(model_dict['intercept_'])
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -89,16 +80,16 @@ def deserialize_logistic_regression(model_dict):
 def serialize_bernoulli_nb(model):
     serialized_model = {
         'meta': 'bernoulli-nb',
-        'classes_': model.classes_.tolist(),
-        'class_count_': model.class_count_.tolist(),
-        'class_log_prior_': model.class_log_prior_.tolist(),
-        'feature_count_': model.feature_count_.tolist(),
-        'feature_log_prob_': model.feature_log_prob_.tolist(),
+        'classes_': encode_array(model.classes_),
+        'class_count_': encode_array(model.class_count_),
+        'class_log_prior_': encode_array(model.class_log_prior_),
+        'feature_count_': encode_array(model.feature_count_),
+        'feature_log_prob_': encode_array(model.feature_log_prob_),
         'params': model.get_params()
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -106,14 +97,14 @@ def serialize_bernoulli_nb(model):
 def deserialize_bernoulli_nb(model_dict):
     model = BernoulliNB(**model_dict['params'])
 
-    model.classes_ = np.array(model_dict['classes_'])
-    model.class_count_ = np.array(model_dict['class_count_'])
-    model.class_log_prior_ = np.array(model_dict['class_log_prior_'])
-    model.feature_count_= np.array(model_dict['feature_count_'])
-    model.feature_log_prob_ = np.array(model_dict['feature_log_prob_'])
+    model.classes_ = decode_array(model_dict['classes_'])
+    model.class_count_ = decode_array(model_dict['class_count_'])
+    model.class_log_prior_ = decode_array(model_dict['class_log_prior_'])
+    model.feature_count_= decode_array(model_dict['feature_count_'])
+    model.feature_log_prob_ = decode_array(model_dict['feature_log_prob_'])
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -121,17 +112,17 @@ def deserialize_bernoulli_nb(model_dict):
 def serialize_gaussian_nb(model):
     serialized_model = {
         'meta': 'gaussian-nb',
-        'classes_': model.classes_.tolist(),
-        'class_count_': model.class_count_.tolist(),
-        'class_prior_': model.class_prior_.tolist(),
-        'theta_': model.theta_.tolist(),
-        'var_': model.var_.tolist(),
+        'classes_': encode_array(model.classes_),
+        'class_count_': encode_array(model.class_count_),
+        'class_prior_': encode_array(model.class_prior_),
+        'theta_': encode_array(model.theta_),
+        'var_': encode_array(model.var_),
         'epsilon_': model.epsilon_,
         'params': model.get_params()
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -139,15 +130,15 @@ def serialize_gaussian_nb(model):
 def deserialize_gaussian_nb(model_dict):
     model = GaussianNB(**model_dict['params'])
 
-    model.classes_ = np.array(model_dict['classes_'])
-    model.class_count_ = np.array(model_dict['class_count_'])
-    model.class_prior_ = np.array(model_dict['class_prior_'])
-    model.theta_ = np.array(model_dict['theta_'])
-    model.var_ = np.array(model_dict['var_'])
+    model.classes_ = decode_array(model_dict['classes_'])
+    model.class_count_ = decode_array(model_dict['class_count_'])
+    model.class_prior_ = decode_array(model_dict['class_prior_'])
+    model.theta_ = decode_array(model_dict['theta_'])
+    model.var_ = decode_array(model_dict['var_'])
     model.epsilon_ = model_dict['epsilon_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -155,16 +146,16 @@ def deserialize_gaussian_nb(model_dict):
 def serialize_multinomial_nb(model):
     serialized_model = {
         'meta': 'multinomial-nb',
-        'classes_': model.classes_.tolist(),
-        'class_count_': model.class_count_.tolist(),
-        'class_log_prior_': model.class_log_prior_.tolist(),
-        'feature_count_': model.feature_count_.tolist(),
-        'feature_log_prob_': model.feature_log_prob_.tolist(),
+        'classes_': encode_array(model.classes_),
+        'class_count_': encode_array(model.class_count_),
+        'class_log_prior_': encode_array(model.class_log_prior_),
+        'feature_count_': encode_array(model.feature_count_),
+        'feature_log_prob_': encode_array(model.feature_log_prob_),
         'params': model.get_params()
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -172,14 +163,14 @@ def serialize_multinomial_nb(model):
 def deserialize_multinomial_nb(model_dict):
     model = MultinomialNB(**model_dict['params'])
 
-    model.classes_ = np.array(model_dict['classes_'])
-    model.class_count_ = np.array(model_dict['class_count_'])
-    model.class_log_prior_ = np.array(model_dict['class_log_prior_'])
-    model.feature_count_= np.array(model_dict['feature_count_'])
-    model.feature_log_prob_ = np.array(model_dict['feature_log_prob_'])
+    model.classes_ = decode_array(model_dict['classes_'])
+    model.class_count_ = decode_array(model_dict['class_count_'])
+    model.class_log_prior_ = decode_array(model_dict['class_log_prior_'])
+    model.feature_count_= decode_array(model_dict['feature_count_'])
+    model.feature_log_prob_ = decode_array(model_dict['feature_log_prob_'])
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -187,17 +178,17 @@ def deserialize_multinomial_nb(model_dict):
 def serialize_complement_nb(model):
     serialized_model = {
         'meta': 'complement-nb',
-        'classes_': model.classes_.tolist(),
-        'class_count_': model.class_count_.tolist(),
-        'class_log_prior_': model.class_log_prior_.tolist(),
-        'feature_count_': model.feature_count_.tolist(),
-        'feature_log_prob_': model.feature_log_prob_.tolist(),
-        'feature_all_': model.feature_all_.tolist(),
+        'classes_': encode_array(model.classes_),
+        'class_count_': encode_array(model.class_count_),
+        'class_log_prior_': encode_array(model.class_log_prior_),
+        'feature_count_': encode_array(model.feature_count_),
+        'feature_log_prob_': encode_array(model.feature_log_prob_),
+        'feature_all_': encode_array(model.feature_all_),
         'params': model.get_params()
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -205,15 +196,15 @@ def serialize_complement_nb(model):
 def deserialize_complement_nb(model_dict):
     model = ComplementNB(**model_dict['params'])
 
-    model.classes_ = np.array(model_dict['classes_'])
-    model.class_count_ = np.array(model_dict['class_count_'])
-    model.class_log_prior_ = np.array(model_dict['class_log_prior_'])
-    model.feature_count_= np.array(model_dict['feature_count_'])
-    model.feature_log_prob_ = np.array(model_dict['feature_log_prob_'])
-    model.feature_all_ = np.array(model_dict['feature_all_'])
+    model.classes_ = decode_array(model_dict['classes_'])
+    model.class_count_ = decode_array(model_dict['class_count_'])
+    model.class_log_prior_ = decode_array(model_dict['class_log_prior_'])
+    model.feature_count_= decode_array(model_dict['feature_count_'])
+    model.feature_log_prob_ = decode_array(model_dict['feature_log_prob_'])
+    model.feature_all_ = decode_array(model_dict['feature_all_'])
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -221,21 +212,21 @@ def deserialize_complement_nb(model_dict):
 def serialize_lda(model):
     serialized_model = {
         'meta': 'lda',
-        'coef_': model.coef_.tolist(),
-        'intercept_': model.intercept_.tolist(),
-        'explained_variance_ratio_': model.explained_variance_ratio_.tolist(),
-        'means_': model.means_.tolist(),
-        'priors_': model.priors_.tolist(),
-        'scalings_': model.scalings_.tolist(),
-        'xbar_': model.xbar_.tolist(),
-        'classes_': model.classes_.tolist(),
+        'coef_': encode_array(model.coef_),
+        'intercept_': encode_array(model.intercept_),
+        'explained_variance_ratio_': encode_array(model.explained_variance_ratio_),
+        'means_': encode_array(model.means_),
+        'priors_': encode_array(model.priors_),
+        'scalings_': encode_array(model.scalings_),
+        'xbar_': encode_array(model.xbar_),
+        'classes_': encode_array(model.classes_),
         'params': model.get_params()
     }
     if 'covariance_' in model.__dict__:
-        serialized_model['covariance_'] = model.covariance_.tolist()
+        serialized_model['covariance_'] = encode_array(model.covariance_)
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -243,17 +234,17 @@ def serialize_lda(model):
 def deserialize_lda(model_dict):
     model = discriminant_analysis.LinearDiscriminantAnalysis(**model_dict['params'])
 
-    model.coef_ = np.array(model_dict['coef_']).astype(np.float64)
-    model.intercept_ = np.array(model_dict['intercept_']).astype(np.float64)
-    model.explained_variance_ratio_ = np.array(model_dict['explained_variance_ratio_']).astype(np.float64)
-    model.means_ = np.array(model_dict['means_']).astype(np.float64)
-    model.priors_ = np.array(model_dict['priors_']).astype(np.float64)
-    model.scalings_ = np.array(model_dict['scalings_']).astype(np.float64)
-    model.xbar_ = np.array(model_dict['xbar_']).astype(np.float64)
-    model.classes_ = np.array(model_dict['classes_']).astype(np.int64)
+    model.coef_ = decode_array(model_dict['coef_'], dtype=np.float64)
+    model.intercept_ = decode_array(model_dict['intercept_'], dtype=np.float64)
+    model.explained_variance_ratio_ = decode_array(model_dict['explained_variance_ratio_'], dtype=np.float64)
+    model.means_ = decode_array(model_dict['means_'], dtype=np.float64)
+    model.priors_ = decode_array(model_dict['priors_'], dtype=np.float64)
+    model.scalings_ = decode_array(model_dict['scalings_'], dtype=np.float64)
+    model.xbar_ = decode_array(model_dict['xbar_'], dtype=np.float64)
+    model.classes_ = decode_array(model_dict['classes_'], dtype=np.int64)
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -261,18 +252,18 @@ def deserialize_lda(model_dict):
 def serialize_qda(model):
     serialized_model = {
         'meta': 'qda',
-        'means_': model.means_.tolist(),
-        'priors_': model.priors_.tolist(),
-        'scalings_': [array.tolist() for array in model.scalings_],
-        'rotations_': [array.tolist() for array in model.rotations_],
-        'classes_': model.classes_.tolist(),
+        'means_': encode_array(model.means_),
+        'priors_': encode_array(model.priors_),
+        'scalings_': [encode_array(array) for array in model.scalings_],
+        'rotations_': [encode_array(array) for array in model.rotations_],
+        'classes_': encode_array(model.classes_),
         'params': model.get_params()
     }
     if 'covariance_' in model.__dict__:
-        serialized_model['covariance_'] = model.covariance_.tolist()
+        serialized_model['covariance_'] = encode_array(model.covariance_)
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -280,14 +271,14 @@ def serialize_qda(model):
 def deserialize_qda(model_dict):
     model = discriminant_analysis.QuadraticDiscriminantAnalysis(**model_dict['params'])
 
-    model.means_ = np.array(model_dict['means_']).astype(np.float64)
-    model.priors_ = np.array(model_dict['priors_']).astype(np.float64)
-    model.scalings_ = np.array(model_dict['scalings_']).astype(np.float64)
-    model.rotations_ = np.array(model_dict['rotations_']).astype(np.float64)
-    model.classes_ = np.array(model_dict['classes_']).astype(np.int64)
+    model.means_ = decode_array(model_dict['means_'], dtype=np.float64)
+    model.priors_ = decode_array(model_dict['priors_'], dtype=np.float64)
+    model.scalings_ = decode_array(model_dict['scalings_'], dtype=np.float64)
+    model.rotations_ = decode_array(model_dict['rotations_'], dtype=np.float64)
+    model.classes_ = decode_array(model_dict['classes_'], dtype=np.int64)
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -295,14 +286,14 @@ def deserialize_qda(model_dict):
 def serialize_svm(model):
     serialized_model = {
         'meta': 'svm',
-        'class_weight_': model.class_weight_.tolist(),
-        'classes_': model.classes_.tolist(),
-        'support_': model.support_.tolist(),
-        '_n_support': model._n_support.tolist(),
-        'intercept_': model.intercept_.tolist(),
-        '_probA': model._probA.tolist(),
-        '_probB': model._probB.tolist(),
-        '_intercept_': model._intercept_.tolist(),
+        'class_weight_': encode_array(model.class_weight_),
+        'classes_': encode_array(model.classes_),
+        'support_': encode_array(model.support_),
+        '_n_support': encode_array(model._n_support),
+        'intercept_': encode_array(model.intercept_),
+        '_probA': encode_array(model._probA),
+        '_probB': encode_array(model._probB),
+        '_intercept_': encode_array(model._intercept_),
         'shape_fit_': model.shape_fit_,
         '_gamma': model._gamma,
         'params': model.get_params()
@@ -311,20 +302,20 @@ def serialize_svm(model):
     if isinstance(model.support_vectors_, sp.sparse.csr_matrix):
         serialized_model['support_vectors_'] = csr.serialize_csr_matrix(model.support_vectors_)
     elif isinstance(model.support_vectors_, np.ndarray):
-        serialized_model['support_vectors_'] = model.support_vectors_.tolist()
+        serialized_model['support_vectors_'] = encode_array(model.support_vectors_)
 
     if isinstance(model.dual_coef_, sp.sparse.csr_matrix):
         serialized_model['dual_coef_'] = csr.serialize_csr_matrix(model.dual_coef_)
     elif isinstance(model.dual_coef_, np.ndarray):
-        serialized_model['dual_coef_'] = model.dual_coef_.tolist()
+        serialized_model['dual_coef_'] = encode_array(model.dual_coef_)
 
     if isinstance(model._dual_coef_, sp.sparse.csr_matrix):
         serialized_model['_dual_coef_'] = csr.serialize_csr_matrix(model._dual_coef_)
     elif isinstance(model._dual_coef_, np.ndarray):
-        serialized_model['_dual_coef_'] = model._dual_coef_.tolist()
+        serialized_model['_dual_coef_'] = encode_array(model._dual_coef_)
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -334,34 +325,34 @@ def deserialize_svm(model_dict):
     model.shape_fit_ = model_dict['shape_fit_']
     model._gamma = model_dict['_gamma']
 
-    model.class_weight_ = np.array(model_dict['class_weight_']).astype(np.float64)
-    model.classes_ = np.array(model_dict['classes_'])
-    model.support_ = np.array(model_dict['support_']).astype(np.int32)
-    model._n_support = np.array(model_dict['_n_support']).astype(np.int32)
-    model.intercept_ = np.array(model_dict['intercept_']).astype(np.float64)
-    model._probA = np.array(model_dict['_probA']).astype(np.float64)
-    model._probB = np.array(model_dict['_probB']).astype(np.float64)
-    model._intercept_ = np.array(model_dict['_intercept_']).astype(np.float64)
+    model.class_weight_ = decode_array(model_dict['class_weight_'], dtype=np.float64)
+    model.classes_ = decode_array(model_dict['classes_'])
+    model.support_ = decode_array(model_dict['support_'], dtype=np.int32)
+    model._n_support = decode_array(model_dict['_n_support'], dtype=np.int32)
+    model.intercept_ = decode_array(model_dict['intercept_'], dtype=np.float64)
+    model._probA = decode_array(model_dict['_probA'], dtype=np.float64)
+    model._probB = decode_array(model_dict['_probB'], dtype=np.float64)
+    model._intercept_ = decode_array(model_dict['_intercept_'], dtype=np.float64)
 
     if 'meta' in model_dict['support_vectors_'] and model_dict['support_vectors_']['meta'] == 'csr':
         model.support_vectors_ = csr.deserialize_csr_matrix(model_dict['support_vectors_'])
         model._sparse = True
     else:
-        model.support_vectors_ = np.array(model_dict['support_vectors_']).astype(np.float64)
+        model.support_vectors_ = decode_array(model_dict['support_vectors_'], dtype=np.float64)
         model._sparse = False
 
     if 'meta' in model_dict['dual_coef_'] and model_dict['dual_coef_']['meta'] == 'csr':
         model.dual_coef_ = csr.deserialize_csr_matrix(model_dict['dual_coef_'])
     else:
-        model.dual_coef_ = np.array(model_dict['dual_coef_']).astype(np.float64)
+        model.dual_coef_ = decode_array(model_dict['dual_coef_'], dtype=np.float64)
 
     if 'meta' in model_dict['_dual_coef_'] and model_dict['_dual_coef_']['meta'] == 'csr':
         model._dual_coef_ = csr.deserialize_csr_matrix(model_dict['_dual_coef_'])
     else:
-        model._dual_coef_ = np.array(model_dict['_dual_coef_']).astype(np.float64)
+        model._dual_coef_ = decode_array(model_dict['_dual_coef_'], dtype=np.float64)
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -382,23 +373,21 @@ def serialize_tree(tree):
     serialized_tree = tree.__getstate__()
 
     dtypes = serialized_tree['nodes'].dtype
-    serialized_tree['nodes'] = serialized_tree['nodes'].tolist()
-    serialized_tree['values'] = serialized_tree['values'].tolist()
+    serialized_tree['nodes'] = serialize_nodes(serialized_tree['nodes'])
+    serialized_tree['values'] = encode_array(serialized_tree['values'])
 
     return serialized_tree, dtypes
 
 
 def deserialize_tree(tree_dict, n_features, n_classes, n_outputs):
-    tree_dict['nodes'] = [tuple(lst) for lst in tree_dict['nodes']]
-
     names = ['left_child', 'right_child', 'feature', 'threshold', 'impurity', 'n_node_samples', 'weighted_n_node_samples']
     if sklearn.__version__ >= '1.3':
         names.append('missing_go_to_left')
-    tree_dict['nodes'] = np.array(tree_dict['nodes'], dtype=np.dtype({'names': names, 'formats': tree_dict['nodes_dtype']}))
-    tree_dict['values'] = np.array(tree_dict['values'])
+    tree_dict['nodes'] = deserialize_nodes(tree_dict['nodes'], tree_dict['nodes_dtype'], names)
+    tree_dict['values'] = decode_array(tree_dict['values'])
 
-    if isinstance(n_classes, list):
-        tree = Tree(n_features, np.array(n_classes, dtype=np.intp), n_outputs)
+    if is_serialized_array(n_classes):
+        tree = Tree(n_features, decode_array(n_classes, dtype=np.intp), n_outputs)
     else:
         tree = Tree(n_features, np.array([n_classes], dtype=np.intp), n_outputs)
     tree.__setstate__(tree_dict)
@@ -410,9 +399,9 @@ def serialize_decision_tree(model):
     tree, dtypes = serialize_tree(model.tree_)
     serialized_model = {
         'meta': 'decision-tree',
-        'feature_importances_': model.feature_importances_.tolist(),
+        'feature_importances_': encode_array(model.feature_importances_),
         'max_features_': model.max_features_,
-        'n_classes_': model.n_classes_.tolist() if isinstance(model.n_classes_, np.ndarray) else int(model.n_classes_),
+        'n_classes_': encode_array(model.n_classes_) if isinstance(model.n_classes_, np.ndarray) else int(model.n_classes_),
         'n_features_in_': model.n_features_in_,
         'n_outputs_': model.n_outputs_,
         'tree_': tree,
@@ -420,9 +409,9 @@ def serialize_decision_tree(model):
     }
 
     if isinstance(model.classes_, list) and isinstance(model.classes_[0], np.ndarray):
-        serialized_model['classes_'] = [x.tolist() for x in model.classes_]
+        serialized_model['classes_'] = [encode_array(x) for x in model.classes_]
     elif isinstance(model.classes_, np.ndarray):
-        serialized_model['classes_'] = model.classes_.tolist()
+        serialized_model['classes_'] = encode_array(model.classes_)
     else:
         serialized_model['classes_'] = model.classes_
 
@@ -433,7 +422,7 @@ def serialize_decision_tree(model):
     serialized_model['tree_']['nodes_dtype'] = tree_dtypes
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -441,15 +430,16 @@ def serialize_decision_tree(model):
 def deserialize_decision_tree(model_dict):
     deserialized_model = DecisionTreeClassifier(**model_dict['params'])
 
-    if isinstance(model_dict['classes_'], list) and isinstance(model_dict['classes_'][0], list):
-        deserialized_model.classes_ = [np.array(x) for x in model_dict['classes_']]
-    elif isinstance(model_dict['classes_'], list):
-        deserialized_model.classes_ = np.array(model_dict['classes_'])
+    if isinstance(model_dict['classes_'], list) and is_serialized_array(model_dict['classes_'][0]):
+        deserialized_model.classes_ = [decode_array(x) for x in model_dict['classes_']]
+    elif is_serialized_array(model_dict['classes_']):
+        deserialized_model.classes_ = decode_array(model_dict['classes_'])
     else:
         deserialized_model.classes_ = model_dict['classes_']
 
     deserialized_model.max_features_ = model_dict['max_features_']
-    deserialized_model.n_classes_ = model_dict['n_classes_']
+    deserialized_model.n_classes_ = (decode_array(model_dict['n_classes_']) if is_serialized_array(model_dict['n_classes_'])
+                                    else model_dict['n_classes_'])
     deserialized_model.n_features_in_ = model_dict['n_features_in_']
     deserialized_model.n_outputs_ = model_dict['n_outputs_']
 
@@ -462,11 +452,11 @@ def deserialize_decision_tree(model_dict):
 def serialize_gradient_boosting(model):
     serialized_model = {
         'meta': 'gb',
-        'classes_': model.classes_.tolist(),
+        'classes_': encode_array(model.classes_),
         'max_features_': model.max_features_,
         'n_classes_': model.n_classes_,
         'n_features_in_': model.n_features_in_,
-        'train_score_': model.train_score_.tolist(),
+        'train_score_': encode_array(model.train_score_),
         'params': model.get_params(),
         'estimators_shape': list(model.estimators_.shape),
         'estimators_': []
@@ -495,29 +485,30 @@ def serialize_gradient_boosting(model):
             serialized_model['_loss'] = 'multinomial'       
 
     if 'priors' in model.init_.__dict__:
-        serialized_model['priors'] = model.init_.priors.tolist()
+        serialized_model['priors'] = encode_array(model.init_.priors)
 
-    serialized_model['estimators_'] = [regression.serialize_decision_tree_regressor(regression_tree) for regression_tree in model.estimators_.reshape(-1, )]
+    serialized_model['estimators_'] = serialize_forest(regression.serialize_decision_tree_regressor, model.estimators_.reshape(-1, ))
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
 
 def deserialize_gradient_boosting(model_dict):
     model = GradientBoostingClassifier(**model_dict['params'])
-    estimators = [regression.deserialize_decision_tree_regressor(tree) for tree in model_dict['estimators_']]
+    estimators = deserialize_forest(regression.deserialize_decision_tree_regressor, model_dict['estimators_'])
     model.estimators_ = np.array(estimators).reshape(model_dict['estimators_shape'])
     if 'init_' in model_dict and model_dict['init_']['meta'] == 'dummy':
         model.init_ = dummy.DummyClassifier()
         model.init_.__dict__ = model_dict['init_']
         model.init_.__dict__.pop('meta')
 
-    model.classes_ = np.array(model_dict['classes_'])
-    model.train_score_ = np.array(model_dict['train_score_'])
+    model.classes_ = decode_array(model_dict['classes_'])
+    model.train_score_ = decode_array(model_dict['train_score_'])
     model.max_features_ = model_dict['max_features_']
-    model.n_classes_ = model_dict['n_classes_']
+    model.n_classes_ = (decode_array(model_dict['n_classes_']) if is_serialized_array(model_dict['n_classes_'])
+                       else model_dict['n_classes_'])
     model.n_features_in_ = model_dict['n_features_in_']
     
     if sklearn.__version__ >= '1.4.0':
@@ -537,10 +528,10 @@ def deserialize_gradient_boosting(model_dict):
             model._loss = _gb_losses.MultinomialDeviance(model.n_classes_)
 
     if 'priors' in model_dict:
-        model.init_.priors = np.array(model_dict['priors'])
+        model.init_.priors = decode_array(model_dict['priors'])
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -557,44 +548,45 @@ def serialize_random_forest(model):
         'min_impurity_decrease': model.min_impurity_decrease,
         'n_features_in_': model.n_features_in_,
         'n_outputs_': model.n_outputs_,
-        'estimators_': [serialize_decision_tree(decision_tree) for decision_tree in model.estimators_],
+        'estimators_': serialize_forest(serialize_decision_tree, model.estimators_),
         'params': model.get_params()
     }
 
     if isinstance(model.classes_, list) and isinstance(model.classes_[0], np.ndarray):
-        serialized_model['classes_'] = [x.tolist() for x in model.classes_]
+        serialized_model['classes_'] = [encode_array(x) for x in model.classes_]
     elif isinstance(model.classes_, np.ndarray):
-        serialized_model['classes_'] = model.classes_.tolist()
+        serialized_model['classes_'] = encode_array(model.classes_)
 
     if 'oob_score_' in model.__dict__:
         serialized_model['oob_score_'] = model.oob_score_
     if 'oob_decision_function_' in model.__dict__:
-        serialized_model['oob_decision_function_'] = model.oob_decision_function_.tolist()
+        serialized_model['oob_decision_function_'] = encode_array(model.oob_decision_function_)
 
     if isinstance(model.n_classes_, (int, list)):
         serialized_model['n_classes_'] = model.n_classes_
     else:
-        serialized_model['n_classes_'] = model.n_classes_.tolist()
+        serialized_model['n_classes_'] = encode_array(model.n_classes_)
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
 
 def deserialize_random_forest(model_dict):
     model = RandomForestClassifier(**model_dict['params'])
-    estimators = [deserialize_decision_tree(decision_tree) for decision_tree in model_dict['estimators_']]
-    model.estimators_ = np.array(estimators)
+    estimators = deserialize_forest(deserialize_decision_tree, model_dict['estimators_'], lazy=True)
+    model.estimators_ = np.array(estimators) if isinstance(estimators, list) else estimators
 
-    if isinstance(model_dict['classes_'], list) and isinstance(model_dict['classes_'][0], list):
-        model.classes_ = [np.array(x) for x in model_dict['classes_']]
-    elif isinstance(model_dict['classes_'], list):
-        model.classes_ = np.array(model_dict['classes_'])
+    if isinstance(model_dict['classes_'], list) and is_serialized_array(model_dict['classes_'][0]):
+        model.classes_ = [decode_array(x) for x in model_dict['classes_']]
+    elif is_serialized_array(model_dict['classes_']):
+        model.classes_ = decode_array(model_dict['classes_'])
     else:
         model.classes_ = model_dict['classes_']
 
-    model.n_classes_ = model_dict['n_classes_']
+    model.n_classes_ = (decode_array(model_dict['n_classes_']) if is_serialized_array(model_dict['n_classes_'])
+                       else model_dict['n_classes_'])
     model.n_features_in_ = model_dict['n_features_in_']
     model.n_outputs_ = model_dict['n_outputs_']
     model.max_depth = model_dict['max_depth']
@@ -608,10 +600,10 @@ def deserialize_random_forest(model_dict):
     if 'oob_score_' in model_dict:
         model.oob_score_ = model_dict['oob_score_']
     if 'oob_decision_function_' in model_dict:
-        model.oob_decision_function_ = model_dict['oob_decision_function_']
+        model.oob_decision_function_ = decode_array(model_dict['oob_decision_function_'])
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -619,17 +611,17 @@ def deserialize_random_forest(model_dict):
 def serialize_perceptron(model):
     serialized_model = {
         'meta': 'perceptron',
-        'coef_': model.coef_.tolist(),
-        'intercept_': model.intercept_.tolist(),
+        'coef_': encode_array(model.coef_),
+        'intercept_': encode_array(model.intercept_),
         'n_iter_': model.n_iter_,
-        'classes_': model.classes_.tolist(),
+        'classes_': encode_array(model.classes_),
         'params': model.get_params()
     }
     if 'covariance_' in model.__dict__:
-        serialized_model['covariance_'] = model.covariance_.tolist()
+        serialized_model['covariance_'] = encode_array(model.covariance_)
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -637,13 +629,13 @@ def serialize_perceptron(model):
 def deserialize_perceptron(model_dict):
     model = Perceptron(**model_dict['params'])
 
-    model.coef_ = np.array(model_dict['coef_']).astype(np.float64)
-    model.intercept_ = np.array(model_dict['intercept_']).astype(np.float64)
-    model.n_iter_ = np.array(model_dict['n_iter_']).astype(np.float64)
-    model.classes_ = np.array(model_dict['classes_']).astype(np.int64)
+    model.coef_ = decode_array(model_dict['coef_'], dtype=np.float64)
+    model.intercept_ = decode_array(model_dict['intercept_'], dtype=np.float64)
+    model.n_iter_ = decode_array(model_dict['n_iter_'], dtype=np.float64)
+    model.classes_ = decode_array(model_dict['classes_'], dtype=np.int64)
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -651,9 +643,9 @@ def deserialize_perceptron(model_dict):
 def serialize_mlp(model):
     serialized_model = {
         'meta': 'mlp',
-        'coefs_': [array.tolist() for array in model.coefs_],
+        'coefs_': [encode_array(array) for array in model.coefs_],
         'loss_': model.loss_,
-        'intercepts_': [array.tolist() for array in model.intercepts_],
+        'intercepts_': [encode_array(array) for array in model.intercepts_],
         'n_iter_': model.n_iter_,
         'n_layers_': model.n_layers_,
         'n_outputs_': model.n_outputs_,
@@ -663,12 +655,12 @@ def serialize_mlp(model):
     }
 
     if isinstance(model.classes_, list):
-        serialized_model['classes_'] = [array.tolist() for array in model.classes_]
+        serialized_model['classes_'] = [encode_array(array) for array in model.classes_]
     else:
-        serialized_model['classes_'] = model.classes_.tolist()
+        serialized_model['classes_'] = encode_array(model.classes_)
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -676,19 +668,19 @@ def serialize_mlp(model):
 def deserialize_mlp(model_dict):
     model = MLPClassifier(**model_dict['params'])
 
-    model.coefs_ = [np.array(coefs) for coefs in model_dict['coefs_']]
+    model.coefs_ = [decode_array(coefs) for coefs in model_dict['coefs_']]
     model.loss_ = model_dict['loss_']
-    model.intercepts_ = [np.array(intercepts) for intercepts in model_dict['intercepts_']]
+    model.intercepts_ = [decode_array(intercepts) for intercepts in model_dict['intercepts_']]
     model.n_iter_ = model_dict['n_iter_']
     model.n_layers_ = model_dict['n_layers_']
     model.n_outputs_ = model_dict['n_outputs_']
     model.out_activation_ = model_dict['out_activation_']
     model._label_binarizer = deserialize_label_binarizer(model_dict['_label_binarizer'])
 
-    model.classes_ = np.array(model_dict['classes_'])
+    model.classes_ = decode_array(model_dict['classes_'])
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -699,30 +691,24 @@ def serialize_xgboost_classifier(model):
         'params': model.get_params()
     }
 
-    filename = f'{str(uuid.uuid4())}.json'
-    model.save_model(filename)
-    with open(filename, 'r') as fh:
-        serialized_model['advanced-params'] = fh.read()
-    os.remove(filename)
+    serialized_model.update(serialize_xgboost_booster(model))
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
 
 if 'XGBClassifier' in __optionals__:
     def deserialize_xgboost_classifier(model_dict):
+        from xgboost import XGBClassifier
+
         model = XGBClassifier(**model_dict['params'])
 
-        filename = f'{str(uuid.uuid4())}.json'
-        with open(filename, 'w') as fh:
-            fh.write(model_dict['advanced-params'])
-        model.load_model(filename)
-        os.remove(filename)
+        deserialize_xgboost_booster(model, model_dict)
 
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
         return model
 
@@ -734,29 +720,23 @@ if 'XGBRFClassifier' in __optionals__:
             'params': model.get_params()
         }
 
-        filename = f'{str(uuid.uuid4())}.json'
-        model.save_model(filename)
-        with open(filename, 'r') as fh:
-            serialized_model['advanced-params'] = fh.read()
-        os.remove(filename)
+        serialized_model.update(serialize_xgboost_booster(model))
 
         if 'feature_names_in_' in model.__dict__:
-            serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+            serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
         return serialized_model
 
 
     def deserialize_xgboost_rf_classifier(model_dict):
+        from xgboost import XGBRFClassifier
+
         model = XGBRFClassifier(**model_dict['params'])
 
-        filename = f'{str(uuid.uuid4())}.json'
-        with open(filename, 'w') as fh:
-            fh.write(model_dict['advanced-params'])
-        model.load_model(filename)
-        os.remove(filename)
+        deserialize_xgboost_booster(model, model_dict)
 
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
         return model
 
@@ -786,15 +766,17 @@ if 'LGBMClassifier' in __optionals__:
         if hasattr(model, '_class_map') and model._class_map is not None:
             serialized_model['params']['_class_map'] = {int(key): int(value) for key, value in model._class_map.items()}
         if hasattr(model, '_classes') and model._classes is not None:
-            serialized_model['params']['_classes'] = model._classes.astype(int).tolist()
+            serialized_model['params']['_classes'] = encode_array(model._classes)
 
         if 'feature_names_in_' in model.__dict__:
-            serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+            serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
         return serialized_model
 
 
     def deserialize_lightgbm_classifier(model_dict):
+        from lightgbm import LGBMClassifier, Booster as LGBMBooster
+
         params = model_dict['params']
         params['_Booster'] = LGBMBooster(model_str=params['_Booster'])
         params['_le'] = deserialize_label_encoder(params['_le'])
@@ -802,13 +784,13 @@ if 'LGBMClassifier' in __optionals__:
         if '_class_map' in params and params['_class_map'] is not None:
             params['_class_map'] = {np.int32(key): np.int64(value) for key, value in params['_class_map'].items()}
         if '_classes' in params and params['_classes'] is not None:
-            params['_classes'] = np.array(params['_classes'], dtype=np.int32)
+            params['_classes'] = decode_array(params['_classes'], dtype=np.int32)
 
         model = LGBMClassifier().set_params(**params)
         model._other_params = model_dict['_other_params']
 
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
         return model
 
@@ -820,29 +802,23 @@ if 'CatBoostClassifier' in __optionals__:
             'params': model.get_params()
         }
 
-        filename = f'{str(uuid.uuid4())}.json'
-        model.save_model(filename, format='json', pool=catboost_data)
-        with open(filename, 'r') as fh:
-            serialized_model['advanced-params'] = fh.read()
-        os.remove(filename)
+        serialized_model.update(serialize_catboost_booster(model, catboost_data))
 
         if 'feature_names_in_' in model.__dict__:
-            serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+            serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
         return serialized_model
 
 
     def deserialize_catboost_classifier(model_dict):
+        from catboost import CatBoostClassifier
+
         model = CatBoostClassifier(**model_dict['params'])
 
-        filename = f'{str(uuid.uuid4())}.json'
-        with open(filename, 'w') as fh:
-            fh.write(model_dict['advanced-params'])
-        model.load_model(filename, format='json')
-        os.remove(filename)
+        deserialize_catboost_booster(model, model_dict)
 
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
         return model
 
@@ -850,11 +826,11 @@ if 'CatBoostClassifier' in __optionals__:
 def serialize_adaboost_classifier(model):
     serialized_model = {
         'meta': 'adaboost-classifier',
-        'estimators_': [serialize_decision_tree(decision_tree) for decision_tree in model.estimators_],
-        'classes_': model.classes_.tolist(),
+        'estimators_': serialize_members(serialize_decision_tree, model.estimators_),
+        'classes_': encode_array(model.classes_),
         'n_classes_': model.n_classes_,
-        'estimator_weights_': model.estimator_weights_.tolist(),
-        'estimator_errors_': model.estimator_errors_.tolist(),
+        'estimator_weights_': encode_array(model.estimator_weights_),
+        'estimator_errors_': encode_array(model.estimator_errors_),
         'n_features_in_': model.n_features_in_,
         'params': model.get_params()
     }
@@ -873,7 +849,7 @@ def serialize_adaboost_classifier(model):
         serialized_model['_estimator'] = None
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -897,15 +873,16 @@ def deserialize_adaboost_classifier(model_dict):
         model.base_estimator_ = model_dict['params']['base_estimator']
     else:
         model._estimator = model_dict['params']['estimator']
-    model.estimators_ = [deserialize_decision_tree(decision_tree) for decision_tree in model_dict['estimators_']]
-    model.classes_ = np.array(model_dict['classes_'])
-    model.n_classes_ = model_dict['n_classes_']
-    model.estimator_weights_ = np.array(model_dict['estimator_weights_'])
-    model.estimator_errors_ = np.array(model_dict['estimator_errors_'])
+    model.estimators_ = deserialize_members(deserialize_decision_tree, model_dict['estimators_'])
+    model.classes_ = decode_array(model_dict['classes_'])
+    model.n_classes_ = (decode_array(model_dict['n_classes_']) if is_serialized_array(model_dict['n_classes_'])
+                       else model_dict['n_classes_'])
+    model.estimator_weights_ = decode_array(model_dict['estimator_weights_'])
+    model.estimator_errors_ = decode_array(model_dict['estimator_errors_'])
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -918,11 +895,11 @@ def serialize_bagging_classifier(model):
         '_n_samples': model._n_samples,
         '_max_features': model._max_features,
         'n_features_in_': model.n_features_in_,
-        'classes_': model.classes_.tolist(),
-        '_seeds': model._seeds.tolist(),
-        'estimators_': [serialize_model(decision_tree) for decision_tree in model.estimators_],
+        'classes_': encode_array(model.classes_),
+        '_seeds': encode_array(model._seeds),
+        'estimators_': serialize_forest(serialize_model, model.estimators_),
         'estimator_params': model.estimator_params,
-        'estimators_features_': [array.tolist() for array in model.estimators_features_],
+        'estimators_features_': [encode_array(array) for array in model.estimators_features_],
         'params': model.get_params()
     }
 
@@ -942,16 +919,16 @@ def serialize_bagging_classifier(model):
     if 'oob_score_' in model.__dict__:
         serialized_model['oob_score_'] = model.oob_score_
     if 'oob_decision_function_' in model.__dict__:
-        serialized_model['oob_decision_function_'] = model.oob_decision_function_.tolist()
+        serialized_model['oob_decision_function_'] = encode_array(model.oob_decision_function_)
 
 
     if isinstance(model.n_classes_, int):
         serialized_model['n_classes_'] = model.n_classes_
     else:
-        serialized_model['n_classes_'] = model.n_classes_.tolist()
+        serialized_model['n_classes_'] = encode_array(model.n_classes_)
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -977,28 +954,28 @@ def deserialize_bagging_classifier(model_dict):
         model.base_estimator_ = model_dict['params']['base_estimator']
     else:
         model._estimator = model_dict['params']['estimator']
-    model.estimators_ = [deserialize_model(decision_tree) for decision_tree in model_dict['estimators_']]
+    model.estimators_ = deserialize_forest(deserialize_model, model_dict['estimators_'])
     model._max_samples = model_dict['_max_samples']
     model._n_samples = model_dict['_n_samples']
     model._max_features = model_dict['_max_features']
     model.n_features_in_ = model_dict['n_features_in_']
-    model.classes_ = np.array(model_dict['classes_'])
-    model._seeds = np.array(model_dict['_seeds'])
+    model.classes_ = decode_array(model_dict['classes_'])
+    model._seeds = decode_array(model_dict['_seeds'])
     model.estimator_params = model_dict['estimator_params']
-    model.estimators_features_ = [np.array(array) for array in model_dict['estimators_features_']]
+    model.estimators_features_ = [decode_array(array) for array in model_dict['estimators_features_']]
 
     if 'oob_score_' in model_dict:
         model.oob_score_ = model_dict['oob_score_']
     if 'oob_decision_function_' in model_dict:
-        model.oob_decision_function_ = model_dict['oob_decision_function_']
+        model.oob_decision_function_ = decode_array(model_dict['oob_decision_function_'])
 
-    if isinstance(model_dict['n_classes_'], list):
-        model.n_classes_ = np.array(model_dict['n_classes_'])
+    if is_serialized_array(model_dict['n_classes_']):
+        model.n_classes_ = decode_array(model_dict['n_classes_'])
     else:
         model.n_classes_ = model_dict['n_classes_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -1012,7 +989,7 @@ def serialize_extra_tree_classifier(model):
         'n_features_in_': model.n_features_in_,
         'n_outputs_': model.n_outputs_,
         'tree_': tree,
-        'classes_': model.classes_.tolist(),
+        'classes_': encode_array(model.classes_),
         'params': model.get_params()
     }
 
@@ -1023,7 +1000,7 @@ def serialize_extra_tree_classifier(model):
     serialized_model['tree_']['nodes_dtype'] = tree_dtypes
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -1031,9 +1008,10 @@ def serialize_extra_tree_classifier(model):
 def deserialize_extra_tree_classifier(model_dict):
     deserialized_model = ExtraTreeClassifier(**model_dict['params'])
 
-    deserialized_model.classes_ = np.array(model_dict['classes_'])
+    deserialized_model.classes_ = decode_array(model_dict['classes_'])
     deserialized_model.max_features_ = model_dict['max_features_']
-    deserialized_model.n_classes_ = model_dict['n_classes_']
+    deserialized_model.n_classes_ = (decode_array(model_dict['n_classes_']) if is_serialized_array(model_dict['n_classes_'])
+                                    else model_dict['n_classes_'])
     deserialized_model.n_features_in_ = model_dict['n_features_in_']
     deserialized_model.n_outputs_ = model_dict['n_outputs_']
 
@@ -1041,7 +1019,7 @@ def deserialize_extra_tree_classifier(model_dict):
     deserialized_model.tree_ = tree
 
     if 'feature_names_in_' in model_dict.keys():
-        deserialized_model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        deserialized_model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return deserialized_model
 
@@ -1051,8 +1029,8 @@ def serialize_extratrees_classifier(model):
         'meta': 'extratrees-classifier',
         'n_features_in_': model.n_features_in_,
         'n_outputs_': model.n_outputs_,
-        'classes_': model.classes_.tolist(),
-        'estimators_': [serialize_extra_tree_classifier(extra_tree) for extra_tree in model.estimators_],
+        'classes_': encode_array(model.classes_),
+        'estimators_': serialize_forest(serialize_extra_tree_classifier, model.estimators_),
         'params': model.get_params()
     }
 
@@ -1072,16 +1050,16 @@ def serialize_extratrees_classifier(model):
     if 'oob_score_' in model.__dict__:
         serialized_model['oob_score_'] = model.oob_score_
     if 'oob_decision_function_' in model.__dict__:
-        serialized_model['oob_decision_function_'] = model.oob_decision_function_.tolist()
+        serialized_model['oob_decision_function_'] = encode_array(model.oob_decision_function_)
 
 
     if isinstance(model.n_classes_, int):
         serialized_model['n_classes_'] = model.n_classes_
     else:
-        serialized_model['n_classes_'] = model.n_classes_.tolist()
+        serialized_model['n_classes_'] = encode_array(model.n_classes_)
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -1105,23 +1083,23 @@ def deserialize_extratrees_classifier(model_dict):
         model.base_estimator_ = model_dict['params']['base_estimator']
     else:
         model._estimator = model_dict['params']['estimator']
-    model.estimators_ = [deserialize_extra_tree_classifier(decision_tree) for decision_tree in model_dict['estimators_']]
+    model.estimators_ = deserialize_forest(deserialize_extra_tree_classifier, model_dict['estimators_'], lazy=True)
     model.n_features_in_ = model_dict['n_features_in_']
     model.n_outputs_ = model_dict['n_outputs_']
-    model.classes_ = np.array(model_dict['classes_'])
+    model.classes_ = decode_array(model_dict['classes_'])
 
     if 'oob_score_' in model_dict:
         model.oob_score_ = model_dict['oob_score_']
     if 'oob_decision_function_' in model_dict:
-        model.oob_decision_function_ = model_dict['oob_decision_function_']
+        model.oob_decision_function_ = decode_array(model_dict['oob_decision_function_'])
 
-    if isinstance(model_dict['n_classes_'], list):
-        model.n_classes_ = np.array(model_dict['n_classes_'])
+    if is_serialized_array(model_dict['n_classes_']):
+        model.n_classes_ = decode_array(model_dict['n_classes_'])
     else:
         model.n_classes_ = model_dict['n_classes_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -1137,9 +1115,9 @@ def serialize_isolation_forest(model):
         'offset_': model.offset_,
         'oob_score': model.oob_score,
         'bootstrap_features': model.bootstrap_features,
-        '_seeds': model._seeds.tolist(),
-        'estimators_': [regression.serialize_extra_tree_regressor(extra_tree) for extra_tree in model.estimators_],
-        'estimators_features_': [array.tolist() for array in model.estimators_features_],
+        '_seeds': encode_array(model._seeds),
+        'estimators_': serialize_forest(regression.serialize_extra_tree_regressor, model.estimators_),
+        'estimators_features_': [encode_array(array) for array in model.estimators_features_],
         'estimator_params': list(model.estimator_params),
         'params': model.get_params()
     }
@@ -1158,13 +1136,13 @@ def serialize_isolation_forest(model):
         serialized_model['_estimator'] = None
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     if '_decision_path_lengths' in model.__dict__:
-        serialized_model['_decision_path_lengths'] = [array.tolist() for array in model._decision_path_lengths]
+        serialized_model['_decision_path_lengths'] = [encode_array(array) for array in model._decision_path_lengths]
 
     if '_average_path_length_per_tree' in model.__dict__:
-        serialized_model['_average_path_length_per_tree'] = [array.tolist() for array in model._average_path_length_per_tree]
+        serialized_model['_average_path_length_per_tree'] = [encode_array(array) for array in model._average_path_length_per_tree]
 
     return serialized_model
 
@@ -1188,7 +1166,7 @@ def deserialize_isolation_forest(model_dict):
         model.base_estimator_ = model_dict['params']['base_estimator']
     else:
         model._estimator = model_dict['params']['estimator']
-    model.estimators_ = [regression.deserialize_extra_tree_regressor(decision_tree) for decision_tree in model_dict['estimators_']]
+    model.estimators_ = deserialize_forest(regression.deserialize_extra_tree_regressor, model_dict['estimators_'])
     model.n_features_in_ = model_dict['n_features_in_']
     model._max_features = model_dict['_max_features']
     model.max_samples_ = model_dict['max_samples_']
@@ -1197,18 +1175,18 @@ def deserialize_isolation_forest(model_dict):
     model.offset_ = model_dict['offset_']
     model.oob_score = model_dict['oob_score']
     model.bootstrap_features = model_dict['bootstrap_features']
-    model._seeds = np.array(model_dict['_seeds'])
-    model.estimators_features_ = [np.array(array) for array in model_dict['estimators_features_']]
+    model._seeds = decode_array(model_dict['_seeds'])
+    model.estimators_features_ = [decode_array(array) for array in model_dict['estimators_features_']]
     model.estimator_params = tuple(model_dict['estimator_params'])
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     if '_decision_path_lengths' in model_dict.keys():
-        model._decision_path_lengths = tuple([np.array(array) for array in model_dict['_decision_path_lengths']])
+        model._decision_path_lengths = tuple([decode_array(array) for array in model_dict['_decision_path_lengths']])
 
     if '_average_path_length_per_tree' in model_dict.keys():
-        model._average_path_length_per_tree = tuple([np.array(array) for array in model_dict['_average_path_length_per_tree']])
+        model._average_path_length_per_tree = tuple([decode_array(array) for array in model_dict['_average_path_length_per_tree']])
 
     return model
 
@@ -1224,7 +1202,7 @@ def serialize_random_trees_embedding(model):
         'bootstrap': model.bootstrap,
         'class_weight': model.class_weight,
         'one_hot_encoder_': serialize_onehot_encoder(model.one_hot_encoder_),
-        'estimators_': [regression.serialize_extra_tree_regressor(extra_tree) for extra_tree in model.estimators_],
+        'estimators_': serialize_forest(regression.serialize_extra_tree_regressor, model.estimators_),
         'estimator_params': list(model.estimator_params),
         'params': model.get_params()
     }
@@ -1243,7 +1221,7 @@ def serialize_random_trees_embedding(model):
         serialized_model['_estimator'] = None
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -1267,7 +1245,7 @@ def deserialize_random_trees_embedding(model_dict):
         model.base_estimator_ = model_dict['params']['base_estimator']
     else:
         model._estimator = model_dict['params']['estimator']
-    model.estimators_ = [regression.deserialize_extra_tree_regressor(decision_tree) for decision_tree in model_dict['estimators_']]
+    model.estimators_ = deserialize_forest(regression.deserialize_extra_tree_regressor, model_dict['estimators_'])
     model.n_features_in_ = model_dict['n_features_in_']
     model._n_features_out = model_dict['_n_features_out']
     model.max_samples = model_dict['max_samples']
@@ -1279,7 +1257,7 @@ def deserialize_random_trees_embedding(model_dict):
     model.estimator_params = tuple(model_dict['estimator_params'])
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -1290,19 +1268,19 @@ def serialize_nearest_neighbour_classifier(model):
         'radius': model.radius,
         'n_features_in_': model.n_features_in_,
         'outputs_2d_': model.outputs_2d_,
-        '_y': model._y.tolist(),
+        '_y': encode_array(model._y),
         'effective_metric_params_': model.effective_metric_params_,
         'effective_metric_': model.effective_metric_,
         '_fit_method': model._fit_method,
         'n_samples_fit_': model.n_samples_fit_,
-        '_fit_X': model._fit_X.tolist(),
+        '_fit_X': encode_array(model._fit_X),
         'params': model.get_params()
     }
 
     if isinstance(model.classes_, list) and isinstance(model.classes_[0], np.ndarray):
-        serialized_model['classes_'] = [x.tolist() for x in model.classes_]
+        serialized_model['classes_'] = [encode_array(x) for x in model.classes_]
     elif isinstance(model.classes_, np.ndarray):
-        serialized_model['classes_'] = model.classes_.tolist()
+        serialized_model['classes_'] = encode_array(model.classes_)
 
     if '_tree' in model.__dict__ and model.__dict__['_tree'] is not None:
         serialized_model['_tree'] = serialize_kdtree(model._tree)
@@ -1310,7 +1288,7 @@ def serialize_nearest_neighbour_classifier(model):
         serialized_model['_tree'] = None
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -1321,17 +1299,17 @@ def deserialize_nearest_neighbour_classifier(model_dict):
     model.radius = model_dict['radius']
     model.n_features_in_ = model_dict['n_features_in_']
     model.outputs_2d_ = model_dict['outputs_2d_']
-    model._y = np.array(model_dict['_y'])
+    model._y = decode_array(model_dict['_y'])
     model.effective_metric_params_ = model_dict['effective_metric_params_']
     model.effective_metric_ = model_dict['effective_metric_']
     model._fit_method = model_dict['_fit_method']
-    model._fit_X = np.array(model_dict['_fit_X'])
+    model._fit_X = decode_array(model_dict['_fit_X'])
     model.n_samples_fit_ = model_dict['n_samples_fit_']
 
-    if isinstance(model_dict['classes_'], list) and isinstance(model_dict['classes_'][0], list):
-        model.classes_ = [np.array(x) for x in model_dict['classes_']]
-    elif isinstance(model_dict['classes_'], list):
-        model.classes_ = np.array(model_dict['classes_'])
+    if isinstance(model_dict['classes_'], list) and is_serialized_array(model_dict['classes_'][0]):
+        model.classes_ = [decode_array(x) for x in model_dict['classes_']]
+    elif is_serialized_array(model_dict['classes_']):
+        model.classes_ = decode_array(model_dict['classes_'])
     else:
         model.classes_ = model_dict['classes_']
 
@@ -1341,7 +1319,7 @@ def deserialize_nearest_neighbour_classifier(model_dict):
         model._tree = None
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -1353,7 +1331,7 @@ def serialize_stacking_classifier(model):
     serialized_model = {
         'meta': 'stacking-classifier',
         '_n_feature_outs': model._n_feature_outs,
-        'classes_': model.classes_.tolist(),
+        'classes_': encode_array(model.classes_),
         'estimators_': [serialize_model(submodel) for submodel in model.estimators_],
         'final_estimator_': serialize_model(model.final_estimator_),
         'stack_method_': model.stack_method_,
@@ -1366,7 +1344,7 @@ def serialize_stacking_classifier(model):
                                                 serialized_model['params']['estimators']]
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
     if '_le' in model.__dict__:
         serialized_model['_le'] = serialize_label_encoder(model._le)
     else:
@@ -1385,14 +1363,14 @@ def deserialize_stacking_classifier(model_dict):
     model = StackingClassifier(**model_dict['params'])
 
     model._n_feature_outs = model_dict['_n_feature_outs']
-    model.classes_ = np.array(model_dict['classes_'])
+    model.classes_ = decode_array(model_dict['classes_'])
     model.estimators_ = [deserialize_model(submodel) for submodel in model_dict['estimators_']]
     model.final_estimator_ = deserialize_model(model_dict['final_estimator_'])
     model.stack_method_ = model_dict['stack_method_']
     model.named_estimators_ = {model_name: deserialize_model(submodel) for model_name, submodel in model_dict['named_estimators_'].items()}
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
     if '_le' in model_dict.keys():
         model._le = deserialize_label_encoder(model_dict['_le'])
     else:
@@ -1407,7 +1385,7 @@ def serialize_voting_classifier(model):
 
     serialized_model = {
         'meta': 'voting-classifier',
-        'classes_': model.classes_.tolist(),
+        'classes_': encode_array(model.classes_),
         'le_': serialize_label_encoder(model.le_),
         'estimators_': [serialize_model(submodel) for submodel in model.estimators_],
         'named_estimators_': {model_name: serialize_model(submodel) for model_name, submodel in
@@ -1421,7 +1399,7 @@ def serialize_voting_classifier(model):
                                                 serialized_model['params']['estimators']]
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -1435,13 +1413,13 @@ def deserialize_voting_classifier(model_dict):
 
     model = VotingClassifier(**model_dict['params'])
 
-    model.classes_ = np.array(model_dict['classes_'])
+    model.classes_ = decode_array(model_dict['classes_'])
     model.le_ = deserialize_label_encoder(model_dict['le_'])
     model.estimators_ = [deserialize_model(submodel) for submodel in model_dict['estimators_']]
     model.named_estimators_ = {model_name: deserialize_model(submodel) for model_name, submodel in model_dict['named_estimators_'].items()}
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -1455,9 +1433,9 @@ if 'imblearn' in __optionals__:
             'meta': 'easy-ensemble-classifier',
             'estimator_': serialize_model(model.estimator_),
             'estimators_': [serialize_model(estimator) for estimator in model.estimator_],
-            'estimators_samples_': [arr_.tolist() for arr_ in model.estimators_samples_],
-            'estimators_features_': [arr_.tolist() for arr_ in model.estimators_features_],
-            'classes_': model.classes_.tolist(),
+            'estimators_samples_': [encode_array(arr_) for arr_ in model.estimators_samples_],
+            'estimators_features_': [encode_array(arr_) for arr_ in model.estimators_features_],
+            'classes_': encode_array(model.classes_),
             'n_classes_': model.n_classes_,
             'n_features_': model.n_features_,
             'params':model.get_params(),
@@ -1473,12 +1451,13 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model.__dict__:
             serialized_model['n_features_in_'] = model.n_features_in_
         if 'feature_names_in_' in model.__dict__:
-            serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+            serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
         return serialized_model
 
 
     def deserialize_easy_ensemble_classifier(model_dict):
+        from imblearn.ensemble import EasyEnsembleClassifier
         # Import here to avoid circular imports
         from . import deserialize_model
 
@@ -1489,15 +1468,15 @@ if 'imblearn' in __optionals__:
 
         model.estimator_ = deserialize_model(model_dict['estimator_'])
         model.estimators_ = [deserialize_model(estimator) for estimator in model_dict['estimators_']]
-        model.estimators_samples_ = [np.array(values) for values in model_dict['estimators_samples_']]
-        model.estimators_features_ = [np.array(values) for values in model_dict['estimators_features_']]
-        model.classes_ = np.array(model_dict['classes_'])
+        model.estimators_samples_ = [decode_array(values) for values in model_dict['estimators_samples_']]
+        model.estimators_features_ = [decode_array(values) for values in model_dict['estimators_features_']]
+        model.classes_ = decode_array(model_dict['classes_'])
         model.n_classes_ = model.n_classes_
         model.n_features_ = model.n_features_
 
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
         return model
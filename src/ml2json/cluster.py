@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import importlib
+import importlib.util
 import inspect
 
 import numpy as np
@@ -12,30 +13,24 @@ from sklearn.cluster import (AffinityPropagation, AgglomerativeClustering,
 from sklearn.cluster._birch import _CFNode, _CFSubcluster
 from sklearn.cluster._bisect_k_means import _BisectingTree
 
-# Allow additional dependencies to be optional
+# Allow additional dependencies to be optional, they are only imported once needed
 __optionals__ = []
-try:
-    from kmodes.kmodes import KModes
-    from kmodes.kprototypes import KPrototypes
+if importlib.util.find_spec('kmodes') is not None:
     __optionals__.extend(['KModes', 'KPrototypes'])
-except:
-    pass
-try:
-    from hdbscan import HDBSCAN
+if importlib.util.find_spec('hdbscan') is not None:
     __optionals__.append('HDBSCAN')
-except:
-    pass
 
 
 from .utils.random_state import serialize_random_state, deserialize_random_state
 from .utils.memory import serialize_memory, deserialize_memory
+from .utils.arrays import encode_array, decode_array, is_serialized_array
 
 
 def serialize_kmeans(model):
     serialized_model = {
         'meta': 'kmeans',
-        'cluster_centers_': model.cluster_centers_.tolist(),
-        'labels_': model.labels_.tolist(),
+        'cluster_centers_': encode_array(model.cluster_centers_),
+        'labels_': encode_array(model.labels_),
         'inertia_': model.inertia_,
         '_tol': float(model._tol),
         '_n_init': model._n_init,
@@ -48,7 +43,7 @@ def serialize_kmeans(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
     serialized_model['params']['n_clusters'] = int(serialized_model['params']['n_clusters'])
 
     return serialized_model
@@ -57,8 +52,8 @@ def serialize_kmeans(model):
 def deserialize_kmeans(model_dict):
     model = KMeans(**model_dict['params'])
 
-    model.cluster_centers_ = np.array(model_dict['cluster_centers_'])
-    model.labels_ = np.array(model_dict['labels_'])
+    model.cluster_centers_ = decode_array(model_dict['cluster_centers_'])
+    model.labels_ = decode_array(model_dict['labels_'])
     model.inertia_ = model_dict['inertia_']
     model._tol = model_dict['_tol']
     model._n_init = model_dict['_n_init']
@@ -69,7 +64,7 @@ def deserialize_kmeans(model_dict):
     model._algorithm = model_dict['_algorithm']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -77,12 +72,12 @@ def deserialize_kmeans(model_dict):
 def serialize_minibatch_kmeans(model):
     serialized_model = {
         'meta': 'minibatch-kmeans',
-        'cluster_centers_': model.cluster_centers_.tolist(),
-        'labels_': model.labels_.tolist(),
+        'cluster_centers_': encode_array(model.cluster_centers_),
+        'labels_': encode_array(model.labels_),
         'inertia_': model.inertia_,
         '_ewa_inertia': model._ewa_inertia,
         '_ewa_inertia_min': model._ewa_inertia_min,
-        '_counts': model._counts.tolist(),
+        '_counts': encode_array(model._counts),
         '_tol': float(model._tol),
         '_n_init': model._n_init,
         '_init_size': model._init_size,
@@ -98,7 +93,7 @@ def serialize_minibatch_kmeans(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
     serialized_model['params']['n_clusters'] = int(serialized_model['params']['n_clusters'])
 
     return serialized_model
@@ -107,12 +102,12 @@ def serialize_minibatch_kmeans(model):
 def deserialize_minibatch_kmeans(model_dict):
     model = MiniBatchKMeans(**model_dict['params'])
 
-    model.cluster_centers_ = np.array(model_dict['cluster_centers_'])
-    model.labels_ = np.array(model_dict['labels_'])
+    model.cluster_centers_ = decode_array(model_dict['cluster_centers_'])
+    model.labels_ = decode_array(model_dict['labels_'])
     model.inertia_ = model_dict['inertia_']
     model._ewa_inertia = model_dict['_ewa_inertia']
     model._ewa_inertia_min = model_dict['_ewa_inertia_min']
-    model._counts = np.array(model_dict['_counts'])
+    model._counts = decode_array(model_dict['_counts'])
     model._tol = model_dict['_tol']
     model._n_init = model_dict['_n_init']
     model._init_size = model_dict['_init_size']
@@ -126,7 +121,7 @@ def deserialize_minibatch_kmeans(model_dict):
     model._n_features_out = model_dict['_n_features_out']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -134,17 +129,17 @@ def deserialize_minibatch_kmeans(model_dict):
 def serialize_affinity_propagation(model):
     serialized_model = {
         'meta': 'affinity-propagation',
-        'cluster_centers_indices_': model.cluster_centers_indices_.tolist(),
-        'cluster_centers_': model.cluster_centers_.tolist(),
-        'labels_': model.labels_.tolist(),
-        'affinity_matrix_': model.affinity_matrix_.tolist(),
+        'cluster_centers_indices_': encode_array(model.cluster_centers_indices_),
+        'cluster_centers_': encode_array(model.cluster_centers_),
+        'labels_': encode_array(model.labels_),
+        'affinity_matrix_': encode_array(model.affinity_matrix_),
         'n_iter_': model.n_iter_,
         'n_features_in_': model.n_features_in_,
         'params': model.get_params(),
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist(),
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_),
 
     return serialized_model
 
@@ -152,15 +147,15 @@ def serialize_affinity_propagation(model):
 def deserialize_affinity_propagation(model_dict):
     model = AffinityPropagation(**model_dict['params'])
 
-    model.cluster_centers_indices_ = np.array(model_dict['cluster_centers_indices_'], dtype=np.int64)
-    model.cluster_centers_ = np.array(model_dict['cluster_centers_'])
-    model.labels_ = np.array(model_dict['labels_'], dtype=np.int64)
-    model.affinity_matrix_ = np.array(model_dict['affinity_matrix_'])
+    model.cluster_centers_indices_ = decode_array(model_dict['cluster_centers_indices_'], dtype=np.int64)
+    model.cluster_centers_ = decode_array(model_dict['cluster_centers_'])
+    model.labels_ = decode_array(model_dict['labels_'], dtype=np.int64)
+    model.affinity_matrix_ = decode_array(model_dict['affinity_matrix_'])
     model.n_iter_ = model_dict['n_iter_']
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -169,18 +164,18 @@ def serialize_agglomerative_clustering(model):
     serialized_model = {
         'meta': 'agglomerative-clustering',
         'n_clusters_': model.n_clusters_,
-        'labels_': model.labels_.tolist(),
+        'labels_': encode_array(model.labels_),
         'n_leaves_': model.n_leaves_,
         'n_connected_components_': model.n_connected_components_,
         'n_features_in_': model.n_features_in_,
-        'children_': model.children_.tolist(),
+        'children_': encode_array(model.children_),
         'params': model.get_params(),
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
     if 'distances_' in model.__dict__:
-        serialized_model['distances_'] = model.distances_.tolist()
+        serialized_model['distances_'] = encode_array(model.distances_)
     if '_metric' in model.__dict__:
         serialized_model['_metric'] = model._metric
 
@@ -191,16 +186,16 @@ def deserialize_agglomerative_clustering(model_dict):
     model = AgglomerativeClustering(**model_dict['params'])
 
     model.n_clusters_ = model_dict['n_clusters_']
-    model.labels_ = np.array(model_dict['labels_'])
+    model.labels_ = decode_array(model_dict['labels_'])
     model.n_leaves_ = model_dict['n_leaves_']
     model.n_connected_components_ = model_dict['n_connected_components_']
     model.n_features_in_ = model_dict['n_features_in_']
-    model.children_ = np.array(model_dict['children_'])
+    model.children_ = decode_array(model_dict['children_'])
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
     if 'distances_' in model_dict.keys():
-        model.distances_ = np.array(model_dict['distances_'])
+        model.distances_ = decode_array(model_dict['distances_'])
     if '_metric' in model_dict:
         model._metric = model_dict['_metric']
 
@@ -218,15 +213,15 @@ def serialize_cfnode(model):
         'is_leaf': model.is_leaf,
         'n_features': model.n_features,
         'subclusters_': [mem(cfsubcluster) for cfsubcluster in model.subclusters_],
-        'init_centroids_': model.init_centroids_.tolist(),
-        'init_sq_norm_': model.init_sq_norm_.tolist(),
-        'squared_norm_': model.squared_norm_.tolist() if isinstance(model.squared_norm_, np.ndarray) else model.squared_norm_,
+        'init_centroids_': encode_array(model.init_centroids_),
+        'init_sq_norm_': encode_array(model.init_sq_norm_),
+        'squared_norm_': encode_array(model.squared_norm_) if isinstance(model.squared_norm_, np.ndarray) else model.squared_norm_,
         'prev_leaf_': mem(model.prev_leaf_),
         'next_leaf_': mem(model.next_leaf_),
     }
 
     if hasattr(model, 'centroids_'):
-        serialized_model['centroids_'] = model.centroids_.tolist()
+        serialized_model['centroids_'] = encode_array(model.centroids_)
     serialized_model['dtype'] = str(model.init_sq_norm_.dtype)
 
     return serialized_model
@@ -245,9 +240,9 @@ def deserialize_cfnode(model_dict):
                         n_features=model_dict['n_features'],
                         dtype=np.dtype(model_dict['dtype']))
 
-    model.init_centroids_ = np.array(model_dict['init_centroids_'])
-    model.init_sq_norm_ = np.array(model_dict['init_sq_norm_'])
-    model.squared_norm_ = np.array(model_dict['squared_norm_'])
+    model.init_centroids_ = decode_array(model_dict['init_centroids_'])
+    model.init_sq_norm_ = decode_array(model_dict['init_sq_norm_'])
+    model.squared_norm_ = decode_array(model_dict['squared_norm_'])
 
     # To be modified by the Birch deserializer
     model.subclusters_ = model_dict['subclusters_']
@@ -265,8 +260,8 @@ def serialize_cfsubcluster(model):
         'meta': 'cfsubcluster',
         'n_samples_': model.n_samples_,
         'squared_sum_': model.squared_sum_,
-        'centroid_': model.centroid_.tolist(),
-        'linear_sum_': model.linear_sum_.tolist(),
+        'centroid_': encode_array(model.centroid_),
+        'linear_sum_': encode_array(model.linear_sum_),
         'sq_norm_': model.sq_norm_,
         'child_': mem(model.child_)
     }
@@ -279,8 +274,8 @@ def deserialize_cfsubcluster(model_dict):
 
     model.n_samples_ = model_dict['n_samples_']
     model.squared_sum_ = model_dict['squared_sum_']
-    model.centroid_ = np.array(model_dict['centroid_'])
-    model.linear_sum_ = np.array(model_dict['linear_sum_'])
+    model.centroid_ = decode_array(model_dict['centroid_'])
+    model.linear_sum_ = decode_array(model_dict['linear_sum_'])
     model.sq_norm_ = model_dict['sq_norm_']
     model.child_ = model_dict['child_']
 
@@ -314,11 +309,11 @@ def serialize_birch(model):
         'meta': 'birch',
         'root_': mem(model.root_),
         'dummy_leaf_': mem(model.dummy_leaf_),
-        'subcluster_centers_': model.subcluster_centers_.tolist(),
+        'subcluster_centers_': encode_array(model.subcluster_centers_),
         '_n_features_out': model._n_features_out,
-        '_subcluster_norms': model._subcluster_norms.tolist(),
-        'subcluster_labels_': model.subcluster_labels_.tolist(),
-        'labels_': model.labels_.tolist(),
+        '_subcluster_norms': encode_array(model._subcluster_norms),
+        'subcluster_labels_': encode_array(model.subcluster_labels_),
+        'labels_': encode_array(model.labels_),
         'n_features_in_': model.n_features_in_,
         'params': model.get_params(),
         'nodes': nodes,
@@ -335,11 +330,11 @@ def serialize_birch(model):
 def deserialize_birch(model_dict):
     model = Birch(**model_dict['params'])
 
-    model.subcluster_centers_ = np.array(model_dict['subcluster_centers_'])
+    model.subcluster_centers_ = decode_array(model_dict['subcluster_centers_'])
     model._n_features_out = model_dict['_n_features_out']
-    model._subcluster_norms = np.array(model_dict['_subcluster_norms'])
-    model.subcluster_labels_ = np.array(model_dict['subcluster_labels_'])
-    model.labels_ = np.array(model_dict['labels_'])
+    model._subcluster_norms = decode_array(model_dict['_subcluster_norms'])
+    model.subcluster_labels_ = decode_array(model_dict['subcluster_labels_'])
+    model.labels_ = decode_array(model_dict['labels_'])
     model.n_features_in_ = model_dict['n_features_in_']
 
     # Deserialize _CFNodes and _CFSubclusters
@@ -379,16 +374,16 @@ def deserialize_birch(model_dict):
 def serialize_dbscan(model):
     serialized_model = {
         'meta': 'dbscan',
-        'components_': model.components_.tolist(),
-        'core_sample_indices_': model.core_sample_indices_.tolist(),
-        'labels_': model.labels_.tolist(),
+        'components_': encode_array(model.components_),
+        'core_sample_indices_': encode_array(model.core_sample_indices_),
+        'labels_': encode_array(model.labels_),
         'n_features_in_': model.n_features_in_,
         '_estimator_type': model._estimator_type,
         'params': model.get_params()
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -396,14 +391,14 @@ def serialize_dbscan(model):
 def deserialize_dbscan(model_dict):
     model = DBSCAN(**model_dict['params'])
 
-    model.components_ = np.array(model_dict['components_'])
-    model.labels_ = np.array(model_dict['labels_'])
-    model.core_sample_indices_ = model_dict['core_sample_indices_']
+    model.components_ = decode_array(model_dict['components_'])
+    model.labels_ = decode_array(model_dict['labels_'])
+    model.core_sample_indices_ = decode_array(model_dict['core_sample_indices_'])
     model.n_features_in_ = model_dict['n_features_in_']
     model._estimator_type = model_dict['_estimator_type']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -411,18 +406,18 @@ def deserialize_dbscan(model_dict):
 def serialize_optics(model):
     serialized_model = {
         'meta': 'optics',
-        'labels_': model.labels_.tolist(),
-        'reachability_': model.reachability_.tolist(),
-        'ordering_': model.ordering_.tolist(),
-        'core_distances_': model.core_distances_.tolist(),
-        'predecessor_': model.predecessor_.tolist(),
-        'cluster_hierarchy_': model.cluster_hierarchy_.tolist(),
+        'labels_': encode_array(model.labels_),
+        'reachability_': encode_array(model.reachability_),
+        'ordering_': encode_array(model.ordering_),
+        'core_distances_': encode_array(model.core_distances_),
+        'predecessor_': encode_array(model.predecessor_),
+        'cluster_hierarchy_': encode_array(model.cluster_hierarchy_),
         'n_features_in_': model.n_features_in_,
         'params': model.get_params()
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -430,16 +425,16 @@ def serialize_optics(model):
 def deserialize_optics(model_dict):
     model = OPTICS(**model_dict['params'])
 
-    model.labels_ = np.array(model_dict['labels_'])
-    model.reachability_ = np.array(model_dict['reachability_'])
-    model.ordering_ = np.array(model_dict['ordering_'])
-    model.core_distances_ = np.array(model_dict['core_distances_'])
-    model.predecessor_ = np.array(model_dict['predecessor_'])
-    model.cluster_hierarchy_ = np.array(model_dict['cluster_hierarchy_'])
+    model.labels_ = decode_array(model_dict['labels_'])
+    model.reachability_ = decode_array(model_dict['reachability_'])
+    model.ordering_ = decode_array(model_dict['ordering_'])
+    model.core_distances_ = decode_array(model_dict['core_distances_'])
+    model.predecessor_ = decode_array(model_dict['predecessor_'])
+    model.cluster_hierarchy_ = decode_array(model_dict['cluster_hierarchy_'])
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -447,14 +442,14 @@ def deserialize_optics(model_dict):
 def serialize_spectral_clustering(model):
     serialized_model = {
         'meta': 'spectral-clustering',
-        'affinity_matrix_': model.affinity_matrix_.tolist(),
-        'labels_': model.labels_.tolist(),
+        'affinity_matrix_': encode_array(model.affinity_matrix_),
+        'labels_': encode_array(model.labels_),
         'n_features_in_': model.n_features_in_,
         'params': model.get_params()
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -462,12 +457,12 @@ def serialize_spectral_clustering(model):
 def deserialize_spectral_clustering(model_dict):
     model = SpectralClustering(**model_dict['params'])
 
-    model.affinity_matrix_ = np.array(model_dict['affinity_matrix_'])
-    model.labels_ = np.array(model_dict['labels_'])
+    model.affinity_matrix_ = decode_array(model_dict['affinity_matrix_'])
+    model.labels_ = decode_array(model_dict['labels_'])
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -476,10 +471,10 @@ def serialize_feature_agglomeration(model):
     serialized_model = {
         'meta': 'feature-agglomeration',
         'n_clusters_': model.n_clusters_,
-        'labels_': model.labels_.tolist(),
+        'labels_': encode_array(model.labels_),
         'n_leaves_': model.n_leaves_,
         'n_features_in_': model.n_features_in_,
-        'children_': model.children_.tolist(),
+        'children_': encode_array(model.children_),
         'pooling_func': (inspect.getmodule(params['pooling_func']).__name__,
                          params['pooling_func'].__name__),
         '_n_features_out': model._n_features_out,
@@ -488,9 +483,9 @@ def serialize_feature_agglomeration(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
     if 'distances_' in model.__dict__:
-        serialized_model['distances_'] = model.feature_names_in_.tolist()
+        serialized_model['distances_'] = encode_array(model.feature_names_in_)
     if '_metric' in model.__dict__:
         serialized_model['_metric'] = model._metric
 
@@ -502,17 +497,17 @@ def deserialize_feature_agglomeration(model_dict):
     model = FeatureAgglomeration(**params)
 
     model.n_clusters_ = model_dict['n_clusters_']
-    model.labels_ = np.array(model_dict['labels_'])
+    model.labels_ = decode_array(model_dict['labels_'])
     model.n_leaves_ = model_dict['n_leaves_']
     model.n_features_in_ = model_dict['n_features_in_']
-    model.children_ = np.array(model_dict['children_'])
+    model.children_ = decode_array(model_dict['children_'])
     model._n_features_out = model_dict['_n_features_out']
     model.n_connected_components_ = model_dict['n_connected_components_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
     if 'distances_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['distances_'])
+        model.feature_names_in_ = decode_array(model_dict['distances_'])
     if '_metric' in model_dict:
         model._metric = model_dict['_metric']
 
@@ -522,15 +517,15 @@ def deserialize_feature_agglomeration(model_dict):
 def serialize_meanshift(model):
     serialized_model = {
         'meta': 'meanshift',
-        'cluster_centers_': model.cluster_centers_.tolist(),
-        'labels_': model.labels_.tolist(),
+        'cluster_centers_': encode_array(model.cluster_centers_),
+        'labels_': encode_array(model.labels_),
         'n_iter_': model.n_iter_,
         'n_features_in_': model.n_features_in_,
         'params': model.get_params()
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -538,13 +533,13 @@ def serialize_meanshift(model):
 def deserialize_meanshift(model_dict):
     model = MeanShift(**model_dict['params'])
 
-    model.cluster_centers_ = np.array(model_dict['cluster_centers_'])
-    model.labels_ = np.array(model_dict['labels_'])
+    model.cluster_centers_ = decode_array(model_dict['cluster_centers_'])
+    model.labels_ = decode_array(model_dict['labels_'])
     model.n_iter_ = model_dict['n_iter_']
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -552,17 +547,17 @@ def deserialize_meanshift(model_dict):
 def serialize_spectral_biclustering(model):
     serialized_model = {
         'meta': 'spectral-biclustering',
-        'rows_': model.rows_.tolist(),
-        'columns_': model.columns_.tolist(),
-        'row_labels_': model.row_labels_.tolist(),
+        'rows_': encode_array(model.rows_),
+        'columns_': encode_array(model.columns_),
+        'row_labels_': encode_array(model.row_labels_),
         'n_features_in_': model.n_features_in_,
         'params': model.get_params()
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
     if 'columns_labels_' in model.__dict__:
-        serialized_model['columns_labels_'] = model.columns_labels_.tolist()
+        serialized_model['columns_labels_'] = encode_array(model.columns_labels_)
 
     return serialized_model
 
@@ -570,15 +565,15 @@ def serialize_spectral_biclustering(model):
 def deserialize_spectral_biclustering(model_dict):
     model = SpectralBiclustering(**model_dict['params'])
 
-    model.rows_ = np.array(model_dict['rows_'])
-    model.columns_ = np.array(model_dict['columns_'])
-    model.row_labels_ = np.array(model_dict['row_labels_'])
+    model.rows_ = decode_array(model_dict['rows_'])
+    model.columns_ = decode_array(model_dict['columns_'])
+    model.row_labels_ = decode_array(model_dict['row_labels_'])
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
     if 'columns_labels_' in model_dict.keys():
-        model.columns_labels_ = np.array(model_dict['columns_labels_'])
+        model.columns_labels_ = decode_array(model_dict['columns_labels_'])
 
     return model
 
@@ -586,17 +581,17 @@ def deserialize_spectral_biclustering(model_dict):
 def serialize_spectral_coclustering(model):
     serialized_model = {
         'meta': 'spectral-coclustering',
-        'rows_': model.rows_.tolist(),
-        'columns_': model.columns_.tolist(),
-        'row_labels_': model.row_labels_.tolist(),
+        'rows_': encode_array(model.rows_),
+        'columns_': encode_array(model.columns_),
+        'row_labels_': encode_array(model.row_labels_),
         'n_features_in_': model.n_features_in_,
         'params': model.get_params()
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
     if 'columns_labels_' in model.__dict__:
-        serialized_model['columns_labels_'] = model.columns_labels_.tolist()
+        serialized_model['columns_labels_'] = encode_array(model.columns_labels_)
 
     return serialized_model
 
@@ -604,15 +599,15 @@ def serialize_spectral_coclustering(model):
 def deserialize_spectral_coclustering(model_dict):
     model = SpectralCoclustering(**model_dict['params'])
 
-    model.rows_ = np.array(model_dict['rows_'])
-    model.columns_ = np.array(model_dict['columns_'])
-    model.row_labels_ = np.array(model_dict['row_labels_'])
+    model.rows_ = decode_array(model_dict['rows_'])
+    model.columns_ = decode_array(model_dict['columns_'])
+    model.row_labels_ = decode_array(model_dict['row_labels_'])
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
     if 'columns_labels_' in model_dict.keys():
-        model.columns_labels_ = np.array(model_dict['columns_labels_'])
+        model.columns_labels_ = decode_array(model_dict['columns_labels_'])
 
     return model
 
@@ -625,8 +620,8 @@ if 'KModes' in __optionals__:
 
         serialized_model = {
             'meta': 'kmodes',
-            '_enc_cluster_centroids': model._enc_cluster_centroids.astype(int).tolist(),
-            'labels_': model.labels_.tolist(),
+            '_enc_cluster_centroids': encode_array(model._enc_cluster_centroids),
+            'labels_': encode_array(model.labels_),
             'cost_': float(model.cost_),
             'n_iter_': model.n_iter_,
             'epoch_costs_': [float(x) for x in model.epoch_costs_],
@@ -638,14 +633,16 @@ if 'KModes' in __optionals__:
 
 
     def deserialize_kmodes(model_dict):
+        from kmodes.kmodes import KModes
+
         params = model_dict['params']
         params['cat_dissim'] = getattr(importlib.import_module(params['cat_dissim'][0]),
                                        params['cat_dissim'][1])
 
         model = KModes(**params)
 
-        model._enc_cluster_centroids = np.array(model_dict['_enc_cluster_centroids'])
-        model.labels_ = np.array(model_dict['labels_'])
+        model._enc_cluster_centroids = decode_array(model_dict['_enc_cluster_centroids'])
+        model.labels_ = decode_array(model_dict['labels_'])
         model.cost_ = model_dict['cost_']
         model.n_iter_ = model_dict['n_iter_']
         model.epoch_costs_ = model_dict['epoch_costs_']
@@ -667,8 +664,8 @@ if 'KPrototypes' in __optionals__:
 
         serialized_model = {
             'meta': 'kprototypes',
-            '_enc_cluster_centroids': np.array(model._enc_cluster_centroids).astype(float).tolist(),
-            'labels_': model.labels_.tolist(),
+            '_enc_cluster_centroids': encode_array(np.array(model._enc_cluster_centroids).astype(float)),
+            'labels_': encode_array(model.labels_),
             'cost_': float(model.cost_),
             'n_iter_': model.n_iter_,
             'epoch_costs_': [float(x) for x in model.epoch_costs_],
@@ -680,6 +677,8 @@ if 'KPrototypes' in __optionals__:
 
 
     def deserialize_kprototypes(model_dict):
+        from kmodes.kprototypes import KPrototypes
+
         params = model_dict['params']
         params['cat_dissim'] = getattr(importlib.import_module(params['cat_dissim'][0]),
                                        params['cat_dissim'][1])
@@ -689,8 +688,8 @@ if 'KPrototypes' in __optionals__:
 
         model = KPrototypes(**params)
 
-        model._enc_cluster_centroids = np.array(model_dict['_enc_cluster_centroids'])
-        model.labels_ = np.array(model_dict['labels_'])
+        model._enc_cluster_centroids = decode_array(model_dict['_enc_cluster_centroids'])
+        model.labels_ = decode_array(model_dict['labels_'])
         model.cost_ = model_dict['cost_']
         model.n_iter_ = model_dict['n_iter_']
         model.epoch_costs_ = model_dict['epoch_costs_']
@@ -705,8 +704,8 @@ def serialize_bisecting_tree(model):
 
     serialized_model = {
         'meta': 'bisecting-tree',
-        'center': model.center.tolist() if isinstance(model.center, np.ndarray) else model.center,
-        'indices': model.indices.tolist() if isinstance(model.indices, np.ndarray) else model.indices,
+        'center': encode_array(model.center) if isinstance(model.center, np.ndarray) else model.center,
+        'indices': encode_array(model.indices) if isinstance(model.indices, np.ndarray) else model.indices,
         'score': model.score,
         'left': serialize_bisecting_tree(model.left),
         'right': serialize_bisecting_tree(model.right),
@@ -722,8 +721,8 @@ def deserialize_bisecting_tree(model_dict):
     if model_dict is None:
         return None
 
-    model = _BisectingTree(np.array(model_dict['center']) if isinstance(model_dict['center'], list) else model_dict['center'],
-                           np.array(model_dict['indices']) if isinstance(model_dict['indices'], list) else model_dict['indices'],
+    model = _BisectingTree(decode_array(model_dict['center']) if is_serialized_array(model_dict['center']) else model_dict['center'],
+                           decode_array(model_dict['indices']) if is_serialized_array(model_dict['indices']) else model_dict['indices'],
                            model_dict['score'])
 
     model.left = deserialize_bisecting_tree(model_dict['left'])
@@ -738,15 +737,15 @@ def deserialize_bisecting_tree(model_dict):
 def serialize_bisecting_kmeans(model):
     serialized_model = {
         'meta': 'bisecting-kmeans',
-        'cluster_centers_': model.cluster_centers_.tolist(),
-        'labels_': model.labels_.tolist(),
+        'cluster_centers_': encode_array(model.cluster_centers_),
+        'labels_': encode_array(model.labels_),
         'inertia_': model.inertia_,
         '_tol': float(model._tol),
         '_n_init': model._n_init,
         '_n_threads': model._n_threads,
         'n_features_in_': model.n_features_in_,
         '_n_features_out': model._n_features_out,
-        '_X_mean': model._X_mean.tolist(),
+        '_X_mean': encode_array(model._X_mean),
         '_bisecting_tree': serialize_bisecting_tree(model._bisecting_tree),
         '_kmeans_single': (inspect.getmodule(model._kmeans_single).__name__,
                            model._kmeans_single.__name__),
@@ -755,7 +754,7 @@ def serialize_bisecting_kmeans(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
     serialized_model['params']['n_clusters'] = int(serialized_model['params']['n_clusters'])
 
     return serialized_model
@@ -763,22 +762,22 @@ def serialize_bisecting_kmeans(model):
 
 def deserialize_bisecting_kmeans(model_dict):
     model = BisectingKMeans(**model_dict['params'])
-    model.cluster_centers_ = np.array(model_dict['cluster_centers_'])
-    model.labels_ = np.array(model_dict['labels_'])
+    model.cluster_centers_ = decode_array(model_dict['cluster_centers_'])
+    model.labels_ = decode_array(model_dict['labels_'])
     model.inertia_ = model_dict['inertia_']
     model._tol = model_dict['_tol']
     model._n_init = model_dict['_n_init']
     model._n_threads = model_dict['_n_threads']
     model.n_features_in_ = model_dict['n_features_in_']
     model._n_features_out = model_dict['_n_features_out']
-    model._X_mean = np.array(model_dict['_X_mean'])
+    model._X_mean = decode_array(model_dict['_X_mean'])
     model._bisecting_tree = deserialize_bisecting_tree(model_dict['_bisecting_tree'])
     model._kmeans_single = getattr(importlib.import_module(model_dict['_kmeans_single'][0]),
                                    model_dict['_kmeans_single'][1])
     model._random_state = deserialize_random_state(model_dict['_random_state'])
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -788,21 +787,21 @@ if 'HDBSCAN' in __optionals__:
         serialized_model = {
             'meta': 'hdbscan',
             '_metric_kwargs': model._metric_kwargs,
-            '_condensed_tree': model._condensed_tree.tolist(),
+            '_condensed_tree': encode_array(model._condensed_tree),
             '_condensed_tree_dtype': f"np.dtype({str(model._condensed_tree.dtype)})",
-            '_single_linkage_tree': model._single_linkage_tree.tolist(),
-            '_raw_data': model._raw_data.tolist(),
+            '_single_linkage_tree': encode_array(model._single_linkage_tree),
+            '_raw_data': encode_array(model._raw_data),
             '_all_finite': bool(model._all_finite),
-            'labels_': model.labels_.tolist(),
-            'probabilities_': model.probabilities_.tolist(),
-            'cluster_persistence_': model.cluster_persistence_.tolist(),
+            'labels_': encode_array(model.labels_),
+            'probabilities_': encode_array(model.probabilities_),
+            'cluster_persistence_': encode_array(model.cluster_persistence_),
             'params': model.get_params()
         }
 
         if 'feature_names_in_' in model.__dict__:
-            serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+            serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
         if '_min_spanning_tree' in model.__dict__ and model._min_spanning_tree is not None:
-            serialized_model['_min_spanning_tree'] = model._min_spanning_tree.tolist()
+            serialized_model['_min_spanning_tree'] = encode_array(model._min_spanning_tree)
         else:
             serialized_model['_min_spanning_tree'] = model._min_spanning_tree
         if '_outlier_scores' in model.__dict__:
@@ -819,6 +818,7 @@ if 'HDBSCAN' in __optionals__:
 
 
     def deserialize_hdbscan(model_dict):
+        from hdbscan import HDBSCAN
 
         if model_dict['params']['memory'] is not None:
             model_dict['params']['memory'] = deserialize_memory(model_dict['params']['memory'])
@@ -826,24 +826,24 @@ if 'HDBSCAN' in __optionals__:
         model = HDBSCAN(**model_dict['params'])
 
         model._metric_kwargs = model_dict['_metric_kwargs']
-        model._condensed_tree = np.array(list(map(tuple, model_dict['_condensed_tree'])),
-                                         dtype=eval(model_dict['_condensed_tree_dtype']))
-        model._single_linkage_tree = np.array(model_dict['_single_linkage_tree'])
-        model._raw_data = np.array(model_dict['_raw_data'])
+        model._condensed_tree = decode_array(model_dict['_condensed_tree'],
+                                             dtype=eval(model_dict['_condensed_tree_dtype']))
+        model._single_linkage_tree = decode_array(model_dict['_single_linkage_tree'])
+        model._raw_data = decode_array(model_dict['_raw_data'])
         model._all_finite = model_dict['_all_finite']
-        model.labels_ = np.array(model_dict['labels_'])
-        model.probabilities_ = np.array(model_dict['probabilities_'])
-        model.cluster_persistence_ = np.array(model_dict['cluster_persistence_'])
+        model.labels_ = decode_array(model_dict['labels_'])
+        model.probabilities_ = decode_array(model_dict['probabilities_'])
+        model.cluster_persistence_ = decode_array(model_dict['cluster_persistence_'])
 
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if '_min_spanning_tree' in model_dict:
-            model._min_spanning_tree = np.array(model_dict['_min_spanning_tree'])
+            model._min_spanning_tree = decode_array(model_dict['_min_spanning_tree'])
         if '_outlier_scores' in model_dict:
-            model._outlier_scores = np.array(model_dict['_outlier_scores'])
+            model._outlier_scores = decode_array(model_dict['_outlier_scores'])
         if '_prediction_data' in model_dict:
-            model._prediction_data = np.array(model_dict['_prediction_data'])
+            model._prediction_data = decode_array(model_dict['_prediction_data'])
         if '_relative_validity' in model_dict:
-            model._relative_validity = np.array(model_dict['_relative_validity'])
+            model._relative_validity = decode_array(model_dict['_relative_validity'])
 
         return model
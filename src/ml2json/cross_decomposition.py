@@ -4,25 +4,27 @@ import numpy as np
 from sklearn.cross_decomposition import (CCA, PLSCanonical,
                                          PLSRegression, PLSSVD)
 
+from .utils.arrays import encode_array, decode_array
+
 
 def serialize_cca(model):
     serialized_model = {
         'meta': 'cca',
-        'x_weights_': model.x_weights_.tolist(),
-        'y_weights_': model.y_weights_.tolist(),
-        'x_loadings_': model.x_loadings_.tolist(),
-        'y_loadings_': model.y_loadings_.tolist(),
-        'x_rotations_': model.x_rotations_.tolist(),
-        'y_rotations_': model.y_rotations_.tolist(),
-        'intercept_': model.intercept_.tolist(),
+        'x_weights_': encode_array(model.x_weights_),
+        'y_weights_': encode_array(model.y_weights_),
+        'x_loadings_': encode_array(model.x_loadings_),
+        'y_loadings_': encode_array(model.y_loadings_),
+        'x_rotations_': encode_array(model.x_rotations_),
+        'y_rotations_': encode_array(model.y_rotations_),
+        'intercept_': encode_array(model.intercept_),
         'n_iter_': model.n_iter_,
         'n_features_in_': model.n_features_in_,
-        '_x_mean': model._x_mean.tolist(),
-        '_y_mean': model._y_mean.tolist(),
-        '_x_std': model._x_std.tolist(),
-        '_y_std': model._y_std.tolist(),
-        '_x_scores': model._x_scores.tolist(),
-        '_y_scores': model._y_scores.tolist(),
+        '_x_mean': encode_array(model._x_mean),
+        '_y_mean': encode_array(model._y_mean),
+        '_x_std': encode_array(model._x_std),
+        '_y_std': encode_array(model._y_std),
+        '_x_scores': encode_array(model._x_scores),
+        '_y_scores': encode_array(model._y_scores),
         '_norm_y_weights': model._norm_y_weights,
         '_n_features_out': model._n_features_out,
         'deflation_mode': model.deflation_mode,
@@ -32,12 +34,12 @@ def serialize_cca(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
     
     if '_coef_' in model.__dict__:
-        serialized_model['_coef_'] = model._coef_.tolist()
+        serialized_model['_coef_'] = encode_array(model._coef_)
     else:
-        serialized_model['coef_'] = model.coef_.tolist()
+        serialized_model['coef_'] = encode_array(model.coef_)
         
     if "_predict_1d" in model.__dict__:
         serialized_model["_predict_1d"] = model._predict_1d
@@ -48,22 +50,22 @@ def serialize_cca(model):
 def deserialize_cca(model_dict):
     model = CCA(**model_dict['params'])
 
-    model.x_weights_ = np.array(model_dict['x_weights_'])
-    model.y_weights_ = np.array(model_dict['y_weights_'])
-    model.x_loadings_ = np.array(model_dict['x_loadings_'])
-    model.y_loadings_ = np.array(model_dict['y_loadings_'])
-    model.x_rotations_ = np.array(model_dict['x_rotations_'])
-    model.y_rotations_ = np.array(model_dict['y_rotations_'])
-    model.intercept_ = np.array(model_dict['intercept_'])
+    model.x_weights_ = decode_array(model_dict['x_weights_'])
+    model.y_weights_ = decode_array(model_dict['y_weights_'])
+    model.x_loadings_ = decode_array(model_dict['x_loadings_'])
+    model.y_loadings_ = decode_array(model_dict['y_loadings_'])
+    model.x_rotations_ = decode_array(model_dict['x_rotations_'])
+    model.y_rotations_ = decode_array(model_dict['y_rotations_'])
+    model.intercept_ = decode_array(model_dict['intercept_'])
     model.n_iter_ = model_dict['n_iter_']
     model.n_features_in_ = model_dict['n_features_in_']
 
-    model._x_mean = np.array(model_dict['_x_mean'])
-    model._y_mean = np.array(model_dict['_y_mean'])
-    model._x_std = np.array(model_dict['_x_std'])
-    model._y_std = np.array(model_dict['_y_std'])
-    model._x_scores = np.array(model_dict['_x_scores'])
-    model._y_scores = np.array(model_dict['_y_scores'])
+    model._x_mean = decode_array(model_dict['_x_mean'])
+    model._y_mean = decode_array(model_dict['_y_mean'])
+    model._x_std = decode_array(model_dict['_x_std'])
+    model._y_std = decode_array(model_dict['_y_std'])
+    model._x_scores = decode_array(model_dict['_x_scores'])
+    model._y_scores = decode_array(model_dict['_y_scores'])
     model._norm_y_weights = model_dict['_norm_y_weights']
     model._n_features_out = model_dict['_n_features_out']
     model.deflation_mode = model_dict['deflation_mode']
@@ -71,12 +73,12 @@ def deserialize_cca(model_dict):
     model.algorithm = model_dict['algorithm']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     if '_coef_' in model_dict.keys():
-        model._coef_ = np.array(model_dict['_coef_'])
+        model._coef_ = decode_array(model_dict['_coef_'])
     else:
-        model.coef_ = np.array(model_dict['coef_'])
+        model.coef_ = decode_array(model_dict['coef_'])
        
     if "_predict_1d" in model_dict.keys():
         model._predict_1d = model_dict["_predict_1d"]
@@ -87,21 +89,21 @@ def deserialize_cca(model_dict):
 def serialize_pls_canonical(model):
     serialized_model = {
         'meta': 'pls-canonical',
-        'x_weights_': model.x_weights_.tolist(),
-        'y_weights_': model.y_weights_.tolist(),
-        'x_loadings_': model.x_loadings_.tolist(),
-        'y_loadings_': model.y_loadings_.tolist(),
-        'x_rotations_': model.x_rotations_.tolist(),
-        'y_rotations_': model.y_rotations_.tolist(),
-        'intercept_': model.intercept_.tolist(),
+        'x_weights_': encode_array(model.x_weights_),
+        'y_weights_': encode_array(model.y_weights_),
+        'x_loadings_': encode_array(model.x_loadings_),
+        'y_loadings_': encode_array(model.y_loadings_),
+        'x_rotations_': encode_array(model.x_rotations_),
+        'y_rotations_': encode_array(model.y_rotations_),
+        'intercept_': encode_array(model.intercept_),
         'n_iter_': model.n_iter_,
         'n_features_in_': model.n_features_in_,
-        '_x_mean': model._x_mean.tolist(),
-        '_y_mean': model._y_mean.tolist(),
-        '_x_std': model._x_std.tolist(),
-        '_y_std': model._y_std.tolist(),
-        '_x_scores': model._x_scores.tolist(),
-        '_y_scores': model._y_scores.tolist(),
+        '_x_mean': encode_array(model._x_mean),
+        '_y_mean': encode_array(model._y_mean),
+        '_x_std': encode_array(model._x_std),
+        '_y_std': encode_array(model._y_std),
+        '_x_scores': encode_array(model._x_scores),
+        '_y_scores': encode_array(model._y_scores),
         '_norm_y_weights': model._norm_y_weights,
         '_n_features_out': model._n_features_out,
         'deflation_mode': model.deflation_mode,
@@ -110,12 +112,12 @@ def serialize_pls_canonical(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
     
     if '_coef_' in model.__dict__:
-        serialized_model['_coef_'] = model._coef_.tolist()
+        serialized_model['_coef_'] = encode_array(model._coef_)
     else:
-        serialized_model['coef_'] = model.coef_.tolist()
+        serialized_model['coef_'] = encode_array(model.coef_)
         
     if "_predict_1d" in model.__dict__:
         serialized_model["_predict_1d"] = model._predict_1d
@@ -126,34 +128,34 @@ def serialize_pls_canonical(model):
 def deserialize_pls_canonical(model_dict):
     model = PLSCanonical(**model_dict['params'])
 
-    model.x_weights_ = np.array(model_dict['x_weights_'])
-    model.y_weights_ = np.array(model_dict['y_weights_'])
-    model.x_loadings_ = np.array(model_dict['x_loadings_'])
-    model.y_loadings_ = np.array(model_dict['y_loadings_'])
-    model.x_rotations_ = np.array(model_dict['x_rotations_'])
-    model.y_rotations_ = np.array(model_dict['y_rotations_'])
-    model.intercept_ = np.array(model_dict['intercept_'])
+    model.x_weights_ = decode_array(model_dict['x_weights_'])
+    model.y_weights_ = decode_array(model_dict['y_weights_'])
+    model.x_loadings_ = decode_array(model_dict['x_loadings_'])
+    model.y_loadings_ = decode_array(model_dict['y_loadings_'])
+    model.x_rotations_ = decode_array(model_dict['x_rotations_'])
+    model.y_rotations_ = decode_array(model_dict['y_rotations_'])
+    model.intercept_ = decode_array(model_dict['intercept_'])
     model.n_iter_ = model_dict['n_iter_']
     model.n_features_in_ = model_dict['n_features_in_']
 
-    model._x_mean = np.array(model_dict['_x_mean'])
-    model._y_mean = np.array(model_dict['_y_mean'])
-    model._x_std = np.array(model_dict['_x_std'])
-    model._y_std = np.array(model_dict['_y_std'])
-    model._x_scores = np.array(model_dict['_x_scores'])
-    model._y_scores = np.array(model_dict['_y_scores'])
+    model._x_mean = decode_array(model_dict['_x_mean'])
+    model._y_mean = decode_array(model_dict['_y_mean'])
+    model._x_std = decode_array(model_dict['_x_std'])
+    model._y_std = decode_array(model_dict['_y_std'])
+    model._x_scores = decode_array(model_dict['_x_scores'])
+    model._y_scores = decode_array(model_dict['_y_scores'])
     model._norm_y_weights = model_dict['_norm_y_weights']
     model._n_features_out = model_dict['_n_features_out']
     model.deflation_mode = model_dict['deflation_mode']
     model.mode = model_dict['mode']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
     
     if '_coef_' in model_dict.keys():
-        model._coef_ = np.array(model_dict['_coef_'])
+        model._coef_ = decode_array(model_dict['_coef_'])
     else:
-        model.coef_ = np.array(model_dict['coef_'])
+        model.coef_ = decode_array(model_dict['coef_'])
         
     if "_predict_1d" in model_dict.keys():
         model._predict_1d = model_dict["_predict_1d"]
@@ -164,23 +166,23 @@ def deserialize_pls_canonical(model_dict):
 def serialize_pls_regression(model):
     serialized_model = {
         'meta': 'pls-regression',
-        'x_weights_': model.x_weights_.tolist(),
-        'y_weights_': model.y_weights_.tolist(),
-        'x_loadings_': model.x_loadings_.tolist(),
-        'y_loadings_': model.y_loadings_.tolist(),
-        'x_rotations_': model.x_rotations_.tolist(),
-        'y_rotations_': model.y_rotations_.tolist(),
-        'intercept_': model.intercept_.tolist(),
+        'x_weights_': encode_array(model.x_weights_),
+        'y_weights_': encode_array(model.y_weights_),
+        'x_loadings_': encode_array(model.x_loadings_),
+        'y_loadings_': encode_array(model.y_loadings_),
+        'x_rotations_': encode_array(model.x_rotations_),
+        'y_rotations_': encode_array(model.y_rotations_),
+        'intercept_': encode_array(model.intercept_),
         'n_iter_': model.n_iter_,
         'n_features_in_': model.n_features_in_,
-        '_x_mean': model._x_mean.tolist(),
-        '_y_mean': model._y_mean.tolist(),
-        '_x_std': model._x_std.tolist(),
-        '_y_std': model._y_std.tolist(),
-        'x_scores_': model.x_scores_.tolist(),
-        'y_scores_': model.y_scores_.tolist(),
-        '_x_scores': model._x_scores.tolist(),
-        '_y_scores': model._y_scores.tolist(),
+        '_x_mean': encode_array(model._x_mean),
+        '_y_mean': encode_array(model._y_mean),
+        '_x_std': encode_array(model._x_std),
+        '_y_std': encode_array(model._y_std),
+        'x_scores_': encode_array(model.x_scores_),
+        'y_scores_': encode_array(model.y_scores_),
+        '_x_scores': encode_array(model._x_scores),
+        '_y_scores': encode_array(model._y_scores),
         '_norm_y_weights': model._norm_y_weights,
         '_n_features_out': model._n_features_out,
         'deflation_mode': model.deflation_mode,
@@ -189,12 +191,12 @@ def serialize_pls_regression(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     if '_coef_' in model.__dict__:
-        serialized_model['_coef_'] = model._coef_.tolist()
+        serialized_model['_coef_'] = encode_array(model._coef_)
     else:
-        serialized_model['coef_'] = model.coef_.tolist()
+        serialized_model['coef_'] = encode_array(model.coef_)
         
     if "_predict_1d" in model.__dict__:
         serialized_model["_predict_1d"] = model._predict_1d
@@ -205,36 +207,36 @@ def serialize_pls_regression(model):
 def deserialize_pls_regression(model_dict):
     model = PLSRegression(**model_dict['params'])
 
-    model.x_weights_ = np.array(model_dict['x_weights_'])
-    model.y_weights_ = np.array(model_dict['y_weights_'])
-    model.x_loadings_ = np.array(model_dict['x_loadings_'])
-    model.y_loadings_ = np.array(model_dict['y_loadings_'])
-    model.x_rotations_ = np.array(model_dict['x_rotations_'])
-    model.y_rotations_ = np.array(model_dict['y_rotations_'])
-    model.intercept_ = np.array(model_dict['intercept_'])
+    model.x_weights_ = decode_array(model_dict['x_weights_'])
+    model.y_weights_ = decode_array(model_dict['y_weights_'])
+    model.x_loadings_ = decode_array(model_dict['x_loadings_'])
+    model.y_loadings_ = decode_array(model_dict['y_loadings_'])
+    model.x_rotations_ = decode_array(model_dict['x_rotations_'])
+    model.y_rotations_ = decode_array(model_dict['y_rotations_'])
+    model.intercept_ = decode_array(model_dict['intercept_'])
     model.n_iter_ = model_dict['n_iter_']
     model.n_features_in_ = model_dict['n_features_in_']
 
-    model._x_mean = np.array(model_dict['_x_mean'])
-    model._y_mean = np.array(model_dict['_y_mean'])
-    model._x_std = np.array(model_dict['_x_std'])
-    model._y_std = np.array(model_dict['_y_std'])
-    model.x_scores_ = np.array(model_dict['x_scores_'])
-    model.y_scores_ = np.array(model_dict['y_scores_'])
-    model._x_scores = np.array(model_dict['_x_scores'])
-    model._y_scores = np.array(model_dict['_y_scores'])
+    model._x_mean = decode_array(model_dict['_x_mean'])
+    model._y_mean = decode_array(model_dict['_y_mean'])
+    model._x_std = decode_array(model_dict['_x_std'])
+    model._y_std = decode_array(model_dict['_y_std'])
+    model.x_scores_ = decode_array(model_dict['x_scores_'])
+    model.y_scores_ = decode_array(model_dict['y_scores_'])
+    model._x_scores = decode_array(model_dict['_x_scores'])
+    model._y_scores = decode_array(model_dict['_y_scores'])
     model._norm_y_weights = model_dict['_norm_y_weights']
     model._n_features_out = model_dict['_n_features_out']
     model.deflation_mode = model_dict['deflation_mode']
     model.mode = model_dict['mode']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         
     if '_coef_' in model_dict.keys():
-        model._coef_ = np.array(model_dict['_coef_'])
+        model._coef_ = decode_array(model_dict['_coef_'])
     else:
-        model.coef_ = np.array(model_dict['coef_'])
+        model.coef_ = decode_array(model_dict['coef_'])
     
     if "_predict_1d" in model_dict.keys():
         model._predict_1d = model_dict["_predict_1d"]
@@ -245,19 +247,19 @@ def deserialize_pls_regression(model_dict):
 def serialize_pls_svd(model):
     serialized_model = {
         'meta': 'pls-svd',
-        'x_weights_': model.x_weights_.tolist(),
-        'y_weights_': model.y_weights_.tolist(),
-        '_x_mean': model._x_mean.tolist(),
-        '_y_mean': model._y_mean.tolist(),
-        '_x_std': model._x_std.tolist(),
-        '_y_std': model._y_std.tolist(),
+        'x_weights_': encode_array(model.x_weights_),
+        'y_weights_': encode_array(model.y_weights_),
+        '_x_mean': encode_array(model._x_mean),
+        '_y_mean': encode_array(model._y_mean),
+        '_x_std': encode_array(model._x_std),
+        '_y_std': encode_array(model._y_std),
         'n_features_in_': model.n_features_in_,
         '_n_features_out': model._n_features_out,
         'params': model.get_params()
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -265,16 +267,16 @@ def serialize_pls_svd(model):
 def deserialize_pls_svd(model_dict):
     model = PLSSVD(**model_dict['params'])
 
-    model.x_weights_ = np.array(model_dict['x_weights_'])
-    model.y_weights_ = np.array(model_dict['y_weights_'])
-    model._x_mean = np.array(model_dict['_x_mean'])
-    model._y_mean = np.array(model_dict['_y_mean'])
-    model._x_std = np.array(model_dict['_x_std'])
-    model._y_std = np.array(model_dict['_y_std'])
+    model.x_weights_ = decode_array(model_dict['x_weights_'])
+    model.y_weights_ = decode_array(model_dict['y_weights_'])
+    model._x_mean = decode_array(model_dict['_x_mean'])
+    model._y_mean = decode_array(model_dict['_y_mean'])
+    model._x_std = decode_array(model_dict['_x_std'])
+    model._y_std = decode_array(model_dict['_y_std'])
     model.n_features_in_ = model_dict['n_features_in_']
     model._n_features_out = model_dict['_n_features_out']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
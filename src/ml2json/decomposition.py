@@ -7,16 +7,17 @@ from sklearn.decomposition import (PCA, KernelPCA, DictionaryLearning, FactorAna
 
 from .preprocessing import serialize_kernel_centerer, deserialize_kernel_centerer
 from .utils.random_state import serialize_random_state, deserialize_random_state
+from .utils.arrays import encode_array, decode_array
 
 
 def serialize_pca(model):
     serialized_model = {
         'meta': 'pca',
-        'components_': model.components_.tolist(),
-        'explained_variance_': model.explained_variance_.tolist(),
-        'explained_variance_ratio_': model.explained_variance_ratio_.tolist(),
-        'singular_values_': model.singular_values_.tolist(),
-        'mean_': model.mean_.tolist(),
+        'components_': encode_array(model.components_),
+        'explained_variance_': encode_array(model.explained_variance_),
+        'explained_variance_ratio_': encode_array(model.explained_variance_ratio_),
+        'singular_values_': encode_array(model.singular_values_),
+        'mean_': encode_array(model.mean_),
         'n_components_': int(model.n_components_),
         'n_samples_': model.n_samples_,
         'noise_variance_': model.noise_variance_,
@@ -26,7 +27,7 @@ def serialize_pca(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
     if 'n_features_' in model.__dict__:
         serialized_model['n_features_'] = model.n_features_
 
@@ -36,11 +37,11 @@ def serialize_pca(model):
 def deserialize_pca(model_dict):
     model = PCA(**model_dict['params'])
 
-    model.components_ = np.array(model_dict['components_'])
-    model.explained_variance_ = np.array(model_dict['explained_variance_'])
-    model.explained_variance_ratio_ = np.array(model_dict['explained_variance_ratio_'])
-    model.singular_values_ = np.array(model_dict['singular_values_'])
-    model.mean_ = np.array(model_dict['mean_'])
+    model.components_ = decode_array(model_dict['components_'])
+    model.explained_variance_ = decode_array(model_dict['explained_variance_'])
+    model.explained_variance_ratio_ = decode_array(model_dict['explained_variance_ratio_'])
+    model.singular_values_ = decode_array(model_dict['singular_values_'])
+    model.mean_ = decode_array(model_dict['mean_'])
     model.n_components_ = model_dict['n_components_']
     model.n_samples_ = model_dict['n_samples_']
     model.n_features_in_ = model_dict['n_features_in_']
@@ -48,7 +49,7 @@ def deserialize_pca(model_dict):
     model._fit_svd_solver = model_dict['_fit_svd_solver']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
     if 'n_features_' in model_dict.keys():
         model.n_features_ = model_dict['n_features_']
 
@@ -58,16 +59,16 @@ def deserialize_pca(model_dict):
 def serialize_kernel_pca(model):
     serialized_model = {
         'meta': 'kernel-pca',
-        'eigenvalues_': model.eigenvalues_.tolist(),
-        'eigenvectors_': model.eigenvectors_.tolist(),
+        'eigenvalues_': encode_array(model.eigenvalues_),
+        'eigenvectors_': encode_array(model.eigenvectors_),
         'n_features_in_': model.n_features_in_,
-        'X_fit_': model.X_fit_.tolist(),
+        'X_fit_': encode_array(model.X_fit_),
         '_centerer': serialize_kernel_centerer(model._centerer),
         'params': model.get_params(),
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     if 'gamma_' in model.__dict__:
         serialized_model['gamma_'] = model.gamma_
@@ -78,14 +79,14 @@ def serialize_kernel_pca(model):
 def deserialize_kernel_pca(model_dict):
     model = KernelPCA(**model_dict['params'])
 
-    model.eigenvalues_ = np.array(model_dict['eigenvalues_'])
-    model.eigenvectors_ = np.array(model_dict['eigenvectors_'])
+    model.eigenvalues_ = decode_array(model_dict['eigenvalues_'])
+    model.eigenvectors_ = decode_array(model_dict['eigenvectors_'])
     model.n_features_in_ = model_dict['n_features_in_']
-    model.X_fit_ = np.array(model_dict['X_fit_'])
+    model.X_fit_ = decode_array(model_dict['X_fit_'])
     model._centerer = deserialize_kernel_centerer(model_dict['_centerer'])
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     if 'gamma_' in model_dict.keys():
         model.gamma_ = model_dict['gamma_']
@@ -96,7 +97,7 @@ def deserialize_kernel_pca(model_dict):
 def serialize_dictionary_learning(model):
     serialized_model = {
         'meta': 'dictionary-learning',
-        'components_': model.components_.tolist(),
+        'components_': encode_array(model.components_),
         'n_iter_': model.n_iter_,
         'error_': model.error_,
         'n_features_in_': model.n_features_in_,
@@ -104,7 +105,7 @@ def serialize_dictionary_learning(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -112,13 +113,13 @@ def serialize_dictionary_learning(model):
 def deserialize_dictionary_learning(model_dict):
     model = DictionaryLearning(**model_dict['params'])
 
-    model.components_ = np.array(model_dict['components_'])
+    model.components_ = decode_array(model_dict['components_'])
     model.n_iter_ = model_dict['n_iter_']
     model.error_ = model_dict['error_']
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -126,17 +127,17 @@ def deserialize_dictionary_learning(model_dict):
 def serialize_factor_analysis(model):
     serialized_model = {
         'meta': 'factor-analysis',
-        'components_': model.components_.tolist(),
+        'components_': encode_array(model.components_),
         'loglike_': model.loglike_,
-        'noise_variance_': model.noise_variance_.tolist(),
-        'mean_': model.mean_.tolist(),
+        'noise_variance_': encode_array(model.noise_variance_),
+        'mean_': encode_array(model.mean_),
         'n_iter_': model.n_iter_,
         'n_features_in_': model.n_features_in_,
         'params': model.get_params(),
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -144,15 +145,15 @@ def serialize_factor_analysis(model):
 def deserialize_factor_analysis(model_dict):
     model = FactorAnalysis(**model_dict['params'])
 
-    model.components_ = np.array(model_dict['components_'])
+    model.components_ = decode_array(model_dict['components_'])
     model.loglike_ = model_dict['loglike_']
-    model.noise_variance_ = np.array(model_dict['noise_variance_'])
-    model.mean_ = np.array(model_dict['mean_'])
+    model.noise_variance_ = decode_array(model_dict['noise_variance_'])
+    model.mean_ = decode_array(model_dict['mean_'])
     model.n_iter_ = model_dict['n_iter_']
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -160,17 +161,17 @@ def deserialize_factor_analysis(model_dict):
 def serialize_fast_ica(model):
     serialized_model = {
         'meta': 'fast-ica',
-        'components_': model.components_.tolist(),
-        'mixing_': model.mixing_.tolist(),
-        'whitening_': model.whitening_.tolist(),
-        'mean_': model.mean_.tolist(),
+        'components_': encode_array(model.components_),
+        'mixing_': encode_array(model.mixing_),
+        'whitening_': encode_array(model.whitening_),
+        'mean_': encode_array(model.mean_),
         'n_iter_': model.n_iter_,
         'n_features_in_': model.n_features_in_,
         'params': model.get_params(),
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
         
     if '_whiten' in model.__dict__:
         serialized_model['_whiten'] = model._whiten
@@ -183,15 +184,15 @@ def serialize_fast_ica(model):
 def deserialize_fast_ica(model_dict):
     model = FastICA(**model_dict['params'])
 
-    model.components_ = np.array(model_dict['components_'])
-    model.mixing_ = np.array(model_dict['mixing_'])
-    model.whitening_ = np.array(model_dict['whitening_'])
-    model.mean_ = np.array(model_dict['mean_'])
+    model.components_ = decode_array(model_dict['components_'])
+    model.mixing_ = decode_array(model_dict['mixing_'])
+    model.whitening_ = decode_array(model_dict['whitening_'])
+    model.mean_ = decode_array(model_dict['mean_'])
     model.n_iter_ = model_dict['n_iter_']
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     if '_whiten' in model_dict.keys():
         model._whiten = model_dict['_whiten']
@@ -204,12 +205,12 @@ def deserialize_fast_ica(model_dict):
 def serialize_incremental_pca(model):
     serialized_model = {
         'meta': 'incremental-pca',
-        'components_': model.components_.tolist(),
-        'explained_variance_': model.explained_variance_.tolist(),
-        'explained_variance_ratio_': model.explained_variance_ratio_.tolist(),
-        'singular_values_': model.singular_values_.tolist(),
-        'mean_': model.mean_.tolist(),
-        'var_': model.var_.tolist(),
+        'components_': encode_array(model.components_),
+        'explained_variance_': encode_array(model.explained_variance_),
+        'explained_variance_ratio_': encode_array(model.explained_variance_ratio_),
+        'singular_values_': encode_array(model.singular_values_),
+        'mean_': encode_array(model.mean_),
+        'var_': encode_array(model.var_),
         'noise_variance_': model.noise_variance_,
         'n_components_': model.n_components_,
         'n_samples_seen_': int(model.n_samples_seen_),
@@ -219,7 +220,7 @@ def serialize_incremental_pca(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -227,12 +228,12 @@ def serialize_incremental_pca(model):
 def deserialize_incremental_pca(model_dict):
     model = IncrementalPCA(**model_dict['params'])
 
-    model.components_ = np.array(model_dict['components_'])
-    model.explained_variance_ = np.array(model_dict['explained_variance_'])
-    model.explained_variance_ratio_ = np.array(model_dict['explained_variance_ratio_'])
-    model.singular_values_ = np.array(model_dict['singular_values_'])
-    model.mean_ = np.array(model_dict['mean_'])
-    model.var_ = np.array(model_dict['var_'])
+    model.components_ = decode_array(model_dict['components_'])
+    model.explained_variance_ = decode_array(model_dict['explained_variance_'])
+    model.explained_variance_ratio_ = decode_array(model_dict['explained_variance_ratio_'])
+    model.singular_values_ = decode_array(model_dict['singular_values_'])
+    model.mean_ = decode_array(model_dict['mean_'])
+    model.var_ = decode_array(model_dict['var_'])
     model.noise_variance_ = model_dict['noise_variance_']
     model.n_components_ = model_dict['n_components_']
     model.n_samples_seen_ = np.int32(model_dict['n_samples_seen_'])
@@ -240,7 +241,7 @@ def deserialize_incremental_pca(model_dict):
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -248,8 +249,8 @@ def deserialize_incremental_pca(model_dict):
 def serialize_minibatch_sparse_pca(model):
     serialized_model = {
         'meta': 'minibatch-sparse-pca',
-        'components_': model.components_.tolist(),
-        'mean_': model.mean_.tolist(),
+        'components_': encode_array(model.components_),
+        'mean_': encode_array(model.mean_),
         'n_components_': model.n_components_,
         'n_iter_': model.n_iter_,
         'n_features_in_': model.n_features_in_,
@@ -257,7 +258,7 @@ def serialize_minibatch_sparse_pca(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -265,14 +266,14 @@ def serialize_minibatch_sparse_pca(model):
 def deserialize_minibatch_sparse_pca(model_dict):
     model = MiniBatchSparsePCA(**model_dict['params'])
 
-    model.components_ = np.array(model_dict['components_'])
-    model.mean_ = np.array(model_dict['mean_'])
+    model.components_ = decode_array(model_dict['components_'])
+    model.mean_ = decode_array(model_dict['mean_'])
     model.n_components_ = model_dict['n_components_']
     model.n_iter_ = np.int32(model_dict['n_iter_'])
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -280,8 +281,8 @@ def deserialize_minibatch_sparse_pca(model_dict):
 def serialize_sparse_pca(model):
     serialized_model = {
         'meta': 'sparse-pca',
-        'components_': model.components_.tolist(),
-        'mean_': model.mean_.tolist(),
+        'components_': encode_array(model.components_),
+        'mean_': encode_array(model.mean_),
         'n_components_': model.n_components_,
         'n_iter_': model.n_iter_,
         'n_features_in_': model.n_features_in_,
@@ -291,9 +292,9 @@ def serialize_sparse_pca(model):
     if isinstance(model.error_, list):
         serialized_model['error_'] = [float(x) for x in model.error_]
     else:
-        serialized_model['error_'] = model.error_.tolist()
+        serialized_model['error_'] = encode_array(model.error_)
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -301,15 +302,15 @@ def serialize_sparse_pca(model):
 def deserialize_sparse_pca(model_dict):
     model = SparsePCA(**model_dict['params'])
 
-    model.components_ = np.array(model_dict['components_'])
-    model.error_ = np.array(model_dict['error_'])
-    model.mean_ = np.array(model_dict['mean_'])
+    model.components_ = decode_array(model_dict['components_'])
+    model.error_ = decode_array(model_dict['error_'])
+    model.mean_ = decode_array(model_dict['mean_'])
     model.n_components_ = model_dict['n_components_']
     model.n_iter_ = np.int32(model_dict['n_iter_'])
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -317,9 +318,9 @@ def deserialize_sparse_pca(model_dict):
 def serialize_latent_dirichlet_allocation(model):
     serialized_model = {
         'meta': 'latent-dirichlet-allocation',
-        'components_': model.components_.tolist(),
-        'exp_dirichlet_component_': model.exp_dirichlet_component_.tolist(),
-        'bound_': model.bound_.tolist(),
+        'components_': encode_array(model.components_),
+        'exp_dirichlet_component_': encode_array(model.exp_dirichlet_component_),
+        'bound_': encode_array(model.bound_),
         'n_iter_': model.n_iter_,
         'n_batch_iter_': model.n_batch_iter_,
         'doc_topic_prior_': model.doc_topic_prior_,
@@ -330,7 +331,7 @@ def serialize_latent_dirichlet_allocation(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -338,9 +339,9 @@ def serialize_latent_dirichlet_allocation(model):
 def deserialize_latent_dirichlet_allocation(model_dict):
     model = LatentDirichletAllocation(**model_dict['params'])
 
-    model.components_ = np.array(model_dict['components_'])
-    model.exp_dirichlet_component_ = np.array(model_dict['exp_dirichlet_component_'])
-    model.bound_ = np.array(model_dict['bound_'])
+    model.components_ = decode_array(model_dict['components_'])
+    model.exp_dirichlet_component_ = decode_array(model_dict['exp_dirichlet_component_'])
+    model.bound_ = decode_array(model_dict['bound_'])
     model.n_iter_ = model_dict['n_iter_']
     model.n_batch_iter_ = model_dict['n_batch_iter_']
     model.doc_topic_prior_ = model_dict['doc_topic_prior_']
@@ -349,7 +350,7 @@ def deserialize_latent_dirichlet_allocation(model_dict):
     model.random_state_ = deserialize_random_state(model_dict['random_state_'])
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -357,7 +358,7 @@ def deserialize_latent_dirichlet_allocation(model_dict):
 def serialize_nmf(model):
     serialized_model = {
         'meta': 'nmf',
-        'components_': model.components_.tolist(),
+        'components_': encode_array(model.components_),
         'n_components_': model.n_components_,
         'reconstruction_err_': model.reconstruction_err_,
         'n_iter_': model.n_iter_,
@@ -366,7 +367,7 @@ def serialize_nmf(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -374,14 +375,14 @@ def serialize_nmf(model):
 def deserialize_nmf(model_dict):
     model = NMF(**model_dict['params'])
 
-    model.components_ = np.array(model_dict['components_'])
+    model.components_ = decode_array(model_dict['components_'])
     model.n_components_ = model_dict['n_components_']
     model.reconstruction_err_ = model_dict['reconstruction_err_']
     model.n_iter_ = model_dict['n_iter_']
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -389,7 +390,7 @@ def deserialize_nmf(model_dict):
 def serialize_minibatch_nmf(model):
     serialized_model = {
         'meta': 'minibatch-nmf',
-        'components_': model.components_.tolist(),
+        'components_': encode_array(model.components_),
         'n_components_': model.n_components_,
         '_n_components': model._n_components,
         'reconstruction_err_': model.reconstruction_err_,
@@ -403,7 +404,7 @@ def serialize_minibatch_nmf(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
     if '_l1_reg_W' in model.__dict__:
         serialized_model['_l1_reg_W'] = model._l1_reg_W
     if '_l1_reg_H' in model.__dict__:
@@ -415,9 +416,9 @@ def serialize_minibatch_nmf(model):
     if '_batch_size' in model.__dict__:
         serialized_model['_batch_size'] = model._batch_size
     if '_components_denominator' in model.__dict__:
-        serialized_model['_components_denominator'] = model._components_denominator.tolist()
+        serialized_model['_components_denominator'] = encode_array(model._components_denominator)
     if '_components_numerator' in model.__dict__:
-        serialized_model['_components_numerator'] = model._components_numerator.tolist()
+        serialized_model['_components_numerator'] = encode_array(model._components_numerator)
     if '_ewa_cost' in model.__dict__:
         serialized_model['_ewa_cost'] = model._ewa_cost
     if '_ewa_cost_min' in model.__dict__:
@@ -434,7 +435,7 @@ def serialize_minibatch_nmf(model):
 def deserialize_minibatch_nmf(model_dict):
     model = MiniBatchNMF(**model_dict['params'])
 
-    model.components_ = np.array(model_dict['components_'])
+    model.components_ = decode_array(model_dict['components_'])
     model.n_components_ = model_dict['n_components_']
     model._n_components = model_dict['_n_components']
     model.reconstruction_err_ = model_dict['reconstruction_err_']
@@ -446,7 +447,7 @@ def deserialize_minibatch_nmf(model_dict):
     model.n_steps_ = model_dict['n_steps_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
     if '_l1_reg_W' in model_dict.keys():
         model._l1_reg_W = model_dict['_l1_reg_W']
     if '_l1_reg_H' in model_dict.keys():
@@ -459,9 +460,9 @@ def deserialize_minibatch_nmf(model_dict):
     if '_batch_size' in model_dict.keys():
         model._batch_size = model_dict['_batch_size']
     if '_components_denominator' in model_dict.keys():
-        model._components_denominator = np.array(model_dict['_components_denominator'])
+        model._components_denominator = decode_array(model_dict['_components_denominator'])
     if '_components_numerator' in model_dict.keys():
-         model._components_numerator = np.array(model_dict['_components_numerator'])
+         model._components_numerator = decode_array(model_dict['_components_numerator'])
     if '_ewa_cost' in model_dict.keys():
         model._ewa_cost = model_dict['_ewa_cost']
     if '_ewa_cost_min' in model_dict.keys():
@@ -477,7 +478,7 @@ def deserialize_minibatch_nmf(model_dict):
 def serialize_minibatch_dictionary_learning(model):
     serialized_model = {
         'meta': 'minibatch-dictionary-learning',
-        'components_': model.components_.tolist(),
+        'components_': encode_array(model.components_),
         'n_iter_': model.n_iter_,
         'n_steps_': model.n_steps_,
         'n_features_in_': model.n_features_in_,
@@ -485,7 +486,7 @@ def serialize_minibatch_dictionary_learning(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -493,13 +494,13 @@ def serialize_minibatch_dictionary_learning(model):
 def deserialize_minibatch_dictionary_learning(model_dict):
     model = MiniBatchDictionaryLearning(**model_dict['params'])
 
-    model.components_ = np.array(model_dict['components_'])
+    model.components_ = decode_array(model_dict['components_'])
     model.n_iter_ = model_dict['n_iter_']
     model.n_steps_ = model_dict['n_steps_']
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -510,22 +511,22 @@ def serialize_sparse_coder(model):
         'params': model.get_params(),
     }
 
-    serialized_model['params']['dictionary'] = serialized_model['params']['dictionary'].tolist()
+    serialized_model['params']['dictionary'] = encode_array(serialized_model['params']['dictionary'])
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
 
 def deserialize_sparse_coder(model_dict):
 
-    model_dict['params']['dictionary'] = np.array(model_dict['params']['dictionary'])
+    model_dict['params']['dictionary'] = decode_array(model_dict['params']['dictionary'])
 
     model = SparseCoder(**model_dict['params'])
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -533,16 +534,16 @@ def deserialize_sparse_coder(model_dict):
 def serialize_truncated_svd(model):
     serialized_model = {
         'meta': 'truncated-svd',
-        'components_': model.components_.tolist(),
-        'explained_variance_': model.explained_variance_.tolist(),
-        'explained_variance_ratio_': model.explained_variance_ratio_.tolist(),
-        'singular_values_': model.singular_values_.tolist(),
+        'components_': encode_array(model.components_),
+        'explained_variance_': encode_array(model.explained_variance_),
+        'explained_variance_ratio_': encode_array(model.explained_variance_ratio_),
+        'singular_values_': encode_array(model.singular_values_),
         'n_features_in_': model.n_features_in_,
         'params': model.get_params(),
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -550,13 +551,13 @@ def serialize_truncated_svd(model):
 def deserialize_truncated_svd(model_dict):
     model = TruncatedSVD(**model_dict['params'])
 
-    model.components_ = np.array(model_dict['components_'])
-    model.explained_variance_ = np.array(model_dict['explained_variance_'])
-    model.explained_variance_ratio_ = np.array(model_dict['explained_variance_ratio_'])
-    model.singular_values_ = np.array(model_dict['singular_values_'])
+    model.components_ = decode_array(model_dict['components_'])
+    model.explained_variance_ = decode_array(model_dict['explained_variance_'])
+    model.explained_variance_ratio_ = decode_array(model_dict['explained_variance_ratio_'])
+    model.singular_values_ = decode_array(model_dict['singular_values_'])
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
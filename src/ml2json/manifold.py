@@ -1,40 +1,26 @@
 # -*- coding: utf-8 -*-
 
+import importlib.util
+
 import scipy
 import numpy as np
 from sklearn.manifold import (Isomap, LocallyLinearEmbedding,
                               MDS, SpectralEmbedding, TSNE)
 from sklearn.utils import check_random_state
 
-# Allow additional dependencies to be optional
+# Allow additional dependencies to be optional, they are only imported once needed
 __optionals__ = []
-try:
-    from umap import UMAP
+if importlib.util.find_spec('umap') is not None:
     __optionals__.append('UMAP')
-except:
-    pass
-
-try:
-    from openTSNE import (TSNE as OpenTSNE, TSNEEmbedding as OpenTNSEEmbedding,
-                          PartialTSNEEmbedding  as OpenPartialTSNEEmbedding)
-    from openTSNE.sklearn import TSNE as OpenTSNEsklearn
-    from openTSNE.affinity import (PerplexityBasedNN, FixedSigmaNN,
-                                   Multiscale, MultiscaleMixture,
-                                   Uniform, PrecomputedAffinities)
-    from openTSNE.nearest_neighbors import (Sklearn as OpentTSNESklearnNN,
-                                            NNDescent as OpentTSNENNDescentNN, HNSW as OpentTSNEHNSWNN,
-                                            PrecomputedDistanceMatrix as OpentTSNEPrecomputedDistanceMatrix,
-                                            PrecomputedNeighbors as OpentTSNEPrecomputedNeighbors)
-    from openTSNE.tsne import gradient_descent as OpenTSNEGradientDescentOptimizer
+if importlib.util.find_spec('openTSNE') is not None:
     __optionals__.append('OpenTSNE')
-except:
-    pass
 
 from .decomposition import serialize_kernel_pca, deserialize_kernel_pca
 from .neighbors import (serialize_nearest_neighbors, deserialize_nearest_neighbors,
                         __optionals__ as __neig_optionals__)
 from .utils.csr import serialize_csr_matrix, deserialize_csr_matrix
 from .utils.random_state import serialize_random_state, deserialize_random_state
+from .utils.arrays import encode_array, decode_array
 
 if 'NNDescent' in __neig_optionals__:
     from .neighbors import serialize_nndescent, deserialize_nndescent
@@ -43,7 +29,7 @@ if 'NNDescent' in __neig_optionals__:
 def serialize_tsne(model):
     serialized_model = {
         'meta': 'tsne',
-        'embedding_': model.embedding_.tolist(),
+        'embedding_': encode_array(model.embedding_),
         'kl_divergence_': model.kl_divergence_,
         'n_features_in_': model.n_features_in_,
         'n_iter_': model.n_iter_,
@@ -51,13 +37,13 @@ def serialize_tsne(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
     if '_init' in model.__dict__:
-        serialized_model['_init'] = model._init.tolist()
+        serialized_model['_init'] = encode_array(model._init)
     if '_learning_rate' in model.__dict__:
-        serialized_model['_learning_rate'] = model._learning_rate.tolist()
+        serialized_model['_learning_rate'] = encode_array(model._learning_rate)
     if 'learning_rate_' in model.__dict__:
-        serialized_model['learning_rate_'] = model.learning_rate_.tolist()
+        serialized_model['learning_rate_'] = encode_array(model.learning_rate_)
 
     return serialized_model
 
@@ -65,19 +51,19 @@ def serialize_tsne(model):
 def deserialize_tsne(model_dict):
     model = TSNE(**model_dict['params'])
 
-    model.embedding_ = np.array(model_dict['embedding_'])
+    model.embedding_ = decode_array(model_dict['embedding_'])
     model.kl_divergence_ = model_dict['kl_divergence_']
     model.n_features_in_ = model_dict['n_features_in_']
     model.n_iter_ = model_dict['n_iter_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
     if '_init' in model_dict.keys():
-        model._init = np.array(model_dict['_init'])
+        model._init = decode_array(model_dict['_init'])
     if '_learning_rate' in model_dict.keys():
-        model._learning_rate = np.array(model_dict['_learning_rate'])
+        model._learning_rate = decode_array(model_dict['_learning_rate'])
     if 'learning_rate_' in model_dict.keys():
-        model.learning_rate_ = np.array(model_dict['learning_rate_'])
+        model.learning_rate_ = decode_array(model_dict['learning_rate_'])
 
     return model
 
@@ -85,8 +71,8 @@ def deserialize_tsne(model_dict):
 def serialize_mds(model):
     serialized_model = {
         'meta': 'mds',
-        'dissimilarity_matrix_': model.dissimilarity_matrix_.tolist(),
-        'embedding_': model.embedding_.tolist(),
+        'dissimilarity_matrix_': encode_array(model.dissimilarity_matrix_),
+        'embedding_': encode_array(model.embedding_),
         'n_features_in_': model.n_features_in_,
         'n_iter_': model.n_iter_,
         'stress_': float(model.stress_),
@@ -94,7 +80,7 @@ def serialize_mds(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -102,14 +88,14 @@ def serialize_mds(model):
 def deserialize_mds(model_dict):
     model = MDS(**model_dict['params'])
 
-    model.dissimilarity_matrix_ = np.array(model_dict['dissimilarity_matrix_'])
-    model.embedding_ = np.array(model_dict['embedding_'])
+    model.dissimilarity_matrix_ = decode_array(model_dict['dissimilarity_matrix_'])
+    model.embedding_ = decode_array(model_dict['embedding_'])
     model.n_features_in_ = model_dict['n_features_in_']
     model.n_iter_ = model_dict['n_iter_']
     model.stress_ = np.float64(model_dict['stress_'])
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -117,8 +103,8 @@ def deserialize_mds(model_dict):
 def serialize_isomap(model):
     serialized_model = {
         'meta': 'isomap',
-        'embedding_': model.embedding_.tolist(),
-        'dist_matrix_': model.dist_matrix_.tolist(),
+        'embedding_': encode_array(model.embedding_),
+        'dist_matrix_': encode_array(model.dist_matrix_),
         'n_features_in_': model.n_features_in_,
         '_n_features_out': model._n_features_out,
         'kernel_pca_': serialize_kernel_pca(model.kernel_pca_),
@@ -127,7 +113,7 @@ def serialize_isomap(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -135,15 +121,15 @@ def serialize_isomap(model):
 def deserialize_isomap(model_dict):
     model = Isomap(**model_dict['params'])
 
-    model.embedding_ = np.array(model_dict['embedding_'])
-    model.dist_matrix_ = np.array(model_dict['dist_matrix_'])
+    model.embedding_ = decode_array(model_dict['embedding_'])
+    model.dist_matrix_ = decode_array(model_dict['dist_matrix_'])
     model.n_features_in_ = model_dict['n_features_in_']
     model._n_features_out = model_dict['_n_features_out']
     model.kernel_pca_ = deserialize_kernel_pca(model_dict['kernel_pca_'])
     model.nbrs_ = deserialize_nearest_neighbors(model_dict['nbrs_'])
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -151,7 +137,7 @@ def deserialize_isomap(model_dict):
 def serialize_locally_linear_embedding(model):
     serialized_model = {
         'meta': 'locally-linear-embedding',
-        'embedding_': model.embedding_.tolist(),
+        'embedding_': encode_array(model.embedding_),
         'n_features_in_': model.n_features_in_,
         '_n_features_out': model._n_features_out,
         'reconstruction_error_': float(model.reconstruction_error_),
@@ -160,7 +146,7 @@ def serialize_locally_linear_embedding(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -168,14 +154,14 @@ def serialize_locally_linear_embedding(model):
 def deserialize_locally_linear_embedding(model_dict):
     model = LocallyLinearEmbedding(**model_dict['params'])
 
-    model.embedding_ = np.array(model_dict['embedding_'])
+    model.embedding_ = decode_array(model_dict['embedding_'])
     model.n_features_in_ = model_dict['n_features_in_']
     model._n_features_out = model_dict['_n_features_out']
     model.reconstruction_error_ = np.float64(model_dict['reconstruction_error_'])
     model.nbrs_ = deserialize_nearest_neighbors(model_dict['nbrs_'])
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -183,7 +169,7 @@ def deserialize_locally_linear_embedding(model_dict):
 def serialize_spectral_embedding(model):
     serialized_model = {
         'meta': 'spectral-embedding',
-        'embedding_': model.embedding_.tolist(),
+        'embedding_': encode_array(model.embedding_),
         'n_features_in_': model.n_features_in_,
         'params': model.get_params()
     }
@@ -194,10 +180,10 @@ def serialize_spectral_embedding(model):
         serialized_model['affinity_matrix_'] = serialize_csr_matrix(model.affinity_matrix_)
         serialized_model['affinity_matrix_type'] = 'sparse'
     else:
-        serialized_model['affinity_matrix_'] = model.affinity_matrix_.tolist()
+        serialized_model['affinity_matrix_'] = encode_array(model.affinity_matrix_)
         serialized_model['affinity_matrix_type'] = 'dense'
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -205,17 +191,17 @@ def serialize_spectral_embedding(model):
 def deserialize_spectral_embedding(model_dict):
     model = SpectralEmbedding(**model_dict['params'])
 
-    model.embedding_ = np.array(model_dict['embedding_'])
+    model.embedding_ = decode_array(model_dict['embedding_'])
     model.n_features_in_ = model_dict['n_features_in_']
 
     if model_dict['affinity_matrix_type'] == 'sparse':
         model.affinity_matrix_ = deserialize_csr_matrix(model_dict['affinity_matrix_'])
     else:
-        model.affinity_matrix_ = np.array(model_dict['affinity_matrix_'])
+        model.affinity_matrix_ = decode_array(model_dict['affinity_matrix_'])
     if 'n_neighbors_' in model_dict.keys():
         model.n_neighbors_ = model_dict['n_neighbors_']
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -226,25 +212,25 @@ if 'UMAP' in __optionals__ and 'NNDescent' in __neig_optionals__:
             'graph_': serialize_csr_matrix(model.graph_),
             '_small_data': model._small_data,
             '_initial_alpha': model._initial_alpha,
-            '_raw_data': model._raw_data.astype(float).tolist(),
+            '_raw_data': encode_array(model._raw_data),
             '_original_n_threads': model._original_n_threads,
             '_sparse_data': model._sparse_data,
-            '_sigmas': model._sigmas.astype(float).tolist(),
-            '_rhos': model._rhos.astype(float).tolist(),
+            '_sigmas': encode_array(model._sigmas),
+            '_rhos': encode_array(model._rhos),
             '_disconnection_distance': model._disconnection_distance,
             '_a': float(model._a),
             '_b': float(model._b),
             '_input_hash': model._input_hash,
             '_n_neighbors': model._n_neighbors,
             '_supervised': model._supervised,
-            'embedding_': model.embedding_.astype(float).tolist(),
+            'embedding_': encode_array(model.embedding_),
             'params': model.get_params()
         }
 
         if serialized_model['params']['precomputed_knn'] is not None and serialized_model['params']['precomputed_knn'][0] is not None:
             serialized_model['params']['precomputed_knn'] = (
-                serialized_model['params']['precomputed_knn'][0].astype(float).tolist(),
-                serialized_model['params']['precomputed_knn'][1].astype(float).tolist(),
+                encode_array(serialized_model['params']['precomputed_knn'][0]),
+                encode_array(serialized_model['params']['precomputed_knn'][1]),
                 serialize_nndescent(serialized_model['params']['precomputed_knn'][2])
             )
 
@@ -253,11 +239,11 @@ if 'UMAP' in __optionals__ and 'NNDescent' in __neig_optionals__:
         else:
             serialized_model['graph_dists_'] = None
         if model.knn_indices is not None:
-            serialized_model['knn_indices'] = model.knn_indices.astype(float).tolist()
+            serialized_model['knn_indices'] = encode_array(model.knn_indices)
         else:
             serialized_model['knn_indices'] = None
         if model.knn_dists is not None:
-            serialized_model['knn_dists'] = model.knn_dists.astype(float).tolist()
+            serialized_model['knn_dists'] = encode_array(model.knn_dists)
         else:
             serialized_model['knn_dists'] = None
         if model.knn_search_index is not None:
@@ -265,21 +251,22 @@ if 'UMAP' in __optionals__ and 'NNDescent' in __neig_optionals__:
         else:
             serialized_model['knn_search_index'] = None
         if 'rad_emb_' in model.__dict__:
-            serialized_model['rad_emb_'] = model.rad_emb_.tolist()
+            serialized_model['rad_emb_'] = encode_array(model.rad_emb_)
         if 'rad_orig_' in model.__dict__:
-            serialized_model['rad_orig_'] = model.rad_orig_.tolist()
+            serialized_model['rad_orig_'] = encode_array(model.rad_orig_)
         if 'feature_names_in_' in model.__dict__:
-            serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+            serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
         return serialized_model
 
 
     def deserialize_umap(model_dict):
+        from umap import UMAP
 
         if model_dict['params']['precomputed_knn'] is not None and model_dict['params']['precomputed_knn'][0] is not None:
             model_dict['params']['precomputed_knn'] = (
-                np.array(model_dict['params']['precomputed_knn'][0], dtype=np.float32),
-                np.array(model_dict['params']['precomputed_knn'][1], dtype=np.float32),
+                decode_array(model_dict['params']['precomputed_knn'][0], dtype=np.float32),
+                decode_array(model_dict['params']['precomputed_knn'][1], dtype=np.float32),
                 deserialize_nndescent(model_dict['params']['precomputed_knn'][2])
             )
 
@@ -288,18 +275,18 @@ if 'UMAP' in __optionals__ and 'NNDescent' in __neig_optionals__:
         model.graph_ = deserialize_csr_matrix(model_dict['graph_'])
         model._small_data = model_dict['_small_data']
         model._initial_alpha = model_dict['_initial_alpha']
-        model._raw_data = np.array(model_dict['_raw_data'], dtype=np.float32)
+        model._raw_data = decode_array(model_dict['_raw_data'], dtype=np.float32)
         model._original_n_threads = model_dict['_original_n_threads']
         model._sparse_data = model_dict['_sparse_data']
-        model._sigmas = np.array(model_dict['_sigmas'], dtype=np.float32)
-        model._rhos = np.array(model_dict['_rhos'], dtype=np.float32)
+        model._sigmas = decode_array(model_dict['_sigmas'], dtype=np.float32)
+        model._rhos = decode_array(model_dict['_rhos'], dtype=np.float32)
         model._disconnection_distance = model_dict['_disconnection_distance']
         model._a = np.float64(model_dict['_a'])
         model._b = np.float64(model_dict['_b'])
         model._input_hash = model_dict['_input_hash']
         model._n_neighbors = model_dict['_n_neighbors']
         model._supervised = model_dict['_supervised']
-        model.embedding_ = np.array(model_dict['embedding_'], dtype=np.float32)
+        model.embedding_ = decode_array(model_dict['embedding_'], dtype=np.float32)
 
         if model_dict['graph_dists_'] is not None:
             model.graph_dists_ = deserialize_csr_matrix(model_dict['graph_dists_']).todok()
@@ -308,11 +295,11 @@ if 'UMAP' in __optionals__ and 'NNDescent' in __neig_optionals__:
 
 
         if model_dict['knn_indices'] is not None:
-            model.knn_indices = np.array(model_dict['knn_indices'], dtype=np.float32)
+            model.knn_indices = decode_array(model_dict['knn_indices'], dtype=np.float32)
         else:
             model.knn_indices = None
         if model_dict['knn_dists'] is not None:
-            model.knn_dists = np.array(model_dict['knn_dists'], dtype=np.float32)
+            model.knn_dists = decode_array(model_dict['knn_dists'], dtype=np.float32)
         else:
             model.knn_dists = None
         if model_dict['knn_search_index'] is not None:
@@ -321,11 +308,11 @@ if 'UMAP' in __optionals__ and 'NNDescent' in __neig_optionals__:
             model.knn_search_index = None
 
         if 'rad_emb_' in model_dict.keys():
-            model.rad_emb_ = np.array(model_dict['rad_emb_'], dtype=np.float32)
+            model.rad_emb_ = decode_array(model_dict['rad_emb_'], dtype=np.float32)
         if 'rad_orig_' in model_dict.keys():
-            model.rad_orig_ = np.array(model_dict['rad_orig_'], dtype=np.float32)
+            model.rad_orig_ = decode_array(model_dict['rad_orig_'], dtype=np.float32)
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
         return model
 
@@ -343,6 +330,9 @@ if 'OpenTSNE' in __optionals__:
 
 
     def deserialize_opentsne(model_dict):
+        from openTSNE import TSNE as OpenTSNE
+        from openTSNE.sklearn import TSNE as OpenTSNEsklearn
+
         if 'embedding_' in model_dict:
             model = OpenTSNEsklearn(**model_dict['params'])
             model.embedding_ = deserialize_opentsne_embedding(model_dict['embedding_'])
@@ -354,7 +344,7 @@ if 'OpenTSNE' in __optionals__:
     def serialize_opentsne_embedding(model):
         serialized_model = {
             'meta': 'openTSNEEmbedding',
-            'value': model.__array__().tolist(),
+            'value': encode_array(model.__array__()),
             'affinities': serialize_opentsne_affinities(model.affinities),
             'optimizer': serialize_opentsne_optimizer(model.optimizer),
             'params': {key: value for key, value in model.__dict__.items()
@@ -365,7 +355,9 @@ if 'OpenTSNE' in __optionals__:
 
 
     def deserialize_opentsne_embedding(model_dict):
-        model = OpenTNSEEmbedding(embedding=np.array(model_dict['value']),
+        from openTSNE import TSNEEmbedding as OpenTNSEEmbedding
+
+        model = OpenTNSEEmbedding(embedding=decode_array(model_dict['value']),
                                   affinities=deserialize_opentsne_affinities(model_dict['affinities']),
                                   random_state=model_dict['params']['random_state'],
                                   optimizer=deserialize_opentsne_optimizer(model_dict['optimizer']),
@@ -385,8 +377,8 @@ if 'OpenTSNE' in __optionals__:
     def serialize_opentsne_partial_embedding(model):
         serialized_model = {
             'meta': 'openTSNEPartialEmbedding',
-            'value': model.__array__().tolist(),
-            'reference_embedding': model.reference_embedding.tolist(),
+            'value': encode_array(model.__array__()),
+            'reference_embedding': encode_array(model.reference_embedding),
             'P': serialize_csr_matrix(model.P),
             'optimizer': serialize_opentsne_optimizer(model.optimizer),
             'gradient_descent_params': {key: value for key, value in model.gradient_descent_params.items()},
@@ -396,8 +388,10 @@ if 'OpenTSNE' in __optionals__:
 
 
     def deserialize_opentsne_partial_embedding(model_dict):
-        model = OpenPartialTSNEEmbedding(embedding=model_dict['value'],
-                                         reference_embedding=model_dict['reference_embedding'],
+        from openTSNE import PartialTSNEEmbedding as OpenPartialTSNEEmbedding
+
+        model = OpenPartialTSNEEmbedding(embedding=decode_array(model_dict['value']),
+                                         reference_embedding=decode_array(model_dict['reference_embedding']),
                                          P=model_dict['P'],
                                          optimizer=deserialize_opentsne_optimizer(model_dict['optimizer']),
                                          **model_dict['gradient_descent_params'])
@@ -406,6 +400,9 @@ if 'OpenTSNE' in __optionals__:
 
 
     def serialize_opentsne_affinities(model):
+        from openTSNE.affinity import (PerplexityBasedNN, FixedSigmaNN, Multiscale, MultiscaleMixture, Uniform,
+                                       PrecomputedAffinities)
+
         affinity_type = type(model).__name__
         serialized_model = {
             'meta': 'openTSNEAffinities',
@@ -417,16 +414,16 @@ if 'OpenTSNE' in __optionals__:
         }
 
         if affinity_type == 'PerplexityBasedNN':
-            serialized_model['_PerplexityBasedNN__neighbors'] = model._PerplexityBasedNN__neighbors.tolist()
-            serialized_model['_PerplexityBasedNN__distances'] = model._PerplexityBasedNN__distances.tolist()
+            serialized_model['_PerplexityBasedNN__neighbors'] = encode_array(model._PerplexityBasedNN__neighbors)
+            serialized_model['_PerplexityBasedNN__distances'] = encode_array(model._PerplexityBasedNN__distances)
             serialized_model['perplexity'] = model.perplexity
             serialized_model['effective_perplexity_'] = model.effective_perplexity_
             serialized_model['symmetrize'] = model.symmetrize
         elif affinity_type == 'FixedSigmaNN':
             serialized_model['sigma'] = model.sigma
         elif affinity_type in ['MultiscaleMixture', 'Multiscale']:
-            serialized_model['_MultiscaleMixture__neighbors'] = getattr(model, '_MultiscaleMixture__neighbors').tolist()
-            serialized_model['_MultiscaleMixture__distances'] = getattr(model, '_MultiscaleMixture__distances').tolist()
+            serialized_model['_MultiscaleMixture__neighbors'] = encode_array(getattr(model, '_MultiscaleMixture__neighbors'))
+            serialized_model['_MultiscaleMixture__distances'] = encode_array(getattr(model, '_MultiscaleMixture__distances'))
             serialized_model['perplexities'] = model.perplexities
             serialized_model['effective_perplexities_'] = model.effective_perplexities_
             serialized_model['symmetrize'] = model.symmetrize
@@ -449,6 +446,10 @@ if 'OpenTSNE' in __optionals__:
 
 
     def deserialize_opentsne_affinities(model_dict):
+        from openTSNE import TSNE as OpenTSNE
+        from openTSNE.affinity import (PerplexityBasedNN, FixedSigmaNN, Multiscale, MultiscaleMixture, Uniform,
+                                       PrecomputedAffinities)
+
         if model_dict['type'] == 'MultiscaleMixture':
             model = MultiscaleMixture(data=None,
                                       perplexities=model_dict['perplexities'],
@@ -460,8 +461,8 @@ if 'OpenTSNE' in __optionals__:
                                       random_state=model_dict['knn_index']['random_state'],
                                       verbose=model_dict['verbose'],
                                       knn_index=deserialize_opentsne_knnindex(model_dict['knn_index']))
-            model._MultiscaleMixture__neighbors = np.array(model_dict['_MultiscaleMixture__neighbors'])
-            model._MultiscaleMixture__distances = np.array(model_dict['_MultiscaleMixture__distances'])
+            model._MultiscaleMixture__neighbors = decode_array(model_dict['_MultiscaleMixture__neighbors'])
+            model._MultiscaleMixture__distances = decode_array(model_dict['_MultiscaleMixture__distances'])
             model.effective_perplexities_ = model_dict['effective_perplexities_']
         elif model_dict['type'] == 'Multiscale':
             model = Multiscale(data=None,
@@ -474,8 +475,8 @@ if 'OpenTSNE' in __optionals__:
                                random_state=model_dict['knn_index']['random_state'],
                                verbose=model_dict['verbose'],
                                knn_index=deserialize_opentsne_knnindex(model_dict['knn_index']))
-            model._MultiscaleMixture__neighbors = np.array(model_dict['_MultiscaleMixture__neighbors'])
-            model._MultiscaleMixture__distances = np.array(model_dict['_MultiscaleMixture__distances'])
+            model._MultiscaleMixture__neighbors = decode_array(model_dict['_MultiscaleMixture__neighbors'])
+            model._MultiscaleMixture__distances = decode_array(model_dict['_MultiscaleMixture__distances'])
             model.effective_perplexities_ = model_dict['effective_perplexities_']
         elif model_dict['type'] == 'FixedSigmaNN':
             model = FixedSigmaNN(data=None,
@@ -527,16 +528,18 @@ if 'OpenTSNE' in __optionals__:
     def serialize_opentsne_optimizer(model):
         serialized_model = {
             'meta': 'openTSNEGradientDescentOptimizer',
-            'gains': model.gains.tolist(),
-            'update': model.update.tolist(),
+            'gains': encode_array(model.gains),
+            'update': encode_array(model.update),
         }
         return serialized_model
 
 
     def deserialize_opentsne_optimizer(model_dict):
+        from openTSNE.tsne import gradient_descent as OpenTSNEGradientDescentOptimizer
+
         model = OpenTSNEGradientDescentOptimizer()
-        model.gains = np.array(model_dict['gains'])
-        model.update = np.array(model_dict['update'])
+        model.gains = decode_array(model_dict['gains'])
+        model.update = decode_array(model_dict['update'])
         return model
 
 
@@ -550,7 +553,7 @@ if 'OpenTSNE' in __optionals__:
         serialized_model = {
             'meta': 'openTSNEKnnIndex',
             'type': index_type,
-            'data': model.data.tolist()
+            'data': encode_array(model.data)
         }
         for param, value in model.__dict__.items():
             if param not in ['index', 'data', '_tmp_dirs']:
@@ -558,7 +561,7 @@ if 'OpenTSNE' in __optionals__:
 
         if index_type == 'HNSW':
             serialized_model['state'] = model.__getstate__()
-            serialized_model['state']['data'] = serialized_model['state']['data'].tolist()
+            serialized_model['state']['data'] = encode_array(serialized_model['state']['data'])
             serialized_model['state']['b64_index'] = serialized_model['state']['b64_index'].decode()
         elif index_type  == 'Sklearn':
             serialized_model['state'] = serialize_nearest_neighbors(model.index)
@@ -567,7 +570,12 @@ if 'OpenTSNE' in __optionals__:
         return serialized_model
 
     def deserialize_opentsne_knnindex(model_dict):
-        params = dict(data=np.array(model_dict['data']),
+        from openTSNE.nearest_neighbors import (Sklearn as OpentTSNESklearnNN, NNDescent as OpentTSNENNDescentNN,
+                                                HNSW as OpentTSNEHNSWNN,
+                                                PrecomputedDistanceMatrix as OpentTSNEPrecomputedDistanceMatrix,
+                                                PrecomputedNeighbors as OpentTSNEPrecomputedNeighbors)
+
+        params = dict(data=decode_array(model_dict['data']),
                       k=model_dict['k'],
                       metric=model_dict['metric'],
                       metric_params=model_dict['metric_params'],
@@ -582,7 +590,7 @@ if 'OpenTSNE' in __optionals__:
             model.index = deserialize_nndescent(model_dict['state'])
         elif model_dict['type'] == 'HNSW':
             model = OpentTSNEHNSWNN(**params)
-            model_dict['state']['data'] = np.array(model_dict['state']['data'])
+            model_dict['state']['data'] = decode_array(model_dict['state']['data'])
             model_dict['state']['b64_index'] = model_dict['state']['b64_index'].encode()
             model.__setstate__(model_dict['state'])
         elif model_dict['type'] == 'PrecomputedDistanceMatrix':
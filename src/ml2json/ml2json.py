@@ -1,1028 +1,84 @@
 # -*- coding: utf-8 -*-
 
 import sys
-import json
 import inspect
 import importlib
 import importlib.util
 import warnings
-from typing import Dict
-
-from sklearn import svm, discriminant_analysis, dummy
-from sklearn.feature_extraction import DictVectorizer
-from sklearn.linear_model import LogisticRegression, Perceptron
-from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor, ExtraTreeClassifier, ExtraTreeRegressor
-from sklearn.ensemble import (AdaBoostClassifier, AdaBoostRegressor, BaggingClassifier, BaggingRegressor,
-                              ExtraTreesClassifier, ExtraTreesRegressor, GradientBoostingClassifier,
-                              GradientBoostingRegressor, IsolationForest, RandomForestClassifier,
-                              RandomForestRegressor, StackingClassifier, StackingRegressor, VotingClassifier,
-                              VotingRegressor, HistGradientBoostingClassifier, HistGradientBoostingRegressor,
-                              RandomTreesEmbedding)
-from sklearn.naive_bayes import BernoulliNB, GaussianNB, MultinomialNB, ComplementNB
-from sklearn.linear_model import LinearRegression, Lasso, Ridge, ElasticNet
-from sklearn.neural_network import MLPClassifier, MLPRegressor
-from sklearn.preprocessing import (LabelEncoder, LabelBinarizer, MultiLabelBinarizer,
-                                   MinMaxScaler, StandardScaler, KernelCenterer,
-                                   OneHotEncoder, RobustScaler, MaxAbsScaler,
-                                   OrdinalEncoder, Normalizer)
-from sklearn.svm import SVR
-from sklearn.cluster import (AffinityPropagation, AgglomerativeClustering,
-                             Birch, DBSCAN, FeatureAgglomeration, KMeans,
-                             BisectingKMeans, MiniBatchKMeans, MeanShift, OPTICS,
-                             SpectralClustering, SpectralBiclustering, SpectralCoclustering)
-from sklearn.cross_decomposition import (CCA, PLSCanonical,
-                                         PLSRegression, PLSSVD)
-from sklearn.decomposition import (PCA, KernelPCA, DictionaryLearning, FactorAnalysis, FastICA, IncrementalPCA,
-                                   LatentDirichletAllocation, MiniBatchDictionaryLearning, MiniBatchSparsePCA, NMF,
-                                   MiniBatchNMF, SparsePCA, SparseCoder, TruncatedSVD)
-from sklearn.manifold import (Isomap, LocallyLinearEmbedding,
-                              MDS, SpectralEmbedding, TSNE)
-from sklearn.neighbors import NearestNeighbors, KDTree, KNeighborsClassifier, KNeighborsRegressor, KernelDensity
-from sklearn.pipeline import FeatureUnion, Pipeline
-
-from . import classification as clf
-from . import regression as reg
-from . import feature_extraction as ext
-from . import preprocessing as pre
-from . import cluster as clus
-from . import decomposition as dec
-from . import manifold as man
-from . import neighbors as nei
-from . import cross_decomposition as crdec
-from . import applicability_domain as ad
-from . import over_undersampling as ous
-from . import pipeline as ppl
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Dict, Iterator, List, TYPE_CHECKING
+
 from .utils import is_model_fitted, recursive_inspection
+from .utils.config import get_config, config_context
+from .utils.instrumentation import observe, relocate
+from .utils.parallel import UnparsedMember, member_pool, n_workers
+from .utils.references import serialize_once, deserialize_once
+from .utils.registry import register, get_serializer, get_deserializer
+
+if TYPE_CHECKING:
+    from catboost import Pool
+    from .utils.batch import BatchResult
+
+# Keys of serialized models describing them, written first so that they can be read without the rest (see `peek`)
+HEADER_KEYS = ('meta', 'unfitted', 'versions', 'n_features_in_', 'feature_names_in_', 'params')
 
-# Make additional dependencies optional
-if 'XGBRegressor' in reg.__optionals__:
-    from xgboost import XGBRegressor, XGBRFRegressor, XGBRanker, XGBClassifier, XGBRFClassifier
-if 'LGBMRegressor' in reg.__optionals__:
-    from lightgbm import LGBMRegressor, LGBMRanker, LGBMClassifier
-if 'CatBoostRegressor' in reg.__optionals__:
-    from catboost import CatBoostRegressor, CatBoostRanker, Pool, CatBoostClassifier
-else:
-    from typing import TypeVar
-    Pool = TypeVar('Pool')
-if 'KModes' in clus.__optionals__:
-    from kmodes.kmodes import KModes
-    from kmodes.kprototypes import KPrototypes
-if 'HDBSCAN' in clus.__optionals__:
-    from hdbscan import HDBSCAN
-if 'NNDescent' in nei.__optionals__:
-    from pynndescent import NNDescent
-if 'UMAP' in man.__optionals__:
-    from umap import UMAP
-if 'OpenTSNE' in man.__optionals__:
-    from openTSNE import (TSNE as OpenTSNE, TSNEEmbedding as OpenTSNEEmbedding,
-                          PartialTSNEEmbedding as OpenPartialTSNEEmbedding)
-    from openTSNE.sklearn import TSNE as OpenTSNEsklearn
-if 'BoundingBoxApplicabilityDomain' in ad.__optionals__:
-    from mlchemad.applicability_domains import (BoundingBoxApplicabilityDomain,
-                                                ConvexHullApplicabilityDomain,
-                                                PCABoundingBoxApplicabilityDomain,
-                                                TopKatApplicabilityDomain,
-                                                LeverageApplicabilityDomain,
-                                                HotellingT2ApplicabilityDomain,
-                                                KernelDensityApplicabilityDomain,
-                                                IsolationForestApplicabilityDomain,
-                                                CentroidDistanceApplicabilityDomain,
-                                                KNNApplicabilityDomain,
-                                                StandardizationApproachApplicabilityDomain)
-if 'imblearn' in ous.__optionals__:
-    from imblearn.under_sampling import (ClusterCentroids, CondensedNearestNeighbour, EditedNearestNeighbours,
-                                         RepeatedEditedNearestNeighbours, AllKNN, InstanceHardnessThreshold,
-                                         NearMiss, NeighbourhoodCleaningRule, OneSidedSelection,
-                                         RandomUnderSampler, TomekLinks)
-    from imblearn.over_sampling import (RandomOverSampler, SMOTE, SMOTEN, SMOTENC, ADASYN, BorderlineSMOTE,
-                                        KMeansSMOTE, SVMSMOTE)
-    from imblearn.combine import SMOTEENN, SMOTETomek
-    from imblearn.ensemble import (EasyEnsembleClassifier, RUSBoostClassifier, BalancedBaggingClassifier,
-                                   BalancedRandomForestClassifier)
-
-
-def serialize_model(model, catboost_data: Pool = None) -> Dict:
+
+def serialize_model(model, catboost_data: 'Pool' = None) -> Dict:
     """Serialize a model into a dictionary.
 
+    Models held several times by the model (e.g. the estimators of stacking and voting ensembles)
+    are serialized once, in a table of the serialized model, and referenced wherever they occur.
+
     :param model: machine learning model to be serialized
     :param catboost_data: if `model` is a CatBoost model, the data `Pool` used to train it
     """
+    return serialize_once(model, lambda: _serialize_model(model, catboost_data))
+
+
+def _serialize_model(model, catboost_data: 'Pool' = None) -> Dict:
+    """Serialize a model into a dictionary, references to shared models aside."""
     # Verify model is fit
     if not is_model_fitted(model):
         return serialize_unfitted_model(model)
 
-    # Classification
-    if isinstance(model, LogisticRegression):
-        model_dict = clf.serialize_logistic_regression(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, BernoulliNB):
-        model_dict = clf.serialize_bernoulli_nb(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, GaussianNB):
-        model_dict = clf.serialize_gaussian_nb(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, MultinomialNB):
-        model_dict = clf.serialize_multinomial_nb(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, ComplementNB):
-        model_dict = clf.serialize_complement_nb(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, discriminant_analysis.LinearDiscriminantAnalysis):
-        model_dict = clf.serialize_lda(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, discriminant_analysis.QuadraticDiscriminantAnalysis):
-        model_dict = clf.serialize_qda(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, svm.SVC):
-        model_dict = clf.serialize_svm(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, Perceptron):
-        model_dict = clf.serialize_perceptron(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, DecisionTreeClassifier):
-        model_dict = clf.serialize_decision_tree(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, GradientBoostingClassifier):
-        model_dict = clf.serialize_gradient_boosting(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, RandomForestClassifier):
-        model_dict = clf.serialize_random_forest(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, MLPClassifier):
-        model_dict = clf.serialize_mlp(model)
-        return serialize_version(model, model_dict)
-    elif 'XGBClassifier' in clf.__optionals__ and isinstance(model, XGBClassifier):
-        model_dict = clf.serialize_xgboost_classifier(model)
-        return serialize_version(model, model_dict)
-    elif 'XGBRFClassifier' in clf.__optionals__ and isinstance(model, XGBRFClassifier):
-        model_dict = clf.serialize_xgboost_rf_classifier(model)
-        return serialize_version(model, model_dict)
-    elif 'LGBMClassifier' in clf.__optionals__ and isinstance(model, LGBMClassifier):
-        model_dict = clf.serialize_lightgbm_classifier(model)
-        return serialize_version(model, model_dict)
-    elif 'CatBoostClassifier' in clf.__optionals__ and isinstance(model, CatBoostClassifier):
-        model_dict = clf.serialize_catboost_classifier(model, catboost_data)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, AdaBoostClassifier):
-        model_dict = clf.serialize_adaboost_classifier(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, BaggingClassifier):
-        model_dict = clf.serialize_bagging_classifier(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, ExtraTreeClassifier):
-        model_dict = clf.serialize_extra_tree_classifier(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, ExtraTreesClassifier):
-        model_dict = clf.serialize_extratrees_classifier(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, IsolationForest):
-        model_dict = clf.serialize_isolation_forest(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, RandomTreesEmbedding):
-        model_dict = clf.serialize_random_trees_embedding(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, KNeighborsClassifier):
-        model_dict = clf.serialize_nearest_neighbour_classifier(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, StackingClassifier):
-        model_dict = clf.serialize_stacking_classifier(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, VotingClassifier):
-        model_dict = clf.serialize_voting_classifier(model)
-        return serialize_version(model, model_dict)
-
-    # Regression
-    elif isinstance(model, LinearRegression):
-        model_dict = reg.serialize_linear_regressor(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, Lasso):
-        model_dict = reg.serialize_lasso_regressor(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, ElasticNet):
-        model_dict = reg.serialize_elastic_regressor(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, Ridge):
-        model_dict = reg.serialize_ridge_regressor(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, SVR):
-        model_dict = reg.serialize_svr(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, ExtraTreeRegressor):
-        model_dict = reg.serialize_extra_tree_regressor(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, DecisionTreeRegressor):
-        model_dict = reg.serialize_decision_tree_regressor(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, GradientBoostingRegressor):
-        model_dict = reg.serialize_gradient_boosting_regressor(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, RandomForestRegressor):
-        model_dict = reg.serialize_random_forest_regressor(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, ExtraTreesRegressor):
-        model_dict = reg.serialize_extratrees_regressor(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, MLPRegressor):
-        model_dict = reg.serialize_mlp_regressor(model)
-        return serialize_version(model, model_dict)
-    elif 'XGBRanker' in reg.__optionals__ and isinstance(model, XGBRanker):
-        model_dict = reg.serialize_xgboost_ranker(model)
-        return serialize_version(model, model_dict)
-    elif 'XGBRegressor' in reg.__optionals__ and isinstance(model, XGBRegressor):
-        model_dict = reg.serialize_xgboost_regressor(model)
-        return serialize_version(model, model_dict)
-    elif 'XGBRFRegressor' in reg.__optionals__ and isinstance(model, XGBRFRegressor):
-        model_dict = reg.serialize_xgboost_rf_regressor(model)
-        return serialize_version(model, model_dict)
-    elif 'LGBMRegressor' in reg.__optionals__ and isinstance(model, LGBMRegressor):
-        model_dict = reg.serialize_lightgbm_regressor(model)
-        return serialize_version(model, model_dict)
-    elif 'LGBMRanker' in reg.__optionals__ and isinstance(model, LGBMRanker):
-        model_dict = reg.serialize_lightgbm_ranker(model)
-        return serialize_version(model, model_dict)
-    elif 'CatBoostRegressor' in reg.__optionals__ and isinstance(model, CatBoostRegressor):
-        model_dict = reg.serialize_catboost_regressor(model, catboost_data)
-        return serialize_version(model, model_dict)
-    elif 'CatBoostRanker' in reg.__optionals__ and isinstance(model, CatBoostRanker):
-        model_dict = reg.serialize_catboost_ranker(model, catboost_data)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, AdaBoostRegressor):
-        model_dict = reg.serialize_adaboost_regressor(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, BaggingRegressor):
-        model_dict = reg.serialize_bagging_regressor(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, KNeighborsRegressor):
-        model_dict = reg.serialize_nearest_neighbour_regressor(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, StackingRegressor):
-        model_dict = reg.serialize_stacking_regressor(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, VotingRegressor):
-        model_dict = reg.serialize_voting_regressor(model)
-        return serialize_version(model, model_dict)
-
-    # Clustering
-    elif isinstance(model, FeatureAgglomeration):
-        model_dict = clus.serialize_feature_agglomeration(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, AffinityPropagation):
-        model_dict = clus.serialize_affinity_propagation(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, AgglomerativeClustering):
-        model_dict = clus.serialize_agglomerative_clustering(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, DBSCAN):
-        model_dict = clus.serialize_dbscan(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, MeanShift):
-        model_dict = clus.serialize_meanshift(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, BisectingKMeans):
-        model_dict = clus.serialize_bisecting_kmeans(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, MiniBatchKMeans):
-        model_dict = clus.serialize_minibatch_kmeans(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, KMeans):
-        model_dict = clus.serialize_kmeans(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, OPTICS):
-        model_dict = clus.serialize_optics(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, SpectralClustering):
-        model_dict = clus.serialize_spectral_clustering(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, SpectralBiclustering):
-        model_dict = clus.serialize_spectral_biclustering(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, SpectralCoclustering):
-        model_dict = clus.serialize_spectral_coclustering(model)
-        return serialize_version(model, model_dict)
-    elif 'KPrototypes' in clus.__optionals__ and isinstance(model, KPrototypes):
-        model_dict = clus.serialize_kprototypes(model)
-        return serialize_version(model, model_dict)
-    elif 'KModes' in clus.__optionals__ and isinstance(model, KModes):
-        model_dict = clus.serialize_kmodes(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, Birch):
-        model_dict = clus.serialize_birch(model)
-        return serialize_version(model, model_dict)
-    elif 'HDBSCAN' in clus.__optionals__ and isinstance(model, HDBSCAN):
-        model_dict = clus.serialize_hdbscan(model)
-        return serialize_version(model, model_dict)
-
-    # Cross-decomposition
-    elif isinstance(model, CCA):
-        model_dict = crdec.serialize_cca(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, PLSCanonical):
-        model_dict = crdec.serialize_pls_canonical(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, PLSRegression):
-        model_dict = crdec.serialize_pls_regression(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, PLSSVD):
-        model_dict = crdec.serialize_pls_svd(model)
-        return serialize_version(model, model_dict)
-
-    # Decomposition
-    elif isinstance(model, PCA):
-        model_dict = dec.serialize_pca(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, KernelPCA):
-        model_dict = dec.serialize_kernel_pca(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, IncrementalPCA):
-        model_dict = dec.serialize_incremental_pca(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, MiniBatchSparsePCA):
-        model_dict = dec.serialize_minibatch_sparse_pca(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, SparsePCA):
-        model_dict = dec.serialize_sparse_pca(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, MiniBatchDictionaryLearning):
-        model_dict = dec.serialize_minibatch_dictionary_learning(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, DictionaryLearning):
-        model_dict = dec.serialize_dictionary_learning(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, FactorAnalysis):
-        model_dict = dec.serialize_factor_analysis(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, FastICA):
-        model_dict = dec.serialize_fast_ica(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, LatentDirichletAllocation):
-        model_dict = dec.serialize_latent_dirichlet_allocation(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, MiniBatchNMF):
-        model_dict = dec.serialize_minibatch_nmf(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, NMF):
-        model_dict = dec.serialize_nmf(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, SparseCoder):
-        model_dict = dec.serialize_sparse_coder(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, TruncatedSVD):
-        model_dict = dec.serialize_truncated_svd(model)
-        return serialize_version(model, model_dict)
-
-    # Manifold
-    elif isinstance(model, TSNE):
-        model_dict = man.serialize_tsne(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, MDS):
-        model_dict = man.serialize_mds(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, Isomap):
-        model_dict = man.serialize_isomap(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, LocallyLinearEmbedding):
-        model_dict = man.serialize_locally_linear_embedding(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, SpectralEmbedding):
-        model_dict = man.serialize_spectral_embedding(model)
-        return serialize_version(model, model_dict)
-    elif 'UMAP' in man.__optionals__ and isinstance(model, UMAP):
-        model_dict = man.serialize_umap(model)
-        return serialize_version(model, model_dict)
-    elif 'OpenTSNE' in man.__optionals__ and isinstance(model, (OpenTSNE, OpenTSNEsklearn)):
-        model_dict = man.serialize_opentsne(model)
-        return serialize_version(model, model_dict)
-    elif 'OpenTSNE' in man.__optionals__ and isinstance(model, OpenTSNEEmbedding):
-        model_dict = man.serialize_opentsne_embedding(model)
-        return serialize_version(model, model_dict)
-    elif 'OpenTSNE' in man.__optionals__ and isinstance(model, OpenPartialTSNEEmbedding):
-        model_dict = man.serialize_opentsne_partial_embedding(model)
-        return serialize_version(model, model_dict)
-
-    # Neighbors
-    elif isinstance(model, NearestNeighbors):
-        model_dict = nei.serialize_nearest_neighbors(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, KDTree):
-        model_dict = nei.serialize_kdtree(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, KernelDensity):
-        model_dict = nei.serialize_kernel_density(model)
-        return serialize_version(model, model_dict)
-    elif 'NNDescent' in nei.__optionals__ and isinstance(model, NNDescent):
-        model_dict = nei.serialize_nndescent(model)
-        return serialize_version(model, model_dict)
-
-    # Feature Extraction
-    elif isinstance(model, DictVectorizer):
-        model_dict = ext.serialize_dict_vectorizer(model)
-        return serialize_version(model, model_dict)
-
-    # Preprocess
-    elif isinstance(model, LabelEncoder):
-        model_dict = pre.serialize_label_encoder(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, LabelBinarizer):
-        model_dict = pre.serialize_label_binarizer(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, MultiLabelBinarizer):
-        model_dict = pre.serialize_multilabel_binarizer(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, MinMaxScaler):
-        model_dict = pre.serialize_minmax_scaler(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, StandardScaler):
-        model_dict = pre.serialize_standard_scaler(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, RobustScaler):
-        model_dict = pre.serialize_robust_scaler(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, MaxAbsScaler):
-        model_dict = pre.serialize_maxabs_scaler(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, KernelCenterer):
-        model_dict = pre.serialize_kernel_centerer(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, OneHotEncoder):
-        model_dict = pre.serialize_onehot_encoder(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, OrdinalEncoder):
-        model_dict = pre.serialize_ordinal_encoder(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, Normalizer):
-        model_dict = pre.serialize_normalizer(model)
-        return serialize_version(model, model_dict)
-
-    # Applicability Domain
-    elif isinstance(model, BoundingBoxApplicabilityDomain):
-        model_dict = ad.serialize_bounding_box_applicability_domain(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, ConvexHullApplicabilityDomain):
-        model_dict = ad.serialize_convex_hull_applicability_domain(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, PCABoundingBoxApplicabilityDomain):
-        model_dict = ad.serialize_pca_bounding_box_applicability_domain(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, TopKatApplicabilityDomain):
-        model_dict = ad.serialize_topkat_applicability_domain(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, LeverageApplicabilityDomain):
-        model_dict = ad.serialize_leverage_applicability_domain(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, HotellingT2ApplicabilityDomain):
-        model_dict = ad.serialize_hotelling_t2_applicability_domain(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, KernelDensityApplicabilityDomain):
-        model_dict = ad.serialize_kernel_density_applicability_domain(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, IsolationForestApplicabilityDomain):
-        model_dict = ad.serialize_isolation_forest_applicability_domain(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, CentroidDistanceApplicabilityDomain):
-        model_dict = ad.serialize_centroid_distance_applicability_domain(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, KNNApplicabilityDomain):
-        model_dict = ad.serialize_knn_applicability_domain(model)
-        return serialize_version(model, model_dict)
-    elif isinstance(model, StandardizationApproachApplicabilityDomain):
-        model_dict = ad.serialize_standardization_approach_applicability_domain(model)
-        return serialize_version(model, model_dict)
-
-    # Balancing
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, ClusterCentroids):
-        model_dict = ous.serialize_cluster_centroids(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, CondensedNearestNeighbour):
-        model_dict = ous.serialize_condensed_nearest_neighbours(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, EditedNearestNeighbours):
-        model_dict = ous.serialize_edited_nearest_neighbours(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, RepeatedEditedNearestNeighbours):
-        model_dict = ous.serialize_repeated_edited_nearest_neighbours(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, AllKNN):
-        model_dict = ous.serialize_all_knn(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, InstanceHardnessThreshold):
-        model_dict = ous.serialize_instance_hardness_threshold(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, NearMiss):
-        model_dict = ous.serialize_near_miss(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, NeighbourhoodCleaningRule):
-        model_dict = ous.serialize_neighbourhood_cleaning_rule(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, OneSidedSelection):
-        model_dict = ous.serialize_one_sided_selection(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, RandomUnderSampler):
-        model_dict = ous.serialize_random_under_sampler(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, TomekLinks):
-        model_dict = ous.serialize_tomek_links(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, RandomOverSampler):
-        model_dict = ous.serialize_random_over_sampler(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, SMOTENC):
-        model_dict = ous.serialize_smotenc(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, SMOTEN):
-        model_dict = ous.serialize_smoten(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, SMOTE):
-        model_dict = ous.serialize_smote(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, ADASYN):
-        model_dict = ous.serialize_adasyn(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, BorderlineSMOTE):
-        model_dict = ous.serialize_borderline_smote(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, KMeansSMOTE):
-        model_dict = ous.serialize_kmeans_smote(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, SVMSMOTE):
-        model_dict = ous.serialize_svm_smote(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, SMOTEENN):
-        model_dict = ous.serialize_smote_enn(model)
-        return serialize_version(model, model_dict)
-    elif 'imblearn' in ous.__optionals__ and isinstance(model, SMOTETomek):
-        model_dict = ous.serialize_smote_tomek(model)
-        return serialize_version(model, model_dict)
-
-    # Pipeline
-    elif isinstance(model, Pipeline):
-        model_dict = ppl.serialize_pipeline(model)
-        return serialize_version(model, model_dict)
-
-    # Otherwise
-    else:
+    entry = get_serializer(type(model))
+    if entry is None:
         raise ModelNotSupported('This model type is not currently supported. Email support@mlrequest.com to request a feature or report a bug.')
+    serializer, pass_catboost_data, meta = entry
+    with _attribute_precisions(model):
+        if pass_catboost_data:
+            model_dict = observe('serialize', meta, serializer, model, catboost_data)
+        else:
+            model_dict = observe('serialize', meta, serializer, model)
+    return _header_first(serialize_version(model, model_dict))
 
 
 def deserialize_model(model_dict: Dict):
     """Instantiate a machine learning model from a previously serialized model.
 
-    :param model_dict: dictionary of the previously serialized model
+    References to the same model resolve to the same instance.
+
+    :param model_dict: dictionary of the previously serialized model, or its json text left unparsed
     """
+    if isinstance(model_dict, UnparsedMember):
+        member, model_dict = model_dict, model_dict.parse()
+        relocate(member, model_dict)
+    return deserialize_once(model_dict, _deserialize_model)
+
+
+def _deserialize_model(model_dict: Dict):
+    """Instantiate a machine learning model from a previously serialized model, references to shared models aside."""
     # Verify model is fitted
     if 'unfitted' in model_dict.keys() and model_dict['unfitted']:
         check_version(model_dict)
         return deserialize_unfitted_model(model_dict)
 
-    # Classification
-    if model_dict['meta'] == 'lr':
-        check_version(model_dict)
-        return clf.deserialize_logistic_regression(model_dict)
-    elif model_dict['meta'] == 'bernoulli-nb':
-        check_version(model_dict)
-        return clf.deserialize_bernoulli_nb(model_dict)
-    elif model_dict['meta'] == 'gaussian-nb':
-        check_version(model_dict)
-        return clf.deserialize_gaussian_nb(model_dict)
-    elif model_dict['meta'] == 'multinomial-nb':
-        check_version(model_dict)
-        return clf.deserialize_multinomial_nb(model_dict)
-    elif model_dict['meta'] == 'complement-nb':
-        check_version(model_dict)
-        return clf.deserialize_complement_nb(model_dict)
-    elif model_dict['meta'] == 'lda':
-        check_version(model_dict)
-        return clf.deserialize_lda(model_dict)
-    elif model_dict['meta'] == 'qda':
-        check_version(model_dict)
-        return clf.deserialize_qda(model_dict)
-    elif model_dict['meta'] == 'svm':
-        check_version(model_dict)
-        return clf.deserialize_svm(model_dict)
-    elif model_dict['meta'] == 'perceptron':
-        check_version(model_dict)
-        return clf.deserialize_perceptron(model_dict)
-    elif model_dict['meta'] == 'decision-tree':
-        check_version(model_dict)
-        return clf.deserialize_decision_tree(model_dict)
-    elif model_dict['meta'] == 'gb':
-        check_version(model_dict)
-        return clf.deserialize_gradient_boosting(model_dict)
-    elif model_dict['meta'] == 'rf':
-        check_version(model_dict)
-        return clf.deserialize_random_forest(model_dict)
-    elif model_dict['meta'] == 'mlp':
-        check_version(model_dict)
-        return clf.deserialize_mlp(model_dict)
-    elif model_dict['meta'] == 'xgboost-classifier':
-        check_version(model_dict)
-        return clf.deserialize_xgboost_classifier(model_dict)
-    elif model_dict['meta'] == 'xgboost-rf-classifier':
-        check_version(model_dict)
-        return clf.deserialize_xgboost_rf_classifier(model_dict)
-    elif model_dict['meta'] == 'lightgbm-classifier':
-        check_version(model_dict)
-        return clf.deserialize_lightgbm_classifier(model_dict)
-    elif model_dict['meta'] == 'catboost-classifier':
-        check_version(model_dict)
-        return clf.deserialize_catboost_classifier(model_dict)
-    elif model_dict['meta'] == 'adaboost-classifier':
-        check_version(model_dict)
-        return clf.deserialize_adaboost_classifier(model_dict)
-    elif model_dict['meta'] == 'bagging-classifier':
-        check_version(model_dict)
-        return clf.deserialize_bagging_classifier(model_dict)
-    elif model_dict['meta'] == 'extra-tree-cls':
-        check_version(model_dict)
-        return clf.deserialize_extra_tree_classifier(model_dict)
-    elif model_dict['meta'] == 'extratrees-classifier':
-        check_version(model_dict)
-        return clf.deserialize_extratrees_classifier(model_dict)
-    elif model_dict['meta'] == 'isolation-forest':
-        check_version(model_dict)
-        return clf.deserialize_isolation_forest(model_dict)
-    elif model_dict['meta'] == 'random-trees-embedding':
-        check_version(model_dict)
-        return clf.deserialize_random_trees_embedding(model_dict)
-    elif model_dict['meta'] == 'nearest-neighbour-classifier':
-        check_version(model_dict)
-        return clf.deserialize_nearest_neighbour_classifier(model_dict)
-    elif model_dict['meta'] == 'stacking-classifier':
-        check_version(model_dict)
-        return clf.deserialize_stacking_classifier(model_dict)
-    elif model_dict['meta'] == 'voting-classifier':
-        check_version(model_dict)
-        return clf.deserialize_voting_classifier(model_dict)
-
-    # Regression
-    elif model_dict['meta'] == 'linear-regression':
-        check_version(model_dict)
-        return reg.deserialize_linear_regressor(model_dict)
-    elif model_dict['meta'] == 'lasso-regression':
-        check_version(model_dict)
-        return reg.deserialize_lasso_regressor(model_dict)
-    elif model_dict['meta'] == 'elasticnet-regression':
-        check_version(model_dict)
-        return reg.deserialize_elastic_regressor(model_dict)
-    elif model_dict['meta'] == 'ridge-regression':
-        check_version(model_dict)
-        return reg.deserialize_ridge_regressor(model_dict)
-    elif model_dict['meta'] == 'svr':
-        check_version(model_dict)
-        return reg.deserialize_svr(model_dict)
-    elif model_dict['meta'] == 'decision-tree-regression':
-        check_version(model_dict)
-        return reg.deserialize_decision_tree_regressor(model_dict)
-    elif model_dict['meta'] == 'gb-regression':
-        check_version(model_dict)
-        return reg.deserialize_gradient_boosting_regressor(model_dict)
-    elif model_dict['meta'] == 'rf-regression':
-        check_version(model_dict)
-        return reg.deserialize_random_forest_regressor(model_dict)
-    elif model_dict['meta'] == 'mlp-regression':
-        check_version(model_dict)
-        return reg.deserialize_mlp_regressor(model_dict)
-    elif model_dict['meta'] == 'xgboost-ranker':
-        check_version(model_dict)
-        return reg.deserialize_xgboost_ranker(model_dict)
-    elif model_dict['meta'] == 'xgboost-regressor':
-        check_version(model_dict)
-        return reg.deserialize_xgboost_regressor(model_dict)
-    elif model_dict['meta'] == 'xgboost-rf-regressor':
-        check_version(model_dict)
-        return reg.deserialize_xgboost_rf_regressor(model_dict)
-    elif model_dict['meta'] == 'lightgbm-regressor':
-        check_version(model_dict)
-        return reg.deserialize_lightgbm_regressor(model_dict)
-    elif model_dict['meta'] == 'lightgbm-ranker':
-        check_version(model_dict)
-        return reg.deserialize_lightgbm_ranker(model_dict)
-    elif model_dict['meta'] == 'catboost-regressor':
-        check_version(model_dict)
-        return reg.deserialize_catboost_regressor(model_dict)
-    elif model_dict['meta'] == 'catboost-ranker':
-        check_version(model_dict)
-        return reg.deserialize_catboost_ranker(model_dict)
-    elif model_dict['meta'] == 'adaboost-regressor':
-        check_version(model_dict)
-        return reg.deserialize_adaboost_regressor(model_dict)
-    elif model_dict['meta'] == 'bagging-regression':
-        check_version(model_dict)
-        return reg.deserialize_bagging_regressor(model_dict)
-    elif model_dict['meta'] == 'extra-tree-reg':
-        check_version(model_dict)
-        return reg.deserialize_extra_tree_regressor(model_dict)
-    elif model_dict['meta'] == 'extratrees-regressor':
-        check_version(model_dict)
-        return reg.deserialize_extratrees_regressor(model_dict)
-    elif model_dict['meta'] == 'nearest-neighbour-regressor':
-        check_version(model_dict)
-        return reg.deserialize_nearest_neighbour_regressor(model_dict)
-    elif model_dict['meta'] == 'stacking-regressor':
-        check_version(model_dict)
-        return reg.deserialize_stacking_regressor(model_dict)
-    elif model_dict['meta'] == 'voting-regressor':
-        check_version(model_dict)
-        return reg.deserialize_voting_regressor(model_dict)
-
-    # Clustering
-    elif model_dict['meta'] == 'affinity-propagation':
-        check_version(model_dict)
-        return clus.deserialize_affinity_propagation(model_dict)
-    elif model_dict['meta'] == 'agglomerative-clustering':
-        check_version(model_dict)
-        return clus.deserialize_agglomerative_clustering(model_dict)
-    elif model_dict['meta'] == 'feature-agglomeration':
-        check_version(model_dict)
-        return clus.deserialize_feature_agglomeration(model_dict)
-    elif model_dict['meta'] == 'dbscan':
-        check_version(model_dict)
-        return clus.deserialize_dbscan(model_dict)
-    elif model_dict['meta'] == 'meanshift':
-        check_version(model_dict)
-        return clus.deserialize_meanshift(model_dict)
-    elif model_dict['meta'] == 'kmeans':
-        check_version(model_dict)
-        return clus.deserialize_kmeans(model_dict)
-    elif model_dict['meta'] == 'minibatch-kmeans':
-        check_version(model_dict)
-        return clus.deserialize_minibatch_kmeans(model_dict)
-    elif model_dict['meta'] == 'optics':
-        check_version(model_dict)
-        return clus.deserialize_optics(model_dict)
-    elif model_dict['meta'] == 'spectral-clustering':
-        check_version(model_dict)
-        return clus.deserialize_spectral_clustering(model_dict)
-    elif model_dict['meta'] == 'spectral-biclustering':
-        check_version(model_dict)
-        return clus.deserialize_spectral_biclustering(model_dict)
-    elif model_dict['meta'] == 'spectral-coclustering':
-        check_version(model_dict)
-        return clus.deserialize_spectral_coclustering(model_dict)
-    elif model_dict['meta'] == 'kmodes':
-        check_version(model_dict)
-        return clus.deserialize_kmodes(model_dict)
-    elif model_dict['meta'] == 'kprototypes':
-        check_version(model_dict)
-        return clus.deserialize_kprototypes(model_dict)
-    elif model_dict['meta'] == 'birch':
-        check_version(model_dict)
-        return clus.deserialize_birch(model_dict)
-    elif model_dict['meta'] == 'bisecting-kmeans':
-        check_version(model_dict)
-        return clus.deserialize_bisecting_kmeans(model_dict)
-    elif model_dict['meta'] == 'hdbscan':
-        check_version(model_dict)
-        return clus.deserialize_hdbscan(model_dict)
-
-    # Cross-decomposition
-    elif model_dict['meta'] == 'cca':
-        check_version(model_dict)
-        return crdec.deserialize_cca(model_dict)
-    elif model_dict['meta'] == 'pls-canonical':
-        check_version(model_dict)
-        return crdec.deserialize_pls_canonical(model_dict)
-    elif model_dict['meta'] == 'pls-regression':
-        check_version(model_dict)
-        return crdec.deserialize_pls_regression(model_dict)
-    elif model_dict['meta'] == 'pls-svd':
-        check_version(model_dict)
-        return crdec.deserialize_pls_svd(model_dict)
-
-    # Decomposition
-    elif model_dict['meta'] == 'pca':
-        check_version(model_dict)
-        return dec.deserialize_pca(model_dict)
-    elif model_dict['meta'] == 'kernel-pca':
-        check_version(model_dict)
-        return  dec.deserialize_kernel_pca(model_dict)
-    elif model_dict['meta'] == 'incremental-pca':
-        check_version(model_dict)
-        return  dec.deserialize_incremental_pca(model_dict)
-    elif model_dict['meta'] == 'sparse-pca':
-        check_version(model_dict)
-        return  dec.deserialize_sparse_pca(model_dict)
-    elif model_dict['meta'] == 'minibatch-sparse-pca':
-        check_version(model_dict)
-        return  dec.deserialize_minibatch_sparse_pca(model_dict)
-    elif model_dict['meta'] == 'dictionary-learning':
-        check_version(model_dict)
-        return  dec.deserialize_dictionary_learning(model_dict)
-    elif model_dict['meta'] == 'minibatch-dictionary-learning':
-        check_version(model_dict)
-        return  dec.deserialize_minibatch_dictionary_learning(model_dict)
-    elif model_dict['meta'] == 'factor-analysis':
-        check_version(model_dict)
-        return  dec.deserialize_factor_analysis(model_dict)
-    elif model_dict['meta'] == 'fast-ica':
-        check_version(model_dict)
-        return  dec.deserialize_fast_ica(model_dict)
-    elif model_dict['meta'] == 'latent-dirichlet-allocation':
-        check_version(model_dict)
-        return  dec.deserialize_latent_dirichlet_allocation(model_dict)
-    elif model_dict['meta'] == 'nmf':
-        check_version(model_dict)
-        return  dec.deserialize_nmf(model_dict)
-    elif model_dict['meta'] == 'minibatch-nmf':
-        check_version(model_dict)
-        return  dec.deserialize_minibatch_nmf(model_dict)
-    elif model_dict['meta'] == 'sparse-coder':
-        check_version(model_dict)
-        return  dec.deserialize_sparse_coder(model_dict)
-    elif model_dict['meta'] == 'truncated-svd':
-        check_version(model_dict)
-        return  dec.deserialize_truncated_svd(model_dict)
-
-    # Manifold
-    elif model_dict['meta'] == 'tsne':
-        check_version(model_dict)
-        return  man.deserialize_tsne(model_dict)
-    elif model_dict['meta'] == 'mds':
-        check_version(model_dict)
-        return  man.deserialize_mds(model_dict)
-    elif model_dict['meta'] == 'isomap':
-        check_version(model_dict)
-        return  man.deserialize_isomap(model_dict)
-    elif model_dict['meta'] == 'locally-linear-embedding':
-        check_version(model_dict)
-        return  man.deserialize_locally_linear_embedding(model_dict)
-    elif model_dict['meta'] == 'spectral-embedding':
-        check_version(model_dict)
-        return  man.deserialize_spectral_embedding(model_dict)
-    elif model_dict['meta'] == 'umap':
-        check_version(model_dict)
-        return  man.deserialize_umap(model_dict)
-    elif model_dict['meta'] == 'openTSNE':
-        check_version(model_dict)
-        return  man.deserialize_opentsne(model_dict)
-    elif model_dict['meta'] == 'openTSNEEmbedding':
-        check_version(model_dict)
-        return  man.deserialize_opentsne_embedding(model_dict)
-    elif model_dict['meta'] == 'openTSNEPartialEmbedding':
-        check_version(model_dict)
-        return  man.deserialize_opentsne_partial_embedding(model_dict)
-
-    # Neighbors
-    elif model_dict['meta'] == 'nearest-neighbors':
-        check_version(model_dict)
-        return  nei.deserialize_nearest_neighbors(model_dict)
-    elif model_dict['meta'] == 'kdtree':
-        check_version(model_dict)
-        return  nei.deserialize_kdtree(model_dict)
-    elif model_dict['meta'] == 'kernel-density':
-        check_version(model_dict)
-        return  nei.deserialize_kernel_density(model_dict)
-    elif model_dict['meta'] == 'nn-descent':
-        check_version(model_dict)
-        return  nei.deserialize_nndescent(model_dict)
-
-    # Feature Extraction
-    elif model_dict['meta'] == 'dict-vectorizer':
-        check_version(model_dict)
-        return ext.deserialize_dict_vectorizer(model_dict)
-
-    # Preprocess
-    elif model_dict['meta'] == 'label-encoder':
-        check_version(model_dict)
-        return pre.deserialize_label_encoder(model_dict)
-    elif model_dict['meta'] == 'label-binarizer':
-        check_version(model_dict)
-        return pre.deserialize_label_binarizer(model_dict)
-    elif model_dict['meta'] == 'multilabel-binarizer':
-        check_version(model_dict)
-        return pre.deserialize_multilabel_binarizer(model_dict)
-    elif model_dict['meta'] == 'minmax-scaler':
-        check_version(model_dict)
-        return pre.deserialize_minmax_scaler(model_dict)
-    elif model_dict['meta'] == 'standard-scaler':
-        check_version(model_dict)
-        return pre.deserialize_standard_scaler(model_dict)
-    elif model_dict['meta'] == 'robust-scaler':
-        check_version(model_dict)
-        return pre.deserialize_robust_scaler(model_dict)
-    elif model_dict['meta'] == 'maxabs-scaler':
-        check_version(model_dict)
-        return pre.deserialize_maxabs_scaler(model_dict)
-    elif model_dict['meta'] == 'kernel-centerer':
-        check_version(model_dict)
-        return pre.deserialize_kernel_centerer(model_dict)
-    elif model_dict['meta'] == 'onehot-encoder':
-        check_version(model_dict)
-        return pre.deserialize_onehot_encoder(model_dict)
-    elif model_dict['meta'] == 'ordinal-encoder':
-        check_version(model_dict)
-        return pre.deserialize_ordinal_encoder(model_dict)
-    elif model_dict['meta'] == 'normalizer':
-        check_version(model_dict)
-        return pre.deserialize_normalizer(model_dict)
-
-    # Applicability Domain
-    elif model_dict['meta'] == 'bounding-box-ad':
-        check_version(model_dict)
-        return ad.deserialize_bounding_box_applicability_domain(model_dict)
-    elif model_dict['meta'] == 'convex-hull-ad':
-        check_version(model_dict)
-        return ad.deserialize_convex_hull_applicability_domain(model_dict)
-    elif model_dict['meta'] == 'pca-bounding-box-ad':
-        check_version(model_dict)
-        return ad.deserialize_pca_bounding_box_applicability_domain(model_dict)
-    elif model_dict['meta'] == 'topkat-ad':
-        check_version(model_dict)
-        return ad.deserialize_topkat_applicability_domain(model_dict)
-    elif model_dict['meta'] == 'leverage-ad':
-        check_version(model_dict)
-        return ad.deserialize_leverage_applicability_domain(model_dict)
-    elif model_dict['meta'] == 'hotelling-t2-ad':
-        check_version(model_dict)
-        return ad.deserialize_hotelling_t2_applicability_domain(model_dict)
-    elif model_dict['meta'] == 'kernel-density-ad':
-        check_version(model_dict)
-        return ad.deserialize_kernel_density_applicability_domain(model_dict)
-    elif model_dict['meta'] == 'isolation-forest-ad':
-        check_version(model_dict)
-        return ad.deserialize_isolation_forest_applicability_domain(model_dict)
-    elif model_dict['meta'] == 'centroid-distance-ad':
-        check_version(model_dict)
-        return ad.deserialize_centroid_distance_applicability_domain(model_dict)
-    elif model_dict['meta'] == 'knn-ad':
-        check_version(model_dict)
-        return ad.deserialize_knn_applicability_domain(model_dict)
-    elif model_dict['meta'] == 'standardization-approach-ad':
-        check_version(model_dict)
-        return ad.deserialize_standardization_approach_applicability_domain(model_dict)
-
-    # Balancing
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'cluster-centroids':
-        check_version(model_dict)
-        return ous.deserialize_cluster_centroids(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'condensed-nearest-neighbours':
-        check_version(model_dict)
-        return ous.deserialize_condensed_nearest_neighbours(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'edited-nearest-neighbours':
-        check_version(model_dict)
-        return ous.deserialize_edited_nearest_neighbours(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'repeated-edited-nearest-neighbours':
-        check_version(model_dict)
-        return ous.deserialize_repeated_edited_nearest_neighbours(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'all-knn':
-        check_version(model_dict)
-        return ous.deserialize_all_knn(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'instance-hardness-threshold':
-        check_version(model_dict)
-        return ous.deserialize_instance_hardness_threshold(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'near-miss':
-        check_version(model_dict)
-        return ous.deserialize_near_miss(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'neighbourhood-cleaning-rule':
-        check_version(model_dict)
-        return ous.deserialize_neighbourhood_cleaning_rule(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'one-sided-selection':
-        check_version(model_dict)
-        return ous.deserialize_one_sided_selection(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'random-under-sampler':
-        check_version(model_dict)
-        return ous.deserialize_random_under_sampler(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'tomek-links':
-        check_version(model_dict)
-        return ous.deserialize_tomek_links(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'random-over-sampler':
-        check_version(model_dict)
-        return ous.deserialize_random_over_sampler(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'smotenc':
-        check_version(model_dict)
-        return ous.deserialize_smotenc(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'smoten':
-        check_version(model_dict)
-        return ous.deserialize_smoten(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'smote':
-        check_version(model_dict)
-        return ous.deserialize_smote(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'adasyn':
-        check_version(model_dict)
-        return ous.deserialize_adasyn(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'borderline-smote':
-        check_version(model_dict)
-        return ous.deserialize_borderline_smote(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'kmeans-smote':
-        check_version(model_dict)
-        return ous.deserialize_kmeans_smote(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'svm-smote':
-        check_version(model_dict)
-        return ous.deserialize_svm_smote(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'smote-enn':
-        check_version(model_dict)
-        return ous.deserialize_smote_enn(model_dict)
-    elif 'imblearn' in ous.__optionals__ and model_dict['meta'] == 'smote-tomek':
-        check_version(model_dict)
-        return ous.deserialize_smote_tomek(model_dict)
-
-    # Pipeline
-    elif model_dict['meta'] == 'pipeline':
-        check_version(model_dict)
-        return ppl.deserialize_pipeline(model_dict)
-
-    # Otherwise
-    else:
+    deserializer = get_deserializer(model_dict['meta']) if isinstance(model_dict.get('meta'), str) else None
+    if deserializer is None:
         raise ModelNotSupported('Model type not supported or corrupt JSON file.')
+    check_version(model_dict)
+    return observe('deserialize', model_dict['meta'], deserializer, model_dict)
 
 
 def serialize_unfitted_model(model):
@@ -1037,7 +93,7 @@ def serialize_unfitted_model(model):
         'params': model.get_params()
     }
     serialize_version(model, serialized_model)
-    return serialized_model
+    return _header_first(serialized_model)
 
 
 def deserialize_unfitted_model(model_dict: Dict):
@@ -1050,56 +106,346 @@ def deserialize_unfitted_model(model_dict: Dict):
     return model
 
 
-def to_dict(model, catboost_data: Pool = None):
-    """Equivalent to `serialize_model`"""
-    return serialize_model(model, catboost_data)
+def to_dict(model, catboost_data: 'Pool' = None, n_jobs: int = None):
+    """Equivalent to `serialize_model`, the members of ensembles being possibly serialized in parallel.
 
+    :param model: the model to serialize
+    :param catboost_data: if `model` is a CatBoost model, the data `Pool` used to train it
+    :param n_jobs: number of worker processes serializing the members of ensembles (e.g. the trees of forests),
+                   -1 for as many as there are CPUs; None or 1 to serialize them in turn
+    """
+    with member_pool(n_jobs):
+        return serialize_model(model, catboost_data)
 
-def from_dict(model_dict):
-    """Equivalent to `deserialize_model`"""
-    return deserialize_model(model_dict)
 
+def from_dict(model_dict, n_jobs: int = None):
+    """Equivalent to `deserialize_model`, the members of ensembles being possibly deserialized in parallel.
 
-def to_json(model, outfile, catboost_data: Pool = None):
-    """Serialize a model to a json file.
+    :param model_dict: dictionary of the previously serialized model
+    :param n_jobs: number of threads deserializing the members of ensembles (e.g. the trees of forests),
+                   -1 for as many as there are CPUs; None or 1 to deserialize them in turn
+    """
+    with member_pool(n_jobs):
+        return deserialize_model(model_dict)
+
+
+def to_json(model, outfile, catboost_data: 'Pool' = None, compression: str = 'infer', compression_level: int = None,
+            n_jobs: int = None):
+    """Serialize a model to a json file, possibly compressed.
+
+    With the 'json' backend (see `set_config`), the json text is written incrementally as by `iter_json`.
+    With orjson, it is encoded at once, numpy arrays being encoded natively rather than converted to lists,
+    unless the arrays of the model are larger than `json_backend.STREAMING_THRESHOLD` (64 MB), in which case
+    it is written incrementally as well.
+    In both cases, the text is compressed while being written.
+    With `n_jobs`, the members of ensembles are serialized and encoded by worker processes,
+    the file being the same as when they are serialized in turn.
 
     :param model: the model to serialize
-    :param outfile: the json file to be created
+    :param outfile: the json file to be created, or a file object (e.g. `io.BytesIO`) left open once written;
+                    text file objects (e.g. `io.StringIO`) cannot be compressed
     :param catboost_data: if `model` is a CatBoost model, the data `Pool` used to train it
+    :param compression: codec the file is compressed with ('gzip', 'bz2', 'xz' or 'zstd'), None for no compression,
+                        or 'infer' to infer it from the extension of `outfile` (e.g. '.gz' or '.zst')
+    :param compression_level: compression level, default to the default of the codec
+    :param n_jobs: number of worker processes serializing the members of ensembles, as for `to_dict`
     """
-    model_dict = to_dict(model, catboost_data)
-    dict_to_json(model_dict, outfile)
+    from .utils.compression import infer_compression, open_file
+    from .utils.json_backend import get_json_backend, dump_model
+
+    if n_jobs is not None:
+        n_workers(n_jobs)  # invalid values are rejected before the file is created
+    compression = infer_compression(outfile, compression)
+    if get_json_backend() == 'json':
+        chunks = iter_json(model, catboost_data, n_jobs)
+        with open_file(outfile, 'w', compression, compression_level) as model_json:
+            model_json.writelines(chunks)
+    else:
+        with open_file(outfile, 'wb', compression, compression_level) as model_json:
+            for chunk in dump_model(lambda: to_dict(model, catboost_data, n_jobs)):
+                model_json.write(chunk)
 
 
-def from_json(infile):
+def iter_json(model, catboost_data: 'Pool' = None, n_jobs: int = None) -> Iterator[str]:
+    """Serialize a model to json incrementally.
+
+    Arrays are encoded chunk by chunk while the json text is consumed,
+    so that the whole text is never held in memory at once,
+    except for the members of ensembles encoded by worker processes with `n_jobs`.
+
+    :param model: the model to serialize
+    :param catboost_data: if `model` is a CatBoost model, the data `Pool` used to train it
+    :param n_jobs: number of worker processes serializing the members of ensembles, as for `to_dict`
+    :return: iterator over consecutive chunks of the json text
+    """
+    from .utils.streaming import iter_model_json
+
+    if n_jobs is not None:
+        n_workers(n_jobs)  # invalid values are rejected up front, rather than once iterating
+    return iter_model_json(lambda: to_dict(model, catboost_data, n_jobs))
+
+
+def from_json(infile, n_jobs: int = None, lazy: bool = False):
     """Instantiate a previously serialized model from a json file.
 
+    The file is parsed incrementally, and large lists of numbers are read directly into numpy arrays.
+    Compressed files are decompressed on the fly, their codec being detected from their first bytes.
+    With `n_jobs`, the members of ensembles are only delimited while reading the file,
+    to be parsed and deserialized by worker processes.
+
+    With `lazy`, the trees of random forests and extra trees are only deserialized when first accessed
+    (e.g. by `predict`, or by `model.estimators_[:10]`), their `estimators_` being a sequence of trees loaded on demand.
+    Trees of uncompressed files are then read again from the file, which should be left unchanged,
+    rather than kept in memory.
+
+    :param infile: json file containing the serialized model, or a binary or text file object (e.g. `io.BytesIO`)
+    :param n_jobs: number of worker processes deserializing the members of ensembles (e.g. the trees of forests),
+                   -1 for as many as there are CPUs; None or 1 to deserialize them in turn
+    :param lazy: whether the trees of forests are deserialized on first access
+    """
+    import os
+    from .utils.compression import detect_compression, is_file_object, open_file
+    from .utils.lazy import lazy_loading
+    from .utils.streaming import read_json
+
+    with member_pool(n_jobs), lazy_loading(lazy):
+        compression = detect_compression(infile)
+        source = os.path.abspath(infile) if lazy and compression is None and not is_file_object(infile) else None
+        with open_file(infile, 'r', compression) as model_json:
+            model_dict = read_json(model_json, defer_members=lazy or (n_jobs is not None and n_jobs != 1),
+                                   source=source)
+        return deserialize_model(model_dict)
+
+
+async def ato_json(model, outfile, catboost_data: 'Pool' = None, compression: str = 'infer',
+                   compression_level: int = None, executor=None) -> None:
+    """Serialize a model to a json file as `to_json` does, in an executor so that the event loop is not blocked.
+
+    Cancelling the coroutine stops serializing the model soon after, the incomplete file being removed.
+
+    :param model: the model to serialize
+    :param outfile: the json file to be created
+    :param catboost_data: if `model` is a CatBoost model, the data `Pool` used to train it
+    :param compression: codec the file is compressed with, as for `to_json`
+    :param compression_level: compression level, default to the default of the codec
+    :param executor: `concurrent.futures` executor, None for the default executor of the event loop
+    """
+    from functools import partial
+    from .utils.aio import run_cancellable, write_or_remove
+
+    await run_cancellable(executor, partial(write_or_remove, to_json, catboost_data=catboost_data,
+                                            compression=compression, compression_level=compression_level),
+                          model, outfile)
+
+
+async def afrom_json(infile, n_jobs: int = None, lazy: bool = False, executor=None):
+    """Instantiate a model from a json file as `from_json` does, in an executor so that the event loop is not blocked.
+
+    The file is read and parsed, and the model reconstructed, by a thread of the executor (by default, that of the
+    event loop), with the options of the caller. Cancelling the coroutine stops reading the file or deserializing
+    the model soon after. With a `ProcessPoolExecutor`, models are loaded by another process and sent back,
+    and cannot be stopped once their loading started.
+
     :param infile: json file containing the serialized model
+    :param n_jobs: number of worker processes deserializing the members of ensembles, as for `from_json`
+    :param lazy: whether the trees of forests are deserialized on first access, as for `from_json`
+    :param executor: `concurrent.futures` executor, None for the default executor of the event loop
     """
-    model_dict = json_to_dict(infile)
-    return deserialize_model(model_dict)
+    from .utils.aio import run_cancellable
 
+    return await run_cancellable(executor, from_json, infile, n_jobs, lazy)
+
+
+async def afrom_json_many(infiles, n_jobs: int = None, lazy: bool = False, executor=None,
+                          return_exceptions: bool = False) -> List:
+    """Instantiate models from json files concurrently, as `afrom_json` does, in the order of the files.
+
+    :param infiles: json files containing the serialized models
+    :param n_jobs: number of worker processes deserializing the members of ensembles, as for `from_json`
+    :param lazy: whether the trees of forests are deserialized on first access, as for `from_json`
+    :param executor: `concurrent.futures` executor, None for the default executor of the event loop
+    :param return_exceptions: whether exceptions raised while loading models are returned in their place,
+                              as by `asyncio.gather`, rather than raised
+    """
+    import asyncio
+
+    return await asyncio.gather(*(afrom_json(infile, n_jobs, lazy, executor) for infile in infiles),
+                                return_exceptions=return_exceptions)
+
+
+def to_json_many(items, compression: str = 'infer', compression_level: int = None, n_jobs: int = -1,
+                 backend: str = 'process', priority=None) -> Iterator['BatchResult']:
+    """Serialize models to json files concurrently, as `to_json` does, in a pool of worker processes or threads.
+
+    Results are obtained as models are written. Errors are reported in the results rather than raised.
+
+    :param items: pairs of a model and the json file it is written to
+    :param compression: codec files are compressed with, as for `to_json`
+    :param compression_level: compression level, default to the default of the codec
+    :param n_jobs: number of workers, -1 for as many as there are CPUs
+    :param backend: either 'process' or 'thread'
+    :param priority: function giving the priority of each file, those of higher priorities being written first
+    :return: iterator of `BatchResult` (path, None, error)
+    """
+    from functools import partial
+    from .utils.batch import run_batch
 
-def dict_to_json(model_dict: Dict, outfile: str):
-    """Write a serialized model to a json file.
+    function = partial(to_json, compression=compression, compression_level=compression_level)
+    return run_batch(function, [(outfile, (model, outfile)) for model, outfile in items], n_jobs, backend, priority)
+
+
+def from_json_many(infiles, n_jobs: int = -1, backend: str = 'process', priority=None) -> Iterator['BatchResult']:
+    """Instantiate models from json files concurrently, as `from_json` does, in a pool of worker processes or threads.
+
+    Results are obtained as models are loaded, so that they can be used while others are still being read.
+    Errors (e.g. a missing or corrupted file) are reported in the results rather than raised.
+    Processes are faster than threads for many files, as parsing json holds the GIL,
+    although the models they load are sent back to the calling process.
+
+    :param infiles: json files containing the serialized models
+    :param n_jobs: number of workers, -1 for as many as there are CPUs
+    :param backend: either 'process' or 'thread'
+    :param priority: function giving the priority of each file, those of higher priorities being read first
+                     (e.g. `lambda path: path in hot_paths`, so that frequently used models are available first)
+    :return: iterator of `BatchResult` (path, model, error)
+    """
+    from .utils.batch import run_batch
+
+    return run_batch(from_json, [(infile, (infile,)) for infile in infiles], n_jobs, backend, priority)
+
+
+def to_archive(model, outfile, catboost_data: 'Pool' = None, inline_threshold: int = 1024, compress: bool = False):
+    """Serialize a model to a zip archive.
+
+    The archive contains the serialized model as a json manifest ('model.json'),
+    in which numeric arrays of at least `inline_threshold` bytes are replaced
+    by references to `.npy` members of the archive.
+
+    :param model: the model to serialize
+    :param outfile: the zip archive to be created
+    :param catboost_data: if `model` is a CatBoost model, the data `Pool` used to train it
+    :param inline_threshold: size (in bytes) from which arrays are stored as separate `.npy` members
+    :param compress: if True, members are deflated; otherwise they are stored as is, making them faster to read
+    """
+    from .utils.archive import write_archive
+
+    write_archive(lambda: to_dict(model, catboost_data), outfile, inline_threshold, compress)
+
+
+def from_archive(infile, n_jobs: int = None, mmap_mode: str = None):
+    """Instantiate a previously serialized model from a zip archive.
+
+    :param infile: zip archive containing the serialized model
+    :param n_jobs: maximum number of threads reading the `.npy` members of the archive
+    :param mmap_mode: if 'r' (read-only) or 'c' (copy-on-write), uncompressed `.npy` members are memory-mapped
+                      instead of being read into memory, so that processes loading the same archive share their pages
+    """
+    from .utils.archive import read_archive
+
+    return read_archive(infile, deserialize_model, n_jobs, mmap_mode)
+
+
+def verify_precision(model, X, float_precision='float32', method: str = None, catboost_data: 'Pool' = None) -> Dict:
+    """Measure how exporting a model with reduced float precision changes its predictions.
+
+    The model is serialized to json with the given `float_precision` (see `set_config`) and read back,
+    and the outputs of both models on a sample batch are compared.
+    Sizes are those of the json text with the current `array_encoding`: with 'base64', rounding to more than
+    6 significant digits keeps arrays in float64, so that the size is unchanged (see `storage_dtype`).
+
+    :param model: the model to export
+    :param X: sample batch to compare the predictions of the models on
+    :param float_precision: precision of floats to be evaluated, as for `set_config`
+    :param method: method of the model giving the predictions, default to the first of 'predict_proba',
+                   'decision_function', 'predict' and 'transform' the model has
+    :param catboost_data: if `model` is a CatBoost model, the data `Pool` used to train it
+    :return: dictionary of the method compared ('method'), the maximum absolute deviation of its numeric outputs
+             ('max_deviation', None for non-numeric outputs), the number of outputs that differ ('n_different'),
+             and the lengths of the json text with full and reduced precision ('full_size' and 'size')
+    """
+    import io
+    import numpy as np
+    from .utils.streaming import read_json
+
+    if method is None:
+        method = next(name for name in ('predict_proba', 'decision_function', 'predict', 'transform')
+                      if hasattr(model, name))
+    with config_context(float_precision='float64'):
+        full_size = sum(len(chunk) for chunk in iter_json(model, catboost_data))
+    with config_context(float_precision=float_precision):
+        text = ''.join(iter_json(model, catboost_data))
+    reloaded_model = deserialize_model(read_json(io.StringIO(text)))
+
+    expected = np.asarray(getattr(model, method)(X))
+    obtained = np.asarray(getattr(reloaded_model, method)(X))
+    numeric = expected.dtype.kind in 'biufc' and obtained.dtype.kind in 'biufc'
+    return {
+        'method': method,
+        'max_deviation': float(np.max(np.abs(obtained - expected), initial=0)) if numeric else None,
+        'n_different': int(np.sum(obtained != expected)),
+        'full_size': full_size,
+        'size': len(text),
+    }
+
+
+def dict_to_json(model_dict: Dict, outfile, compression: str = 'infer', compression_level: int = None):
+    """Write a serialized model to a json file, with the current json backend.
 
     :param model_dict: serialized model
-    :param outfile: json file to be created
+    :param outfile: json file to be created, or file object, as for `to_json`
+    :param compression: codec the file is compressed with, as for `to_json`
+    :param compression_level: compression level, default to the default of the codec
     """
-    with open(outfile, 'w') as model_json:
-        json.dump(model_dict, model_json)
+    from .utils.compression import infer_compression, open_file
+    from .utils.json_backend import get_json_backend, dumps
+    from .utils.streaming import iter_encode
+
+    compression = infer_compression(outfile, compression)
+    if get_json_backend() == 'json':
+        with open_file(outfile, 'w', compression, compression_level) as model_json:
+            model_json.writelines(iter_encode(model_dict))
+    else:
+        with open_file(outfile, 'wb', compression, compression_level) as model_json:
+            model_json.write(dumps(model_dict))
 
 
 def json_to_dict(infile):
-    """Obtain a serialized model from a json file.
+    """Obtain a serialized model from a json file, with the current json backend.
 
-    :param infile: json file to read the serialized model from
+    :param infile: json file to read the serialized model from, possibly compressed, or file object
     """
-    with open(infile, 'r') as model_json:
-        model_dict = json.load(model_json)
+    from .utils.compression import detect_compression, open_file
+    from .utils.json_backend import loads
+
+    with open_file(infile, 'rb', detect_compression(infile)) as model_json:
+        model_dict = loads(model_json.read())
     return model_dict
 
 
+def peek(infile) -> Dict:
+    """Read the header of a serialized model (its type, library versions, parameters and features) from a file.
+
+    Models are written with their header first, so that only the start of json files is read.
+    Values of other keys preceding the header in files written by earlier versions are skimmed without being parsed.
+
+    :param infile: json file, possibly compressed, or zip archive containing the serialized model, or file object
+                   holding a json file
+    :return: dictionary of the keys of `HEADER_KEYS` the serialized model holds
+             (e.g. {'meta': 'rf', 'versions': ['sklearn', '1.4.0'], 'n_features_in_': 20, 'params': {...}})
+    """
+    import io
+    import zipfile
+    from .utils.archive import MANIFEST_NAME
+    from .utils.compression import detect_compression, is_file_object, open_file
+    from .utils.streaming import read_header
+
+    if not is_file_object(infile) and zipfile.is_zipfile(infile):
+        with zipfile.ZipFile(infile, 'r') as archive, archive.open(MANIFEST_NAME) as manifest:
+            return read_header(io.TextIOWrapper(manifest, encoding='utf-8'), HEADER_KEYS)
+    with open_file(infile, 'r', detect_compression(infile)) as model_json:
+        return read_header(model_json, HEADER_KEYS)
+
+
 def serialize_version(model, model_dict):
     """Add version(s) of the libraries required to instantiate the model.
 
@@ -1125,19 +471,235 @@ def check_version(model_dict):
         return
     # Obtain module used to fit the model
     module_name, version = model_dict['versions']
+    installed_version = _get_installed_version(module_name, version)
+    if installed_version is not None:
+        warnings.warn(f'Version of the current {module_name} library ({installed_version}) '
+                      f'does not match the version used to fit the serialized model ({version})')
+
+
+def _header_first(model_dict: Dict) -> Dict:
+    """Reorder the keys of a serialized model so that those of its header come first."""
+    header = {key: model_dict[key] for key in HEADER_KEYS if key in model_dict}
+    return {**header, **model_dict}
+
+
+@lru_cache(maxsize=None)
+def _get_installed_version(module_name, version):
+    """Obtain the version of an installed library if it differs from the one a model was fitted with.
+
+    Results are cached so that nested models do not look the library up again.
+
+    :param module_name: name of the library
+    :param version: version of the library the model was fitted with
+    :return: None if the versions match or if `version` is empty
+    """
     # Module is installed
     installed = importlib.util.find_spec(module_name) is not None
     if not installed:
         raise ModuleNotFoundError(f'Module {module_name} could not be found. Is it installed?')
     # Check version of the installed module
     if version == '':
-        return
+        return None
     installed_version = importlib.import_module(module_name).__version__
     if version != installed_version:
-        warnings.warn(f'Version of the current {module_name} library ({installed_version}) '
-                      f'does not match the version used to fit the serialized model ({version})')
+        return installed_version
+    return None
+
+
+def _attribute_precisions(model):
+    """Make the precisions given by attribute name in the `float_precision` option apply to the arrays of a model."""
+    if not isinstance(get_config()['float_precision'], dict):
+        return nullcontext()
+    from .utils.precision import attribute_names
+
+    return attribute_names(model)
 
 
 class ModelNotSupported(Exception):
     """Custom class for unsupported model types."""
     pass
+
+
+def _register_builtin(cls: str, meta: str, module: str, name: str, pass_catboost_data: bool = False):
+    """Register the (de)serializers of a supported model, to be imported on first use.
+
+    :param cls: import path of the class of the model
+    :param meta: tag identifying the serialized model
+    :param module: module of this package implementing the (de)serializers
+    :param name: name of the (de)serializers, without their 'serialize_' and 'deserialize_' prefixes
+    :param pass_catboost_data: if True, the serializer also receives the CatBoost data `Pool` as second argument
+    """
+    register(cls, meta, f'{__package__}.{module}:serialize_{name}', f'{__package__}.{module}:deserialize_{name}',
+             pass_catboost_data=pass_catboost_data)
+
+
+def _register_builtin_models():
+    """Register the (de)serializers of all supported models."""
+    # Classification
+    _register_builtin('sklearn.linear_model:LogisticRegression', 'lr', 'classification', 'logistic_regression')
+    _register_builtin('sklearn.naive_bayes:BernoulliNB', 'bernoulli-nb', 'classification', 'bernoulli_nb')
+    _register_builtin('sklearn.naive_bayes:GaussianNB', 'gaussian-nb', 'classification', 'gaussian_nb')
+    _register_builtin('sklearn.naive_bayes:MultinomialNB', 'multinomial-nb', 'classification', 'multinomial_nb')
+    _register_builtin('sklearn.naive_bayes:ComplementNB', 'complement-nb', 'classification', 'complement_nb')
+    _register_builtin('sklearn.discriminant_analysis:LinearDiscriminantAnalysis', 'lda', 'classification', 'lda')
+    _register_builtin('sklearn.discriminant_analysis:QuadraticDiscriminantAnalysis', 'qda', 'classification', 'qda')
+    _register_builtin('sklearn.svm:SVC', 'svm', 'classification', 'svm')
+    _register_builtin('sklearn.linear_model:Perceptron', 'perceptron', 'classification', 'perceptron')
+    _register_builtin('sklearn.tree:DecisionTreeClassifier', 'decision-tree', 'classification', 'decision_tree')
+    _register_builtin('sklearn.ensemble:GradientBoostingClassifier', 'gb', 'classification', 'gradient_boosting')
+    _register_builtin('sklearn.ensemble:RandomForestClassifier', 'rf', 'classification', 'random_forest')
+    _register_builtin('sklearn.neural_network:MLPClassifier', 'mlp', 'classification', 'mlp')
+    _register_builtin('xgboost:XGBClassifier', 'xgboost-classifier', 'classification', 'xgboost_classifier')
+    _register_builtin('xgboost:XGBRFClassifier', 'xgboost-rf-classifier', 'classification', 'xgboost_rf_classifier')
+    _register_builtin('lightgbm:LGBMClassifier', 'lightgbm-classifier', 'classification', 'lightgbm_classifier')
+    _register_builtin('catboost:CatBoostClassifier', 'catboost-classifier', 'classification', 'catboost_classifier', pass_catboost_data=True)
+    _register_builtin('sklearn.ensemble:AdaBoostClassifier', 'adaboost-classifier', 'classification', 'adaboost_classifier')
+    _register_builtin('sklearn.ensemble:BaggingClassifier', 'bagging-classifier', 'classification', 'bagging_classifier')
+    _register_builtin('sklearn.tree:ExtraTreeClassifier', 'extra-tree-cls', 'classification', 'extra_tree_classifier')
+    _register_builtin('sklearn.ensemble:ExtraTreesClassifier', 'extratrees-classifier', 'classification', 'extratrees_classifier')
+    _register_builtin('sklearn.ensemble:IsolationForest', 'isolation-forest', 'classification', 'isolation_forest')
+    _register_builtin('sklearn.ensemble:RandomTreesEmbedding', 'random-trees-embedding', 'classification', 'random_trees_embedding')
+    _register_builtin('sklearn.neighbors:KNeighborsClassifier', 'nearest-neighbour-classifier', 'classification', 'nearest_neighbour_classifier')
+    _register_builtin('sklearn.ensemble:StackingClassifier', 'stacking-classifier', 'classification', 'stacking_classifier')
+    _register_builtin('sklearn.ensemble:VotingClassifier', 'voting-classifier', 'classification', 'voting_classifier')
+
+    # Regression
+    _register_builtin('sklearn.linear_model:LinearRegression', 'linear-regression', 'regression', 'linear_regressor')
+    _register_builtin('sklearn.linear_model:Lasso', 'lasso-regression', 'regression', 'lasso_regressor')
+    _register_builtin('sklearn.linear_model:ElasticNet', 'elasticnet-regression', 'regression', 'elastic_regressor')
+    _register_builtin('sklearn.linear_model:Ridge', 'ridge-regression', 'regression', 'ridge_regressor')
+    _register_builtin('sklearn.svm:SVR', 'svr', 'regression', 'svr')
+    _register_builtin('sklearn.tree:ExtraTreeRegressor', 'extra-tree-reg', 'regression', 'extra_tree_regressor')
+    _register_builtin('sklearn.tree:DecisionTreeRegressor', 'decision-tree-regression', 'regression', 'decision_tree_regressor')
+    _register_builtin('sklearn.ensemble:GradientBoostingRegressor', 'gb-regression', 'regression', 'gradient_boosting_regressor')
+    _register_builtin('sklearn.ensemble:RandomForestRegressor', 'rf-regression', 'regression', 'random_forest_regressor')
+    _register_builtin('sklearn.ensemble:ExtraTreesRegressor', 'extratrees-regressor', 'regression', 'extratrees_regressor')
+    _register_builtin('sklearn.neural_network:MLPRegressor', 'mlp-regression', 'regression', 'mlp_regressor')
+    _register_builtin('xgboost:XGBRanker', 'xgboost-ranker', 'regression', 'xgboost_ranker')
+    _register_builtin('xgboost:XGBRegressor', 'xgboost-regressor', 'regression', 'xgboost_regressor')
+    _register_builtin('xgboost:XGBRFRegressor', 'xgboost-rf-regressor', 'regression', 'xgboost_rf_regressor')
+    _register_builtin('lightgbm:LGBMRegressor', 'lightgbm-regressor', 'regression', 'lightgbm_regressor')
+    _register_builtin('lightgbm:LGBMRanker', 'lightgbm-ranker', 'regression', 'lightgbm_ranker')
+    _register_builtin('catboost:CatBoostRegressor', 'catboost-regressor', 'regression', 'catboost_regressor', pass_catboost_data=True)
+    _register_builtin('catboost:CatBoostRanker', 'catboost-ranker', 'regression', 'catboost_ranker', pass_catboost_data=True)
+    _register_builtin('sklearn.ensemble:AdaBoostRegressor', 'adaboost-regressor', 'regression', 'adaboost_regressor')
+    _register_builtin('sklearn.ensemble:BaggingRegressor', 'bagging-regression', 'regression', 'bagging_regressor')
+    _register_builtin('sklearn.neighbors:KNeighborsRegressor', 'nearest-neighbour-regressor', 'regression', 'nearest_neighbour_regressor')
+    _register_builtin('sklearn.ensemble:StackingRegressor', 'stacking-regressor', 'regression', 'stacking_regressor')
+    _register_builtin('sklearn.ensemble:VotingRegressor', 'voting-regressor', 'regression', 'voting_regressor')
+
+    # Clustering
+    _register_builtin('sklearn.cluster:FeatureAgglomeration', 'feature-agglomeration', 'cluster', 'feature_agglomeration')
+    _register_builtin('sklearn.cluster:AffinityPropagation', 'affinity-propagation', 'cluster', 'affinity_propagation')
+    _register_builtin('sklearn.cluster:AgglomerativeClustering', 'agglomerative-clustering', 'cluster', 'agglomerative_clustering')
+    _register_builtin('sklearn.cluster:DBSCAN', 'dbscan', 'cluster', 'dbscan')
+    _register_builtin('sklearn.cluster:MeanShift', 'meanshift', 'cluster', 'meanshift')
+    _register_builtin('sklearn.cluster:BisectingKMeans', 'bisecting-kmeans', 'cluster', 'bisecting_kmeans')
+    _register_builtin('sklearn.cluster:MiniBatchKMeans', 'minibatch-kmeans', 'cluster', 'minibatch_kmeans')
+    _register_builtin('sklearn.cluster:KMeans', 'kmeans', 'cluster', 'kmeans')
+    _register_builtin('sklearn.cluster:OPTICS', 'optics', 'cluster', 'optics')
+    _register_builtin('sklearn.cluster:SpectralClustering', 'spectral-clustering', 'cluster', 'spectral_clustering')
+    _register_builtin('sklearn.cluster:SpectralBiclustering', 'spectral-biclustering', 'cluster', 'spectral_biclustering')
+    _register_builtin('sklearn.cluster:SpectralCoclustering', 'spectral-coclustering', 'cluster', 'spectral_coclustering')
+    _register_builtin('kmodes.kprototypes:KPrototypes', 'kprototypes', 'cluster', 'kprototypes')
+    _register_builtin('kmodes.kmodes:KModes', 'kmodes', 'cluster', 'kmodes')
+    _register_builtin('sklearn.cluster:Birch', 'birch', 'cluster', 'birch')
+    _register_builtin('hdbscan:HDBSCAN', 'hdbscan', 'cluster', 'hdbscan')
+
+    # Cross-decomposition
+    _register_builtin('sklearn.cross_decomposition:CCA', 'cca', 'cross_decomposition', 'cca')
+    _register_builtin('sklearn.cross_decomposition:PLSCanonical', 'pls-canonical', 'cross_decomposition', 'pls_canonical')
+    _register_builtin('sklearn.cross_decomposition:PLSRegression', 'pls-regression', 'cross_decomposition', 'pls_regression')
+    _register_builtin('sklearn.cross_decomposition:PLSSVD', 'pls-svd', 'cross_decomposition', 'pls_svd')
+
+    # Decomposition
+    _register_builtin('sklearn.decomposition:PCA', 'pca', 'decomposition', 'pca')
+    _register_builtin('sklearn.decomposition:KernelPCA', 'kernel-pca', 'decomposition', 'kernel_pca')
+    _register_builtin('sklearn.decomposition:IncrementalPCA', 'incremental-pca', 'decomposition', 'incremental_pca')
+    _register_builtin('sklearn.decomposition:MiniBatchSparsePCA', 'minibatch-sparse-pca', 'decomposition', 'minibatch_sparse_pca')
+    _register_builtin('sklearn.decomposition:SparsePCA', 'sparse-pca', 'decomposition', 'sparse_pca')
+    _register_builtin('sklearn.decomposition:MiniBatchDictionaryLearning', 'minibatch-dictionary-learning', 'decomposition', 'minibatch_dictionary_learning')
+    _register_builtin('sklearn.decomposition:DictionaryLearning', 'dictionary-learning', 'decomposition', 'dictionary_learning')
+    _register_builtin('sklearn.decomposition:FactorAnalysis', 'factor-analysis', 'decomposition', 'factor_analysis')
+    _register_builtin('sklearn.decomposition:FastICA', 'fast-ica', 'decomposition', 'fast_ica')
+    _register_builtin('sklearn.decomposition:LatentDirichletAllocation', 'latent-dirichlet-allocation', 'decomposition', 'latent_dirichlet_allocation')
+    _register_builtin('sklearn.decomposition:MiniBatchNMF', 'minibatch-nmf', 'decomposition', 'minibatch_nmf')
+    _register_builtin('sklearn.decomposition:NMF', 'nmf', 'decomposition', 'nmf')
+    _register_builtin('sklearn.decomposition:SparseCoder', 'sparse-coder', 'decomposition', 'sparse_coder')
+    _register_builtin('sklearn.decomposition:TruncatedSVD', 'truncated-svd', 'decomposition', 'truncated_svd')
+
+    # Manifold
+    _register_builtin('sklearn.manifold:TSNE', 'tsne', 'manifold', 'tsne')
+    _register_builtin('sklearn.manifold:MDS', 'mds', 'manifold', 'mds')
+    _register_builtin('sklearn.manifold:Isomap', 'isomap', 'manifold', 'isomap')
+    _register_builtin('sklearn.manifold:LocallyLinearEmbedding', 'locally-linear-embedding', 'manifold', 'locally_linear_embedding')
+    _register_builtin('sklearn.manifold:SpectralEmbedding', 'spectral-embedding', 'manifold', 'spectral_embedding')
+    _register_builtin('umap:UMAP', 'umap', 'manifold', 'umap')
+    _register_builtin('openTSNE:TSNE', 'openTSNE', 'manifold', 'opentsne')
+    _register_builtin('openTSNE.sklearn:TSNE', 'openTSNE', 'manifold', 'opentsne')
+    _register_builtin('openTSNE:TSNEEmbedding', 'openTSNEEmbedding', 'manifold', 'opentsne_embedding')
+    _register_builtin('openTSNE:PartialTSNEEmbedding', 'openTSNEPartialEmbedding', 'manifold', 'opentsne_partial_embedding')
+
+    # Neighbors
+    _register_builtin('sklearn.neighbors:NearestNeighbors', 'nearest-neighbors', 'neighbors', 'nearest_neighbors')
+    _register_builtin('sklearn.neighbors:KDTree', 'kdtree', 'neighbors', 'kdtree')
+    _register_builtin('sklearn.neighbors:KernelDensity', 'kernel-density', 'neighbors', 'kernel_density')
+    _register_builtin('pynndescent:NNDescent', 'nn-descent', 'neighbors', 'nndescent')
+
+    # Feature Extraction
+    _register_builtin('sklearn.feature_extraction:DictVectorizer', 'dict-vectorizer', 'feature_extraction', 'dict_vectorizer')
+
+    # Preprocess
+    _register_builtin('sklearn.preprocessing:LabelEncoder', 'label-encoder', 'preprocessing', 'label_encoder')
+    _register_builtin('sklearn.preprocessing:LabelBinarizer', 'label-binarizer', 'preprocessing', 'label_binarizer')
+    _register_builtin('sklearn.preprocessing:MultiLabelBinarizer', 'multilabel-binarizer', 'preprocessing', 'multilabel_binarizer')
+    _register_builtin('sklearn.preprocessing:MinMaxScaler', 'minmax-scaler', 'preprocessing', 'minmax_scaler')
+    _register_builtin('sklearn.preprocessing:StandardScaler', 'standard-scaler', 'preprocessing', 'standard_scaler')
+    _register_builtin('sklearn.preprocessing:RobustScaler', 'robust-scaler', 'preprocessing', 'robust_scaler')
+    _register_builtin('sklearn.preprocessing:MaxAbsScaler', 'maxabs-scaler', 'preprocessing', 'maxabs_scaler')
+    _register_builtin('sklearn.preprocessing:KernelCenterer', 'kernel-centerer', 'preprocessing', 'kernel_centerer')
+    _register_builtin('sklearn.preprocessing:OneHotEncoder', 'onehot-encoder', 'preprocessing', 'onehot_encoder')
+    _register_builtin('sklearn.preprocessing:OrdinalEncoder', 'ordinal-encoder', 'preprocessing', 'ordinal_encoder')
+    _register_builtin('sklearn.preprocessing:Normalizer', 'normalizer', 'preprocessing', 'normalizer')
+
+    # Applicability Domain
+    _register_builtin('mlchemad.applicability_domains:BoundingBoxApplicabilityDomain', 'bounding-box-ad', 'applicability_domain', 'bounding_box_applicability_domain')
+    _register_builtin('mlchemad.applicability_domains:ConvexHullApplicabilityDomain', 'convex-hull-ad', 'applicability_domain', 'convex_hull_applicability_domain')
+    _register_builtin('mlchemad.applicability_domains:PCABoundingBoxApplicabilityDomain', 'pca-bounding-box-ad', 'applicability_domain', 'pca_bounding_box_applicability_domain')
+    _register_builtin('mlchemad.applicability_domains:TopKatApplicabilityDomain', 'topkat-ad', 'applicability_domain', 'topkat_applicability_domain')
+    _register_builtin('mlchemad.applicability_domains:LeverageApplicabilityDomain', 'leverage-ad', 'applicability_domain', 'leverage_applicability_domain')
+    _register_builtin('mlchemad.applicability_domains:HotellingT2ApplicabilityDomain', 'hotelling-t2-ad', 'applicability_domain', 'hotelling_t2_applicability_domain')
+    _register_builtin('mlchemad.applicability_domains:KernelDensityApplicabilityDomain', 'kernel-density-ad', 'applicability_domain', 'kernel_density_applicability_domain')
+    _register_builtin('mlchemad.applicability_domains:IsolationForestApplicabilityDomain', 'isolation-forest-ad', 'applicability_domain', 'isolation_forest_applicability_domain')
+    _register_builtin('mlchemad.applicability_domains:CentroidDistanceApplicabilityDomain', 'centroid-distance-ad', 'applicability_domain', 'centroid_distance_applicability_domain')
+    _register_builtin('mlchemad.applicability_domains:KNNApplicabilityDomain', 'knn-ad', 'applicability_domain', 'knn_applicability_domain')
+    _register_builtin('mlchemad.applicability_domains:StandardizationApproachApplicabilityDomain', 'standardization-approach-ad', 'applicability_domain', 'standardization_approach_applicability_domain')
+
+    # Balancing
+    _register_builtin('imblearn.under_sampling:ClusterCentroids', 'cluster-centroids', 'over_undersampling', 'cluster_centroids')
+    _register_builtin('imblearn.under_sampling:CondensedNearestNeighbour', 'condensed-nearest-neighbours', 'over_undersampling', 'condensed_nearest_neighbours')
+    _register_builtin('imblearn.under_sampling:EditedNearestNeighbours', 'edited-nearest-neighbours', 'over_undersampling', 'edited_nearest_neighbours')
+    _register_builtin('imblearn.under_sampling:RepeatedEditedNearestNeighbours', 'repeated-edited-nearest-neighbours', 'over_undersampling', 'repeated_edited_nearest_neighbours')
+    _register_builtin('imblearn.under_sampling:AllKNN', 'all-knn', 'over_undersampling', 'all_knn')
+    _register_builtin('imblearn.under_sampling:InstanceHardnessThreshold', 'instance-hardness-threshold', 'over_undersampling', 'instance_hardness_threshold')
+    _register_builtin('imblearn.under_sampling:NearMiss', 'near-miss', 'over_undersampling', 'near_miss')
+    _register_builtin('imblearn.under_sampling:NeighbourhoodCleaningRule', 'neighbourhood-cleaning-rule', 'over_undersampling', 'neighbourhood_cleaning_rule')
+    _register_builtin('imblearn.under_sampling:OneSidedSelection', 'one-sided-selection', 'over_undersampling', 'one_sided_selection')
+    _register_builtin('imblearn.under_sampling:RandomUnderSampler', 'random-under-sampler', 'over_undersampling', 'random_under_sampler')
+    _register_builtin('imblearn.under_sampling:TomekLinks', 'tomek-links', 'over_undersampling', 'tomek_links')
+    _register_builtin('imblearn.over_sampling:RandomOverSampler', 'random-over-sampler', 'over_undersampling', 'random_over_sampler')
+    _register_builtin('imblearn.over_sampling:SMOTENC', 'smotenc', 'over_undersampling', 'smotenc')
+    _register_builtin('imblearn.over_sampling:SMOTEN', 'smoten', 'over_undersampling', 'smoten')
+    _register_builtin('imblearn.over_sampling:SMOTE', 'smote', 'over_undersampling', 'smote')
+    _register_builtin('imblearn.over_sampling:ADASYN', 'adasyn', 'over_undersampling', 'adasyn')
+    _register_builtin('imblearn.over_sampling:BorderlineSMOTE', 'borderline-smote', 'over_undersampling', 'borderline_smote')
+    _register_builtin('imblearn.over_sampling:KMeansSMOTE', 'kmeans-smote', 'over_undersampling', 'kmeans_smote')
+    _register_builtin('imblearn.over_sampling:SVMSMOTE', 'svm-smote', 'over_undersampling', 'svm_smote')
+    _register_builtin('imblearn.combine:SMOTEENN', 'smote-enn', 'over_undersampling', 'smote_enn')
+    _register_builtin('imblearn.combine:SMOTETomek', 'smote-tomek', 'over_undersampling', 'smote_tomek')
+
+    # Pipeline
+    _register_builtin('sklearn.pipeline:Pipeline', 'pipeline', 'pipeline', 'pipeline')
+
+
+_register_builtin_models()
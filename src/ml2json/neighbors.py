@@ -2,20 +2,19 @@
 
 import inspect
 import importlib
+import importlib.util
 
 import numpy as np
 import scipy.sparse
 from sklearn.neighbors import NearestNeighbors, KDTree, KernelDensity
 
-# Allow additional dependencies to be optional
+# Allow additional dependencies to be optional, they are only imported once needed
 __optionals__ = []
-try:
-    from pynndescent import NNDescent
+if importlib.util.find_spec('pynndescent') is not None:
     __optionals__.append('NNDescent')
-except:
-    pass
 
 from .utils.csr import serialize_csr_matrix, deserialize_csr_matrix
+from .utils.arrays import encode_array, decode_array, is_serialized_array
 
 
 def serialize_nearest_neighbors(model):
@@ -23,7 +22,7 @@ def serialize_nearest_neighbors(model):
         'meta': 'nearest-neighbors',
         'effective_metric_params_': model.effective_metric_params_,
         '_fit_method': model._fit_method,
-        '_fit_X': model._fit_X.tolist() if not scipy.sparse.issparse(model._fit_X) else serialize_csr_matrix(model._fit_X),
+        '_fit_X': encode_array(model._fit_X) if not scipy.sparse.issparse(model._fit_X) else serialize_csr_matrix(model._fit_X),
         'n_samples_fit_': model.n_samples_fit_,
         'effective_metric_': model.effective_metric_,
         'n_features_in_': model.n_features_in_,
@@ -31,7 +30,7 @@ def serialize_nearest_neighbors(model):
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
     if model._tree is not None:
         serialized_model['_tree'] = serialize_kdtree(model._tree)
     else:
@@ -45,13 +44,13 @@ def deserialize_nearest_neighbors(model_dict):
 
     model.effective_metric_params_ = model_dict['effective_metric_params_']
     model._fit_method = model_dict['_fit_method']
-    model._fit_X = np.array(model_dict['_fit_X']) if isinstance(model_dict['_fit_X'], list) else deserialize_csr_matrix(model_dict['_fit_X'])
+    model._fit_X = decode_array(model_dict['_fit_X']) if is_serialized_array(model_dict['_fit_X']) else deserialize_csr_matrix(model_dict['_fit_X'])
     model.n_samples_fit_ = model_dict['n_samples_fit_']
     model.effective_metric_ = model_dict['effective_metric_']
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
     if model_dict['_tree'] is not None:
         model._tree = deserialize_kdtree(model_dict['_tree'])
     else:
@@ -69,7 +68,7 @@ def serialize_kernel_density(model):
     }
     
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
     if model.tree_ is not None:
         serialized_model['tree_'] = serialize_kdtree(model.tree_)
     else:
@@ -84,7 +83,7 @@ def deserialize_kernel_density(model_dict):
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
     if model_dict['tree_'] is not None:
         model.tree_ = deserialize_kdtree(model_dict['tree_'])
     else:
@@ -97,12 +96,12 @@ def serialize_kdtree(model):
     state = model.__getstate__()
     serialized_model = {
         'meta': 'kdtree',
-        'data': np.array(model.data).tolist(),
-        'data_arr': state[0].tolist(),
-        'idx_data_arr': state[1].astype(int).tolist(),
-        'node_data_arr': state[2].tolist(),
+        'data': encode_array(np.asarray(model.data)),
+        'data_arr': encode_array(state[0]),
+        'idx_data_arr': encode_array(state[1]),
+        'node_data_arr': encode_array(state[2]),
         'node_data_arr_dtype': f"np.dtype({str(state[2].dtype)})",
-        'node_bounds_arr': state[3].tolist(),
+        'node_bounds_arr': encode_array(state[3]),
         'leaf_size': state[4],
         'n_levels': state[5],
         'n_nodes': state[6],
@@ -115,7 +114,7 @@ def serialize_kdtree(model):
     }
 
     if state[12] is not None:
-        serialized_model['sample_weight_arr'] = state[12].tolist()
+        serialized_model['sample_weight_arr'] = encode_array(state[12])
     else:
         serialized_model['sample_weight_arr'] = state[12]
 
@@ -123,13 +122,14 @@ def serialize_kdtree(model):
 
 
 def deserialize_kdtree(model_dict):
-    model = KDTree(np.array(model_dict['data']))
+    # The tree is restored from its state rather than built again from its data
+    model = KDTree.__new__(KDTree)
 
     params = [
-        np.array(model_dict['data_arr']),
-        np.array(model_dict['idx_data_arr'], dtype=np.int64),
-        np.array(list(map(tuple, model_dict['node_data_arr'])), dtype=eval(model_dict['node_data_arr_dtype'])),
-        np.array(model_dict['node_bounds_arr']),
+        decode_array(model_dict['data_arr']),
+        decode_array(model_dict['idx_data_arr'], dtype=np.int64),
+        decode_array(model_dict['node_data_arr'], dtype=eval(model_dict['node_data_arr_dtype'])),
+        decode_array(model_dict['node_bounds_arr']),
         model_dict['leaf_size'],
         model_dict['n_levels'],
         model_dict['n_nodes'],
@@ -141,7 +141,7 @@ def deserialize_kdtree(model_dict):
     ]
 
     if model_dict['sample_weight_arr'] is not None:
-        params.append(np.array(model_dict['sample_weight_arr']))
+        params.append(decode_array(model_dict['sample_weight_arr']))
     else:
         params.append(model_dict['sample_weight_arr'])
 
@@ -159,18 +159,18 @@ if 'NNDescent' in __optionals__:
         del state['_search_function'], state['_deheap_function']
         del state['_distance_correction']
 
-        state['_raw_data'] = state['_raw_data'].astype(float).tolist()
-        state['rng_state'] = state['rng_state'].astype(int).tolist()
-        state['search_rng_state'] = state['search_rng_state'].astype(int).tolist()
+        state['_raw_data'] = encode_array(state['_raw_data'])
+        state['rng_state'] = encode_array(state['rng_state'])
+        state['search_rng_state'] = encode_array(state['search_rng_state'])
         state['_search_graph'] = serialize_csr_matrix(state['_search_graph'])
-        state['_visited'] = state['_visited'].astype(int).tolist()
-        state['_vertex_order'] = state['_vertex_order'].astype(int).tolist()
-        state['_neighbor_graph'] = (state['_neighbor_graph'][0].tolist(),
-                                    state['_neighbor_graph'][1].astype(float).tolist())
-        state['_search_forest'] = ((state['_search_forest'][0][0].astype(float).tolist(),
-                                    state['_search_forest'][0][1].astype(float).tolist(),
-                                    state['_search_forest'][0][2].astype(int).tolist(),
-                                    state['_search_forest'][0][3].astype(int).tolist(),
+        state['_visited'] = encode_array(state['_visited'])
+        state['_vertex_order'] = encode_array(state['_vertex_order'])
+        state['_neighbor_graph'] = (encode_array(state['_neighbor_graph'][0]),
+                                    encode_array(state['_neighbor_graph'][1]))
+        state['_search_forest'] = ((encode_array(state['_search_forest'][0][0]),
+                                    encode_array(state['_search_forest'][0][1]),
+                                    encode_array(state['_search_forest'][0][2]),
+                                    encode_array(state['_search_forest'][0][3]),
                                     state['_search_forest'][0][4]),)
 
         serialized_model = {
@@ -182,21 +182,22 @@ if 'NNDescent' in __optionals__:
 
 
     def deserialize_nndescent(model_dict):
+        from pynndescent import NNDescent
 
         params = model_dict['params']
 
-        params['_raw_data'] = np.array(params['_raw_data'], dtype=np.float32)
-        params['rng_state'] = np.array(params['rng_state'], dtype=np.int64)
-        params['search_rng_state'] = np.array(params['search_rng_state'], dtype=np.int64)
+        params['_raw_data'] = decode_array(params['_raw_data'], dtype=np.float32)
+        params['rng_state'] = decode_array(params['rng_state'], dtype=np.int64)
+        params['search_rng_state'] = decode_array(params['search_rng_state'], dtype=np.int64)
         params['_search_graph'] = deserialize_csr_matrix(params['_search_graph'])
-        params['_visited'] = np.array(params['_visited'], dtype=np.uint8)
-        params['_vertex_order'] = np.array(params['_vertex_order'], dtype=np.int32)
-        params['_neighbor_graph'] = (np.array(params['_neighbor_graph'][0]),
-                                     np.array(params['_neighbor_graph'][1], dtype=np.float32))
-        params['_search_forest'] = ((np.array(params['_search_forest'][0][0], dtype=np.float32),
-                                     np.array(params['_search_forest'][0][1], dtype=np.float32),
-                                     np.array(params['_search_forest'][0][2], dtype=np.int32),
-                                     np.array(params['_search_forest'][0][3], dtype=np.int32),
+        params['_visited'] = decode_array(params['_visited'], dtype=np.uint8)
+        params['_vertex_order'] = decode_array(params['_vertex_order'], dtype=np.int32)
+        params['_neighbor_graph'] = (decode_array(params['_neighbor_graph'][0]),
+                                     decode_array(params['_neighbor_graph'][1], dtype=np.float32))
+        params['_search_forest'] = ((decode_array(params['_search_forest'][0][0], dtype=np.float32),
+                                     decode_array(params['_search_forest'][0][1], dtype=np.float32),
+                                     decode_array(params['_search_forest'][0][2], dtype=np.int32),
+                                     decode_array(params['_search_forest'][0][3], dtype=np.int32),
                                      params['_search_forest'][0][4]),)
 
         model = NNDescent(params['_raw_data'], metric=params['metric'], metric_kwds=params['metric_kwds'])
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import importlib
+import importlib.util
 import inspect
 
 import numpy as np
@@ -12,25 +13,14 @@ from sklearn.cluster import (AffinityPropagation, AgglomerativeClustering,
 from sklearn.cluster._birch import _CFNode, _CFSubcluster
 from sklearn.cluster._bisect_k_means import _BisectingTree
 
-# Allow additional dependencies to be optional
+# Allow additional dependencies to be optional, they are only imported once needed
 __optionals__ = []
-
-
-try:
-    from imblearn.under_sampling import (ClusterCentroids, CondensedNearestNeighbour, EditedNearestNeighbours,
-                                         RepeatedEditedNearestNeighbours, AllKNN, InstanceHardnessThreshold,
-                                         NearMiss, NeighbourhoodCleaningRule, OneSidedSelection,
-                                         RandomUnderSampler, TomekLinks)
-    from imblearn.over_sampling import (RandomOverSampler, SMOTE, SMOTEN, SMOTENC, ADASYN, BorderlineSMOTE,
-                                        KMeansSMOTE, SVMSMOTE)
-    from imblearn.combine import SMOTEENN, SMOTETomek
-
+if importlib.util.find_spec('imblearn') is not None:
     __optionals__.extend(['imblearn'])
-except:
-    pass
 
 from .utils.random_state import serialize_random_state, deserialize_random_state
 from .utils.memory import serialize_memory, deserialize_memory
+from .utils.arrays import encode_array, decode_array
 
 
 if 'imblearn' in __optionals__:
@@ -58,6 +48,7 @@ if 'imblearn' in __optionals__:
 
 
     def deserialize_cluster_centroids(model_dict):
+        from imblearn.under_sampling import ClusterCentroids
         from collections import OrderedDict
         from .ml2json import deserialize_model
 
@@ -96,12 +87,13 @@ if 'imblearn' in __optionals__:
         if 'estimators_' in model.__dict__:
             serialized_model['estimators_'] = [serialize_model(estimator_) for estimator_ in model.estimators_]
         if 'sample_indices_' in model.__dict__:
-            serialized_model['sample_indices_'] = model.sample_indices_.tolist()
+            serialized_model['sample_indices_'] = encode_array(model.sample_indices_)
 
         return serialized_model
 
 
     def deserialize_condensed_nearest_neighbours(model_dict):
+        from imblearn.under_sampling import CondensedNearestNeighbour
         from collections import OrderedDict
         from .ml2json import deserialize_model
 
@@ -119,7 +111,7 @@ if 'imblearn' in __optionals__:
         if 'estimators_' in model_dict.keys():
             model.estimators_ = [deserialize_model(estimator_) for estimator_ in model_dict['estimators_']]
         if 'sample_indices_' in model_dict.keys():
-            model.sample_indices_ = np.array(model_dict['sample_indices_'])
+            model.sample_indices_ = decode_array(model_dict['sample_indices_'])
 
         return model
 
@@ -145,12 +137,13 @@ if 'imblearn' in __optionals__:
         if 'nn_' in model.__dict__:
             serialized_model['nn_'] = serialize_model(model.nn_)
         if 'sample_indices_' in model.__dict__:
-            serialized_model['sample_indices_'] = model.sample_indices_.tolist()
+            serialized_model['sample_indices_'] = encode_array(model.sample_indices_)
 
         return serialized_model
 
 
     def deserialize_edited_nearest_neighbours(model_dict):
+        from imblearn.under_sampling import EditedNearestNeighbours
         from collections import OrderedDict
         from .ml2json import deserialize_model
 
@@ -162,13 +155,13 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if 'sampling_strategy_' in model_dict.keys():
             model.sampling_strategy_ = eval(model_dict['sampling_strategy_'])
         if 'nn_' in model_dict.keys():
             model.nn_ = deserialize_model(model_dict['nn_'])
         if 'sample_indices_' in model_dict.keys():
-            model.sample_indices_ = np.array(model_dict['sample_indices_'])
+            model.sample_indices_ = decode_array(model_dict['sample_indices_'])
 
         return model
 
@@ -196,12 +189,13 @@ if 'imblearn' in __optionals__:
         if 'enn_' in model.__dict__:
             serialized_model['enn_'] = serialize_edited_nearest_neighbours(model.enn_)
         if 'sample_indices_' in model.__dict__:
-            serialized_model['sample_indices_'] = model.sample_indices_.tolist()
+            serialized_model['sample_indices_'] = encode_array(model.sample_indices_)
 
         return serialized_model
 
 
     def deserialize_repeated_edited_nearest_neighbours(model_dict):
+        from imblearn.under_sampling import RepeatedEditedNearestNeighbours
         from collections import OrderedDict
         from .ml2json import deserialize_model
 
@@ -213,7 +207,7 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if 'n_iter_' in model_dict.keys():
             model.n_iter_ = model_dict['n_iter_']
         if 'sampling_strategy_' in model_dict.keys():
@@ -223,7 +217,7 @@ if 'imblearn' in __optionals__:
         if 'enn_' in model_dict.keys():
             model.enn_ = deserialize_edited_nearest_neighbours(model_dict['enn_'])
         if 'sample_indices_' in model_dict.keys():
-            model.sample_indices_ = np.array(model_dict['sample_indices_'])
+            model.sample_indices_ = decode_array(model_dict['sample_indices_'])
 
         return model
 
@@ -249,12 +243,13 @@ if 'imblearn' in __optionals__:
         if 'enn_' in model.__dict__:
             serialized_model['enn_'] = serialize_edited_nearest_neighbours(model.enn_)
         if 'sample_indices_' in model.__dict__:
-            serialized_model['sample_indices_'] = model.sample_indices_.tolist()
+            serialized_model['sample_indices_'] = encode_array(model.sample_indices_)
 
         return serialized_model
 
 
     def deserialize_all_knn(model_dict):
+        from imblearn.under_sampling import AllKNN
         from collections import OrderedDict
         from .ml2json import deserialize_model
 
@@ -266,7 +261,7 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if 'sampling_strategy_' in model_dict.keys():
             model.sampling_strategy_ = eval(model_dict['sampling_strategy_'])
         if 'nn_' in model_dict.keys():
@@ -274,7 +269,7 @@ if 'imblearn' in __optionals__:
         if 'enn_' in model_dict.keys():
             model.enn_ = deserialize_edited_nearest_neighbours(model_dict['enn_'])
         if 'sample_indices_' in model_dict.keys():
-            model.sample_indices_ = np.array(model_dict['sample_indices_'])
+            model.sample_indices_ = decode_array(model_dict['sample_indices_'])
 
         return model
 
@@ -298,12 +293,13 @@ if 'imblearn' in __optionals__:
         if 'estimator_' in model.__dict__:
             serialized_model['estimator_'] = serialize_model(model.estimator_)
         if 'sample_indices_' in model.__dict__:
-            serialized_model['sample_indices_'] = model.sample_indices_.tolist()
+            serialized_model['sample_indices_'] = encode_array(model.sample_indices_)
 
         return serialized_model
 
 
     def deserialize_instance_hardness_threshold(model_dict):
+        from imblearn.under_sampling import InstanceHardnessThreshold
         from collections import OrderedDict
         from .ml2json import deserialize_model
 
@@ -315,13 +311,13 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if 'sampling_strategy_' in model_dict.keys():
             model.sampling_strategy_ = eval(model_dict['sampling_strategy_'])
         if 'estimator_' in model_dict.keys():
             model.estimator_ = deserialize_model(model_dict['estimator_'])
         if 'sample_indices_' in model_dict.keys():
-            model.sample_indices_ = np.array(model_dict['sample_indices_'])
+            model.sample_indices_ = decode_array(model_dict['sample_indices_'])
 
         return model
 
@@ -347,12 +343,13 @@ if 'imblearn' in __optionals__:
         if 'nn_' in model.__dict__:
             serialized_model['nn_'] = serialize_model(model.nn_)
         if 'sample_indices_' in model.__dict__:
-            serialized_model['sample_indices_'] = model.sample_indices_.tolist()
+            serialized_model['sample_indices_'] = encode_array(model.sample_indices_)
 
         return serialized_model
 
 
     def deserialize_near_miss(model_dict):
+        from imblearn.under_sampling import NearMiss
         from collections import OrderedDict
         from .ml2json import deserialize_model
 
@@ -366,13 +363,13 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if 'sampling_strategy_' in model_dict.keys():
             model.sampling_strategy_ = eval(model_dict['sampling_strategy_'])
         if 'nn_' in model_dict.keys():
             model.nn_ = deserialize_model(model_dict['nn_'])
         if 'sample_indices_' in model_dict.keys():
-            model.sample_indices_ = np.array(model_dict['sample_indices_'])
+            model.sample_indices_ = decode_array(model_dict['sample_indices_'])
 
         return model
 
@@ -400,7 +397,7 @@ if 'imblearn' in __optionals__:
         if 'edited_nearest_neighbours_' in model.__dict__:
             serialized_model['edited_nearest_neighbours_'] = serialize_edited_nearest_neighbours(model.edited_nearest_neighbours_)
         if 'sample_indices_' in model.__dict__:
-            serialized_model['sample_indices_'] = model.sample_indices_.tolist()
+            serialized_model['sample_indices_'] = encode_array(model.sample_indices_)
         if 'classes_to_clean_' in model.__dict__:
             serialized_model['classes_to_clean_'] = [int(x) for x in model.classes_to_clean_]
 
@@ -408,6 +405,7 @@ if 'imblearn' in __optionals__:
 
 
     def deserialize_neighbourhood_cleaning_rule(model_dict):
+        from imblearn.under_sampling import NeighbourhoodCleaningRule
         from collections import OrderedDict
         from .ml2json import deserialize_model
 
@@ -421,7 +419,7 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if 'sampling_strategy_' in model_dict.keys():
             model.sampling_strategy_ = eval(model_dict['sampling_strategy_'])
         if 'nn_' in model_dict.keys():
@@ -429,7 +427,7 @@ if 'imblearn' in __optionals__:
         if 'edited_nearest_neighbours_' in model_dict.keys():
             model.edited_nearest_neighbours_ = deserialize_edited_nearest_neighbours(model_dict['edited_nearest_neighbours_'])
         if 'sample_indices_' in model_dict.keys():
-            model.sample_indices_ = np.array(model_dict['sample_indices_'])
+            model.sample_indices_ = decode_array(model_dict['sample_indices_'])
         if 'classes_to_clean_' in model_dict.keys():
             model.classes_to_clean_ = model_dict['classes_to_clean_']
 
@@ -457,12 +455,13 @@ if 'imblearn' in __optionals__:
         if 'estimators_' in model.__dict__:
             serialized_model['estimators_'] = [serialize_model(estimator_) for estimator_ in model.estimators_]
         if 'sample_indices_' in model.__dict__:
-            serialized_model['sample_indices_'] = model.sample_indices_.tolist()
+            serialized_model['sample_indices_'] = encode_array(model.sample_indices_)
 
         return serialized_model
 
 
     def deserialize_one_sided_selection(model_dict):
+        from imblearn.under_sampling import OneSidedSelection
         from collections import OrderedDict
         from .ml2json import deserialize_model
 
@@ -474,7 +473,7 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if 'sampling_strategy_' in model_dict.keys():
             model.sampling_strategy_ = eval(model_dict['sampling_strategy_'])
         if 'estimator_' in model_dict.keys():
@@ -482,7 +481,7 @@ if 'imblearn' in __optionals__:
         if 'estimators_' in model_dict.keys():
             model.estimators_ = [deserialize_model(estimator_) for estimator_ in model_dict['estimators_']]
         if 'sample_indices_' in model_dict.keys():
-            model.sample_indices_ = np.array(model_dict['sample_indices_'])
+            model.sample_indices_ = decode_array(model_dict['sample_indices_'])
 
         return model
 
@@ -499,12 +498,13 @@ if 'imblearn' in __optionals__:
         if 'sampling_strategy_' in model.__dict__:
             serialized_model['sampling_strategy_'] = str(model.sampling_strategy_)
         if 'sample_indices_' in model.__dict__:
-            serialized_model['sample_indices_'] = model.sample_indices_.tolist()
+            serialized_model['sample_indices_'] = encode_array(model.sample_indices_)
 
         return serialized_model
 
 
     def deserialize_random_under_sampler(model_dict):
+        from imblearn.under_sampling import RandomUnderSampler
         from collections import OrderedDict
 
         model = RandomUnderSampler(**model_dict['params'])
@@ -512,11 +512,11 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if 'sampling_strategy_' in model_dict.keys():
             model.sampling_strategy_ = eval(model_dict['sampling_strategy_'])
         if 'sample_indices_' in model_dict.keys():
-            model.sample_indices_ = np.array(model_dict['sample_indices_'])
+            model.sample_indices_ = decode_array(model_dict['sample_indices_'])
 
         return model
 
@@ -535,12 +535,13 @@ if 'imblearn' in __optionals__:
         if 'sampling_strategy_' in model.__dict__:
             serialized_model['sampling_strategy_'] = str(model.sampling_strategy_)
         if 'sample_indices_' in model.__dict__:
-            serialized_model['sample_indices_'] = model.sample_indices_.tolist()
+            serialized_model['sample_indices_'] = encode_array(model.sample_indices_)
 
         return serialized_model
 
 
     def deserialize_tomek_links(model_dict):
+        from imblearn.under_sampling import TomekLinks
         from collections import OrderedDict
 
         model = TomekLinks(**model_dict['params'])
@@ -548,11 +549,11 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if 'sampling_strategy_' in model_dict.keys():
             model.sampling_strategy_ = eval(model_dict['sampling_strategy_'])
         if 'sample_indices_' in model_dict.keys():
-            model.sample_indices_ = np.array(model_dict['sample_indices_'])
+            model.sample_indices_ = decode_array(model_dict['sample_indices_'])
 
         return model
 
@@ -569,7 +570,7 @@ if 'imblearn' in __optionals__:
         if 'sampling_strategy_' in model.__dict__:
             serialized_model['sampling_strategy_'] = str(model.sampling_strategy_)
         if 'sample_indices_' in model.__dict__:
-            serialized_model['sample_indices_'] = model.sample_indices_.tolist()
+            serialized_model['sample_indices_'] = encode_array(model.sample_indices_)
         if 'shrinkage_' in model.__dict__:
             serialized_model['shrinkage_'] = model.shrinkage_
 
@@ -577,6 +578,7 @@ if 'imblearn' in __optionals__:
 
 
     def deserialize_random_over_sampler(model_dict):
+        from imblearn.over_sampling import RandomOverSampler
         from collections import OrderedDict
 
         model = RandomOverSampler(**model_dict['params'])
@@ -584,13 +586,13 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if 'sampling_strategy_' in model_dict.keys():
             model.sampling_strategy_ = eval(model_dict['sampling_strategy_'])
         if 'sample_indices_' in model_dict.keys():
-            model.sample_indices_ = np.array(model_dict['sample_indices_'])
+            model.sample_indices_ = decode_array(model_dict['sample_indices_'])
         if 'shrinkage_' in model_dict.keys():
-            model.shrinkage_ = np.array(model_dict['shrinkage_'])
+            model.shrinkage_ = decode_array(model_dict['shrinkage_'])
 
         return model
 
@@ -617,6 +619,7 @@ if 'imblearn' in __optionals__:
 
 
     def deserialize_smote(model_dict):
+        from imblearn.over_sampling import SMOTE
         from collections import OrderedDict
         from .ml2json import deserialize_model
 
@@ -628,7 +631,7 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if 'sampling_strategy_' in model_dict.keys():
             model.sampling_strategy_ = eval(model_dict['sampling_strategy_'])
         if 'nn_k_' in model_dict.keys():
@@ -661,9 +664,9 @@ if 'imblearn' in __optionals__:
         if 'categorical_encoder_' in model.__dict__:
             serialized_model['categorical_encoder_'] = serialize_model(model.categorical_encoder_) if model.categorical_encoder_ is not None else None
         if 'categorical_features_' in model.__dict__:
-            serialized_model['categorical_features_'] = model.categorical_features_.tolist()
+            serialized_model['categorical_features_'] = encode_array(model.categorical_features_)
         if 'continuous_features_' in model.__dict__:
-            serialized_model['continuous_features_'] = model.continuous_features_.tolist()
+            serialized_model['continuous_features_'] = encode_array(model.continuous_features_)
         if 'median_std_' in model.__dict__:
             serialized_model['median_std_'] = {int(param): float(value) for param, value in model.median_std_.items()}
         if 'ohe_' in model.__dict__:
@@ -673,6 +676,7 @@ if 'imblearn' in __optionals__:
 
 
     def deserialize_smotenc(model_dict):
+        from imblearn.over_sampling import SMOTENC
         from collections import OrderedDict
         from .ml2json import deserialize_model
 
@@ -688,7 +692,7 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if 'sampling_strategy_' in model_dict.keys():
             model.sampling_strategy_ = eval(model_dict['sampling_strategy_'])
         if 'nn_k_' in model_dict.keys():
@@ -696,9 +700,9 @@ if 'imblearn' in __optionals__:
         if 'categorical_encoder_' in model_dict.keys():
             model.categorical_encoder_ = deserialize_model(model_dict['categorical_encoder_']) if model_dict['categorical_encoder_'] is not None else None
         if 'categorical_features_' in model_dict.keys():
-            model.categorical_features_ = model_dict['categorical_features_']
+            model.categorical_features_ = decode_array(model_dict['categorical_features_'])
         if 'continuous_features_' in model_dict.keys():
-            model.continuous_features_ = model_dict['continuous_features_']
+            model.continuous_features_ = decode_array(model_dict['continuous_features_'])
         if 'median_std_' in model_dict.keys():
             model.median_std_ = model_dict['median_std_']
         if 'ohe_' in model_dict.keys():
@@ -733,6 +737,7 @@ if 'imblearn' in __optionals__:
 
 
     def deserialize_smoten(model_dict):
+        from imblearn.over_sampling import SMOTEN
         from collections import OrderedDict
         from .ml2json import deserialize_model
 
@@ -746,7 +751,7 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if 'sampling_strategy_' in model_dict.keys():
             model.sampling_strategy_ = eval(model_dict['sampling_strategy_'])
         if 'nn_k_' in model_dict.keys():
@@ -779,6 +784,7 @@ if 'imblearn' in __optionals__:
 
 
     def deserialize_adasyn(model_dict):
+        from imblearn.over_sampling import SMOTE
         from collections import OrderedDict
         from .ml2json import deserialize_model
 
@@ -790,7 +796,7 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if 'sampling_strategy_' in model_dict.keys():
             model.sampling_strategy_ = eval(model_dict['sampling_strategy_'])
         if 'nn_' in model_dict.keys():
@@ -817,7 +823,7 @@ if 'imblearn' in __optionals__:
         if 'sampling_strategy_' in model.__dict__:
             serialized_model['sampling_strategy_'] = str(model.sampling_strategy_)
         if 'in_danger_indices' in model.__dict__:
-            serialized_model['in_danger_indices'] = {int(param): value.tolist()
+            serialized_model['in_danger_indices'] = {int(param): encode_array(value)
                                                      for param, value in model.in_danger_indices.items()}
         if 'nn_k_' in model.__dict__:
             serialized_model['nn_k_'] = serialize_model(model.nn_k_)
@@ -828,6 +834,7 @@ if 'imblearn' in __optionals__:
 
 
     def deserialize_borderline_smote(model_dict):
+        from imblearn.over_sampling import BorderlineSMOTE
         from collections import OrderedDict
         from .ml2json import deserialize_model
 
@@ -841,11 +848,11 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if 'sampling_strategy_' in model_dict.keys():
             model.sampling_strategy_ = eval(model_dict['sampling_strategy_'])
         if 'in_danger_indices' in model_dict.keys():
-            model.in_danger_indices = {param: np.array(value)
+            model.in_danger_indices = {param: decode_array(value)
                                        for param, value in model_dict['in_danger_indices'].items()}
         if 'nn_k_' in model_dict.keys():
             model.nn_k_ = deserialize_model(model_dict['nn_k_'])
@@ -883,6 +890,7 @@ if 'imblearn' in __optionals__:
 
 
     def deserialize_kmeans_smote(model_dict):
+        from imblearn.over_sampling import KMeansSMOTE
         from collections import OrderedDict
         from .ml2json import deserialize_model
 
@@ -896,7 +904,7 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if 'sampling_strategy_' in model_dict.keys():
             model.sampling_strategy_ = eval(model_dict['sampling_strategy_'])
         if 'kmeans_estimator_' in model_dict.keys():
@@ -941,6 +949,7 @@ if 'imblearn' in __optionals__:
 
 
     def deserialize_svm_smote(model_dict):
+        from imblearn.over_sampling import SVMSMOTE
         from collections import OrderedDict
         from .ml2json import deserialize_model
 
@@ -956,7 +965,7 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if 'sampling_strategy_' in model_dict.keys():
             model.sampling_strategy_ = eval(model_dict['sampling_strategy_'])
         if 'svm_estimator_' in model_dict.keys():
@@ -997,6 +1006,7 @@ if 'imblearn' in __optionals__:
 
 
     def deserialize_smote_enn(model_dict):
+        from imblearn.combine import SMOTEENN
         from collections import OrderedDict
         from .ml2json import deserialize_model
 
@@ -1010,7 +1020,7 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if 'sampling_strategy_' in model_dict.keys():
             model.sampling_strategy_ = eval(model_dict['sampling_strategy_']) if model_dict['sampling_strategy_'] != 'auto' else 'auto'
         if 'enn_' in model_dict.keys():
@@ -1047,6 +1057,7 @@ if 'imblearn' in __optionals__:
 
 
     def deserialize_smote_tomek(model_dict):
+        from imblearn.combine import SMOTETomek
         from collections import OrderedDict
         from .ml2json import deserialize_model
 
@@ -1060,7 +1071,7 @@ if 'imblearn' in __optionals__:
         if 'n_features_in_' in model_dict.keys():
             model.n_features_in_ = model_dict['n_features_in_']
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
         if 'sampling_strategy_' in model_dict.keys():
             model.sampling_strategy_ = eval(model_dict['sampling_strategy_']) if model_dict['sampling_strategy_'] != 'auto' else 'auto'
         if 'tomek_' in model_dict.keys():
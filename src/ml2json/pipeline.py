@@ -4,6 +4,7 @@ import os
 import uuid
 import inspect
 import importlib
+import importlib.util
 
 import numpy as np
 import scipy as sp
@@ -13,16 +14,13 @@ from sklearn.utils import Bunch
 
 from .utils.memory import serialize_memory, deserialize_memory
 from .utils.bunch import serialize_bunch, deserialize_bunch
+from .utils.arrays import encode_array, decode_array
 
 
-# Allow additional dependencies to be optional
+# Allow additional dependencies to be optional, they are only imported once needed
 __optionals__ = []
-
-try:
-    from imblearn.pipeline import Pipeline as ImblearnPipeline
+if importlib.util.find_spec('imblearn') is not None:
     __optionals__.append('imblearn')
-except:
-    pass
 
 
 def serialize_pipeline(model):
@@ -40,11 +38,11 @@ def serialize_pipeline(model):
     if not isinstance(serialized_model['params']['memory'], str) and serialized_model['params']['memory'] is not None:
         serialized_model['params']['memory'] = serialize_memory(serialized_model['params']['memory'])
     if 'classes_' in model.__dict__:
-        serialized_model['classes_'] = model.classes_.tolist()
+        serialized_model['classes_'] = encode_array(model.classes_)
     if 'n_features_in_' in model.__dict__:
         serialized_model['n_features_in_'] = model.n_features_in_
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
     return serialized_model
 
 
@@ -56,11 +54,11 @@ def deserialize_pipeline(model_dict):
         model_dict['params']['memory'] = deserialize_memory(model_dict['params']['memory'])
     model = Pipeline(**model_dict['params'])
     if 'classes_' in model_dict.keys():
-        model.classes_ = np.array(model_dict['classes_'])
+        model.classes_ = decode_array(model_dict['classes_'])
     if 'n_feature_in_' in model_dict.keys():
-        model.n_feature_in_ = np.array(model_dict['n_feature_in_'])
+        model.n_feature_in_ = decode_array(model_dict['n_feature_in_'])
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     # model.named_steps = deserialize_bunch(model_dict['named_steps'])
     return model
@@ -82,11 +80,11 @@ if 'imblearn' in __optionals__:
         if not isinstance(serialized_model['params']['memory'], str) and serialized_model['params']['memory'] is not None:
             serialized_model['params']['memory'] = serialize_memory(serialized_model['params']['memory'])
         if 'classes_' in model.__dict__:
-            serialized_model['classes_'] = model.classes_.tolist()
+            serialized_model['classes_'] = encode_array(model.classes_)
         if 'n_features_in_' in model.__dict__:
             serialized_model['n_features_in_'] = model.n_features_in_
         if 'feature_names_in_' in model.__dict__:
-            serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+            serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
         return serialized_model
 
 
@@ -98,11 +96,11 @@ if 'imblearn' in __optionals__:
             model_dict['params']['memory'] = deserialize_memory(model_dict['params']['memory'])
         model = Pipeline(**model_dict['params'])
         if 'classes_' in model_dict.keys():
-            model.classes_ = np.array(model_dict['classes_'])
+            model.classes_ = decode_array(model_dict['classes_'])
         if 'n_feature_in_' in model_dict.keys():
-            model.n_feature_in_ = np.array(model_dict['n_feature_in_'])
+            model.n_feature_in_ = decode_array(model_dict['n_feature_in_'])
         if 'feature_names_in_' in model_dict.keys():
-            model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+            model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
         # model.named_steps = deserialize_bunch(model_dict['named_steps'])
         return model
@@ -8,6 +8,8 @@ from sklearn.preprocessing import (LabelEncoder, LabelBinarizer, MultiLabelBinar
                                    KernelCenterer, OneHotEncoder, RobustScaler, MaxAbsScaler, OrdinalEncoder,
                                    Normalizer)
 
+from .utils.arrays import encode_array, decode_array, is_serialized_array
+
 
 def serialize_label_binarizer(label_binarizer):
     serialized_label_binarizer = {
@@ -17,7 +19,7 @@ def serialize_label_binarizer(label_binarizer):
         'sparse_output': label_binarizer.sparse_output,
         'y_type_': label_binarizer.y_type_,
         'sparse_input_': label_binarizer.sparse_input_,
-        'classes_': label_binarizer.classes_.tolist()
+        'classes_': encode_array(label_binarizer.classes_)
     }
 
     return serialized_label_binarizer
@@ -30,7 +32,7 @@ def deserialize_label_binarizer(label_binarizer_dict):
     label_binarizer.sparse_output = label_binarizer_dict['sparse_output']
     label_binarizer.y_type_ = label_binarizer_dict['y_type_']
     label_binarizer.sparse_input_ = label_binarizer_dict['sparse_input_']
-    label_binarizer.classes_ = np.array(label_binarizer_dict['classes_'])
+    label_binarizer.classes_ = decode_array(label_binarizer_dict['classes_'])
 
     return label_binarizer
 
@@ -48,7 +50,7 @@ def serialize_multilabel_binarizer(model):
 def deserialize_multilabel_binarizer(model_dict):
     model = MultiLabelBinarizer()
 
-    model.classes_ = np.array(model_dict['classes'])
+    model.classes_ = decode_array(model_dict['classes'])
     model.sparse_output = model_dict['sparse_output'] == 'True'
     model._cached_dict = dict(zip(model.classes_, range(len(model.classes_))))
 
@@ -58,18 +60,18 @@ def deserialize_multilabel_binarizer(model_dict):
 def serialize_minmax_scaler(model):
     serialized_model = {
         'meta': 'minmax-scaler',
-        'min_': model.min_.tolist(),
-        'scale_': model.scale_.tolist(),
-        'data_min_': model.data_min_.tolist(),
-        'data_max_': model.data_max_.tolist(),
-        'data_range_': model.data_range_.tolist(),
+        'min_': encode_array(model.min_),
+        'scale_': encode_array(model.scale_),
+        'data_min_': encode_array(model.data_min_),
+        'data_max_': encode_array(model.data_max_),
+        'data_range_': encode_array(model.data_range_),
         'n_features_in_': model.n_features_in_,
         'n_samples_seen_': model.n_samples_seen_,
         'params': model.get_params(),
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -79,16 +81,16 @@ def deserialize_minmax_scaler(model_dict):
 
     model = MinMaxScaler(**model_dict['params'])
 
-    model.min_ = np.array(model_dict['min_'])
-    model.scale_ = np.array(model_dict['scale_'])
-    model.data_min_ = np.array(model_dict['data_min_'])
-    model.data_max_ = np.array(model_dict['data_max_'])
-    model.data_range_ = np.array(model_dict['data_range_'])
+    model.min_ = decode_array(model_dict['min_'])
+    model.scale_ = decode_array(model_dict['scale_'])
+    model.data_min_ = decode_array(model_dict['data_min_'])
+    model.data_max_ = decode_array(model_dict['data_max_'])
+    model.data_range_ = decode_array(model_dict['data_range_'])
     model.n_features_in_ = model_dict['n_features_in_']
     model.n_samples_seen_ = model_dict['n_samples_seen_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'])
 
     return model
 
@@ -103,22 +105,22 @@ def serialize_standard_scaler(model):
     if model.var_ is None:
         serialized_model['var_'] = model.var_
     else:
-        serialized_model['var_'] = model.var_.tolist()
+        serialized_model['var_'] = encode_array(model.var_)
     if model.mean_ is None:
         serialized_model['mean_'] = model.mean_
     else:
-        serialized_model['mean_'] = model.mean_.tolist()
+        serialized_model['mean_'] = encode_array(model.mean_)
     if isinstance(model.scale_, np.ndarray):
-        serialized_model['scale_'] = model.scale_.tolist()
+        serialized_model['scale_'] = encode_array(model.scale_)
     else:
         serialized_model['scale_'] = model.scale_,
     if isinstance(model.n_samples_seen_, (int, float)):
         serialized_model['n_samples_seen_'] = model.n_samples_seen_
     else:
-        serialized_model['n_samples_seen_'] = model.n_samples_seen_.tolist()
+        serialized_model['n_samples_seen_'] = encode_array(model.n_samples_seen_)
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -127,25 +129,25 @@ def deserialize_standard_scaler(model_dict):
     model = StandardScaler(**model_dict['params'])
     model.n_features_in_ = model_dict['n_features_in_']
 
-    if isinstance(model_dict['mean_'], list):
-        model.mean_ = np.array(model_dict['mean_'])
+    if is_serialized_array(model_dict['mean_']):
+        model.mean_ = decode_array(model_dict['mean_'])
     else:
         model.mean_ = model_dict['mean_']
-    if isinstance(model_dict['var_'], list):
-        model.var_ = np.array(model_dict['var_'])
+    if is_serialized_array(model_dict['var_']):
+        model.var_ = decode_array(model_dict['var_'])
     else:
         model.var_ = model_dict['var_']
-    if isinstance(model_dict['scale_'], list):
-        model.scale_ = np.array(model_dict['scale_'])
+    if is_serialized_array(model_dict['scale_']):
+        model.scale_ = decode_array(model_dict['scale_'])
     else:
         model.scale_ = model_dict['scale_']
-    if isinstance(model_dict['n_samples_seen_'], list):
-        model.n_samples_seen_ = np.array(model_dict['n_samples_seen_'])
+    if is_serialized_array(model_dict['n_samples_seen_']):
+        model.n_samples_seen_ = decode_array(model_dict['n_samples_seen_'])
     else:
         model.n_samples_seen_ = model_dict['n_samples_seen_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'])
 
     return model
 
@@ -157,15 +159,15 @@ def serialize_robust_scaler(model):
         'params': model.get_params(),
     }
     if hasattr(model, 'scale_'):
-        serialized_model['scale_'] = (model.scale_.tolist()
+        serialized_model['scale_'] = (encode_array(model.scale_)
                                       if isinstance(model.scale_, np.ndarray)
                                       else model.scale_)
     if hasattr(model, 'center_'):
-        serialized_model['center_'] = (model.center_.tolist()
+        serialized_model['center_'] = (encode_array(model.center_)
                                        if isinstance(model.center_, np.ndarray)
                                        else model.center_)
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
 
     return serialized_model
@@ -178,18 +180,18 @@ def deserialize_robust_scaler(model_dict):
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'scale_' in model_dict.keys():
-        if isinstance(model_dict['scale_'], list):
-            model.scale_ = np.array(model_dict['scale_'])
+        if is_serialized_array(model_dict['scale_']):
+            model.scale_ = decode_array(model_dict['scale_'])
         else:
             model.scale_ = model_dict['scale_']
     if 'center_' in model_dict.keys():
-        if isinstance(model_dict['center_'], list):
-            model.center_ = np.array(model_dict['center_'])
+        if is_serialized_array(model_dict['center_']):
+            model.center_ = decode_array(model_dict['center_'])
         else:
             model.center_ = model_dict['center_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'])
 
     return model
 
@@ -203,13 +205,13 @@ def serialize_maxabs_scaler(model):
     if 'n_features_in_' in model.__dict__:
         serialized_model['n_features_in_'] = model.n_features_in_
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
     if 'n_samples_seen_' in model.__dict__:
         serialized_model['n_samples_seen_'] = model.n_samples_seen_
     if 'max_abs_' in model.__dict__:
-        serialized_model['max_abs_'] = model.max_abs_.tolist()
+        serialized_model['max_abs_'] = encode_array(model.max_abs_)
     if 'scale_' in model.__dict__:
-        serialized_model['scale_'] = model.scale_.tolist()
+        serialized_model['scale_'] = encode_array(model.scale_)
 
     return serialized_model
 
@@ -220,13 +222,13 @@ def deserialize_maxabs_scaler(model_dict):
     if 'n_features_in_' in model_dict.keys():
         model.n_features_in_ = model_dict['n_features_in_']
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'])
     if 'n_samples_seen_' in model_dict.keys():
         model.n_samples_seen_ = model_dict['n_samples_seen_']
     if 'max_abs_' in model_dict.keys():
-        model.max_abs_ = np.array(model_dict['max_abs_'])
+        model.max_abs_ = decode_array(model_dict['max_abs_'])
     if 'scale_' in model_dict.keys():
-        model.scale_ = np.array(model_dict['scale_'])
+        model.scale_ = decode_array(model_dict['scale_'])
 
     return model
 
@@ -234,7 +236,7 @@ def deserialize_maxabs_scaler(model_dict):
 def serialize_label_encoder(model):
     serialized_model = {
         'meta': 'label-encoder',
-        'classes_': model.classes_.tolist(),
+        'classes_': encode_array(model.classes_),
     }
 
     return serialized_model
@@ -242,7 +244,7 @@ def serialize_label_encoder(model):
 
 def deserialize_label_encoder(model_dict):
     model = LabelEncoder()
-    model.classes_ = np.array(model_dict['classes_'])
+    model.classes_ = decode_array(model_dict['classes_'])
 
     return model
 
@@ -250,13 +252,13 @@ def deserialize_label_encoder(model_dict):
 def serialize_kernel_centerer(model):
     serialized_model = {
         'meta': 'kernel-centerer',
-        'K_fit_all_': model.K_fit_all_.astype(float).tolist(),
-        'K_fit_rows_': model.K_fit_rows_.tolist(),
+        'K_fit_all_': encode_array(model.K_fit_all_),
+        'K_fit_rows_': encode_array(model.K_fit_rows_),
         'n_features_in_': model.n_features_in_,
     }
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist(),
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_),
 
     return serialized_model
 
@@ -264,12 +266,12 @@ def serialize_kernel_centerer(model):
 def deserialize_kernel_centerer(model_dict):
     model = KernelCenterer()
 
-    model.K_fit_all_ = np.array(model_dict['K_fit_all_'], dtype=np.float64)
-    model.K_fit_rows_ = np.array(model_dict['K_fit_rows_'])
+    model.K_fit_all_ = decode_array(model_dict['K_fit_all_'], dtype=np.float64)
+    model.K_fit_rows_ = decode_array(model_dict['K_fit_rows_'])
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -277,9 +279,9 @@ def deserialize_kernel_centerer(model_dict):
 def serialize_onehot_encoder(model):
     serialized_model = {
         'meta': 'onehot-encoder',
-        'categories_': [category.tolist() for category in model.categories_],
+        'categories_': [encode_array(category) for category in model.categories_],
         'categories_dtype': [f"np.dtype('{str(category.dtype)}')" for category in model.categories_],
-        'drop_idx_': model.drop_idx_ if model.drop_idx_ is None else model.drop_idx_.tolist(),
+        'drop_idx_': model.drop_idx_ if model.drop_idx_ is None else encode_array(model.drop_idx_),
         '_infrequent_enabled': model._infrequent_enabled,
         'n_features_in_': model.n_features_in_,
         '_n_features_outs': model._n_features_outs,
@@ -296,7 +298,7 @@ def serialize_onehot_encoder(model):
     serialized_model['params']['dtype'] = (inspect.getmodule(dtype).__name__, name)
 
     if '_drop_idx_after_grouping' in model.__dict__:
-        serialized_model['_drop_idx_after_grouping'] = model._drop_idx_after_grouping.tolist() if model._drop_idx_after_grouping is not None else None
+        serialized_model['_drop_idx_after_grouping'] = encode_array(model._drop_idx_after_grouping) if model._drop_idx_after_grouping is not None else None
 
     return serialized_model
 
@@ -308,15 +310,15 @@ def deserialize_onehot_encoder(model_dict):
 
     model = OneHotEncoder(**model_dict['params'])
 
-    model.categories_ = [np.array(category, dtype=eval(dtype))
+    model.categories_ = [decode_array(category, dtype=eval(dtype))
                          for category, dtype in zip(model_dict['categories_'], model_dict['categories_dtype'])]
-    model.drop_idx_ = model_dict['drop_idx_'] if model_dict['drop_idx_'] is None else np.array(model_dict['drop_idx_'])
+    model.drop_idx_ = model_dict['drop_idx_'] if model_dict['drop_idx_'] is None else decode_array(model_dict['drop_idx_'])
     model._infrequent_enabled = model_dict['_infrequent_enabled']
     model.n_features_in_ = model_dict['n_features_in_']
-    model._n_features_outs = model_dict['_n_features_outs']
+    model._n_features_outs = [int(n_features_out) for n_features_out in model_dict['_n_features_outs']]
 
     if '_drop_idx_after_grouping' in model_dict.keys():
-        model._drop_idx_after_grouping = np.array(model_dict['_drop_idx_after_grouping']) if model_dict['_drop_idx_after_grouping'] is not None else None
+        model._drop_idx_after_grouping = decode_array(model_dict['_drop_idx_after_grouping']) if model_dict['_drop_idx_after_grouping'] is not None else None
 
     return model
 
@@ -324,7 +326,7 @@ def deserialize_onehot_encoder(model_dict):
 def serialize_ordinal_encoder(model):
     serialized_model = {
         'meta': 'ordinal-encoder',
-        'categories_': [category.tolist() for category in model.categories_],
+        'categories_': [encode_array(category) for category in model.categories_],
         'categories_dtype': [f"np.dtype('{str(category.dtype)}')" for category in model.categories_],
         '_infrequent_enabled': model._infrequent_enabled,
         'n_features_in_': model.n_features_in_,
@@ -341,13 +343,13 @@ def serialize_ordinal_encoder(model):
     serialized_model['params']['dtype'] = (inspect.getmodule(dtype).__name__, name)
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
     if 'infrequent_categories_' in model.__dict__:
-        serialized_model['infrequent_categories_'] = model.infrequent_categories_.tolist()
+        serialized_model['infrequent_categories_'] = encode_array(model.infrequent_categories_)
     if '_infrequent_indices' in model.__dict__:
-        serialized_model['_infrequent_indices'] = [x.tolist() for x in model._infrequent_indices]
+        serialized_model['_infrequent_indices'] = [encode_array(x) for x in model._infrequent_indices]
     if '_default_to_infrequent_mappings' in model.__dict__:
-        serialized_model['_default_to_infrequent_mappings'] = [x.tolist() for x in model._default_to_infrequent_mappings]
+        serialized_model['_default_to_infrequent_mappings'] = [encode_array(x) for x in model._default_to_infrequent_mappings]
     if '_missing_indices' in model.__dict__:
         serialized_model['_missing_indices'] = model._missing_indices
 
@@ -361,20 +363,20 @@ def deserialize_ordinal_encoder(model_dict):
 
     model = OrdinalEncoder(**model_dict['params'])
 
-    model.categories_ = [np.array(category, dtype=eval(dtype))
+    model.categories_ = [decode_array(category, dtype=eval(dtype))
                          for category, dtype in zip(model_dict['categories_'], model_dict['categories_dtype'])]
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
     if 'infrequent_categories_' in model_dict.keys():
-        model.infrequent_categories_ = np.array(model_dict['infrequent_categories_'])
+        model.infrequent_categories_ = decode_array(model_dict['infrequent_categories_'])
     if '_infrequent_enabled' in model_dict.keys():
         model._infrequent_enabled = model_dict['_infrequent_enabled']
     if '_infrequent_indices' in model_dict.keys():
-        model._infrequent_indices = [np.array(x) for x in model_dict['_infrequent_indices']]
+        model._infrequent_indices = [decode_array(x) for x in model_dict['_infrequent_indices']]
     if '_default_to_infrequent_mappings' in model_dict.keys():
-        model._default_to_infrequent_mappings = [np.array(x) for x in model_dict['_default_to_infrequent_mappings']]
+        model._default_to_infrequent_mappings = [decode_array(x) for x in model_dict['_default_to_infrequent_mappings']]
     if '_missing_indices' in model_dict.keys():
         model._missing_indices = {int(param): int(value) for param, value in model_dict['_missing_indices'].items()}
 
@@ -390,7 +392,7 @@ def serialize_normalizer(model):
     if 'n_features_in_' in model.__dict__:
         serialized_model['n_features_in_'] = model.n_features_in_
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -402,6 +404,6 @@ def deserialize_normalizer(model_dict):
     if 'n_features_in_' in model_dict.keys():
         model.n_features_in_ = model_dict['n_features_in_']
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'])
 
     return model
@@ -1,9 +1,8 @@
 # -*- coding: utf-8 -*-
 
-import os
-import uuid
 import inspect
 import importlib
+import importlib.util
 
 import numpy as np
 import scipy as sp
@@ -23,33 +22,29 @@ from sklearn.neighbors import KNeighborsRegressor
 
 from .neighbors import serialize_kdtree, deserialize_kdtree
 
-# Allow additional dependencies to be optional
+# Allow additional dependencies to be optional, they are only imported once needed
 __optionals__ = []
-try:
-    from xgboost import XGBRegressor, XGBRFRegressor, XGBRanker
+if importlib.util.find_spec('xgboost') is not None:
     __optionals__.extend(['XGBRegressor', 'XGBRFRegressor', 'XGBRanker'])
-except:
-    pass
-try:
-    from lightgbm import LGBMRegressor, LGBMRanker, Booster as LGBMBooster
+if importlib.util.find_spec('lightgbm') is not None:
     __optionals__.extend(['LGBMRegressor', 'LGBMRanker'])
-except:
-    pass
-try:
-    from catboost import CatBoostRegressor, CatBoostRanker
+if importlib.util.find_spec('catboost') is not None:
     __optionals__.extend(['CatBoostRegressor', 'CatBoostRanker'])
-except:
-    pass
 
 
 from .utils import csr
+from .utils.boosters import (serialize_xgboost_booster, deserialize_xgboost_booster,
+                             serialize_catboost_booster, deserialize_catboost_booster)
+from .utils.arrays import encode_array, decode_array, is_serialized_array
+from .utils.parallel import serialize_members, deserialize_members
+from .utils.trees import serialize_nodes, deserialize_nodes, serialize_forest, deserialize_forest
 
 
 def serialize_linear_regressor(model):
     serialized_model = {
         'meta': 'linear-regression',
-        'coef_': model.coef_.tolist(),
-        'intercept_': model.intercept_.tolist(),
+        'coef_': encode_array(model.coef_),
+        'intercept_': encode_array(model.intercept_),
         'params': model.get_params()
     }
 
@@ -59,8 +54,8 @@ def serialize_linear_regressor(model):
 def deserialize_linear_regressor(model_dict):
     model = LinearRegression(**model_dict['params'])
 
-    model.coef_ = np.array(model_dict['coef_'])
-    model.intercept_ = np.array(model_dict['intercept_'])
+    model.coef_ = decode_array(model_dict['coef_'])
+    model.intercept_ = decode_array(model_dict['intercept_'])
 
     return model
 
@@ -68,19 +63,19 @@ def deserialize_linear_regressor(model_dict):
 def serialize_lasso_regressor(model):
     serialized_model = {
         'meta': 'lasso-regression',
-        'coef_': model.coef_.tolist(),
+        'coef_': encode_array(model.coef_),
         'params': model.get_params()
     }
 
     if isinstance(model.n_iter_, int):
         serialized_model['n_iter_'] = model.n_iter_
     else:
-        serialized_model['n_iter_'] = model.n_iter_.tolist()
+        serialized_model['n_iter_'] = encode_array(model.n_iter_)
 
     if isinstance(model.n_iter_, float):
         serialized_model['intercept_'] = model.intercept_
     else:
-        serialized_model['intercept_'] = model.intercept_.tolist()
+        serialized_model['intercept_'] = encode_array(model.intercept_)
 
     return serialized_model
 
@@ -88,15 +83,15 @@ def serialize_lasso_regressor(model):
 def deserialize_lasso_regressor(model_dict):
     model = Lasso(model_dict['params'])
 
-    model.coef_ = np.array(model_dict['coef_'])
+    model.coef_ = decode_array(model_dict['coef_'])
 
-    if isinstance(model_dict['n_iter_'], list):
-        model.n_iter_ = np.array(model_dict['n_iter_'])
+    if is_serialized_array(model_dict['n_iter_']):
+        model.n_iter_ = decode_array(model_dict['n_iter_'])
     else:
         model.n_iter_ = int(model_dict['n_iter_'])
 
-    if isinstance(model_dict['intercept_'], list):
-        model.intercept_ = np.array(model_dict['intercept_'])
+    if is_serialized_array(model_dict['intercept_']):
+        model.intercept_ = decode_array(model_dict['intercept_'])
     else:
         model.intercept_ = float(model_dict['intercept_'])
 
@@ -106,18 +101,18 @@ def deserialize_lasso_regressor(model_dict):
 def serialize_elastic_regressor(model):
     serialized_model = {
         'meta': 'elasticnet-regression',
-        'coef_': model.coef_.tolist(),
+        'coef_': encode_array(model.coef_),
         'alpha': model.alpha,
         'params': model.get_params()
     }
     if isinstance(model.n_iter_, int):
         serialized_model['n_iter_'] = model.n_iter_
     else:
-        serialized_model['n_iter_'] = model.n_iter_.tolist()
+        serialized_model['n_iter_'] = encode_array(model.n_iter_)
     if isinstance(model.intercept_, float):
         serialized_model['intercept_'] = model.intercept_
     else:
-        serialized_model['intercept_'] = model.intercept_.tolist()
+        serialized_model['intercept_'] = encode_array(model.intercept_)
 
     return serialized_model
 
@@ -125,15 +120,15 @@ def serialize_elastic_regressor(model):
 def deserialize_elastic_regressor(model_dict):
     model = ElasticNet(model_dict['params'])
 
-    model.coef_ = np.array(model_dict['coef_'])
-    model.alpha = np.array(model_dict['alpha'])
+    model.coef_ = decode_array(model_dict['coef_'])
+    model.alpha = decode_array(model_dict['alpha'])
 
-    if isinstance(model_dict['n_iter_'], list):
-        model.n_iter_ = np.array(model_dict['n_iter_'])
+    if is_serialized_array(model_dict['n_iter_']):
+        model.n_iter_ = decode_array(model_dict['n_iter_'])
     else:
         model.n_iter_ = int(model_dict['n_iter_'])
-    if isinstance(model_dict['intercept_'], list):
-        model.intercept_ = np.array(model_dict['intercept_'])
+    if is_serialized_array(model_dict['intercept_']):
+        model.intercept_ = decode_array(model_dict['intercept_'])
     else:
         model.intercept_ = float(model_dict['intercept_'])
     return model
@@ -142,17 +137,17 @@ def deserialize_elastic_regressor(model_dict):
 def serialize_ridge_regressor(model):
     serialized_model = {
         'meta': 'ridge-regression',
-        'coef_': model.coef_.tolist(),
+        'coef_': encode_array(model.coef_),
         'params': model.get_params()
     }
 
     if model.n_iter_:
-        serialized_model['n_iter_'] = model.n_iter_.tolist()
+        serialized_model['n_iter_'] = encode_array(model.n_iter_)
 
     if isinstance(model.n_iter_, float):
         serialized_model['intercept_'] = model.intercept_
     else:
-        serialized_model['intercept_'] = model.intercept_.tolist()
+        serialized_model['intercept_'] = encode_array(model.intercept_)
 
     return serialized_model
 
@@ -160,13 +155,13 @@ def serialize_ridge_regressor(model):
 def deserialize_ridge_regressor(model_dict):
     model = Ridge(model_dict['params'])
 
-    model.coef_ = np.array(model_dict['coef_'])
+    model.coef_ = decode_array(model_dict['coef_'])
 
     if 'n_iter_' in model_dict:
-        model.n_iter_ = np.array(model_dict['n_iter_'])
+        model.n_iter_ = decode_array(model_dict['n_iter_'])
 
-    if isinstance(model_dict['intercept_'], list):
-        model.intercept_ = np.array(model_dict['intercept_'])
+    if is_serialized_array(model_dict['intercept_']):
+        model.intercept_ = decode_array(model_dict['intercept_'])
     else:
         model.intercept_ = float(model_dict['intercept_'])
 
@@ -176,10 +171,10 @@ def deserialize_ridge_regressor(model_dict):
 def serialize_svr(model):
     serialized_model = {
         'meta': 'svr',
-        'support_': model.support_.tolist(),
-        '_n_support': model._n_support.tolist(),
-        '_probA': model._probA.tolist(),
-        '_probB': model._probB.tolist(),
+        'support_': encode_array(model.support_),
+        '_n_support': encode_array(model._n_support),
+        '_probA': encode_array(model._probA),
+        '_probB': encode_array(model._probB),
         'shape_fit_': model.shape_fit_,
         '_gamma': model._gamma,
         'params': model.get_params()
@@ -188,25 +183,25 @@ def serialize_svr(model):
     if isinstance(model.support_vectors_, sp.sparse.csr_matrix):
         serialized_model['support_vectors_'] = csr.serialize_csr_matrix(model.support_vectors_)
     elif isinstance(model.support_vectors_, np.ndarray):
-        serialized_model['support_vectors_'] = model.support_vectors_.tolist()
+        serialized_model['support_vectors_'] = encode_array(model.support_vectors_)
 
     if isinstance(model.dual_coef_, sp.sparse.csr_matrix):
         serialized_model['dual_coef_'] = csr.serialize_csr_matrix(model.dual_coef_)
     elif isinstance(model.dual_coef_, np.ndarray):
-        serialized_model['dual_coef_'] = model.dual_coef_.tolist()
+        serialized_model['dual_coef_'] = encode_array(model.dual_coef_)
 
     if isinstance(model._dual_coef_, sp.sparse.csr_matrix):
         serialized_model['_dual_coef_'] = csr.serialize_csr_matrix(model._dual_coef_)
     elif isinstance(model._dual_coef_, np.ndarray):
-        serialized_model['_dual_coef_'] = model._dual_coef_.tolist()
+        serialized_model['_dual_coef_'] = encode_array(model._dual_coef_)
 
     if hasattr(model, 'class_weight_') and sklearn.__version__ < '1.2.0':
-            serialized_model['class_weight_'] = model.class_weight_.tolist(),
+            serialized_model['class_weight_'] = encode_array(model.class_weight_),
 
     if hasattr(model, 'intercept_'):
-        serialized_model['intercept_'] = model.intercept_.tolist()
+        serialized_model['intercept_'] = encode_array(model.intercept_)
     if hasattr(model, '_intercept'):
-        serialized_model['_intercept'] = model._intercept.tolist()
+        serialized_model['_intercept'] = encode_array(model._intercept)
 
     return serialized_model
 
@@ -217,35 +212,35 @@ def deserialize_svr(model_dict):
     model._gamma = model_dict['_gamma']
 
 
-    model.support_ = np.array(model_dict['support_']).astype(np.int32)
-    model._n_support = np.array(model_dict['_n_support']).astype(np.int32)
-    model._probA = np.array(model_dict['_probA']).astype(np.float64)
-    model._probB = np.array(model_dict['_probB']).astype(np.float64)
+    model.support_ = decode_array(model_dict['support_'], dtype=np.int32)
+    model._n_support = decode_array(model_dict['_n_support'], dtype=np.int32)
+    model._probA = decode_array(model_dict['_probA'], dtype=np.float64)
+    model._probB = decode_array(model_dict['_probB'], dtype=np.float64)
 
     if 'meta' in model_dict['support_vectors_'] and model_dict['support_vectors_']['meta'] == 'csr':
         model.support_vectors_ = csr.deserialize_csr_matrix(model_dict['support_vectors_'])
         model._sparse = True
     else:
-        model.support_vectors_ = np.array(model_dict['support_vectors_']).astype(np.float64)
+        model.support_vectors_ = decode_array(model_dict['support_vectors_'], dtype=np.float64)
         model._sparse = False
 
     if 'meta' in model_dict['dual_coef_'] and model_dict['dual_coef_']['meta'] == 'csr':
         model.dual_coef_ = csr.deserialize_csr_matrix(model_dict['dual_coef_'])
     else:
-        model.dual_coef_ = np.array(model_dict['dual_coef_']).astype(np.float64)
+        model.dual_coef_ = decode_array(model_dict['dual_coef_'], dtype=np.float64)
 
     if 'meta' in model_dict['_dual_coef_'] and model_dict['_dual_coef_']['meta'] == 'csr':
         model._dual_coef_ = csr.deserialize_csr_matrix(model_dict['_dual_coef_'])
     else:
-        model._dual_coef_ = np.array(model_dict['_dual_coef_']).astype(np.float64)
+        model._dual_coef_ = decode_array(model_dict['_dual_coef_'], dtype=np.float64)
 
     if 'class_weight_' in model_dict:
-        model.class_weight_ = np.array(model_dict['class_weight_']).astype(np.float64)
+        model.class_weight_ = decode_array(model_dict['class_weight_'], dtype=np.float64)
     if '_intercept' in model_dict:
-        model._intercept = np.array(model_dict['_intercept']).astype(np.float64)
+        model._intercept = decode_array(model_dict['_intercept'], dtype=np.float64)
         model._intercept_ = model._intercept.copy()
     if 'intercept_' in model_dict:
-        model.intercept_ = np.array(model_dict['intercept_']).astype(np.float64)
+        model.intercept_ = decode_array(model_dict['intercept_'], dtype=np.float64)
         model._intercept_ = model.intercept_.copy()
 
     return model
@@ -254,20 +249,18 @@ def deserialize_svr(model_dict):
 def serialize_tree(tree):
     serialized_tree = tree.__getstate__()
     dtypes = serialized_tree['nodes'].dtype
-    serialized_tree['nodes'] = serialized_tree['nodes'].tolist()
-    serialized_tree['values'] = serialized_tree['values'].tolist()
+    serialized_tree['nodes'] = serialize_nodes(serialized_tree['nodes'])
+    serialized_tree['values'] = encode_array(serialized_tree['values'])
 
     return serialized_tree, dtypes
 
 
 def deserialize_tree(tree_dict, n_features, n_outputs):
-    tree_dict['nodes'] = [tuple(lst) for lst in tree_dict['nodes']]
-
     names = ['left_child', 'right_child', 'feature', 'threshold', 'impurity', 'n_node_samples', 'weighted_n_node_samples']
     if sklearn.__version__ >= '1.3':
         names.append('missing_go_to_left')
-    tree_dict['nodes'] = np.array(tree_dict['nodes'], dtype=np.dtype({'names': names, 'formats': tree_dict['nodes_dtype']}))
-    tree_dict['values'] = np.array(tree_dict['values'])
+    tree_dict['nodes'] = deserialize_nodes(tree_dict['nodes'], tree_dict['nodes_dtype'], names)
+    tree_dict['values'] = decode_array(tree_dict['values'])
 
     # Dummy classes
     dummy_classes = np.array([1] * n_outputs, dtype=np.intp)
@@ -282,7 +275,7 @@ def serialize_decision_tree_regressor(model):
     tree, dtypes = serialize_tree(model.tree_)
     serialized_model = {
         'meta': 'decision-tree-regression',
-        'feature_importances_': model.feature_importances_.tolist(),
+        'feature_importances_': encode_array(model.feature_importances_),
         'max_features_': model.max_features_,
         'n_features_in_': model.n_features_in_,
         'n_outputs_': model.n_outputs_,
@@ -325,7 +318,7 @@ def serialize_gradient_boosting_regressor(model):
         'meta': 'gb-regression',
         'max_features_': model.max_features_,
         'n_features_in_': model.n_features_in_,
-        'train_score_': model.train_score_.tolist(),
+        'train_score_': encode_array(model.train_score_),
         'params': model.get_params(),
         'estimators_shape': list(model.estimators_.shape),
         'estimators_': []
@@ -361,12 +354,11 @@ def serialize_gradient_boosting_regressor(model):
             serialized_model['_loss'] = 'quantile'
 
     if 'priors' in model.init_.__dict__:
-        serialized_model['priors'] = model.init_.priors.tolist()
+        serialized_model['priors'] = encode_array(model.init_.priors)
 
-    for tree in model.estimators_.reshape((-1,)):
-        serialized_model['estimators_'].append(serialize_decision_tree_regressor(tree))
+    serialized_model['estimators_'] = serialize_forest(serialize_decision_tree_regressor, model.estimators_.reshape((-1,)))
 
-    serialized_model['init_'] = {key: value.tolist() if isinstance(value, np.ndarray) else value
+    serialized_model['init_'] = {key: encode_array(value) if isinstance(value, np.ndarray) else value
                                  for key, value in serialized_model['init_'].items()}
 
     return serialized_model
@@ -374,18 +366,18 @@ def serialize_gradient_boosting_regressor(model):
 
 def deserialize_gradient_boosting_regressor(model_dict):
     model = GradientBoostingRegressor(**model_dict['params'])
-    trees = [deserialize_decision_tree_regressor(tree) for tree in model_dict['estimators_']]
+    trees = deserialize_forest(deserialize_decision_tree_regressor, model_dict['estimators_'])
     model.estimators_ = np.array(trees).reshape(model_dict['estimators_shape'])
 
     if 'init_' in model_dict:
-        model_dict['init_'] = {key: np.array(value) if isinstance(value, list) else value
+        model_dict['init_'] = {key: decode_array(value) if is_serialized_array(value) else value
                                for key, value in model_dict['init_'].items()}
         if model_dict['init_']['meta'] == 'dummy':
             model.init_ = dummy.DummyRegressor()
         model.init_.__dict__ = model_dict['init_']
         model.init_.__dict__.pop('meta')
 
-    model.train_score_ = np.array(model_dict['train_score_'])
+    model.train_score_ = decode_array(model_dict['train_score_'])
     model.max_features_ = model_dict['max_features_']
     model.n_features_in_ = model_dict['n_features_in_']
     
@@ -410,7 +402,7 @@ def deserialize_gradient_boosting_regressor(model_dict):
             model._loss = _gb_losses.QuantileLossFunction(1)
 
     if 'priors' in model_dict:
-        model.init_.priors = np.array(model_dict['priors'])
+        model.init_.priors = decode_array(model_dict['priors'])
 
     return model
 
@@ -419,7 +411,7 @@ def serialize_random_forest_regressor(model):
 
     serialized_model = {
         'meta': 'rf-regression',
-        'estimators_': [serialize_decision_tree_regressor(decision_tree) for decision_tree in model.estimators_],
+        'estimators_': serialize_forest(serialize_decision_tree_regressor, model.estimators_),
         'n_features_in_': model.n_features_in_,
         'n_outputs_': model.n_outputs_,
         'params': model.get_params()
@@ -427,18 +419,18 @@ def serialize_random_forest_regressor(model):
 
     if 'oob_score_' in model.__dict__:
         serialized_model['oob_score_'] = model.oob_score_
-    if 'oob_decision_function_' in model.__dict__:
-        serialized_model['oob_prediction_'] = model.oob_prediction_.tolist()
+    if 'oob_prediction_' in model.__dict__:
+        serialized_model['oob_prediction_'] = encode_array(model.oob_prediction_)
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist(),
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_),
 
     return serialized_model
 
 
 def deserialize_random_forest_regressor(model_dict):
     model = RandomForestRegressor(**model_dict['params'])
-    estimators = [deserialize_decision_tree_regressor(decision_tree) for decision_tree in model_dict['estimators_']]
-    model.estimators_ = np.array(estimators)
+    estimators = deserialize_forest(deserialize_decision_tree_regressor, model_dict['estimators_'], lazy=True)
+    model.estimators_ = np.array(estimators) if isinstance(estimators, list) else estimators
 
     model.n_features_in_ = model_dict['n_features_in_']
     model.n_outputs_ = model_dict['n_outputs_']
@@ -446,7 +438,7 @@ def deserialize_random_forest_regressor(model_dict):
     if 'oob_score_' in model_dict:
         model.oob_score_ = model_dict['oob_score_']
     if 'oob_prediction_' in model_dict:
-        model.oob_prediction_ =np.array(model_dict['oob_prediction_'])
+        model.oob_prediction_ = decode_array(model_dict['oob_prediction_'])
 
     return model
 
@@ -454,9 +446,9 @@ def deserialize_random_forest_regressor(model_dict):
 def serialize_mlp_regressor(model):
     serialized_model = {
         'meta': 'mlp-regression',
-        'coefs_': [array.tolist() for array in model.coefs_],
+        'coefs_': [encode_array(array) for array in model.coefs_],
         'loss_': model.loss_,
-        'intercepts_': [array.tolist() for array in model.intercepts_],
+        'intercepts_': [encode_array(array) for array in model.intercepts_],
         'n_iter_': model.n_iter_,
         'n_layers_': model.n_layers_,
         'n_outputs_': model.n_outputs_,
@@ -470,9 +462,9 @@ def serialize_mlp_regressor(model):
 def deserialize_mlp_regressor(model_dict):
     model = MLPRegressor(**model_dict['params'])
 
-    model.coefs_ = [np.array(array) for array in model_dict['coefs_']]
+    model.coefs_ = [decode_array(array) for array in model_dict['coefs_']]
     model.loss_ = model_dict['loss_']
-    model.intercepts_ = [np.array(array) for array in model_dict['intercepts_']]
+    model.intercepts_ = [decode_array(array) for array in model_dict['intercepts_']]
     model.n_iter_ = model_dict['n_iter_']
     model.n_layers_ = model_dict['n_layers_']
     model.n_outputs_ = model_dict['n_outputs_']
@@ -488,23 +480,17 @@ if 'XGBRanker' in __optionals__:
             'params': model.get_params()
         }
 
-        filename = f'{str(uuid.uuid4())}.json'
-        model.save_model(filename)
-        with open(filename, 'r') as fh:
-            serialized_model['advanced-params'] = fh.read()
-        os.remove(filename)
+        serialized_model.update(serialize_xgboost_booster(model))
 
         return serialized_model
 
 
     def deserialize_xgboost_ranker(model_dict):
+        from xgboost import XGBRanker
+
         model = XGBRanker(**model_dict['params'])
 
-        filename = f'{str(uuid.uuid4())}.json'
-        with open(filename, 'w') as fh:
-            fh.write(model_dict['advanced-params'])
-        model.load_model(filename)
-        os.remove(filename)
+        deserialize_xgboost_booster(model, model_dict)
 
         return model
 
@@ -515,23 +501,17 @@ if 'XGBRegressor' in __optionals__:
             'params': model.get_params()
         }
 
-        filename = f'{str(uuid.uuid4())}.json'
-        model.save_model(filename)
-        with open(filename, 'r') as fh:
-            serialized_model['advanced-params'] = fh.read()
-        os.remove(filename)
+        serialized_model.update(serialize_xgboost_booster(model))
 
         return serialized_model
 
 
     def deserialize_xgboost_regressor(model_dict):
+        from xgboost import XGBRegressor
+
         model = XGBRegressor(**model_dict['params'])
 
-        filename = f'{str(uuid.uuid4())}.json'
-        with open(filename, 'w') as fh:
-            fh.write(model_dict['advanced-params'])
-        model.load_model(filename)
-        os.remove(filename)
+        deserialize_xgboost_booster(model, model_dict)
 
         return model
 
@@ -542,23 +522,17 @@ if 'XGBRFRegressor' in __optionals__:
             'params': model.get_params()
         }
 
-        filename = f'{str(uuid.uuid4())}.json'
-        model.save_model(filename)
-        with open(filename, 'r') as fh:
-            serialized_model['advanced-params'] = fh.read()
-        os.remove(filename)
+        serialized_model.update(serialize_xgboost_booster(model))
 
         return serialized_model
 
 
     def deserialize_xgboost_rf_regressor(model_dict):
+        from xgboost import XGBRFRegressor
+
         model = XGBRFRegressor(**model_dict['params'])
 
-        filename = f'{str(uuid.uuid4())}.json'
-        with open(filename, 'w') as fh:
-            fh.write(model_dict['advanced-params'])
-        model.load_model(filename)
-        os.remove(filename)
+        deserialize_xgboost_booster(model, model_dict)
 
         return model
 
@@ -587,19 +561,21 @@ if 'LGBMRegressor' in __optionals__:
         if hasattr(model, '_class_map') and model._class_map is not None:
             serialized_model['params']['_class_map'] = {int(key): int(value) for key, value in model._class_map.items()}
         if hasattr(model, '_classes') and model._classes is not None:
-            serialized_model['params']['_classes'] = model._classes.astype(int).tolist()
+            serialized_model['params']['_classes'] = encode_array(model._classes)
 
         return serialized_model
 
 
     def deserialize_lightgbm_regressor(model_dict):
+        from lightgbm import LGBMRegressor, Booster as LGBMBooster
+
         params = model_dict['params']
         params['_Booster'] = LGBMBooster(model_str=params['_Booster'])
 
         if '_class_map' in params and params['_class_map'] is not None:
             params['_class_map'] = {np.int32(key): np.int64(value) for key, value in model_dict['_class_map'].items()}
         if '_classes' in params and params['_classes'] is not None:
-            params['_classes'] = np.array(model_dict['_classes'], dtype=np.int32)
+            params['_classes'] = decode_array(model_dict['_classes'], dtype=np.int32)
 
         model = LGBMRegressor().set_params(**params)
         model._other_params = model_dict['_other_params']
@@ -630,19 +606,21 @@ if 'LGBMRanker' in __optionals__:
         if hasattr(model, '_class_map') and model._class_map is not None:
             serialized_model['params']['_class_map'] = {int(key): int(value) for key, value in model._class_map.items()}
         if hasattr(model, '_classes') and model._classes is not None:
-            serialized_model['params']['_classes'] = model._classes.astype(int).tolist()
+            serialized_model['params']['_classes'] = encode_array(model._classes)
 
         return serialized_model
 
 
     def deserialize_lightgbm_ranker(model_dict):
+        from lightgbm import LGBMRanker, Booster as LGBMBooster
+
         params = model_dict['params']
         params['_Booster'] = LGBMBooster(model_str=params['_Booster'])
 
         if '_class_map' in params:
             params['_class_map'] = {np.int32(key): np.int64(value) for key, value in model_dict['_class_map'].items()}
         if '_classes' in params:
-            params['_classes'] = np.array(model_dict['_classes'], dtype=np.int32)
+            params['_classes'] = decode_array(model_dict['_classes'], dtype=np.int32)
 
 
         model = LGBMRanker().set_params(**params)
@@ -658,51 +636,39 @@ if 'CatBoostRegressor' in __optionals__:
             'params': model.get_params()
         }
 
-        filename = f'{str(uuid.uuid4())}.json'
-        model.save_model(filename, format='json', pool=catboost_data)
-        with open(filename, 'r') as fh:
-            serialized_model['advanced-params'] = fh.read()
-        os.remove(filename)
+        serialized_model.update(serialize_catboost_booster(model, catboost_data))
 
         return serialized_model
 
 
     def deserialize_catboost_regressor(model_dict):
+        from catboost import CatBoostRegressor
+
         model = CatBoostRegressor(**model_dict['params'])
 
-        filename = f'{str(uuid.uuid4())}.json'
-        with open(filename, 'w') as fh:
-            fh.write(model_dict['advanced-params'])
-        model.load_model(filename, format='json')
-        os.remove(filename)
+        deserialize_catboost_booster(model, model_dict)
 
         return model
 
 
 if 'CatBoostRanker' in __optionals__:
-    def serialize_catboost_ranker(model: CatBoostRanker, catboost_data):
+    def serialize_catboost_ranker(model: 'CatBoostRanker', catboost_data):
         serialized_model = {
             'meta': 'catboost-ranker',
             'params': model.get_params()
         }
 
-        filename = f'{str(uuid.uuid4())}.json'
-        model.save_model(filename, format='json', pool=catboost_data)
-        with open(filename, 'r') as fh:
-            serialized_model['advanced-params'] = fh.read()
-        os.remove(filename)
+        serialized_model.update(serialize_catboost_booster(model, catboost_data))
 
         return serialized_model
 
 
     def deserialize_catboost_ranker(model_dict):
+        from catboost import CatBoostRanker
+
         model = CatBoostRanker(**model_dict['params'])
 
-        filename = f'{str(uuid.uuid4())}.json'
-        with open(filename, 'w') as fh:
-            fh.write(model_dict['advanced-params'])
-        model.load_model(filename, format='json')
-        os.remove(filename)
+        deserialize_catboost_booster(model, model_dict)
 
         return model
 
@@ -710,9 +676,9 @@ if 'CatBoostRanker' in __optionals__:
 def serialize_adaboost_regressor(model):
     serialized_model = {
         'meta': 'adaboost-regressor',
-        'estimators_': [serialize_decision_tree_regressor(decision_tree) for decision_tree in model.estimators_],
-        'estimator_weights_': model.estimator_weights_.tolist(),
-        'estimator_errors_': model.estimator_errors_.tolist(),
+        'estimators_': serialize_members(serialize_decision_tree_regressor, model.estimators_),
+        'estimator_weights_': encode_array(model.estimator_weights_),
+        'estimator_errors_': encode_array(model.estimator_errors_),
         'estimator_params': model.estimator_params,
         'n_features_in_': model.n_features_in_,
         'params': model.get_params()
@@ -732,7 +698,7 @@ def serialize_adaboost_regressor(model):
         serialized_model['_estimator'] = None
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -755,14 +721,14 @@ def deserialize_adaboost_regressor(model_dict):
         model.base_estimator_ = model_dict['params']['base_estimator']
     else:
         model._estimator = model_dict['params']['estimator']
-    model.estimators_ = [deserialize_decision_tree_regressor(decision_tree) for decision_tree in model_dict['estimators_']]
-    model.estimator_weights_ = np.array(model_dict['estimator_weights_'])
-    model.estimator_errors_ = np.array(model_dict['estimator_errors_'])
+    model.estimators_ = deserialize_members(deserialize_decision_tree_regressor, model_dict['estimators_'])
+    model.estimator_weights_ = decode_array(model_dict['estimator_weights_'])
+    model.estimator_errors_ = decode_array(model_dict['estimator_errors_'])
     model.estimator_params = tuple(model_dict['estimator_params'])
     model.n_features_in_ = model_dict['n_features_in_']
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -774,10 +740,10 @@ def serialize_bagging_regressor(model):
         '_n_samples': model._n_samples,
         '_max_features': model._max_features,
         'n_features_in_': model.n_features_in_,
-        '_seeds': model._seeds.tolist(),
-        'estimators_': [serialize_decision_tree_regressor(decision_tree) for decision_tree in model.estimators_],
+        '_seeds': encode_array(model._seeds),
+        'estimators_': serialize_forest(serialize_decision_tree_regressor, model.estimators_),
         'estimator_params': model.estimator_params,
-        'estimators_features_': [array.tolist() for array in model.estimators_features_],
+        'estimators_features_': [encode_array(array) for array in model.estimators_features_],
         'params': model.get_params()
     }
 
@@ -796,11 +762,11 @@ def serialize_bagging_regressor(model):
 
     if 'oob_score_' in model.__dict__:
         serialized_model['oob_score_'] = model.oob_score_
-    if 'oob_decision_function_' in model.__dict__:
-        serialized_model['oob_decision_function_'] = model.oob_decision_function_.tolist()
+    if 'oob_prediction_' in model.__dict__:
+        serialized_model['oob_prediction_'] = encode_array(model.oob_prediction_)
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -824,22 +790,22 @@ def deserialize_bagging_regressor(model_dict):
         model.base_estimator_ = model_dict['params']['base_estimator']
     else:
         model._estimator = model_dict['params']['estimator']
-    model.estimators_ = [deserialize_decision_tree_regressor(decision_tree) for decision_tree in model_dict['estimators_']]
+    model.estimators_ = deserialize_forest(deserialize_decision_tree_regressor, model_dict['estimators_'])
     model._max_samples = model_dict['_max_samples']
     model._n_samples = model_dict['_n_samples']
     model._max_features = model_dict['_max_features']
     model.n_features_in_ = model_dict['n_features_in_']
-    model._seeds = np.array(model_dict['_seeds'])
+    model._seeds = decode_array(model_dict['_seeds'])
     model.estimator_params = model_dict['estimator_params']
-    model.estimators_features_ = [np.array(array) for array in model_dict['estimators_features_']]
+    model.estimators_features_ = [decode_array(array) for array in model_dict['estimators_features_']]
 
     if 'oob_score_' in model_dict:
         model.oob_score_ = model_dict['oob_score_']
-    if 'oob_decision_function_' in model_dict:
-        model.oob_decision_function_ = model_dict['oob_decision_function_']
+    if 'oob_prediction_' in model_dict:
+        model.oob_prediction_ = decode_array(model_dict['oob_prediction_'])
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -862,7 +828,7 @@ def serialize_extra_tree_regressor(model):
     serialized_model['tree_']['nodes_dtype'] = tree_dtypes
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -878,7 +844,7 @@ def deserialize_extra_tree_regressor(model_dict):
     deserialized_model.tree_ = tree
 
     if 'feature_names_in_' in model_dict.keys():
-        deserialized_model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        deserialized_model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return deserialized_model
 
@@ -888,7 +854,7 @@ def serialize_extratrees_regressor(model):
         'meta': 'extratrees-regressor',
         'n_features_in_': model.n_features_in_,
         'n_outputs_': model.n_outputs_,
-        'estimators_': [serialize_extra_tree_regressor(extra_tree) for extra_tree in model.estimators_],
+        'estimators_': serialize_forest(serialize_extra_tree_regressor, model.estimators_),
         'params': model.get_params()
     }
 
@@ -908,10 +874,10 @@ def serialize_extratrees_regressor(model):
     if 'oob_score_' in model.__dict__:
         serialized_model['oob_score_'] = model.oob_score_
     if 'oob_prediction_' in model.__dict__:
-        serialized_model['oob_prediction_'] = model.oob_prediction_.tolist()
+        serialized_model['oob_prediction_'] = encode_array(model.oob_prediction_)
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -935,17 +901,17 @@ def deserialize_extratrees_regressor(model_dict):
         model.base_estimator_ = model_dict['params']['base_estimator']
     else:
         model._estimator = model_dict['params']['estimator']
-    model.estimators_ = [deserialize_extra_tree_regressor(decision_tree) for decision_tree in model_dict['estimators_']]
+    model.estimators_ = deserialize_forest(deserialize_extra_tree_regressor, model_dict['estimators_'], lazy=True)
     model.n_features_in_ = model_dict['n_features_in_']
     model.n_outputs_ = model_dict['n_outputs_']
 
     if 'oob_score_' in model_dict:
         model.oob_score_ = model_dict['oob_score_']
     if 'oob_prediction_' in model_dict:
-        model.oob_prediction_ = model_dict['oob_prediction_']
+        model.oob_prediction_ = decode_array(model_dict['oob_prediction_'])
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -954,12 +920,12 @@ def serialize_nearest_neighbour_regressor(model):
         'meta': 'nearest-neighbour-regressor',
         'radius': model.radius,
         'n_features_in_': model.n_features_in_,
-        '_y': model._y.tolist(),
+        '_y': encode_array(model._y),
         'effective_metric_params_': model.effective_metric_params_,
         'effective_metric_': model.effective_metric_,
         '_fit_method': model._fit_method,
         'n_samples_fit_': model.n_samples_fit_,
-        '_fit_X': model._fit_X.tolist(),
+        '_fit_X': encode_array(model._fit_X),
         'params': model.get_params()
     }
 
@@ -969,7 +935,7 @@ def serialize_nearest_neighbour_regressor(model):
         serialized_model['_tree'] = None
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -979,11 +945,11 @@ def deserialize_nearest_neighbour_regressor(model_dict):
 
     model.radius = model_dict['radius']
     model.n_features_in_ = model_dict['n_features_in_']
-    model._y = np.array(model_dict['_y'])
+    model._y = decode_array(model_dict['_y'])
     model.effective_metric_params_ = model_dict['effective_metric_params_']
     model.effective_metric_ = model_dict['effective_metric_']
     model._fit_method = model_dict['_fit_method']
-    model._fit_X = np.array(model_dict['_fit_X'])
+    model._fit_X = decode_array(model_dict['_fit_X'])
     model.n_samples_fit_ = model_dict['n_samples_fit_']
 
     if model_dict['_tree'] is not None:
@@ -992,7 +958,7 @@ def deserialize_nearest_neighbour_regressor(model_dict):
         model._tree = None
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -1016,7 +982,7 @@ def serialize_stacking_regressor(model):
                                                 serialized_model['params']['estimators']]
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -1037,7 +1003,7 @@ def deserialize_stacking_regressor(model_dict):
     model.named_estimators_ = {model_name: deserialize_model(submodel) for model_name, submodel in model_dict['named_estimators_'].items()}
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
 
@@ -1060,7 +1026,7 @@ def serialize_voting_regressor(model):
                                                 serialized_model['params']['estimators']]
 
     if 'feature_names_in_' in model.__dict__:
-        serialized_model['feature_names_in_'] = model.feature_names_in_.tolist()
+        serialized_model['feature_names_in_'] = encode_array(model.feature_names_in_)
 
     return serialized_model
 
@@ -1079,6 +1045,6 @@ def deserialize_voting_regressor(model_dict):
                                model_dict['named_estimators_'].items()}
 
     if 'feature_names_in_' in model_dict.keys():
-        model.feature_names_in_ = np.array(model_dict['feature_names_in_'][0])
+        model.feature_names_in_ = decode_array(model_dict['feature_names_in_'][0])
 
     return model
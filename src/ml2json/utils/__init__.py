@@ -1,23 +1,24 @@
 # -*- coding: utf-8 -*-
 
-from sklearn.utils.validation import check_is_fitted
-from sklearn.exceptions import NotFittedError
-from sklearn.neighbors import KDTree
-from sklearn.decomposition import SparseCoder
+import sys
 
-import scipy as sp
 
 def is_model_fitted(model):
+    # Imported here so that importing ml2json does not import scikit-learn
+    from scipy.sparse import csr_matrix
+    from sklearn.utils.validation import check_is_fitted
+    from sklearn.exceptions import NotFittedError
+    from sklearn.neighbors import KDTree
+    from sklearn.decomposition import SparseCoder
+
     # 1) Models that are not estimators (no fit method)
-    #   1.1 Models that depend on optional librairies
-    try:
+    #   1.1 Models that depend on optional librairies, only imported if the model could be one of theirs
+    if 'pynndescent' in sys.modules:
         from pynndescent import NNDescent
         if isinstance(model, NNDescent):
             return True
-    except:
-        pass
     #   1.2 Scikit-Learn or SciPy objects
-    if isinstance(model, (sp.sparse.csr_matrix, KDTree, SparseCoder)):
+    if isinstance(model, (csr_matrix, KDTree, SparseCoder)):
         return True
     # 2) Models that are estimators
     try:
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+import os
+import threading
+from contextvars import ContextVar, copy_context
+from functools import partial
+from typing import Callable, Optional
+
+from .config import get_config
+from .instrumentation import instrument
+
+
+# Event set once the coroutine awaiting the model being (de)serialized in the current thread is cancelled
+_cancellation: ContextVar[Optional[threading.Event]] = ContextVar('ml2json_cancellation', default=None)
+
+
+def check_cancelled(*_) -> None:
+    """Stop (de)serializing a model once the coroutine awaiting it is cancelled.
+
+    Called as files are read and, as a hook (see `instrument`), as models and their members are (de)serialized.
+    """
+    cancelled = _cancellation.get()
+    if cancelled is not None and cancelled.is_set():
+        import asyncio
+
+        raise asyncio.CancelledError()
+
+
+async def run_cancellable(executor, function: Callable, *args):
+    """Call a function (de)serializing a model in an executor, without blocking the event loop.
+
+    The function is called with the options of the caller (see `config_context`), whatever the executor.
+    Within threads, it stops soon after the calling coroutine is cancelled.
+    Functions submitted to process pools cannot be stopped once started.
+
+    :param executor: `concurrent.futures` executor, None for the default executor of the event loop
+    :param function: module-level function (de)serializing a model
+    :param args: arguments of the function
+    """
+    import asyncio
+    from concurrent.futures import ProcessPoolExecutor
+    from .batch import _call
+
+    loop = asyncio.get_running_loop()
+    if isinstance(executor, ProcessPoolExecutor):
+        # Worker processes do not inherit the context of the caller, started with 'spawn' in particular
+        return await loop.run_in_executor(executor, partial(_call, function, get_config(), *args))
+    cancelled = threading.Event()
+    future = loop.run_in_executor(executor, copy_context().run, _run, cancelled, function, args)
+    try:
+        return await future
+    except asyncio.CancelledError:
+        cancelled.set()
+        raise
+
+
+def _run(cancelled: threading.Event, function: Callable, args: tuple):
+    _cancellation.set(cancelled)
+    with instrument(check_cancelled):
+        return function(*args)
+
+
+def write_or_remove(write: Callable, model, outfile, **kwargs) -> None:
+    """Write a model to a file, removing the file if writing fails or is cancelled."""
+    try:
+        write(model, outfile, **kwargs)
+    except BaseException:
+        if isinstance(outfile, (str, os.PathLike)) and os.path.exists(outfile):
+            os.remove(outfile)
+        raise
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+import json
+import struct
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .arrays import _array_store, _is_binary_dtype, _is_binary_array
+
+
+# Name of the member holding the serialized model, whose large arrays are replaced by references to other members
+MANIFEST_NAME = 'model.json'
+# Folder of the archive holding the arrays stored outside of the manifest
+ARRAYS_DIR = 'arrays'
+# Modes in which members can be memory-mapped, as for `numpy.load`
+MMAP_MODES = ('r', 'c')
+# Readers of the headers of the versions of the `.npy` format written by numpy
+_NPY_HEADER_READERS = {(1, 0): np.lib.format.read_array_header_1_0, (2, 0): np.lib.format.read_array_header_2_0}
+
+
+class ArchiveWriter:
+    """Store the arrays of a model being serialized as `.npy` members of a zip archive.
+
+    :param archive: zip archive opened for writing
+    :param inline_threshold: size (in bytes) from which arrays are stored as separate members
+    """
+
+    # Arrays are stored as their raw bytes
+    raw_bytes = True
+
+    def __init__(self, archive: zipfile.ZipFile, inline_threshold: int):
+        self.archive = archive
+        self.inline_threshold = inline_threshold
+        self.n_members = 0
+
+    def accepts(self, array: np.ndarray) -> bool:
+        """Determine if an array is to be stored as a separate member."""
+        return array.nbytes >= self.inline_threshold and _is_binary_dtype(array.dtype)
+
+    def add(self, array: np.ndarray) -> Dict:
+        """Write an array to the archive and obtain the reference replacing it in the manifest."""
+        name = f'{ARRAYS_DIR}/{self.n_members}.npy'
+        self.n_members += 1
+        with self.archive.open(name, 'w', force_zip64=True) as member:
+            np.lib.format.write_array(member, array, allow_pickle=False)
+        return {'meta': 'ndarray', 'dtype': np.lib.format.dtype_to_descr(array.dtype), 'shape': list(array.shape),
+                'file': name}
+
+
+class ArchiveReader:
+    """Arrays of a serialized model read from the `.npy` members of a zip archive.
+
+    :param archive: zip archive opened for reading
+    :param mmap_mode: if not None, uncompressed members are memory-mapped with this mode ('r' or 'c')
+                      rather than read into memory
+    """
+
+    def __init__(self, archive: zipfile.ZipFile, mmap_mode: Optional[str] = None):
+        if mmap_mode not in (None, *MMAP_MODES):
+            raise ValueError(f'mmap_mode must be one of {MMAP_MODES} or None, got {mmap_mode!r}')
+        self.archive = archive
+        self.mmap_mode = mmap_mode
+        self.arrays: Dict[str, np.ndarray] = {}
+
+    def accepts(self, array: np.ndarray) -> bool:
+        """Arrays serialized while reading an archive are never stored in it."""
+        return False
+
+    def read_members(self, names: List[str], n_jobs: Optional[int] = None) -> None:
+        """Read members of the archive, in parallel threads.
+
+        :param names: names of the `.npy` members to be read
+        :param n_jobs: maximum number of threads, default to the default of `concurrent.futures.ThreadPoolExecutor`
+        """
+        names = [name for name in dict.fromkeys(names) if name not in self.arrays]
+        if len(names) < 2 or n_jobs == 1:
+            for name in names:
+                self.arrays[name] = self.read_member(name)
+            return
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            self.arrays.update(zip(names, executor.map(self.read_member, names)))
+
+    def read_member(self, name: str) -> np.ndarray:
+        """Read a `.npy` member of the archive."""
+        if self.mmap_mode is not None:
+            array = self.map_member(name)
+            if array is not None:
+                return array
+        with self.archive.open(name) as member:
+            return np.lib.format.read_array(member, allow_pickle=False)
+
+    def map_member(self, name: str) -> Optional[np.memmap]:
+        """Memory-map a `.npy` member of the archive.
+
+        :return: None if the member cannot be memory-mapped (e.g. it is compressed or empty)
+        """
+        info = self.archive.getinfo(name)
+        if info.compress_type != zipfile.ZIP_STORED or not isinstance(self.archive.filename, str):
+            return None
+        with open(self.archive.filename, 'rb') as archive_file:
+            # Skip the local header of the member, whose extra field may differ from that of the central directory
+            archive_file.seek(info.header_offset)
+            header = archive_file.read(zipfile.sizeFileHeader)
+            name_length, extra_length = struct.unpack('<HH', header[26:30])
+            archive_file.seek(info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+            version = np.lib.format.read_magic(archive_file)
+            if version not in _NPY_HEADER_READERS:
+                return None
+            shape, fortran_order, dtype = _NPY_HEADER_READERS[version](archive_file)
+            offset = archive_file.tell()
+        if dtype.hasobject or np.prod(shape) == 0:
+            return None
+        return np.memmap(self.archive.filename, dtype=dtype, mode=self.mmap_mode, offset=offset, shape=shape,
+                         order='F' if fortran_order else 'C')
+
+    def load(self, name: str) -> np.ndarray:
+        """Obtain the array of a `.npy` member of the archive, reading it if it was not read already."""
+        if name not in self.arrays:
+            self.arrays[name] = self.read_member(name)
+        return self.arrays[name]
+
+
+@contextmanager
+def array_store(store):
+    """Make arrays be stored in, or loaded from, an archive within a context.
+
+    :param store: either an `ArchiveWriter` or an `ArchiveReader`
+    """
+    token = _array_store.set(store)
+    try:
+        yield store
+    finally:
+        _array_store.reset(token)
+
+
+def write_archive(model_dict_factory, outfile, inline_threshold: int, compress: bool = False) -> None:
+    """Write a serialized model to a zip archive.
+
+    :param model_dict_factory: callable serializing the model, called while arrays are redirected to the archive
+    :param outfile: zip archive to be created
+    :param inline_threshold: size (in bytes) from which arrays are stored as separate members
+    :param compress: if True, members are deflated, otherwise they are stored uncompressed
+    """
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with zipfile.ZipFile(outfile, 'w', compression=compression, allowZip64=True) as archive:
+        with array_store(ArchiveWriter(archive, inline_threshold)):
+            model_dict = model_dict_factory()
+        archive.writestr(MANIFEST_NAME, json.dumps(model_dict))
+
+
+def read_archive(infile, model_dict_loader, n_jobs: Optional[int] = None, mmap_mode: Optional[str] = None):
+    """Read a serialized model from a zip archive.
+
+    :param infile: zip archive containing the serialized model
+    :param model_dict_loader: callable instantiating the model from its manifest,
+                              called while arrays are read from the archive
+    :param n_jobs: maximum number of threads reading the arrays
+    :param mmap_mode: if not None, uncompressed arrays are memory-mapped with this mode ('r' or 'c')
+    """
+    with zipfile.ZipFile(infile, 'r') as archive:
+        model_dict = json.loads(archive.read(MANIFEST_NAME))
+        reader = ArchiveReader(archive, mmap_mode)
+        reader.read_members(find_references(model_dict), n_jobs)
+        with array_store(reader):
+            return model_dict_loader(model_dict)
+
+
+def find_references(value) -> List[str]:
+    """Find the members of an archive referenced in a serialized model.
+
+    :param value: manifest of the archive, or any value it contains
+    """
+    references = []
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            if _is_binary_array(value) and 'file' in value:
+                references.append(value['file'])
+            else:
+                stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return references
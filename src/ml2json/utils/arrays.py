@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+import base64
+from contextvars import ContextVar
+
+import numpy as np
+from numpy.lib.recfunctions import unstructured_to_structured
+
+from .config import get_config
+from .instrumentation import count_bytes
+from .precision import FULL_PRECISION, get_precision, reduce_precision, storage_dtype
+
+
+# Kinds of dtypes whose values can be stored as raw bytes (booleans, integers, floats and complex numbers)
+_BINARY_KINDS = 'biufc'
+# Archive arrays are written to, or read from, while a model is (de)serialized to an archive
+_array_store = ContextVar('ml2json_array_store', default=None)
+
+
+def encode_array(array):
+    """Serialize a numpy array according to the `array_encoding` option.
+
+    Arrays are converted to nested lists by default.
+    If `array_encoding` is 'base64', numeric arrays are stored as their raw little-endian bytes, encoded in base64,
+    along with their dtype and shape so that they are restored exactly.
+    Arrays of other types (e.g. strings or objects) are always converted to nested lists.
+    When writing an archive, large numeric arrays are stored as separate members and replaced by a reference.
+    Floats are rounded according to the `float_precision` option. Arrays of float64 stored as raw bytes
+    are then stored as float32 (see `storage_dtype`), along with the dtype they are cast back to when decoded.
+
+    :param array: numpy array (or numpy scalar) to be serialized
+    """
+    if not isinstance(array, np.ndarray):
+        return array.tolist() if hasattr(array, 'tolist') else array
+    count_bytes(array.nbytes)
+    config = get_config()
+    store = _array_store.get()
+    stored = store is not None and store.accepts(array)
+    decoded_dtype = None
+    if array.dtype.kind == 'f' and config['float_precision'] != FULL_PRECISION:
+        raw_bytes = config['array_encoding'] == 'base64' or (stored and store.raw_bytes)
+        precision = get_precision(array, config['float_precision'])
+        array = reduce_precision(array, precision, raw_bytes)
+        dtype = storage_dtype(array, precision)
+        if raw_bytes and dtype != array.dtype and not (stored and getattr(store, 'keeps_dtype', False)):
+            decoded_dtype, array = np.lib.format.dtype_to_descr(array.dtype), array.astype(dtype)
+    if stored:
+        value = store.add(array)
+        if decoded_dtype is not None:
+            if isinstance(value, dict):
+                value['decoded_dtype'] = decoded_dtype
+            else:
+                value.decoded_dtype = decoded_dtype
+        return value
+    if config['array_encoding'] != 'base64' or not _is_binary_dtype(array.dtype):
+        return array.tolist()
+    dtype = array.dtype.newbyteorder('<')
+    value = {'meta': 'ndarray', 'dtype': np.lib.format.dtype_to_descr(dtype), 'shape': list(array.shape)}
+    if decoded_dtype is not None:
+        value['decoded_dtype'] = decoded_dtype
+    value['data'] = base64.b64encode(np.ascontiguousarray(array, dtype=dtype).tobytes()).decode('ascii')
+    return value
+
+
+def decode_array(value, dtype=None):
+    """Instantiate a numpy array serialized with `encode_array`.
+
+    Arrays stored as raw bytes are restored with their original dtype,
+    whereas `dtype` is applied to arrays stored as nested lists.
+
+    :param value: serialized array
+    :param dtype: dtype of the array, if stored as nested lists
+    """
+    array = _decode_array(value, dtype)
+    count_bytes(array.nbytes)
+    return array
+
+
+def _decode_array(value, dtype=None) -> np.ndarray:
+    """Instantiate a numpy array serialized with `encode_array`, as `decode_array`."""
+    if _is_binary_array(value):
+        if 'file' in value:
+            store = _array_store.get()
+            if store is None:
+                raise ValueError(f'Array stored in archive member {value["file"]} can only be read with from_archive')
+            array = store.load(value['file'])
+        else:
+            array_dtype = np.lib.format.descr_to_dtype(value['dtype'])
+            data = bytearray(base64.b64decode(value['data']))
+            array = np.frombuffer(data, dtype=array_dtype).reshape(value['shape'])
+            if not array_dtype.isnative:
+                array = array.astype(array_dtype.newbyteorder('='))
+        if 'decoded_dtype' in value:
+            # Floats stored with a reduced precision are restored with their original dtype
+            array = array.astype(np.lib.format.descr_to_dtype(value['decoded_dtype']))
+        return array
+    if isinstance(value, list) and _contains_binary_array(value):
+        # Sequence of arrays, stacked as numpy would for nested lists
+        return np.array([_decode_array(item) for item in value])
+    if isinstance(value, np.ndarray):
+        # Nested lists already parsed into an array when reading json
+        if dtype is not None and np.dtype(dtype).names is not None:
+            return unstructured_to_structured(value, dtype=np.dtype(dtype))
+        return np.asarray(value, dtype=dtype)
+    if dtype is not None and np.dtype(dtype).names is not None:
+        # Records of structured arrays are serialized as lists
+        return np.array([tuple(record) for record in value], dtype=dtype)
+    return np.array(value, dtype=dtype)
+
+
+def is_serialized_array(value) -> bool:
+    """Determine if a serialized value is an array, either stored as nested lists or as raw bytes.
+
+    :param value: serialized value
+    """
+    return isinstance(value, (list, np.ndarray)) or _is_binary_array(value)
+
+
+def _is_binary_array(value) -> bool:
+    """Determine if a serialized value is an array stored as raw bytes."""
+    return isinstance(value, dict) and value.get('meta') == 'ndarray'
+
+
+def _contains_binary_array(value: list) -> bool:
+    """Determine if nested lists hold arrays stored as raw bytes, only looking at their first items."""
+    while isinstance(value, list) and len(value) > 0:
+        value = value[0]
+    return _is_binary_array(value)
+
+
+def _is_binary_dtype(dtype: np.dtype) -> bool:
+    """Determine if the values of a dtype can be stored as raw bytes."""
+    if dtype.names is not None:
+        return all(_is_binary_dtype(dtype.fields[name][0]) for name in dtype.names)
+    if dtype.subdtype is not None:
+        return _is_binary_dtype(dtype.subdtype[0])
+    return dtype.kind in _BINARY_KINDS
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+from contextvars import copy_context
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from .config import get_config, config_context
+from .parallel import n_workers
+
+
+# Pools of workers models can be (de)serialized by
+BACKENDS = ('process', 'thread')
+
+
+class BatchResult(NamedTuple):
+    """Outcome of writing or reading a model of a batch (see `to_json_many` and `from_json_many`).
+
+    :param path: path of the file written or read
+    :param model: the model read, None when writing models or if the model could not be read
+    :param error: exception raised while writing or reading the model, None if it succeeded
+    """
+    path: Any
+    model: Any
+    error: Optional[Exception]
+
+
+def run_batch(function: Callable, items: Iterable[Tuple[Any, tuple]], n_jobs: int = -1, backend: str = 'process',
+              priority: Callable = None) -> Iterator[BatchResult]:
+    """Apply a function to the arguments of each item of a batch in a pool of workers, yielding results as they come.
+
+    Exceptions raised by the function are reported in the results, rather than raised.
+
+    :param function: module-level function writing or reading a model
+    :param items: path of the file of each item, and the arguments the function is called with
+    :param n_jobs: number of workers, -1 for as many as there are CPUs
+    :param backend: either 'process' or 'thread'
+    :param priority: function giving the priority of the path of each item, items of higher priorities being started
+                     first; None to start them in order
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f'backend must be one of {BACKENDS}, got {backend!r}')
+    items = list(items)
+    if priority is not None:
+        items.sort(key=lambda item: priority(item[0]), reverse=True)
+    return _run_batch(partial(_call, function, get_config()), items, n_workers(n_jobs), backend)
+
+
+def _run_batch(function: Callable, items: list, n_workers: int, backend: str) -> Iterator[BatchResult]:
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+    if backend == 'process':
+        executor = ProcessPoolExecutor(max_workers=n_workers)
+        futures = {executor.submit(function, *args): path for path, args in items}
+    else:
+        executor = ThreadPoolExecutor(max_workers=n_workers)
+        futures = {executor.submit(copy_context().run, function, *args): path for path, args in items}
+    try:
+        for future in as_completed(futures):
+            try:
+                yield BatchResult(futures[future], future.result(), None)
+            except Exception as error:
+                yield BatchResult(futures[future], None, error)
+    finally:
+        # Items not started yet are dropped if results stop being requested
+        for future in futures:
+            future.cancel()
+        executor.shutdown()
+
+
+def _call(function: Callable, config: dict, *args):
+    """Call a function with the options of the caller of `run_batch`."""
+    with config_context(**config):
+        return function(*args)
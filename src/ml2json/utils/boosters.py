@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import tempfile
+from typing import Dict
+
+import numpy as np
+
+from .arrays import encode_array, decode_array
+from .config import get_config, config_context
+
+
+def serialize_xgboost_booster(model) -> Dict:
+    """Serialize the booster of an XGBoost scikit-learn model, according to the `booster_format` option.
+
+    Boosters are stored as the json text XGBoost saves models as ('advanced-params'),
+    or as their UBJSON raw buffer ('booster', see `encode_bytes`).
+
+    :param model: XGBoost scikit-learn model (e.g. `XGBClassifier`)
+    :return: the keys to add to the serialized model
+    """
+    booster = model.get_booster()
+    native = get_config()['booster_format'] == 'native'
+    # As `XGBModel.save_model`, the type of the model is kept along with the booster
+    booster.set_attr(scikit_learn=json.dumps({'_estimator_type': model._estimator_type}))
+    try:
+        raw = booster.save_raw(raw_format='ubj' if native else 'json')
+    finally:
+        booster.set_attr(scikit_learn=None)
+    if native:
+        return {'booster': encode_bytes(raw), 'booster_format': 'ubj'}
+    return {'advanced-params': raw.decode('utf-8')}
+
+
+def deserialize_xgboost_booster(model, model_dict: Dict) -> None:
+    """Load the booster serialized with `serialize_xgboost_booster`, in either format, into a model.
+
+    :param model: XGBoost scikit-learn model (e.g. `XGBClassifier`) to load the booster into
+    :param model_dict: serialized model
+    """
+    if 'booster' in model_dict:
+        model.load_model(bytearray(decode_bytes(model_dict['booster'])))
+    else:
+        model.load_model(bytearray(model_dict['advanced-params'].encode('utf-8')))
+
+
+def serialize_catboost_booster(model, pool=None) -> Dict:
+    """Serialize a CatBoost model, according to the `booster_format` option.
+
+    Models are stored as the json text CatBoost saves them as ('advanced-params'), or as their `.cbm` blob
+    ('booster', see `encode_bytes`). CatBoost only writes json to files, which are written to the temporary
+    directory of the system rather than to the current one, as it may not be writable.
+
+    :param model: CatBoost model
+    :param pool: data `Pool` the model was trained with, if it has categorical features (only needed for json)
+    :return: the keys to add to the serialized model
+    """
+    if get_config()['booster_format'] == 'native':
+        return {'booster': encode_bytes(model._serialize_model()), 'booster_format': 'cbm'}
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'model.json')
+        model.save_model(filename, format='json', pool=pool)
+        with open(filename, 'r') as fh:
+            return {'advanced-params': fh.read()}
+
+
+def deserialize_catboost_booster(model, model_dict: Dict) -> None:
+    """Load the model serialized with `serialize_catboost_booster`, in either format, into a CatBoost model.
+
+    :param model: CatBoost model to load the serialized model into
+    :param model_dict: serialized model
+    """
+    if 'booster' in model_dict:
+        model.load_model(blob=decode_bytes(model_dict['booster']))
+        return
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'model.json')
+        with open(filename, 'w') as fh:
+            fh.write(model_dict['advanced-params'])
+        model.load_model(filename, format='json')
+
+
+def encode_bytes(data) -> Dict:
+    """Serialize raw bytes as an array of bytes, encoded in base64 (or stored as a member of archives).
+
+    :param data: bytes, or bytearray
+    """
+    with config_context(array_encoding='base64'):
+        return encode_array(np.frombuffer(data, dtype=np.uint8))
+
+
+def decode_bytes(value) -> bytes:
+    """Obtain the raw bytes serialized with `encode_bytes`."""
+    return decode_array(value).tobytes()
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+# Size of the blocks files are hashed by
+HASH_BLOCK_SIZE = 1 << 20
+
+_KEYS = ('stat', 'hash')
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a `ModelCache`."""
+    hits: int
+    misses: int
+    evictions: int
+    n_models: int
+    n_bytes: int
+
+
+class _Load:
+    """Load of a model in progress, that other threads requesting the same model wait for."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.model = None
+        self.error: Optional[BaseException] = None
+
+    def result(self):
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.model
+
+
+class ModelCache:
+    """Cache of deserialized models, so that models read several times from the same files are only loaded once.
+
+    Models are identified by the path and the modification time and size of their file (`key='stat'`),
+    or by the hash of its content (`key='hash'`), so that models are loaded again once their file changes.
+    The least recently used models are evicted beyond `max_models` models or `max_bytes` bytes, as estimated
+    from the size of their numpy arrays and other attributes. When several threads request the same model,
+    it is loaded once, the other threads waiting for it.
+
+    Cached models are shared by all callers and should not be modified.
+
+    :param max_models: maximum number of models kept, None for no limit
+    :param max_bytes: maximum estimated size of the models kept, None for no limit
+    :param key: how files are identified, either 'stat' (path, modification time and size)
+                or 'hash' (SHA-256 of the content, identical files at different paths sharing the same model)
+    """
+
+    def __init__(self, max_models: Optional[int] = 128, max_bytes: Optional[int] = None, key: str = 'stat'):
+        if key not in _KEYS:
+            raise ValueError(f'key must be one of {_KEYS}, got {key!r}')
+        self.max_models = max_models
+        self.max_bytes = max_bytes
+        self.key = key
+        self._lock = threading.Lock()
+        # Cached models and their estimated sizes, from least to most recently used
+        self._models: OrderedDict = OrderedDict()
+        self._loads: Dict[Tuple, _Load] = {}
+        self._n_bytes = 0
+        self._hits = self._misses = self._evictions = 0
+
+    def from_json(self, infile, n_jobs: int = None):
+        """Obtain the model serialized in a json file, as `ml2json.from_json`."""
+        from ..ml2json import from_json
+
+        return self._get(('json', *self._file_key(infile)), lambda: from_json(infile, n_jobs))
+
+    def from_archive(self, infile, n_jobs: int = None, mmap_mode: str = None):
+        """Obtain the model serialized in a zip archive, as `ml2json.from_archive`."""
+        from ..ml2json import from_archive
+
+        return self._get(('archive', mmap_mode, *self._file_key(infile)),
+                         lambda: from_archive(infile, n_jobs, mmap_mode))
+
+    def cache_info(self) -> CacheInfo:
+        """Obtain the numbers of hits, misses and evictions, and the number and estimated size of the models kept."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, len(self._models), self._n_bytes)
+
+    def clear(self) -> None:
+        """Remove all models from the cache, keeping its statistics."""
+        with self._lock:
+            self._models.clear()
+            self._n_bytes = 0
+
+    def _file_key(self, infile) -> Tuple:
+        """Identify the current content of a file."""
+        if self.key == 'hash':
+            digest = hashlib.sha256()
+            with open(infile, 'rb') as file:
+                for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b''):
+                    digest.update(block)
+            return (digest.hexdigest(),)
+        stat = os.stat(infile)
+        return os.path.abspath(infile), stat.st_mtime_ns, stat.st_size
+
+    def _get(self, key: Tuple, loader: Callable):
+        """Obtain a cached model, loading it unless it is already being loaded by another thread."""
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                self._hits += 1
+                return self._models[key][0]
+            load = self._loads.get(key)
+            self._misses += 1
+            if load is None:
+                load = self._loads[key] = _Load()
+                loading = True
+            else:
+                loading = False
+        if not loading:
+            return load.result()
+        try:
+            load.model = loader()
+            self._add(key, load.model)
+        except BaseException as error:
+            load.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._loads[key]
+            load.done.set()
+        return load.model
+
+    def _add(self, key: Tuple, model) -> None:
+        """Keep a model, evicting the least recently used ones beyond the limits."""
+        n_bytes = estimate_size(model)
+        if self.max_bytes is not None and n_bytes > self.max_bytes:
+            return
+        with self._lock:
+            self._models[key] = (model, n_bytes)
+            self._n_bytes += n_bytes
+            while ((self.max_models is not None and len(self._models) > self.max_models)
+                   or (self.max_bytes is not None and self._n_bytes > self.max_bytes)):
+                _, (_, evicted_bytes) = self._models.popitem(last=False)
+                self._n_bytes -= evicted_bytes
+                self._evictions += 1
+
+
+def estimate_size(obj) -> int:
+    """Estimate the memory used by an object, including the numpy arrays and other objects it holds."""
+    seen, states = set(), []
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, type):
+            continue
+        seen.add(id(obj))
+        # The size of arrays includes their data, unless they are views of other arrays
+        size += sys.getsizeof(obj)
+        if isinstance(obj, np.ndarray):
+            if obj.base is not None:
+                stack.append(obj.base)
+            elif obj.dtype == object:
+                stack.extend(obj.ravel())
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, '__dict__'):
+            stack.append(obj.__dict__)
+        elif not isinstance(obj, (str, bytes, bytearray, int, float, complex)) and obj is not None:
+            # Extension types (e.g. the trees of scikit-learn) expose their arrays through their state,
+            # kept alive so that the identifiers of its objects are not reused
+            try:
+                states.append(obj.__getstate__())
+            except (AttributeError, TypeError):
+                continue
+            stack.append(states[-1])
+    return size
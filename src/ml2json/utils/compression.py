@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import importlib.util
+from contextlib import contextmanager
+from typing import IO, Optional
+
+
+# Codecs files can be compressed with
+COMPRESSIONS = ('gzip', 'bz2', 'xz', 'zstd')
+# Extensions from which the codec of files to be written is inferred
+_EXTENSIONS = {'.gz': 'gzip', '.gzip': 'gzip', '.bz2': 'bz2', '.xz': 'xz', '.zst': 'zstd', '.zstd': 'zstd'}
+# Magic bytes from which the codec of files to be read is detected
+_MAGIC_BYTES = {b'\x1f\x8b': 'gzip', b'BZh': 'bz2', b'\xfd7zXZ\x00': 'xz', b'\x28\xb5\x2f\xfd': 'zstd'}
+# Compression levels used by default, favouring speed over compression ratio as zlib does
+DEFAULT_LEVELS = {'gzip': 6, 'bz2': 9, 'xz': 6, 'zstd': 3}
+
+
+def infer_compression(path, compression: Optional[str] = 'infer') -> Optional[str]:
+    """Obtain the codec a file is to be compressed with.
+
+    :param path: path of the file, or file object (whose name, if any, the codec is inferred from)
+    :param compression: codec (one of `COMPRESSIONS`), None for no compression,
+                        or 'infer' to infer it from the extension of the file
+    """
+    if compression == 'infer':
+        if is_file_object(path):
+            path = path.name if isinstance(getattr(path, 'name', None), str) else ''
+        return _EXTENSIONS.get(os.path.splitext(os.fspath(path))[1].lower())
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(f"compression must be one of {COMPRESSIONS}, 'infer' or None, got {compression!r}")
+    return compression
+
+
+def detect_compression(path) -> Optional[str]:
+    """Detect the codec a file was compressed with from its first bytes.
+
+    :param path: path of the file, or file object (only seekable binary files, or buffered ones, being inspected)
+    :return: None if the file is not compressed
+    """
+    length = max(len(magic) for magic in _MAGIC_BYTES)
+    if not is_file_object(path):
+        with open(path, 'rb') as file:
+            header = file.read(length)
+    elif isinstance(path, io.TextIOBase):
+        return None
+    elif hasattr(path, 'peek'):
+        header = path.peek(length)[:length]
+    elif path.seekable():
+        position = path.tell()
+        header = path.read(length)
+        path.seek(position)
+    else:
+        return None
+    return next((compression for magic, compression in _MAGIC_BYTES.items() if header.startswith(magic)), None)
+
+
+def open_file(path, mode: str = 'r', compression: Optional[str] = None, level: Optional[int] = None) -> IO:
+    """Open a file, compressed or decompressed on the fly.
+
+    Files compressed with zstd are compressed using as many threads as there are CPUs.
+    File objects (e.g. `io.BytesIO`) are left open once done. Text file objects cannot be compressed.
+
+    :param path: path of the file, or file object
+    :param mode: either 'r', 'w', 'rb' or 'wb'
+    :param compression: codec (one of `COMPRESSIONS`), or None for no compression
+    :param level: compression level, default to `DEFAULT_LEVELS`
+    """
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(f'compression must be one of {COMPRESSIONS} or None, got {compression!r}')
+    if is_file_object(path):
+        return _open_file_object(path, mode, compression, level)
+    if compression is None:
+        return open(path, mode)
+    level = DEFAULT_LEVELS[compression] if level is None else level
+    mode = mode if 'b' in mode else mode + 't'
+    if compression == 'gzip':
+        import gzip
+
+        return gzip.open(path, mode, compresslevel=level)
+    if compression == 'bz2':
+        import bz2
+
+        return bz2.open(path, mode, compresslevel=level)
+    if compression == 'xz':
+        import lzma
+
+        return lzma.open(path, mode, **({} if 'r' in mode else {'preset': level}))
+    if importlib.util.find_spec('zstandard') is None:
+        raise ModuleNotFoundError('Module zstandard could not be found. Is it installed?')
+    import zstandard
+
+    if 'r' in mode:
+        return zstandard.open(path, mode)
+    return zstandard.open(path, mode, cctx=zstandard.ZstdCompressor(level=level, threads=-1))
+
+
+def is_file_object(path) -> bool:
+    """Determine if a file is given as a file object rather than a path."""
+    return hasattr(path, 'read') or hasattr(path, 'write')
+
+
+@contextmanager
+def _open_file_object(fp, mode: str, compression: Optional[str], level: Optional[int]):
+    """Wrap a file object to read or write it as `open_file` does, without closing it."""
+    if isinstance(fp, io.TextIOBase):
+        if compression is not None:
+            raise ValueError('compressed files cannot be written to, or read from, text file objects')
+        yield _EncodedText(fp) if 'b' in mode else fp
+        return
+    stream = fp if compression is None else _compressed_stream(fp, mode[0] + 'b', compression, level)
+    try:
+        if 'b' in mode:
+            yield stream
+        else:
+            text = io.TextIOWrapper(stream, encoding='utf-8')
+            try:
+                yield text
+            finally:
+                text.flush()
+                text.detach()
+    finally:
+        if stream is not fp:
+            stream.close()
+
+
+def _compressed_stream(fp, mode: str, compression: str, level: Optional[int]) -> IO:
+    """Compress or decompress a binary file object on the fly, without closing it once done."""
+    level = DEFAULT_LEVELS[compression] if level is None else level
+    if compression == 'gzip':
+        import gzip
+
+        return gzip.GzipFile(fileobj=fp, mode=mode, compresslevel=level)
+    if compression == 'bz2':
+        import bz2
+
+        return bz2.BZ2File(fp, mode, compresslevel=level)
+    if compression == 'xz':
+        import lzma
+
+        return lzma.LZMAFile(fp, mode, **({} if 'r' in mode else {'preset': level}))
+    if importlib.util.find_spec('zstandard') is None:
+        raise ModuleNotFoundError('Module zstandard could not be found. Is it installed?')
+    import zstandard
+
+    if 'r' in mode:
+        return zstandard.open(fp, mode, closefd=False)
+    return zstandard.open(fp, mode, cctx=zstandard.ZstdCompressor(level=level, threads=-1), closefd=False)
+
+
+class _EncodedText:
+    """Binary view of a text file object, bytes being encoded and decoded as utf-8."""
+
+    def __init__(self, fp):
+        self.fp = fp
+
+    def read(self, size: int = -1) -> bytes:
+        return self.fp.read(size).encode('utf-8')
+
+    def write(self, data: bytes) -> int:
+        return self.fp.write(data.decode('utf-8'))
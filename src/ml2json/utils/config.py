@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+import importlib.util
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional, Union
+
+
+_global_config = {
+    'array_encoding': 'list',
+    'json_backend': 'auto',
+    'float_precision': 'float64',
+    'booster_format': 'json',
+    'forest_format': 'trees',
+}
+# Options overridden within `config_context`
+_context_config: ContextVar[Optional[Dict]] = ContextVar('ml2json_config', default=None)
+
+_ARRAY_ENCODINGS = ('list', 'base64')
+_JSON_BACKENDS = ('auto', 'json', 'orjson')
+_BOOSTER_FORMATS = ('json', 'native')
+_FOREST_FORMATS = ('trees', 'packed')
+
+
+def get_config() -> Dict:
+    """Obtain the current values of the global options of ml2json."""
+    config = _context_config.get()
+    return dict(_global_config if config is None else config)
+
+
+def set_config(array_encoding: Optional[str] = None, json_backend: Optional[str] = None,
+               float_precision: Union[str, int, Dict, None] = None, booster_format: Optional[str] = None,
+               forest_format: Optional[str] = None) -> None:
+    """Set the global options of ml2json.
+
+    :param array_encoding: how numpy arrays are serialized, either 'list' (nested JSON lists)
+                           or 'base64' (raw little-endian bytes, encoded in base64 along with their dtype and shape)
+    :param json_backend: library json text is encoded and decoded with, either 'json' (standard library),
+                         'orjson' (faster, encoding numpy arrays natively) or 'auto' (orjson if installed)
+    :param float_precision: precision arrays of floats are exported with, either 'float64' (exactly),
+                            'float32' (rounded to float32) or a number of significant digits,
+                            or a dictionary of such precisions by attribute name (e.g. {'coefs_': 'float32'}),
+                            other attributes being exported exactly
+    :param booster_format: how XGBoost and CatBoost models are embedded, either 'json' (the json text
+                           they save models as) or 'native' (their compact binary formats, UBJSON and `.cbm`,
+                           encoded in base64 or stored as members of archives)
+    :param forest_format: how the trees of forests and other ensembles of decision trees are stored, either 'trees'
+                          (each tree serialized on its own) or 'packed' (fields shared by the trees stored once,
+                          and the nodes and values of all trees concatenated, see `serialize_forest`)
+    """
+    config = _context_config.get()
+    config = _global_config if config is None else config
+    if array_encoding is not None:
+        if array_encoding not in _ARRAY_ENCODINGS:
+            raise ValueError(f'array_encoding must be one of {_ARRAY_ENCODINGS}, got {array_encoding!r}')
+        config['array_encoding'] = array_encoding
+    if json_backend is not None:
+        if json_backend not in _JSON_BACKENDS:
+            raise ValueError(f'json_backend must be one of {_JSON_BACKENDS}, got {json_backend!r}')
+        if json_backend not in ('auto', 'json') and importlib.util.find_spec(json_backend) is None:
+            raise ModuleNotFoundError(f'Module {json_backend} could not be found. Is it installed?')
+        config['json_backend'] = json_backend
+    if float_precision is not None:
+        from .precision import check_precision
+
+        for precision in float_precision.values() if isinstance(float_precision, dict) else [float_precision]:
+            check_precision(precision)
+        config['float_precision'] = dict(float_precision) if isinstance(float_precision, dict) else float_precision
+    if booster_format is not None:
+        if booster_format not in _BOOSTER_FORMATS:
+            raise ValueError(f'booster_format must be one of {_BOOSTER_FORMATS}, got {booster_format!r}')
+        config['booster_format'] = booster_format
+    if forest_format is not None:
+        if forest_format not in _FOREST_FORMATS:
+            raise ValueError(f'forest_format must be one of {_FOREST_FORMATS}, got {forest_format!r}')
+        config['forest_format'] = forest_format
+
+
+@contextmanager
+def config_context(**options):
+    """Temporarily set the global options of ml2json within a context.
+
+    Accepts the same options as `set_config`.
+    """
+    token = _context_config.set(get_config())
+    try:
+        set_config(**options)
+        yield
+    finally:
+        _context_config.reset(token)
@@ -3,13 +3,15 @@
 import numpy as np
 import scipy as sp
 
+from .arrays import encode_array, decode_array
+
 
 def serialize_csr_matrix(csr_matrix):
     serialized_csr_matrix = {
         'meta': 'csr',
-        'data': csr_matrix.data.tolist(),
-        'indices': csr_matrix.indices.tolist(),
-        'indptr': csr_matrix.indptr.tolist(),
+        'data': encode_array(csr_matrix.data),
+        'indices': encode_array(csr_matrix.indices),
+        'indptr': encode_array(csr_matrix.indptr),
         '_shape': csr_matrix._shape,
     }
     return serialized_csr_matrix
@@ -17,8 +19,8 @@ def serialize_csr_matrix(csr_matrix):
 
 def deserialize_csr_matrix(csr_dict, data_type=np.float64, indices_type=np.int32, indptr_type=np.int32):
     csr_matrix = sp.sparse.csr_matrix(tuple(csr_dict['_shape']))
-    csr_matrix.data = np.array(csr_dict['data']).astype(data_type)
-    csr_matrix.indices = np.array(csr_dict['indices']).astype(indices_type)
-    csr_matrix.indptr = np.array(csr_dict['indptr']).astype(indptr_type)
+    csr_matrix.data = decode_array(csr_dict['data'], dtype=data_type)
+    csr_matrix.indices = decode_array(csr_dict['indices'], dtype=indices_type)
+    csr_matrix.indptr = decode_array(csr_dict['indptr'], dtype=indptr_type)
 
     return csr_matrix
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import zlib
+import zipfile
+import importlib.util
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .archive import MANIFEST_NAME
+from .compression import DEFAULT_LEVELS, detect_compression, open_file
+from .streaming import _ARRAY_CHARACTERS, _NUMBER_CHARACTERS, _NUMBER_START, JSONStreamReader
+
+
+# Fields known to be redundant or derivable, by key, and the keys of the sibling fields they are flagged along with
+KNOWN_FIELDS = {
+    'named_steps': (('params',), 'duplicates the steps of the pipeline, and is not read when loading it'),
+    'feature_importances_': (('tree_',), 'is computed by scikit-learn from the tree, and is not read when loading it'),
+}
+# Approximate length of the json text of an array encoded in base64, besides its data (dtype, shape, etc.)
+BINARY_ARRAY_OVERHEAD = 64
+
+
+class PathStats:
+    """Size of the values found at a path of a serialized model.
+
+    :param parent: path of the object or list holding the values, None for the model itself
+    :param kind: 'object', 'list' or 'value' (strings, numbers, and lists of numbers)
+    """
+
+    __slots__ = ('parent', 'kind', 'n_bytes', 'count', 'value_hash', 'identical', 'binary_savings')
+
+    def __init__(self, parent: Optional[str], kind: str):
+        self.parent = parent
+        self.kind = kind
+        # Length of the json text of the values, and number of values
+        self.n_bytes = 0
+        self.count = 0
+        # Hash of the first value, and whether all values are the same
+        self.value_hash = None
+        self.identical = kind == 'object'
+        # Estimated reduction of the length of the values if arrays were encoded in base64
+        self.binary_savings = 0
+
+
+class ModelReport:
+    """Breakdown of the size of a serialized model by path, obtained with `inspect_file`.
+
+    Paths join keys with dots, '[*]' standing for all the items of a list (e.g. 'estimators_[*].tree_.values').
+    Sizes are those of the json text of the model, before compression.
+
+    :param path: path of the file
+    :param file_size: size of the file, in bytes
+    :param compression: codec the file is compressed with, 'zip' for archives, None if uncompressed
+    :param paths: sizes of the values found at each path, '' being the model itself
+    :param compressed_sizes: estimated size of the json text compressed with each available codec
+    """
+
+    def __init__(self, path, file_size: int, compression: Optional[str], paths: Dict[str, PathStats],
+                 compressed_sizes: Dict[str, int]):
+        self.path = path
+        self.file_size = file_size
+        self.compression = compression
+        self.paths = paths
+        self.compressed_sizes = compressed_sizes
+
+    @property
+    def n_bytes(self) -> int:
+        """Length of the json text of the model (including the arrays stored separately in archives)."""
+        return self.paths[''].n_bytes
+
+    @property
+    def binary_savings(self) -> int:
+        """Estimated reduction of the size of the model if its arrays were encoded in base64 (negative if larger)."""
+        return sum(stats.binary_savings for stats in self.paths.values())
+
+    def redundant_fields(self) -> List[Tuple[str, int, str]]:
+        """Find fields known to be redundant or derivable, and values identical in all members of a list.
+
+        :return: path, size and reason of each field, from the largest
+        """
+        fields = []
+        for path, stats in self.paths.items():
+            key = path.rpartition('.')[2] if stats.parent else path
+            if key in KNOWN_FIELDS:
+                siblings, reason = KNOWN_FIELDS[key]
+                if all(_join(stats.parent, sibling) in self.paths for sibling in siblings):
+                    fields.append((path, stats.n_bytes, reason))
+        known_paths = [path for path, _, _ in fields]
+        identical = _identical_paths(self.paths)
+        for path in identical:
+            stats = self.paths[path]
+            if stats.parent in identical or any(path == known or path.startswith((known + '.', known + '['))
+                                                for known in known_paths):
+                continue
+            members = path[:path.rindex('[*]') + 3]
+            count = self.paths[members].count
+            fields.append((path, stats.n_bytes * (count - 1) // count,
+                           f'is identical in all {count} items of {members}, and could be stored once'))
+        return sorted(fields, key=lambda field: -field[1])
+
+    def format(self, max_depth: Optional[int] = None, min_share: float = 0.001) -> str:
+        """Format the report as a tree of paths, followed by redundant fields and estimated savings.
+
+        :param max_depth: number of levels of paths shown, None for all
+        :param min_share: share of the size of the model below which paths and fields are not shown
+        """
+        children: Dict[Optional[str], List[str]] = {}
+        for path, stats in self.paths.items():
+            children.setdefault(stats.parent, []).append(path)
+        total = max(self.n_bytes, 1)
+        compression = f', {self.compression}' if self.compression is not None else ''
+        lines = [f'{self.path}: {_format_size(self.file_size)} ({_format_size(self.n_bytes)} of json{compression})',
+                 '', f'{"path":<60}{"size":>11}{"share":>8}{"count":>9}']
+        n_hidden = 0
+        stack = [('', 0)]
+        while stack:
+            path, depth = stack.pop()
+            stats = self.paths[path]
+            if stats.n_bytes < min_share * total or (max_depth is not None and depth > max_depth):
+                n_hidden += 1
+                continue
+            name = '  ' * depth + (path or '(model)')
+            lines.append(f'{name:<60}{_format_size(stats.n_bytes):>11}{stats.n_bytes / total:>8.1%}{stats.count:>9}')
+            stack.extend((child, depth + 1)
+                         for child in sorted(children.get(path, []), key=lambda child: self.paths[child].n_bytes))
+        if n_hidden:
+            lines.append(f'({n_hidden} smaller or deeper paths not shown)')
+
+        fields = [field for field in self.redundant_fields() if field[1] >= min_share * total]
+        if fields:
+            lines += ['', 'Redundant or derivable fields:']
+            lines += [f'  {path} ({_format_size(n_bytes)}) {reason}' for path, n_bytes, reason in fields]
+        lines += ['', 'Estimated savings:']
+        savings = [("binary array encoding (array_encoding='base64')", self.binary_savings)]
+        savings += [(f'{codec} compression', self.n_bytes - size) for codec, size in self.compressed_sizes.items()]
+        lines += [f'  {name}: {_format_size(saving)} ({saving / total:.0%})' for name, saving in savings]
+        return '\n'.join(lines)
+
+
+class _CompressingReader:
+    """Text file whose content is compressed as it is read, to estimate its compressed size."""
+
+    def __init__(self, fp, codecs: Tuple[str, ...]):
+        self.fp = fp
+        self.compressors = {codec: _compressor(codec) for codec in codecs}
+        self.sizes = dict.fromkeys(codecs, 0)
+
+    def read(self, size: int = -1) -> str:
+        chunk = self.fp.read(size)
+        data = chunk.encode('utf-8')
+        for codec, compressor in self.compressors.items():
+            self.sizes[codec] += len(compressor.compress(data))
+        return chunk
+
+    def seekable(self) -> bool:
+        return False
+
+    def compressed_sizes(self) -> Dict[str, int]:
+        """Obtain the size of the content read so far, compressed with each codec."""
+        return {codec: size + len(self.compressors[codec].flush()) for codec, size in self.sizes.items()}
+
+
+def _compressor(codec: str):
+    if codec == 'gzip':
+        return zlib.compressobj(DEFAULT_LEVELS['gzip'], zlib.DEFLATED, 31)
+    import zstandard
+
+    return zstandard.ZstdCompressor(level=DEFAULT_LEVELS['zstd']).compressobj()
+
+
+class _SizeScanner(JSONStreamReader):
+    """Measure the length of the json text of the values of a model by path, without parsing objects and lists.
+
+    :param fp: text file to read the json text from
+    :param member_sizes: sizes of the members of the archive the json text is the manifest of,
+                         added to the size of the references to them
+    """
+
+    def __init__(self, fp, member_sizes: Optional[Dict[str, int]] = None):
+        super().__init__(fp)
+        self.member_sizes = member_sizes or {}
+        self.paths: Dict[str, PathStats] = {}
+        # Number of characters discarded from the start of the buffer, and bytes of archive members accounted for
+        self.n_discarded = 0
+        self.n_extra = 0
+
+    def scan(self) -> Dict[str, PathStats]:
+        self._scan_value('', None)
+        if self._peek() != '':
+            self._error('Extra data')
+        return self.paths
+
+    def _read_more(self) -> bool:
+        pos = self.pos
+        if not super()._read_more():
+            return False
+        self.n_discarded += pos
+        return True
+
+    def _scan_value(self, path: str, parent: Optional[str]) -> None:
+        character = self._peek()
+        start, extra = self.n_discarded + self.pos, self.n_extra
+        binary_savings = 0
+        if character == '{':
+            kind, value = 'object', None
+            self._scan_object(path)
+        elif character == '[':
+            self._ensure(64)
+            if _NUMBER_START.match(self.buffer, self.pos) is not None:
+                kind, value = 'value', self._skim('[', ']')
+                # Shapes of arrays already encoded in base64 are left as they are
+                if path.rpartition('.')[2] != 'shape':
+                    binary_savings = _binary_savings(value)
+            else:
+                kind, value = 'list', None
+                self._scan_list(path)
+        elif character == '"':
+            kind, value = 'value', self._read_string()
+            if path.rpartition('.')[2] == 'file' and value in self.member_sizes:
+                self.n_extra += self.member_sizes[value]
+        else:
+            kind, value = 'value', repr(self._read_scalar())
+        stats = self.paths.get(path)
+        if stats is None:
+            stats = self.paths[path] = PathStats(parent, kind)
+        stats.n_bytes += self.n_discarded + self.pos - start + self.n_extra - extra
+        stats.count += 1
+        stats.binary_savings += binary_savings
+        if kind != 'value' or stats.kind != 'value':
+            stats.identical = stats.identical and kind == stats.kind == 'object'
+        elif stats.count == 1:
+            stats.value_hash, stats.identical = hash(value), True
+        elif stats.identical and hash(value) != stats.value_hash:
+            stats.identical = False
+
+    def _scan_object(self, path: str) -> None:
+        self.pos += 1
+        if self._peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            if self._peek() != '"':
+                self._error('Expecting property name enclosed in double quotes')
+            key = self._read_string()
+            if self._peek() != ':':
+                self._error("Expecting ':' delimiter")
+            self.pos += 1
+            self._scan_value(_join(path, key), path)
+            character = self._peek()
+            self.pos += 1
+            if character == '}':
+                return
+            if character != ',':
+                self._error("Expecting ',' delimiter")
+
+    def _scan_list(self, path: str) -> None:
+        self.pos += 1
+        if self._peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            self._scan_value(path + '[*]', path)
+            character = self._peek()
+            self.pos += 1
+            if character == ']':
+                return
+            if character != ',':
+                self._error("Expecting ',' delimiter")
+
+
+def inspect_file(infile) -> ModelReport:
+    """Measure the size of each part of a serialized model, reading its file incrementally.
+
+    :param infile: json file, possibly compressed, or zip archive containing the serialized model
+    """
+    codecs = ('gzip',) + (('zstd',) if importlib.util.find_spec('zstandard') is not None else ())
+    member_sizes = None
+    if zipfile.is_zipfile(infile):
+        compression = 'zip'
+        with zipfile.ZipFile(infile, 'r') as archive:
+            member_sizes = {info.filename: info.compress_size for info in archive.infolist()}
+            with archive.open(MANIFEST_NAME) as manifest:
+                paths, compressed_sizes = _scan(io.TextIOWrapper(manifest, encoding='utf-8'), codecs, member_sizes)
+    else:
+        compression = detect_compression(infile)
+        with open_file(infile, 'r', compression) as model_json:
+            paths, compressed_sizes = _scan(model_json, codecs)
+    return ModelReport(infile, os.path.getsize(infile), compression, paths, compressed_sizes)
+
+
+def _scan(fp, codecs: Tuple[str, ...], member_sizes: Optional[Dict[str, int]] = None):
+    reader = _CompressingReader(fp, codecs)
+    paths = _SizeScanner(reader, member_sizes).scan()
+    return paths, reader.compressed_sizes()
+
+
+def _binary_savings(text: str) -> int:
+    """Estimate the reduction of the length of a list of numbers if it were encoded in base64 as 64-bit values.
+
+    :return: a negative number if the list would be longer, as lists of small integers are
+    """
+    if _ARRAY_CHARACTERS.fullmatch(text) is None:
+        return 0
+    # Numbers are counted from the brackets and commas of the list, as the lists they are in and the commas they follow
+    skeleton = np.frombuffer(text.encode('ascii').translate(None, _NUMBER_CHARACTERS), dtype=np.uint8)
+    opening, closing, comma = ord('['), ord(']'), ord(',')
+    n_numbers = (np.count_nonzero((skeleton[:-1] == opening) & (skeleton[1:] != opening))
+                 + np.count_nonzero((skeleton[1:] == comma) & (skeleton[:-1] != closing)))
+    return len(text) - 4 * -(-8 * int(n_numbers) // 3) - BINARY_ARRAY_OVERHEAD
+
+
+def _identical_paths(paths: Dict[str, PathStats]) -> set:
+    """Find the paths within lists whose values are the same in all items of the innermost list."""
+    identical = set()
+    # Objects are identical if all their fields are, in all of them
+    for path in sorted(paths, key=len, reverse=True):
+        stats = paths[path]
+        if '[*]' not in path or stats.count < 2 or not stats.identical:
+            continue
+        members = paths[path[:path.rindex('[*]') + 3]]
+        if stats.count != members.count:
+            continue
+        if stats.kind == 'object':
+            fields = [child for child, child_stats in paths.items() if child_stats.parent == path]
+            if not all(field in identical for field in fields):
+                continue
+        identical.add(path)
+    return identical
+
+
+def _join(path: Optional[str], key: str) -> str:
+    return f'{path}.{key}' if path else key
+
+
+def _format_size(n_bytes: int) -> str:
+    sign, n_bytes = '-' if n_bytes < 0 else '', abs(n_bytes)
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if n_bytes < 1024 or unit == 'GB':
+            return f'{sign}{n_bytes:.0f} {unit}' if unit == 'B' else f'{sign}{n_bytes:.1f} {unit}'
+        n_bytes /= 1024
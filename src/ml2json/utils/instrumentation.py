@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+import time
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+class Event(NamedTuple):
+    """Event reported to hooks while (de)serializing models (see `instrument`).
+
+    :param kind: 'start' or 'end' of the (de)serialization of a model, or 'progress' through the members of an ensemble
+    :param operation: either 'serialize' or 'deserialize'
+    :param meta: tag of the model (de)serialized
+    :param path: keys and indices locating the model within each model holding it, from the outermost
+                 (e.g. ('params.steps[1][1]', 'estimators_[3]')), empty for the outermost model itself;
+                 joined with '.', the path of the model in the serialized document (as shown by `ml2json inspect`)
+    :param elapsed: time taken to (de)serialize the model, in seconds, at its end
+    :param array_bytes: size in memory of the numpy arrays encoded or decoded while (de)serializing the model,
+                        at its end (not the size of its json text)
+    :param done: number of members of the ensemble (de)serialized so far, for progress events
+    :param total: number of members of the ensemble, for progress events
+    """
+    kind: str
+    operation: str
+    meta: str
+    path: Tuple[str, ...]
+    elapsed: Optional[float] = None
+    array_bytes: Optional[int] = None
+    done: Optional[int] = None
+    total: Optional[int] = None
+
+
+# Levels of nested lists, tuples and dictionaries searched for the sub-models of a model
+_MAX_DEPTH = 4
+
+
+class _Frame:
+    """Model being (de)serialized, and the size of the arrays encoded or decoded so far while doing so.
+
+    :param path: path of the model (see `Event`)
+    :param meta: tag of the model
+    :param source: the model when serializing it, its serialized dictionary when deserializing it
+    """
+
+    __slots__ = ('path', 'meta', 'array_bytes', 'source', 'locations')
+
+    def __init__(self, path: Tuple[str, ...], meta: str, source):
+        self.path = path
+        self.meta = meta
+        self.array_bytes = 0
+        self.source = source
+        self.locations: Optional[Dict[int, str]] = None
+
+    def locate(self, obj, default: Optional[str] = None) -> Optional[str]:
+        """Obtain the keys and indices locating a sub-model, or its serialized dictionary, within the model."""
+        if self.locations is None:
+            self.locations = _locations(self.source)
+        return self.locations.get(id(obj), default)
+
+
+def _locations(source) -> Dict[int, str]:
+    """Find the objects held by a model (in its parameters and attributes) or by a serialized model, by identifier."""
+    locations = {}
+    if isinstance(source, dict):
+        roots = [(str(key), value) for key, value in source.items()]
+    else:
+        params = source.get_params(deep=False) if hasattr(source, 'get_params') else {}
+        roots = ([(f'params.{key}', value) for key, value in params.items()]
+                 + [(key, value) for key, value in getattr(source, '__dict__', {}).items()])
+    for path, value in roots:
+        _locate_items(value, path, locations, _MAX_DEPTH)
+    return locations
+
+
+def _locate_items(value, path: str, locations: Dict[int, str], depth: int) -> None:
+    locations.setdefault(id(value), path)
+    if depth == 0:
+        return
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _locate_items(item, f'{path}.{key}', locations, depth - 1)
+    elif isinstance(value, (list, tuple)) and value and not isinstance(value[0], (int, float, type(None))):
+        # Lists of numbers (arrays) are skipped
+        for index, item in enumerate(value):
+            _locate_items(item, f'{path}[{index}]', locations, depth - 1)
+
+
+_hooks: ContextVar[Tuple[Callable[[Event], None], ...]] = ContextVar('ml2json_hooks', default=())
+_frame: ContextVar[Optional[_Frame]] = ContextVar('ml2json_frame', default=None)
+
+
+@contextmanager
+def instrument(*hooks: Callable[[Event], None]):
+    """Report the (de)serialization of models and of their sub-models to hooks within a context.
+
+    Each hook is called with an `Event` when a model starts and ends being (de)serialized,
+    and as members of ensembles (e.g. the trees of forests) are (de)serialized.
+    Hooks may be called from several threads when members are deserialized in parallel (see `from_dict`).
+    Without hooks, models are (de)serialized as fast as usual.
+
+    :param hooks: callables receiving the events, e.g. `TimingProfile` instances
+    """
+    token = _hooks.set(_hooks.get() + hooks)
+    try:
+        yield
+    finally:
+        _hooks.reset(token)
+
+
+def observe(operation: str, meta: str, function: Callable, *args):
+    """Call a function (de)serializing a model, reporting it to the hooks if any.
+
+    :param operation: either 'serialize' or 'deserialize'
+    :param meta: tag of the model
+    :param function: function (de)serializing the model
+    :param args: arguments of the function, the model or its serialized dictionary first
+    """
+    hooks = _hooks.get()
+    if not hooks:
+        return function(*args)
+    parent = _frame.get()
+    path = parent.path + (parent.locate(args[0], f'<{meta}>'),) if parent is not None else ()
+    frame = _Frame(path, meta, args[0])
+    _emit(hooks, Event('start', operation, meta, frame.path))
+    token = _frame.set(frame)
+    start = time.perf_counter()
+    try:
+        return function(*args)
+    finally:
+        elapsed = time.perf_counter() - start
+        _frame.reset(token)
+        if parent is not None:
+            parent.array_bytes += frame.array_bytes
+        _emit(hooks, Event('end', operation, meta, frame.path, elapsed, frame.array_bytes))
+
+
+def relocate(original, replacement) -> None:
+    """Locate an object replacing another (e.g. a member of an ensemble once parsed) where the other was found."""
+    frame = _frame.get()
+    if frame is not None and _hooks.get():
+        location = frame.locate(original)
+        if location is not None:
+            frame.locations[id(replacement)] = location
+
+
+def count_bytes(n_bytes: int) -> None:
+    """Add the size of an array encoded or decoded to the model being (de)serialized, if reported to hooks."""
+    frame = _frame.get()
+    if frame is not None:
+        frame.array_bytes += n_bytes
+
+
+def track(items: Iterable, total: int, operation: str) -> Iterable:
+    """Report progress through the members of an ensemble to the hooks, as they are iterated over.
+
+    Progress is reported each time another percent of the members is done.
+
+    :param items: members of the ensemble, or the results of (de)serializing them
+    :param total: number of members
+    :param operation: either 'serialize' or 'deserialize'
+    """
+    hooks = _hooks.get()
+    frame = _frame.get()
+    if not hooks or frame is None:
+        return items
+    return _track(hooks, frame, items, total, operation)
+
+
+def _track(hooks, frame: _Frame, items: Iterable, total: int, operation: str):
+    reported = 0
+    for done, item in enumerate(items, 1):
+        yield item
+        if done * 100 // total > reported * 100 // total or done == total:
+            reported = done
+            _emit(hooks, Event('progress', operation, frame.meta, frame.path, done=done, total=total))
+
+
+def _emit(hooks, event: Event) -> None:
+    for hook in hooks:
+        hook(event)
+
+
+class TimingProfile:
+    """Hook collecting the time taken to (de)serialize each model and sub-model, printed as a hierarchical profile.
+
+    Sub-models are told apart by their path (e.g. `estimators_[3]`), models (de)serialized several times
+    at the same path being aggregated.
+
+    Example::
+
+        profile = ml2json.TimingProfile()
+        with ml2json.instrument(profile):
+            ml2json.to_json(model, 'model.json')
+        print(profile.report())
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # Number of calls, total time, size of arrays and tag of the model of each path, by operation
+        self.entries: Dict[Tuple[str, Tuple[str, ...]], List] = {}
+
+    def __call__(self, event: Event) -> None:
+        if event.kind != 'end':
+            return
+        with self.lock:
+            entry = self.entries.setdefault((event.operation, event.path), [0, 0.0, 0, event.meta])
+            entry[0] += 1
+            entry[1] += event.elapsed
+            entry[2] += event.array_bytes
+
+    def report(self) -> str:
+        """Format the profile as a table, sub-models being indented below the models holding them."""
+        with self.lock:
+            entries = dict(self.entries)
+        lines = [f'{"model":<60}{"calls":>7}{"total (s)":>11}{"self (s)":>10}{"arrays (MB)":>13}']
+        previous_operation = None
+        # Sorted paths put sub-models right after the models holding them
+        for operation, path in sorted(entries):
+            if operation != previous_operation:
+                lines.append(operation)
+                previous_operation = operation
+            calls, total, array_bytes, meta = entries[(operation, path)]
+            children = sum(entry[1] for (child_operation, child_path), entry in entries.items()
+                           if child_operation == operation and len(child_path) == len(path) + 1
+                           and child_path[:-1] == path)
+            name = '  ' * (len(path) + 1) + (f'{path[-1]} ({meta})' if path else meta)
+            lines.append(f'{name:<60}{calls:>7}{total:>11.4f}{total - children:>10.4f}{array_bytes / 2 ** 20:>13.2f}')
+        return '\n'.join(lines)
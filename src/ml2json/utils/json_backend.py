@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+
+import re
+import json
+import math
+import uuid
+import importlib.util
+from functools import lru_cache, partial
+from typing import Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from .archive import array_store
+from .config import get_config
+from .parallel import EncodedMember
+from .streaming import StreamedArray, iter_encode
+
+
+# Libraries json text can be encoded and decoded with, besides the standard `json` module
+FAST_BACKENDS = ('orjson',)
+# Total size of the arrays of a model (in bytes) from which files are written incrementally whatever the backend,
+# rather than encoded at once in memory by orjson
+STREAMING_THRESHOLD = 64 * 2 ** 20
+
+# Translation of json text marking digits with '1', characters continuing the digits of floats with '.',
+# and other characters with ' ', to find integers that may not fit in 64 bits, which orjson decodes as floats
+_DIGIT_MARKS = bytes(ord('1') if chr(c) in '0123456789' else ord('.') if chr(c) in '.eE' else ord(' ')
+                     for c in range(256))
+_LARGE_INTEGER = b' ' + b'1' * 20
+_DIGITS = re.compile(rb'1*')
+
+
+class NativeArrayWriter:
+    """Keep the arrays of a model being serialized, for them to be encoded by orjson.
+
+    Arrays orjson encodes exactly as `tolist` followed by `json.dumps` would (float64, integer and boolean arrays)
+    are left as is, to be encoded natively; other arrays are only converted to lists while being encoded.
+    Arrays are checked for NaN and infinite values, which orjson encodes as null,
+    and the size of all the arrays of the model is counted, whatever their encoding.
+    """
+
+    # Arrays are encoded as nested lists
+    raw_bytes = False
+
+    def __init__(self):
+        self.non_finite = False
+        self.n_bytes = 0
+
+    def accepts(self, array: np.ndarray) -> bool:
+        """Determine if the encoding of an array is to be left to orjson, when arrays are encoded as lists."""
+        self.n_bytes += array.nbytes
+        return array.ndim > 0 and get_config()['array_encoding'] == 'list'
+
+    def add(self, array: np.ndarray):
+        """Obtain the value replacing an array in the serialized model."""
+        if not self.non_finite and _contains_non_finite_array(array):
+            self.non_finite = True
+        if array.dtype.isnative and (array.dtype == np.float64 or array.dtype.kind in 'biu'):
+            return array
+        return StreamedArray(array, 'list')
+
+
+def get_json_backend() -> str:
+    """Obtain the library json text is currently encoded and decoded with, either 'json' or 'orjson'."""
+    backend = get_config()['json_backend']
+    if backend == 'auto':
+        return next((name for name in FAST_BACKENDS if is_available(name)), 'json')
+    return backend
+
+
+@lru_cache(maxsize=None)
+def is_available(backend: str) -> bool:
+    """Determine if the library of a json backend is installed, without importing it."""
+    return backend == 'json' or importlib.util.find_spec(backend) is not None
+
+
+def dump_model(model_dict_factory: Callable[[], Dict]) -> Iterator[bytes]:
+    """Serialize a model and encode it to json with the current backend, as chunks of json text to be written.
+
+    With orjson, the text is encoded at once, unless the arrays of the model hold more than `STREAMING_THRESHOLD`
+    bytes, in which case it is encoded incrementally as with the `json` module, so that the text of large models
+    is never held in memory as a whole.
+
+    :param model_dict_factory: callable serializing the model, called while arrays are left for the backend to encode
+    """
+    if get_json_backend() == 'json':
+        return iter([json.dumps(model_dict_factory()).encode('utf-8')])
+    writer = NativeArrayWriter()
+    with array_store(writer):
+        model_dict = model_dict_factory()
+    if writer.n_bytes > STREAMING_THRESHOLD:
+        return (chunk.encode('utf-8') for chunk in iter_encode(model_dict))
+    if writer.non_finite:
+        return iter([json.dumps(model_dict, default=_encode_array).encode('utf-8')])
+    return iter([dumps(model_dict)])
+
+
+def dump_fragment(model_dict_factory: Callable[[], Dict]) -> Optional[bytes]:
+    """Serialize a model and encode it with orjson, as part of a model encoded by `dump_model`.
+
+    :param model_dict_factory: callable serializing the model, called while arrays are left for orjson to encode
+    :return: None if orjson cannot encode the model as `json.dumps` would
+    """
+    import orjson
+
+    writer = NativeArrayWriter()
+    with array_store(writer):
+        model_dict = model_dict_factory()
+    if writer.non_finite or _contains_non_finite(model_dict):
+        return None
+    try:
+        return orjson.dumps(model_dict, default=_encode_array, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        return None
+
+
+def dumps(value) -> bytes:
+    """Encode a serialized model to json with the current backend, as `json.dumps` would.
+
+    Values orjson cannot encode as `json.dumps` would (e.g. NaN, encoded as null by orjson,
+    or integers of more than 64 bits) are encoded with the `json` module instead.
+
+    :param value: serialized model, possibly holding finite arrays left by `NativeArrayWriter`
+                  and members of ensembles already encoded by worker processes
+    """
+    if get_json_backend() == 'orjson' and not _contains_non_finite(value):
+        import orjson
+
+        fragments = []
+        marker = f'ml2json-fragment-{uuid.uuid4().hex}-'
+        try:
+            data = orjson.dumps(value, default=partial(_encode_fragment, fragments, marker),
+                                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            if not fragments:
+                return data
+            # Members encoded by workers replace the strings marking their position
+            pattern = re.compile(b'"' + re.escape(marker.encode('ascii')) + rb'(\d+)"')
+            return pattern.sub(lambda match: fragments[int(match[1])], data)
+    return json.dumps(value, default=_encode_array).encode('utf-8')
+
+
+def loads(data: bytes):
+    """Decode json text with the current backend, as `json.loads` would.
+
+    Text orjson cannot decode as `json.loads` would (e.g. holding NaN, or integers of more than 64 bits)
+    is decoded with the `json` module instead.
+
+    :param data: json text
+    """
+    if get_json_backend() == 'orjson' and not _contains_large_integer(data):
+        import orjson
+
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _encode_array(value):
+    """Convert the arrays, and numpy scalars, that the backend does not encode natively (e.g. non-contiguous)."""
+    if isinstance(value, StreamedArray):
+        return value.array.tolist()
+    if isinstance(value, EncodedMember):
+        return value.serialize()
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def _encode_fragment(fragments: List[bytes], marker: str, value):
+    """Mark the position of a member encoded by a worker with a string, or convert arrays as `_encode_array`."""
+    if isinstance(value, EncodedMember):
+        fragments.append(value.data)
+        return f'{marker}{len(fragments) - 1}'
+    return _encode_array(value)
+
+
+def _contains_non_finite(value) -> bool:
+    """Determine if a serialized model holds NaN or infinite floats, outside of the arrays left by `NativeArrayWriter`."""
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, (float, np.floating)):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def _contains_non_finite_array(array: np.ndarray) -> bool:
+    """Determine if an array holds NaN or infinite values."""
+    if array.dtype.names is not None:
+        return any(_contains_non_finite_array(array[name]) for name in array.dtype.names)
+    if array.dtype.kind in 'fc':
+        return not np.isfinite(array).all()
+    if array.dtype.kind == 'O':
+        return _contains_non_finite(array.tolist())
+    return False
+
+
+def _contains_large_integer(data: bytes) -> bool:
+    """Determine if json text may hold integers of more than 64 bits."""
+    marks = (b' ' + data).translate(_DIGIT_MARKS)
+    start = marks.find(_LARGE_INTEGER)
+    while start != -1:
+        end = _DIGITS.match(marks, start + 1).end()
+        if marks[end:end + 1] != b'.':
+            return True
+        start = marks.find(_LARGE_INTEGER, end)
+    return False
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+import threading
+from collections.abc import Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, List
+
+from .parallel import UnparsedMember
+
+
+class FileMember(UnparsedMember):
+    """Member of an ensemble left unparsed in an uncompressed json file, read from the file when needed.
+
+    :param path: path of the json file
+    :param offset: position of the member in the file, in bytes
+    :param length: length of the json text of the member, in bytes
+    :param references: whether the member may refer to objects shared with the rest of the model
+    """
+
+    __slots__ = ('path', 'offset', 'length', 'references')
+
+    def __init__(self, path, offset: int, length: int, references: bool):
+        self.path = path
+        self.offset = offset
+        self.length = length
+        self.references = references
+
+    @property
+    def text(self) -> str:
+        """Read the json text of the member from the file."""
+        with open(self.path, 'rb') as file:
+            file.seek(self.offset)
+            return file.read(self.length).decode('utf-8')
+
+    def has_references(self) -> bool:
+        return self.references
+
+
+class LazyMembers(Sequence):
+    """Members of an ensemble, each deserialized the first time it is accessed.
+
+    Pickling (e.g. to send the model to another process) deserializes all members, into a list.
+
+    :param deserializer: function deserializing a member
+    :param members: serialized members of the ensemble, left unparsed
+    """
+
+    def __init__(self, deserializer: Callable, members: List[UnparsedMember]):
+        self.deserializer = deserializer
+        self.members = members
+        self.loaded: List = [None] * len(members)
+        self.lock = threading.Lock()
+
+    @property
+    def n_loaded(self) -> int:
+        """Number of members deserialized so far."""
+        return sum(member is not None for member in self.loaded)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        member = self.loaded[index]
+        if member is None:
+            member = self.deserializer(self.members[index].parse())
+            with self.lock:
+                if self.loaded[index] is None:
+                    self.loaded[index] = member
+                member = self.loaded[index]
+        return member
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+    def __repr__(self) -> str:
+        return f'LazyMembers({self.n_loaded}/{len(self)} loaded)'
+
+
+_lazy_loading: ContextVar[bool] = ContextVar('ml2json_lazy_loading', default=False)
+
+
+@contextmanager
+def lazy_loading(enabled: bool = True):
+    """Deserialize the members of ensembles supporting it on first access, within a context (see `lazy_members`).
+
+    :param enabled: whether members are deserialized lazily
+    """
+    token = _lazy_loading.set(enabled)
+    try:
+        yield
+    finally:
+        _lazy_loading.reset(token)
+
+
+def lazy_members(deserializer: Callable, members: List):
+    """Obtain the members of an ensemble deserialized on first access, or None if they cannot be.
+
+    Members are deserialized lazily within `lazy_loading` if all of them were left unparsed
+    and none refers to objects shared with the rest of the model.
+
+    :param deserializer: function deserializing a member
+    :param members: serialized members of the ensemble, possibly left unparsed
+    """
+    if not _lazy_loading.get() or not members:
+        return None
+    if not all(isinstance(member, UnparsedMember) and not member.has_references() for member in members):
+        return None
+    return LazyMembers(deserializer, members)
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+import os
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, copy_context
+from functools import partial
+from typing import Callable, Iterable, List, Optional, Sequence
+
+from .config import get_config, config_context
+from .instrumentation import track
+
+
+# Number of tasks each worker process is given at once, at most
+MAX_CHUNK_SIZE = 64
+
+
+class EncodedMember:
+    """Member of an ensemble serialized and encoded to json by a worker process, to be written as is.
+
+    :param data: json text of the serialized member (str with the `json` module, bytes with orjson)
+    :param serializer: function serializing the member, should it be encoded again
+    :param member: the member of the ensemble
+    """
+
+    __slots__ = ('data', 'serializer', 'member')
+
+    def __init__(self, data, serializer: Callable, member):
+        self.data = data
+        self.serializer = serializer
+        self.member = member
+
+    def serialize(self):
+        """Serialize the member again, into a dictionary."""
+        return self.serializer(self.member)
+
+
+class UnparsedMember:
+    """Member of an ensemble whose json text was left unparsed, to be parsed by a worker process.
+
+    :param text: json text of the serialized member
+    """
+
+    __slots__ = ('text',)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def parse(self):
+        """Parse the json text of the member."""
+        import io
+        from .streaming import read_json
+
+        return read_json(io.StringIO(self.text))
+
+    def has_references(self) -> bool:
+        """Determine if the member may refer to objects shared with the rest of the model."""
+        return '"reference"' in self.text
+
+
+class MemberPool:
+    """Pools of worker processes, or threads, (de)serializing the members of ensembles, started on first use.
+
+    :param n_jobs: number of workers, -1 for as many as there are CPUs
+    """
+
+    def __init__(self, n_jobs: int):
+        self.n_workers = n_workers(n_jobs)
+        self.executor = None
+        self.thread_executor = None
+
+    def map(self, function: Callable, items: List) -> Iterable:
+        """Apply a function to items in the worker processes, results being obtained in order."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.n_workers)
+        chunk_size = min(MAX_CHUNK_SIZE, max(1, len(items) // (4 * self.n_workers)))
+        return self.executor.map(function, items, chunksize=chunk_size)
+
+    def map_threads(self, function: Callable, items: List) -> Iterable:
+        """Apply a function to items in the worker threads, each within a copy of the current context."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        if self.thread_executor is None:
+            self.thread_executor = ThreadPoolExecutor(max_workers=self.n_workers)
+        contexts = [copy_context() for _ in items]
+        return self.thread_executor.map(partial(_run_in_context, function), contexts, items)
+
+    def shutdown(self) -> None:
+        """Stop the workers."""
+        for executor in (self.executor, self.thread_executor):
+            if executor is not None:
+                executor.shutdown()
+
+
+def n_workers(n_jobs: int) -> int:
+    """Obtain the number of workers to start for `n_jobs`, -1 standing for as many as there are CPUs,
+    -2 for all of them but one, and so on.
+
+    :raises ValueError: if `n_jobs` is 0, or negative and below minus the number of CPUs
+    """
+    cpu_count = os.cpu_count() or 1
+    if isinstance(n_jobs, bool) or not isinstance(n_jobs, int) or n_jobs == 0 or n_jobs < -cpu_count:
+        raise ValueError(f'n_jobs must be a nonzero integer between -{cpu_count} and -1, or positive, got {n_jobs!r}')
+    return cpu_count + 1 + n_jobs if n_jobs < 0 else n_jobs
+
+
+_member_pool: ContextVar[Optional[MemberPool]] = ContextVar('ml2json_member_pool', default=None)
+
+
+@contextmanager
+def member_pool(n_jobs: Optional[int] = None):
+    """(De)serialize the members of ensembles in parallel within a context.
+
+    :param n_jobs: number of worker processes, -1 for as many as there are CPUs; None or 1 to serialize them in turn
+    """
+    pool = MemberPool(n_jobs) if n_jobs is not None and n_jobs != 1 else None
+    token = _member_pool.set(pool)
+    try:
+        yield
+    finally:
+        _member_pool.reset(token)
+        if pool is not None:
+            pool.shutdown()
+
+
+def serialize_members(serializer: Callable, members: Iterable) -> List:
+    """Serialize the members of an ensemble (e.g. the trees of a forest), in worker processes if any.
+
+    Results are those of serializing the members in turn. When the model is being encoded to json
+    (see `to_json` and `iter_json`), members are encoded by the workers as well and written as is.
+    Members are serialized in turn when writing archives.
+
+    :param serializer: module-level function serializing a member
+    :param members: members of the ensemble
+    """
+    from .arrays import _array_store
+
+    members = list(members)
+    pool = _member_pool.get()
+    encoding = _member_encoding(_array_store.get())
+    if pool is None or encoding is None or len(members) < 2:
+        return [serializer(member) for member in track(members, len(members), 'serialize')]
+    results = pool.map(partial(_serialize_member, serializer, config=get_config(), encoding=encoding), members)
+    results = list(track(results, len(members), 'serialize'))
+    if encoding == 'dict':
+        return results
+    # Members orjson cannot encode as `json.dumps` would (e.g. holding NaN) are serialized again by the caller
+    return [serializer(member) if data is None else EncodedMember(data, serializer, member)
+            for data, member in zip(results, members)]
+
+
+def deserialize_members(deserializer: Callable, members: Iterable, lazy: bool = False) -> Sequence:
+    """Deserialize the members of an ensemble (e.g. the trees of a forest), in parallel if workers are available.
+
+    Members left unparsed when reading json (see `from_json`) are parsed and deserialized by worker processes,
+    as parsing holds the GIL. Members already parsed are deserialized by threads, decoding their arrays releasing it.
+
+    :param deserializer: module-level function deserializing a member
+    :param members: serialized members of the ensemble, possibly unparsed
+    :param lazy: whether the ensemble supports members being deserialized on first access instead,
+                 as they are when loading models lazily (see `lazy_members`)
+    """
+    members = list(members)
+    if lazy:
+        from .lazy import lazy_members
+
+        loaded_members = lazy_members(deserializer, members)
+        if loaded_members is not None:
+            return loaded_members
+    pool = _member_pool.get()
+    if pool is None or len(members) < 2:
+        return [deserializer(_parsed(member)) for member in track(members, len(members), 'deserialize')]
+    # Members referring to objects shared with the rest of the model are parsed here, to be resolved along with it
+    members = [member.text if isinstance(member, UnparsedMember) and not member.has_references() else _parsed(member)
+               for member in members]
+    if not any(isinstance(member, str) for member in members):
+        results = pool.map_threads(partial(_deserialize_member, deserializer), members)
+    else:
+        results = pool.map(partial(_deserialize_member_in_process, deserializer), members)
+    return list(track(results, len(members), 'deserialize'))
+
+
+def _parsed(member):
+    """Obtain a serialized member, parsing its text if it was left unparsed."""
+    return member.parse() if isinstance(member, UnparsedMember) else member
+
+
+def _run_in_context(function: Callable, context: Context, item):
+    """Apply a function to an item within a context, the members of nested ensembles being deserialized in turn."""
+    return context.run(_run_without_pool, function, item)
+
+
+def _run_without_pool(function: Callable, item):
+    """Apply a function to an item, without workers."""
+    _member_pool.set(None)
+    return function(item)
+
+
+def _deserialize_member(deserializer: Callable, member):
+    """Deserialize a member of an ensemble, parsing it first if given as json text."""
+    return deserializer(UnparsedMember(member).parse() if isinstance(member, str) else member)
+
+
+def _deserialize_member_in_process(deserializer: Callable, member):
+    """Deserialize a member of an ensemble in a worker process, within a fresh context."""
+    return Context().run(_deserialize_member, deserializer, member)
+
+
+def _member_encoding(store) -> Optional[str]:
+    """Obtain how members are returned by workers while arrays are kept by a store ('dict', 'json' or 'orjson').
+
+    :return: None if members cannot be serialized by workers
+    """
+    from .json_backend import NativeArrayWriter
+    from .streaming import StreamingWriter
+
+    if store is None:
+        return 'dict'
+    if isinstance(store, StreamingWriter):
+        return 'json'
+    if isinstance(store, NativeArrayWriter):
+        return 'orjson'
+    return None
+
+
+def _serialize_member(serializer: Callable, member, config: dict, encoding: str):
+    """Serialize a member of an ensemble in a worker process, within a fresh context with the options of the caller."""
+    return Context().run(_serialize_member_in_context, serializer, member, config, encoding)
+
+
+def _serialize_member_in_context(serializer: Callable, member, config: dict, encoding: str):
+    """Serialize a member of an ensemble, and encode it to json unless `encoding` is 'dict'."""
+    with config_context(**config):
+        if encoding == 'json':
+            from .streaming import iter_model_json
+
+            return ''.join(iter_model_json(partial(serializer, member)))
+        if encoding == 'orjson':
+            from .json_backend import dump_fragment
+
+            return dump_fragment(partial(serializer, member))
+        return serializer(member)
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+
+# Precision floats are exported with by default: exactly
+FULL_PRECISION = 'float64'
+# Largest number of significant digits of a float64, beyond which rounding has no effect
+MAX_DIGITS = 17
+# Number of significant digits of decimals float32 values are read back as exactly
+FLOAT32_DIGITS = 6
+# Names of the attributes of the model being serialized, by identifier of their arrays
+_attribute_names: ContextVar[Optional[Dict[int, str]]] = ContextVar('ml2json_attribute_names', default=None)
+
+
+def check_precision(precision) -> None:
+    """Check the validity of the precision of floats, either 'float64', 'float32' or a number of significant digits."""
+    if precision in (FULL_PRECISION, 'float32'):
+        return
+    if isinstance(precision, bool) or not isinstance(precision, int) or not 1 <= precision <= MAX_DIGITS:
+        raise ValueError(f"float precision must be 'float64', 'float32' or a number of significant digits "
+                         f"between 1 and {MAX_DIGITS}, got {precision!r}")
+
+
+@contextmanager
+def attribute_names(model):
+    """Make the arrays of the attributes of a model identifiable by name while it is serialized.
+
+    :param model: model being serialized
+    """
+    names = {}
+    for name, value in getattr(model, '__dict__', {}).items():
+        for item in value if isinstance(value, (list, tuple)) else [value]:
+            if isinstance(item, np.ndarray):
+                names[id(item)] = name
+    token = _attribute_names.set(names)
+    try:
+        yield
+    finally:
+        _attribute_names.reset(token)
+
+
+def get_precision(array: np.ndarray, float_precision: Union[str, int, Dict]) -> Union[str, int]:
+    """Obtain the precision an array of floats is to be exported with.
+
+    :param array: array to be serialized
+    :param float_precision: value of the `float_precision` option, possibly giving precisions by attribute name
+    """
+    if not isinstance(float_precision, dict):
+        return float_precision
+    names = _attribute_names.get()
+    name = names.get(id(array)) if names is not None else None
+    return float_precision.get(name, FULL_PRECISION)
+
+
+def reduce_precision(array: np.ndarray, precision: Union[str, int], raw_bytes: bool) -> np.ndarray:
+    """Round the values of an array of floats.
+
+    Values are replaced by the shortest decimals that are read back as the same float32 ('float32'),
+    or by decimals with a number of significant digits, so that they are written with fewer digits.
+    Arrays to be stored as raw bytes keep their dtype; with 'float32', their values are those of float32.
+
+    :param array: array of floats
+    :param precision: either 'float64' (no rounding), 'float32' or a number of significant digits
+    :param raw_bytes: whether the array is to be stored as raw bytes, rather than as nested lists
+    :return: array of float64, or of the dtype of `array` if `raw_bytes` is True
+    """
+    if precision == FULL_PRECISION or array.dtype.itemsize > 8:
+        return array
+    if precision == 'float32':
+        if raw_bytes:
+            return array.astype(np.float32).astype(array.dtype)
+        rounded = _shortest_float32(array.astype(np.float32))
+    else:
+        rounded = _round_significant(array.astype(np.float64), precision)
+    return rounded.astype(array.dtype) if raw_bytes else rounded
+
+
+def storage_dtype(array: np.ndarray, precision: Union[str, int]) -> np.dtype:
+    """Obtain the dtype the raw bytes of an array of floats rounded with `reduce_precision` are stored with.
+
+    Arrays of float64 rounded to the precision of float32, or to at most 6 significant digits,
+    are stored as float32, halving their size; other arrays keep their dtype.
+
+    :param array: array of floats, as rounded by `reduce_precision`
+    :param precision: either 'float64', 'float32' or a number of significant digits
+    """
+    if array.dtype == np.float64 and (precision == 'float32'
+                                      or (isinstance(precision, int) and precision <= FLOAT32_DIGITS)):
+        return np.dtype(np.float32)
+    return array.dtype
+
+
+def _round_significant(values: np.ndarray, digits: int) -> np.ndarray:
+    """Round float64 values to the closest float64 of decimals with a number of significant digits.
+
+    Values for which powers of ten are not exact (e.g. subnormals) are left as is.
+    """
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        exponents = digits - 1 - np.floor(np.log10(np.abs(values)))
+        exact = np.abs(exponents) <= 22
+        scales = 10.0 ** np.abs(np.where(exact, exponents, 0))
+        rounded = np.where(exponents >= 0, np.round(values * scales) / scales, np.round(values / scales) * scales)
+    return np.where(exact, rounded, values)
+
+
+def _shortest_float32(values: np.ndarray) -> np.ndarray:
+    """Obtain the float64 of the shortest decimals (of 6 to 9 significant digits) read back as float32 values."""
+    shape = values.shape
+    values = values.ravel()
+    result = values.astype(np.float64)
+    pending = np.flatnonzero(np.isfinite(values) & (values != 0))
+    for digits in range(6, 10):
+        rounded = _round_significant(result[pending], digits)
+        found = rounded.astype(np.float32) == values[pending]
+        result[pending[found]] = rounded[found]
+        pending = pending[~found]
+    return result.reshape(shape)
@@ -2,16 +2,18 @@
 
 import numpy as np
 
+from .arrays import encode_array, decode_array
+
 
 def serialize_random_state(random_state):
     params = random_state.get_state(legacy=False)
-    params['state']['key'] = params['state']['key'].tolist()
+    params['state']['key'] = encode_array(params['state']['key'])
 
     return params
 
 
 def deserialize_random_state(model_dict):
-    model_dict['state']['key'] = np.array(model_dict['state']['key'], dtype=np.uint32)
+    model_dict['state']['key'] = decode_array(model_dict['state']['key'], dtype=np.uint32)
 
     random_state = np.random.RandomState()
     random_state.set_state(model_dict)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+
+from .instrumentation import relocate
+
+
+# Key of the serialized model holding the objects it references several times, by identifier
+TABLE_KEY = 'shared_objects'
+# Tag of the references to the objects of the table
+REFERENCE_META = 'reference'
+
+
+class SerializedObjects:
+    """Objects serialized while serializing a model, so that those referenced several times are serialized once."""
+
+    def __init__(self):
+        # Serialized objects, kept alive so that their identifiers are not reused, their dictionaries and table keys
+        self.entries: Dict[int, list] = {}
+        self.shared: Dict[str, Dict] = {}
+
+    def serialize(self, obj, serializer: Callable[[], Dict]) -> Dict:
+        """Serialize an object the first time it is met, or obtain a reference to it afterwards."""
+        entry = self.entries.get(id(obj))
+        if entry is None:
+            obj_dict = serializer()
+            self.entries[id(obj)] = [obj, obj_dict, None]
+            return obj_dict
+        if entry[2] is None:
+            entry[2] = str(len(self.shared))
+            self.shared[entry[2]] = entry[1]
+        return _reference(entry[2])
+
+    def table(self) -> Dict[str, Dict]:
+        """Move the objects referenced several times to the table, replacing their first occurrence by a reference."""
+        table = {}
+        for key, obj_dict in self.shared.items():
+            table[key] = dict(obj_dict)
+            obj_dict.clear()
+            obj_dict.update(_reference(key))
+        return table
+
+
+class DeserializedObjects:
+    """Objects of the table of a serialized model, deserialized once whatever the number of references to them.
+
+    :param table: objects of the serialized model referenced several times, by identifier
+    """
+
+    def __init__(self, table: Dict[str, Dict]):
+        self.table = table
+        self.objects: Dict[str, Any] = {}
+
+    def resolve(self, key: str, deserializer: Callable[[Dict], Any]):
+        """Obtain the object a reference refers to."""
+        if key not in self.objects:
+            self.objects[key] = deserializer(self.table[key])
+        return self.objects[key]
+
+
+_serialized_objects: ContextVar[Optional[SerializedObjects]] = ContextVar('ml2json_serialized_objects', default=None)
+_deserialized_objects: ContextVar[Optional[DeserializedObjects]] = ContextVar('ml2json_deserialized_objects',
+                                                                               default=None)
+
+
+def serialize_once(obj, serializer: Callable[[], Dict]) -> Dict:
+    """Serialize an object, objects it holds several times (e.g. the steps of a pipeline) being serialized once.
+
+    The serialized model holds these objects in a table, and references to them wherever they occur.
+
+    :param obj: object to be serialized
+    :param serializer: function serializing the object
+    """
+    objects = _serialized_objects.get()
+    if objects is not None:
+        return objects.serialize(obj, serializer)
+    objects = SerializedObjects()
+    token = _serialized_objects.set(objects)
+    try:
+        obj_dict = serializer()
+    finally:
+        _serialized_objects.reset(token)
+    table = objects.table()
+    if table:
+        obj_dict[TABLE_KEY] = table
+    return obj_dict
+
+
+def deserialize_once(obj_dict: Dict, deserializer: Callable[[Dict], Any]):
+    """Deserialize an object, references to the same serialized object resolving to the same Python object.
+
+    :param obj_dict: serialized object, possibly a reference to an object of the table of the serialized model
+    :param deserializer: function deserializing the object
+    """
+    objects = _deserialized_objects.get()
+    if obj_dict.get('meta') == REFERENCE_META:
+        if objects is None:
+            raise ValueError('References to shared objects can only be deserialized along with the model holding them.')
+        relocate(obj_dict, objects.table.get(obj_dict['id']))
+        return objects.resolve(obj_dict['id'], deserializer)
+    if objects is not None or TABLE_KEY not in obj_dict:
+        return deserializer(obj_dict)
+    token = _deserialized_objects.set(DeserializedObjects(obj_dict[TABLE_KEY]))
+    try:
+        return deserializer(obj_dict)
+    finally:
+        _deserialized_objects.reset(token)
+
+
+def _reference(key: str) -> Dict:
+    """Obtain a reference to an object of the table."""
+    return {'meta': REFERENCE_META, 'id': key}
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+import sys
+import importlib
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+
+# Serializers, whether they require the CatBoost data and the 'meta' tag of the models they serialize,
+# keyed by the class they were registered for, and deserializers keyed by the 'meta' tag of the serialized model
+_serializers: Dict[type, Tuple[Callable, bool, str]] = {}
+_deserializers: Dict[str, Union[Callable, str]] = {}
+# Classes given by their import path, keyed by class name until first encountered
+_lazy_serializers: Dict[str, List[Tuple[str, Tuple[Union[Callable, str], bool, str]]]] = {}
+# Serializer resolved through the MRO of each type encountered so far
+_dispatch_cache: Dict[type, Optional[Tuple[Callable, bool, str]]] = {}
+
+
+def register(cls: Union[type, str], meta: str, serializer: Union[Callable, str], deserializer: Union[Callable, str],
+             pass_catboost_data: bool = False) -> None:
+    """Register the functions used to (de)serialize a model type.
+
+    Subclasses of `cls` are serialized with `serializer` unless they are registered themselves.
+    The class and functions can be given as 'module:name' import paths, in which case they are
+    only imported once a model of this type (or this `meta` tag) is (de)serialized.
+
+    :param cls: class of the model, or its import path
+    :param meta: tag identifying the serialized model, used to find `deserializer` again
+    :param serializer: function turning a fitted instance of `cls` into a dictionary, or its import path
+    :param deserializer: function instantiating a model from a dictionary produced by `serializer`, or its import path
+    :param pass_catboost_data: if True, `serializer` also receives the CatBoost data `Pool` as second argument
+    """
+    if isinstance(cls, str):
+        name = cls.rpartition(':')[2].rpartition('.')[2]
+        _lazy_serializers.setdefault(name, []).append((cls, (serializer, pass_catboost_data, meta)))
+    else:
+        _serializers[cls] = (serializer, pass_catboost_data, meta)
+    _deserializers[meta] = deserializer
+    _dispatch_cache.clear()
+
+
+def get_serializer(cls: type) -> Optional[Tuple[Callable, bool, str]]:
+    """Obtain the serializer of a model type, whether it requires the CatBoost data `Pool` and its 'meta' tag.
+
+    :param cls: type of the model to be serialized
+    :return: None if neither the type nor any of its base classes is registered
+    """
+    try:
+        return _dispatch_cache[cls]
+    except KeyError:
+        pass
+    entry = None
+    for base in cls.__mro__:
+        if base not in _serializers and base.__name__ in _lazy_serializers:
+            _resolve_lazy_class(base)
+        if base in _serializers:
+            entry = _serializers[base]
+            if isinstance(entry[0], str):
+                entry = _serializers[base] = (_import_from_path(entry[0]), *entry[1:])
+            break
+    _dispatch_cache[cls] = entry
+    return entry
+
+
+def get_deserializer(meta: str) -> Optional[Callable]:
+    """Obtain the deserializer of a serialized model type.
+
+    :param meta: tag identifying the serialized model
+    :return: None if no model type is registered with this tag or if its dependencies are not installed
+    """
+    deserializer = _deserializers.get(meta)
+    if isinstance(deserializer, str):
+        try:
+            deserializer = _import_from_path(deserializer)
+        except (ImportError, AttributeError):
+            return None
+        _deserializers[meta] = deserializer
+    return deserializer
+
+
+def registered_metas() -> List[str]:
+    """Obtain the tags of all registered model types, whether their dependencies are installed or not."""
+    return list(_deserializers)
+
+
+def _resolve_lazy_class(cls: type) -> None:
+    """Move the serializer registered for the import path of `cls` to the resolved serializers.
+
+    Only import paths pointing to an already imported library are resolved,
+    for an instance of `cls` could not exist otherwise.
+
+    :param cls: class of the model to be serialized
+    """
+    library = cls.__module__.partition('.')[0]
+    for path, entry in _lazy_serializers[cls.__name__]:
+        if path.partition('.')[0].partition(':')[0] != library or library not in sys.modules:
+            continue
+        try:
+            resolved = _import_from_path(path)
+        except (ImportError, AttributeError):
+            continue
+        if resolved is cls:
+            _serializers[cls] = entry
+            return
+
+
+def _import_from_path(path: str):
+    """Import an object from its 'module:name' import path.
+
+    :param path: import path of the object
+    """
+    module_name, _, name = path.partition(':')
+    obj = importlib.import_module(module_name)
+    for attr in name.split('.'):
+        obj = getattr(obj, attr)
+    return obj
@@ -0,0 +1,619 @@
+# -*- coding: utf-8 -*-
+
+import re
+import json
+import warnings
+import base64
+from json.decoder import scanstring
+from json.scanner import NUMBER_RE
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple, Union
+
+import numpy as np
+
+from .aio import check_cancelled
+from .arrays import _is_binary_dtype
+from .archive import array_store
+from .config import get_config
+from .lazy import FileMember
+from .parallel import EncodedMember, UnparsedMember
+
+
+# Approximate number of array items, or of characters, written at once
+CHUNK_SIZE = 1 << 16
+# Number of characters read at once
+READ_SIZE = 1 << 20
+# Length (in characters) from which lists of numbers are read as arrays rather than lists
+MIN_ARRAY_LENGTH = 1024
+# Keys of the lists of members of ensembles, whose objects can be left unparsed for workers to parse them
+MEMBER_KEYS = ('estimators_',)
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# Nested lists of numbers start with a number after their opening brackets
+_NUMBER_START = re.compile(r'[\[ \t\n\r]*\[[ \t\n\r]*[-0-9NI]')
+# Characters of nested lists of numbers, including NaN and (-)Infinity, whose syntax is checked when parsing them
+_ARRAY_CHARACTERS = re.compile(r'[\[\]\-0-9.eE+, \t\n\rNaIfinty]*')
+_NUMBER_CHARACTERS = b'-0123456789.eE+ \t\n\rNaIfinty'
+_FLOAT_CHARACTERS = re.compile(rb'[.eENI]')
+# Integers that may not fit in 64 bits
+_LARGE_INTEGER = re.compile(rb'\d{19}')
+# Nesting depth steps of characters, offset by 1: 2 for opening brackets, 0 for closing brackets and 1 otherwise
+_BRACKET_STEPS = bytes(2 if c == ord('[') else 0 if c == ord(']') else 1 for c in range(256))
+_BRACKETS_TO_SPACES = bytes.maketrans(b'[]', b'  ')
+_DECODER = json.JSONDecoder()
+_CONSTANTS = {'true': True, 'false': False, 'null': None,
+              'NaN': float('nan'), 'Infinity': float('inf'), '-Infinity': float('-inf')}
+
+
+class StreamedArray:
+    """Array left as is in a serialized model, to be encoded while the model is being written.
+
+    :param array: array to be serialized
+    :param encoding: encoding of the array, either 'list' or 'base64'
+    :param decoded_dtype: descriptor of the dtype the array is cast to when decoded, if stored with a reduced precision
+    """
+
+    __slots__ = ('array', 'encoding', 'decoded_dtype')
+
+    def __init__(self, array: np.ndarray, encoding: str, decoded_dtype: str = None):
+        self.array = array
+        self.encoding = encoding
+        self.decoded_dtype = decoded_dtype
+
+
+class StreamingWriter:
+    """Keep the arrays of a model being serialized, so that they are only encoded when written."""
+
+    # Arrays are encoded according to the `array_encoding` option
+    raw_bytes = False
+
+    def accepts(self, array: np.ndarray) -> bool:
+        """Determine if the encoding of an array is to be deferred."""
+        return array.ndim > 0
+
+    def add(self, array: np.ndarray) -> StreamedArray:
+        """Obtain the placeholder of an array in the serialized model."""
+        return StreamedArray(array, get_config()['array_encoding'])
+
+
+def iter_model_json(model_dict_factory: Callable[[], Dict]) -> Iterator[str]:
+    """Serialize a model and encode it to json incrementally.
+
+    :param model_dict_factory: callable serializing the model, called while the encoding of arrays is deferred
+    """
+    with array_store(StreamingWriter()):
+        model_dict = model_dict_factory()
+    return iter_encode(model_dict)
+
+
+def iter_encode(value, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Encode a serialized model to json incrementally, as `json.dump` would.
+
+    :param value: serialized model, possibly holding arrays whose encoding was deferred
+    :param chunk_size: approximate number of characters yielded at once
+    """
+    buffer, size = [], 0
+    for chunk in _iter_encode(value):
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= chunk_size:
+            yield ''.join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield ''.join(buffer)
+
+
+def _iter_encode(value) -> Iterator[str]:
+    """Encode a value to json incrementally, without buffering."""
+    if isinstance(value, StreamedArray):
+        yield from _iter_encode_array(value.array, value.encoding, value.decoded_dtype)
+    elif isinstance(value, EncodedMember):
+        # Members encoded by workers with orjson are bytes
+        yield value.data if isinstance(value.data, str) else value.data.decode('utf-8')
+    elif isinstance(value, np.ndarray):
+        # Arrays left for orjson to encode natively (see `NativeArrayWriter`)
+        yield from _iter_encode_array(value, 'list')
+    elif isinstance(value, dict):
+        if not value:
+            yield '{}'
+            return
+        separator = '{'
+        for key, item in value.items():
+            yield f'{separator}{_encode_key(key)}: '
+            yield from _iter_encode(item)
+            separator = ', '
+        yield '}'
+    elif isinstance(value, (list, tuple)):
+        if not any(isinstance(item, (dict, list, tuple, np.ndarray, StreamedArray, EncodedMember)) for item in value):
+            yield json.dumps(value)
+            return
+        separator = '['
+        for item in value:
+            yield separator
+            yield from _iter_encode(item)
+            separator = ', '
+        yield ']'
+    else:
+        yield json.dumps(value)
+
+
+def _encode_key(key) -> str:
+    """Encode the key of a dictionary to json, converting it to a string as `json.dump` would."""
+    if isinstance(key, str):
+        return json.dumps(key)
+    if key is None or isinstance(key, (int, float)):
+        return json.dumps(json.dumps(key))
+    raise TypeError(f'keys must be str, int, float, bool or None, not {type(key).__name__}')
+
+
+def _iter_encode_array(array: np.ndarray, encoding: str, decoded_dtype: str = None) -> Iterator[str]:
+    """Encode an array to json chunk by chunk, as `encode_array` followed by `json.dump` would."""
+    if encoding == 'base64' and _is_binary_dtype(array.dtype):
+        dtype = array.dtype.newbyteorder('<')
+        yield (f'{{"meta": "ndarray", "dtype": {json.dumps(np.lib.format.dtype_to_descr(dtype))}, '
+               f'"shape": {json.dumps(list(array.shape))}, ')
+        if decoded_dtype is not None:
+            yield f'"decoded_dtype": {json.dumps(decoded_dtype)}, '
+        yield '"data": "'
+        # Bytes are encoded by multiples of 3 so that the base64 chunks can be concatenated
+        remainder = b''
+        for block in _iter_blocks(array):
+            data = remainder + np.ascontiguousarray(block, dtype=dtype).tobytes()
+            end = len(data) - len(data) % 3
+            yield base64.b64encode(data[:end]).decode('ascii')
+            remainder = data[end:]
+        yield base64.b64encode(remainder).decode('ascii') + '"}'
+    elif array.ndim == 0 or array.size <= CHUNK_SIZE:
+        yield json.dumps(array.tolist())
+    elif array.size // len(array) > CHUNK_SIZE:
+        # Rows are too large to be written at once
+        separator = '['
+        for row in array:
+            yield separator
+            yield from _iter_encode_array(row, encoding)
+            separator = ', '
+        yield ']'
+    else:
+        separator = '['
+        for block in _iter_blocks(array):
+            yield separator + json.dumps(block.tolist())[1:-1]
+            separator = ', '
+        yield ']'
+
+
+def _iter_blocks(array: np.ndarray) -> Iterator[np.ndarray]:
+    """Split an array along its first axis into blocks of about `CHUNK_SIZE` items."""
+    if array.ndim == 0 or array.size == 0:
+        yield array
+        return
+    rows = max(1, CHUNK_SIZE // max(1, array.size // len(array)))
+    for start in range(0, len(array), rows):
+        yield array[start:start + rows]
+
+
+class JSONStreamReader:
+    """Parse json text incrementally, reading large lists of numbers directly into arrays.
+
+    Nested lists of numbers of at least `MIN_ARRAY_LENGTH` characters are parsed into numpy arrays,
+    with the dtype `numpy.array` would give them, without creating a Python object per number.
+    Other values are parsed as `json.load` would.
+
+    :param fp: text file to read the json text from
+    :param defer_members: if True, the objects of lists of members of ensembles (see `MEMBER_KEYS`)
+                          are left unparsed, as `UnparsedMember`
+    :param source: path of the file, if uncompressed, for members left unparsed to be read again from it
+                   (as `FileMember`) rather than kept in memory
+    """
+
+    def __init__(self, fp: TextIO, defer_members: bool = False, source=None):
+        self.fp = fp
+        self.defer_members = defer_members
+        self.source = source
+        # Position in the file of a chunk and number of its first characters known to be single bytes
+        self.single_bytes: Optional[Tuple[int, int]] = None
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        # Positions in the file (as given by `tell`) of the chunks read into the buffer, by index in the buffer
+        self.seekable = fp.seekable()
+        self.chunks: List[Tuple[int, int]] = []
+
+    def read(self):
+        """Parse the json text."""
+        value = self._read_value()
+        if self._peek() != '':
+            self._error('Extra data')
+        return value
+
+    def _read_more(self) -> bool:
+        """Append the next characters of the file to the buffer, reading at least as many as already buffered."""
+        check_cancelled()
+        position = self.fp.tell() if self.seekable else None
+        chunk = self.fp.read(max(READ_SIZE, len(self.buffer) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        chunks = [(index - self.pos, chunk_position) for index, chunk_position in self.chunks]
+        first = max([i for i, (index, _) in enumerate(chunks) if index <= 0], default=0)
+        self.chunks = chunks[first:] + [(len(self.buffer) - self.pos, position)]
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _tell(self) -> Optional[Tuple[int, int]]:
+        """Obtain the position of the file to seek, and the number of characters to skip, to return to the current position.
+
+        :return: None if the file is not seekable
+        """
+        if not self.seekable:
+            return None
+        index, position = [chunk for chunk in self.chunks if chunk[0] <= self.pos][-1]
+        return position, self.pos - index
+
+    def _seek(self, position: int, n_skipped: int) -> None:
+        """Return to a position obtained with `_tell`, discarding the buffer."""
+        self.fp.seek(position)
+        self.buffer, self.pos, self.chunks, self.eof = '', 0, [], False
+        self._ensure(n_skipped + 1)
+        self.pos = n_skipped
+
+    def _ensure(self, n_characters: int) -> None:
+        """Buffer at least `n_characters` characters after the current position, unless the file ends."""
+        while len(self.buffer) - self.pos < n_characters and self._read_more():
+            pass
+
+    def _peek(self) -> str:
+        """Skip whitespace and obtain the next character, or an empty string at the end of the file."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or not self._read_more():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def _error(self, message: str):
+        raise json.JSONDecodeError(message, self.buffer, self.pos)
+
+    def _read_value(self):
+        character = self._peek()
+        if character == '{':
+            return self._read_object()
+        if character == '[':
+            array = self._read_numeric_array()
+            return array if array is not None else self._read_list()
+        if character == '"':
+            return self._read_string()
+        return self._read_scalar()
+
+    def _read_object(self) -> Dict:
+        self.pos += 1
+        obj = {}
+        if self._peek() == '}':
+            self.pos += 1
+            return obj
+        while True:
+            if self._peek() != '"':
+                self._error('Expecting property name enclosed in double quotes')
+            key = self._read_string()
+            if self._peek() != ':':
+                self._error("Expecting ':' delimiter")
+            self.pos += 1
+            if self.defer_members and key in MEMBER_KEYS and self._peek() == '[':
+                obj[key] = self._read_list(self._read_member)
+            else:
+                obj[key] = self._read_value()
+            character = self._peek()
+            self.pos += 1
+            if character == '}':
+                return obj
+            if character != ',':
+                self._error("Expecting ',' delimiter")
+
+    def _read_list(self, read_item: Callable = None) -> list:
+        read_item = self._read_value if read_item is None else read_item
+        self.pos += 1
+        items = []
+        if self._peek() == ']':
+            self.pos += 1
+            return items
+        while True:
+            items.append(read_item())
+            character = self._peek()
+            self.pos += 1
+            if character == ']':
+                return items
+            if character != ',':
+                self._error("Expecting ',' delimiter")
+
+    def _read_member(self):
+        """Read a member of an ensemble, leaving its text unparsed if it is an object."""
+        if self._peek() != '{':
+            return self._read_value()
+        offset = self._byte_offset() if self.source is not None else None
+        text = self._skim('{', '}')
+        if offset is None or not _single_bytes(text):
+            return UnparsedMember(text)
+        position, n_characters = self.single_bytes
+        self.single_bytes = position, n_characters + len(text)
+        return FileMember(self.source, offset, len(text), '"reference"' in text)
+
+    def _byte_offset(self) -> Optional[int]:
+        """Obtain the position in the file of the current position, in bytes.
+
+        :return: None if it cannot be told, i.e. if characters of the chunk read into the buffer
+                 before the current position may not be single bytes
+        """
+        if not self.seekable:
+            return None
+        index, position = [chunk for chunk in self.chunks if chunk[0] <= self.pos][-1]
+        # Positions of text files are only byte offsets when the decoder holds no partial character
+        if position >= 1 << 64:
+            return None
+        start = self.single_bytes[1] if self.single_bytes is not None and self.single_bytes[0] == position else 0
+        if not _single_bytes(self.buffer[index + start:self.pos]):
+            return None
+        self.single_bytes = position, self.pos - index
+        return position + self.pos - index
+
+    def read_header(self, keys: Tuple[str, ...]) -> Dict:
+        """Parse the given keys of the object the json text holds, skipping the values of other keys.
+
+        Reading stops at the first other key following 'versions', which models are written with
+        after their other header keys (see `HEADER_KEYS`), so that the rest of the text is not read.
+        """
+        header = {}
+        if self._peek() != '{':
+            self._error('Expecting object')
+        self.pos += 1
+        if self._peek() == '}':
+            return header
+        while True:
+            if self._peek() != '"':
+                self._error('Expecting property name enclosed in double quotes')
+            key = self._read_string()
+            if self._peek() != ':':
+                self._error("Expecting ':' delimiter")
+            self.pos += 1
+            if key in keys:
+                header[key] = self._read_value()
+            elif 'versions' in header:
+                return header
+            else:
+                self._skip_value()
+            character = self._peek()
+            self.pos += 1
+            if character == '}':
+                return header
+            if character != ',':
+                self._error("Expecting ',' delimiter")
+
+    def _skip_value(self) -> None:
+        """Move past the value starting at the current position, without parsing the objects and lists it holds."""
+        character = self._peek()
+        if character == '{':
+            self._skim('{', '}')
+        elif character == '[':
+            self._skim('[', ']')
+        elif character == '"':
+            self._read_string()
+        else:
+            self._read_scalar()
+
+    def _skim(self, opening: str, closing: str) -> str:
+        """Obtain the text of the object or list starting at the current position, only checking its nesting."""
+        # Offset from the current position of the text skimmed so far, and its nesting depth
+        offset, depth = 0, 0
+        while True:
+            start = self.pos + offset
+            if start == len(self.buffer):
+                if not self._read_more():
+                    self._error('Unterminated value')
+                continue
+            quote = self.buffer.find('"', start)
+            end = len(self.buffer) if quote < 0 else quote
+            # The value can only end with a closing brace or bracket, once there are as many as opened
+            if self.buffer.count(closing, start, end) >= depth:
+                for index in range(start, end):
+                    character = self.buffer[index]
+                    if character == opening:
+                        depth += 1
+                    elif character == closing:
+                        depth -= 1
+                        if depth == 0:
+                            text, self.pos = self.buffer[self.pos:index + 1], index + 1
+                            return text
+            else:
+                depth += self.buffer.count(opening, start, end) - self.buffer.count(closing, start, end)
+            if quote < 0:
+                offset = end - self.pos
+                continue
+            string_end = _string_end(self.buffer, quote)
+            while string_end < 0:
+                # The string may continue past the buffer
+                quote -= self.pos
+                if not self._read_more():
+                    self._error('Unterminated string')
+                quote += self.pos
+                string_end = _string_end(self.buffer, quote)
+            offset = string_end - self.pos
+
+    def _read_string(self) -> str:
+        while True:
+            try:
+                value, self.pos = scanstring(self.buffer, self.pos + 1)
+                return value
+            except json.JSONDecodeError:
+                # The string may continue past the buffer
+                if not self._read_more():
+                    raise
+
+    def _read_scalar(self):
+        self._ensure(64)
+        for literal, value in _CONSTANTS.items():
+            if self.buffer.startswith(literal, self.pos):
+                self.pos += len(literal)
+                return value
+        match = NUMBER_RE.match(self.buffer, self.pos)
+        if match is None:
+            self._error('Expecting value')
+        if match.end() == len(self.buffer) and not self.eof:
+            # The number may continue past the buffer
+            self._ensure(len(self.buffer) - self.pos + 1)
+            match = NUMBER_RE.match(self.buffer, self.pos)
+        integer, fraction, exponent = match.groups()
+        self.pos = match.end()
+        if fraction or exponent:
+            return float(integer + (fraction or '') + (exponent or ''))
+        return int(integer)
+
+    def _read_numeric_array(self) -> Union[np.ndarray, list, None]:
+        """Parse the list starting at the current position, into an array if it is a large rectangular list of numbers.
+
+        Numbers are parsed block by block as the text is read. If the list turns out not to form an array,
+        the file is read again from the start of the list (or, if it is not seekable, the text of the list
+        is kept in the buffer) so that it can be parsed as any other list.
+
+        :return: None if the list is to be parsed as any other list, a list if it is small
+        """
+        self._ensure(max(MIN_ARRAY_LENGTH, 64))
+        if _NUMBER_START.match(self.buffer, self.pos) is None:
+            return None
+        start = self._tell()
+        # Offset from the current position of the text parsed so far, which is only kept if the file is not seekable
+        offset, depth, block_size = 0, 0, max(READ_SIZE, MIN_ARRAY_LENGTH)
+        blocks, skeletons, is_float = [], [], False
+        while depth > 0 or not blocks:
+            if self.pos + offset == len(self.buffer) and not self._read_more():
+                return self._restart(start)
+            block_start = self.pos + offset
+            block_end = min(len(self.buffer), block_start + block_size)
+            valid_end = _ARRAY_CHARACTERS.match(self.buffer, block_start, block_end).end()
+            block = self.buffer[block_start:valid_end].encode('ascii')
+            steps = np.frombuffer(block.translate(_BRACKET_STEPS), dtype=np.int8) - 1
+            depths = np.cumsum(steps, dtype=np.int16) + depth
+            closed = np.flatnonzero(depths == 0)
+            if len(closed) > 0:
+                # End of the list
+                cut = int(closed[0]) + 1
+            elif valid_end < block_end:
+                return self._restart(start)
+            else:
+                # Numbers are not split between blocks
+                cut = max(block.rfind(b']'), block.rfind(b',')) + 1
+                if cut == 0:
+                    # Block within a number, to be extended
+                    if block_end == len(self.buffer) and not self._read_more():
+                        return self._restart(start)
+                    block_size *= 2
+                    continue
+            block = block[:cut]
+            depth = int(depths[cut - 1])
+            if not blocks and depth == 0 and cut < MIN_ARRAY_LENGTH:
+                # Small lists are parsed as lists, now that they are known to be in the buffer
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+                self.pos = end
+                return value
+            if start is None:
+                offset += cut
+            else:
+                self.pos += cut
+            skeletons.append(block.translate(None, _NUMBER_CHARACTERS))
+            if not is_float and _FLOAT_CHARACTERS.search(block) is not None:
+                is_float = True
+            elif not is_float and _LARGE_INTEGER.search(block) is not None:
+                return self._restart(start)
+            blocks.append(_parse_numbers(block, is_float))
+            if blocks[-1] is None:
+                return self._restart(start)
+
+        shape = _rectangular_shape(b''.join(skeletons))
+        array = np.concatenate(blocks).astype(np.float64 if is_float else np.int64, copy=False)
+        if shape is None or array.size != np.prod(shape):
+            return self._restart(start)
+        self.pos += offset
+        return array.reshape(shape)
+
+    def _restart(self, start: Optional[Tuple[int, int]]) -> None:
+        """Return to the start of a list that does not form an array, unless its text was kept in the buffer."""
+        if start is not None:
+            self._seek(*start)
+        return None
+
+
+def _single_bytes(text: str) -> bool:
+    """Determine if the characters of text read from a file are single bytes, newlines being possibly translated."""
+    return text.isascii() and '\n' not in text
+
+
+def _string_end(text: str, quote: int) -> int:
+    """Obtain the position following the end of the string starting at a quote, -1 if it continues past the text."""
+    end = text.find('"', quote + 1)
+    while end >= 0:
+        # The quote is escaped if preceded by an odd number of backslashes
+        backslash = end - 1
+        while text[backslash] == '\\':
+            backslash -= 1
+        if (end - backslash) % 2:
+            return end + 1
+        end = text.find('"', end + 1)
+    return -1
+
+
+def _parse_numbers(block: bytes, is_float: bool) -> Optional[np.ndarray]:
+    """Parse the numbers of a block of nested lists into a flat array.
+
+    :param block: part of nested lists of numbers, not splitting numbers
+    :param is_float: whether numbers are parsed as floats rather than integers
+    :return: None if the block does not only hold comma-separated numbers
+    """
+    numbers = block.translate(_BRACKETS_TO_SPACES).strip(b' ,\t\n\r')
+    if not numbers:
+        return np.empty(0, dtype=np.float64 if is_float else np.int64)
+    with warnings.catch_warnings():
+        # Parsing stops at the first invalid number with a warning
+        warnings.simplefilter('error')
+        try:
+            return np.fromstring(numbers, dtype=np.float64 if is_float else np.int64, sep=',')
+        except (DeprecationWarning, ValueError):
+            return None
+
+
+def _rectangular_shape(skeleton: bytes) -> Optional[tuple]:
+    """Determine the shape of the array formed by nested lists, if they are rectangular.
+
+    :param skeleton: brackets and commas of the nested lists, without their numbers
+    :return: None if the lists are ragged
+    """
+    n_dims = len(skeleton) - len(skeleton.lstrip(b'['))
+    # Length of the skeleton of the first list of each depth, from the innermost one
+    lengths = []
+    for n_closed in range(1, n_dims + 1):
+        end = skeleton.find(b']' * n_closed)
+        if end < 0:
+            return None
+        lengths.append(end + n_closed - (n_dims - n_closed))
+    shape = [max(1, lengths[0] - 1)]
+    for length, item_length in zip(lengths[1:], lengths):
+        shape.insert(0, (length - 1) // (item_length + 1))
+    # Nested lists are rectangular if their skeleton is the one of an array of that shape
+    expected = b'[' + b','.join([b''] * shape[-1]) + b']'
+    for size in reversed(shape[:-1]):
+        expected = b'[' + b','.join([expected] * size) + b']'
+    return tuple(shape) if skeleton == expected else None
+
+
+def read_json(fp: TextIO, defer_members: bool = False, source=None):
+    """Parse a serialized model from a json file, reading large lists of numbers directly into arrays.
+
+    :param fp: text file to read the serialized model from
+    :param defer_members: if True, members of ensembles are left unparsed, for workers to parse them
+                          or to be deserialized lazily
+    :param source: path of the file, if uncompressed, for members left unparsed to be read from it when needed
+    """
+    return JSONStreamReader(fp, defer_members, source).read()
+
+
+def read_header(fp: TextIO, keys: Tuple[str, ...]) -> Dict:
+    """Parse the given keys of a serialized model from a json file, skipping the values of other keys.
+
+    :param fp: text file to read the serialized model from
+    :param keys: keys of the model to parse
+    """
+    return JSONStreamReader(fp).read_header(keys)
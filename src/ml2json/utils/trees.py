@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+from sklearn.tree import BaseDecisionTree
+from sklearn.tree._tree import NODE_DTYPE
+
+from .arrays import _array_store, _is_binary_array, _is_binary_dtype, encode_array, decode_array, is_serialized_array
+from .config import config_context, get_config
+from .parallel import serialize_members, deserialize_members
+from .precision import FULL_PRECISION
+
+
+# Tag of the trees of forests stored packed (see `serialize_forest`)
+PACKED_META = 'packed-trees'
+# Fields of serialized trees computed by scikit-learn from the tree, left out of packed forests
+_DERIVED_FIELDS = ('feature_importances_',)
+# Fields of the state of serialized trees, as obtained with `serialize_tree`
+_TREE_FIELDS = {'max_depth', 'node_count', 'nodes', 'values', 'nodes_dtype'}
+
+
+def serialize_nodes(nodes: np.ndarray) -> Dict:
+    """Serialize the nodes of a scikit-learn `Tree` column-wise, as one array per field.
+
+    Fields are exported exactly whatever the `float_precision` option, rounded thresholds changing predictions.
+
+    :param nodes: structured array of the nodes
+    """
+    with config_context(float_precision=FULL_PRECISION):
+        return {name: encode_array(np.ascontiguousarray(nodes[name])) for name in nodes.dtype.names}
+
+
+def deserialize_nodes(value, formats: List[str], names: List[str]) -> np.ndarray:
+    """Instantiate the nodes of a scikit-learn `Tree`, serialized column-wise or as a structured array.
+
+    Columns are assigned to a structured array of the nodes of the installed version of scikit-learn,
+    fields it does not know being ignored and fields missing from the file left to zero.
+
+    :param value: serialized nodes
+    :param formats: dtypes of the fields, in order
+    :param names: names of the fields of nodes serialized as a structured array (by earlier versions of ml2json)
+    """
+    if not isinstance(value, dict) or is_serialized_array(value):
+        return decode_array(value, dtype=np.dtype({'names': names, 'formats': formats}))
+    columns = {name: decode_array(column, dtype=dtype) for (name, column), dtype in zip(value.items(), formats)}
+    nodes = np.zeros(len(next(iter(columns.values()), ())), dtype=NODE_DTYPE)
+    for name, column in columns.items():
+        if name in NODE_DTYPE.names:
+            nodes[name] = column
+    return nodes
+
+
+def serialize_forest(serializer: Callable, trees: Iterable) -> Union[List, Dict]:
+    """Serialize the decision trees of an ensemble, according to the `forest_format` option.
+
+    With 'trees', each tree is serialized on its own (see `serialize_members`). With 'packed', fields holding
+    the same value in all trees (e.g. `classes_`) are stored once, those differing (e.g. the `random_state`
+    of each tree) as the overrides of each tree, and the nodes and values of all trees are concatenated
+    into a few large arrays, delimited by the offsets of the first node of each tree.
+    Trees are serialized on their own if they cannot be packed (e.g. values of different shapes).
+
+    :param serializer: module-level function serializing a tree
+    :param trees: decision trees of the ensemble
+    """
+    trees = list(trees)
+    if get_config()['forest_format'] != 'packed' or not all(isinstance(tree, BaseDecisionTree) for tree in trees):
+        return serialize_members(serializer, trees)
+    # Arrays are kept as they are while serializing the trees, to be concatenated before being encoded
+    token = _array_store.set(_ArrayCollector())
+    try:
+        members = [serializer(tree) for tree in trees]
+    finally:
+        _array_store.reset(token)
+    packed = _pack(members)
+    return packed if packed is not None else serialize_members(serializer, trees)
+
+
+def deserialize_forest(deserializer: Callable, value, lazy: bool = False) -> Sequence:
+    """Deserialize the decision trees of an ensemble, serialized with `serialize_forest`.
+
+    The arrays of packed forests are decoded at once, each tree being restored from slices of them.
+
+    :param deserializer: module-level function deserializing a tree
+    :param value: serialized trees, either a list or a packed forest
+    :param lazy: whether the ensemble supports trees being deserialized on first access (see `deserialize_members`)
+    """
+    if not isinstance(value, dict) or value.get('meta') != PACKED_META:
+        return deserialize_members(deserializer, value, lazy=lazy)
+    from .lazy import LazyMembers, _lazy_loading
+
+    forest = PackedForest(value)
+    trees = [PackedTree(forest, index) for index in range(len(forest))]
+    if lazy and _lazy_loading.get() and trees:
+        return LazyMembers(deserializer, trees)
+    return deserialize_members(deserializer, [tree.parse() for tree in trees])
+
+
+class PackedForest:
+    """Decision trees of a packed forest, their shared fields, overrides, nodes and values being decoded once.
+
+    :param forest_dict: packed forest, as serialized by `serialize_forest`
+    """
+
+    def __init__(self, forest_dict: Dict):
+        self.shared = forest_dict['shared']
+        self.offsets = decode_array(forest_dict['node_offsets'], dtype=np.int64)
+        self.overrides = forest_dict.get('overrides', [{}] * (len(self.offsets) - 1))
+        self.max_depth = decode_array(forest_dict['max_depth'], dtype=np.int64)
+        self.nodes_dtype = forest_dict['nodes_dtype']
+        self.nodes = {name: decode_array(column, dtype=dtype)
+                      for (name, column), dtype in zip(forest_dict['nodes'].items(), self.nodes_dtype)}
+        self.values = decode_array(forest_dict['values'], dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def tree_dict(self, index: int) -> Dict:
+        """Obtain a tree of the forest as serialized on its own, its nodes and values being slices of the forest's."""
+        start, end = int(self.offsets[index]), int(self.offsets[index + 1])
+        tree_dict = _merge(self.shared, self.overrides[index])
+        tree_dict['tree_'] = {
+            'max_depth': int(self.max_depth[index]),
+            'node_count': end - start,
+            'nodes': {name: column[start:end] for name, column in self.nodes.items()},
+            'values': self.values[start:end],
+            'nodes_dtype': self.nodes_dtype,
+        }
+        return tree_dict
+
+
+class PackedTree:
+    """Tree of a packed forest, sliced out of the forest when parsed (see `LazyMembers`).
+
+    :param forest: packed forest holding the tree
+    :param index: position of the tree in the forest
+    """
+
+    __slots__ = ('forest', 'index')
+
+    def __init__(self, forest: PackedForest, index: int):
+        self.forest = forest
+        self.index = index
+
+    def parse(self) -> Dict:
+        """Obtain the tree as serialized on its own."""
+        return self.forest.tree_dict(self.index)
+
+
+class _ArrayCollector:
+    """Array store keeping numeric arrays as they are, instead of encoding them."""
+
+    raw_bytes = True
+    # Arrays keep their dtype, being encoded again once concatenated
+    keeps_dtype = True
+
+    def accepts(self, array: np.ndarray) -> bool:
+        return _is_binary_dtype(array.dtype)
+
+    def add(self, array: np.ndarray) -> np.ndarray:
+        return array
+
+
+def _pack(members: List[Dict]) -> Optional[Dict]:
+    """Pack trees serialized with their arrays kept as they are, or obtain None if they cannot be packed."""
+    if not members or any(set(member.get('tree_', ())) != _TREE_FIELDS for member in members):
+        return None
+    trees = [member.pop('tree_') for member in members]
+    for member in members:
+        for field in _DERIVED_FIELDS:
+            member.pop(field, None)
+    shared = members[0]
+    overrides = [_difference(member, shared) for member in members]
+    values = [tree['values'] for tree in trees]
+    if (any(override is None for override in overrides)
+            or any(tree['nodes_dtype'] != trees[0]['nodes_dtype'] for tree in trees)
+            or any(value.shape[1:] != values[0].shape[1:] for value in values)):
+        return None
+    offsets = np.cumsum([0] + [tree['node_count'] for tree in trees], dtype=np.int64)
+    with config_context(float_precision=FULL_PRECISION):
+        nodes = {name: encode_array(np.concatenate([tree['nodes'][name] for tree in trees]))
+                 for name in trees[0]['nodes']}
+    packed = {
+        'meta': PACKED_META,
+        'shared': _encode(shared),
+        'node_offsets': encode_array(offsets),
+        'max_depth': encode_array(np.array([tree['max_depth'] for tree in trees], dtype=np.int64)),
+        'nodes_dtype': trees[0]['nodes_dtype'],
+        'nodes': nodes,
+        'values': encode_array(np.concatenate(values)),
+    }
+    if any(overrides):
+        packed['overrides'] = [_encode(override) for override in overrides]
+    return packed
+
+
+def _difference(value: Dict, reference: Dict) -> Optional[Dict]:
+    """Obtain the fields of a dictionary differing from those of a reference, recursively,
+    or None if the reference has fields the dictionary does not have."""
+    if not set(reference) <= set(value):
+        return None
+    difference = {}
+    for key, item in value.items():
+        if key not in reference:
+            difference[key] = item
+        elif isinstance(item, dict) and isinstance(reference[key], dict):
+            nested = _difference(item, reference[key])
+            if nested is None:
+                return None
+            if nested:
+                difference[key] = nested
+        elif not _equal(item, reference[key]):
+            difference[key] = item
+    return difference
+
+
+def _equal(value, reference) -> bool:
+    if isinstance(value, np.ndarray) or isinstance(reference, np.ndarray):
+        return (isinstance(value, np.ndarray) and isinstance(reference, np.ndarray)
+                and value.dtype == reference.dtype and np.array_equal(value, reference))
+    if isinstance(value, (list, tuple)) and isinstance(reference, (list, tuple)):
+        return (type(value) is type(reference) and len(value) == len(reference)
+                and all(_equal(item, other) for item, other in zip(value, reference)))
+    if isinstance(value, dict) and isinstance(reference, dict):
+        return value.keys() == reference.keys() and all(_equal(value[key], reference[key]) for key in value)
+    if value is reference:
+        return True
+    try:
+        return bool(type(value) is type(reference) and value == reference)
+    except (TypeError, ValueError):
+        return False
+
+
+def _encode(value):
+    """Encode the arrays kept as they are in a serialized value."""
+    if isinstance(value, np.ndarray):
+        return encode_array(value)
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _merge(value: Dict, override: Dict) -> Dict:
+    """Obtain a copy of a dictionary with fields overridden, recursively, arrays being replaced as a whole."""
+    merged = dict(value)
+    for key, item in override.items():
+        if isinstance(item, dict) and not _is_binary_array(item) and isinstance(merged.get(key), dict):
+            item = _merge(merged[key], item)
+        merged[key] = item
+    return merged
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+import os
+import asyncio
+import multiprocessing
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+
+from src import ml2json
+from src.ml2json.utils.lazy import LazyMembers
+
+
+class TestAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.y = load_iris(return_X_y=True)
+
+    def test_round_trip(self):
+        model = LogisticRegression().fit(self.X, self.y)
+
+        async def round_trip():
+            with ml2json.config_context(array_encoding='base64'):
+                await ml2json.ato_json(model, 'aio.json')
+            return await ml2json.afrom_json('aio.json')
+
+        loaded_model = asyncio.run(round_trip())
+        with open('aio.json') as file:
+            self.assertIn('"data"', file.read())
+        os.remove('aio.json')
+        np.testing.assert_array_equal(loaded_model.predict(self.X), model.predict(self.X))
+
+    def test_process_options(self):
+        # Options of the caller reach worker processes, started afresh with 'spawn'
+        model = LogisticRegression().fit(self.X, self.y)
+
+        async def write():
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+                with ml2json.config_context(array_encoding='base64'):
+                    await ml2json.ato_json(model, 'aio-spawn.json', executor=executor)
+
+        asyncio.run(write())
+        with open('aio-spawn.json') as file:
+            self.assertIn('"data"', file.read())
+        os.remove('aio-spawn.json')
+
+    def test_many(self):
+        models = [LogisticRegression(C=c).fit(self.X, self.y) for c in (0.1, 1.0)]
+        paths = ['aio-0.json', 'aio-1.json']
+        for model, path in zip(models, paths):
+            ml2json.to_json(model, path)
+
+        forest = RandomForestClassifier(n_estimators=5, random_state=0).fit(self.X, self.y)
+        ml2json.to_json(forest, 'aio-forest.json')
+
+        async def load():
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                loaded = await ml2json.afrom_json_many(paths, executor=executor)
+            missing = await ml2json.afrom_json_many(['aio-missing.json'], return_exceptions=True)
+            lazy = await ml2json.afrom_json_many(['aio-forest.json'], lazy=True)
+            return loaded, missing, lazy
+
+        loaded_models, missing, lazy = asyncio.run(load())
+        for model, loaded_model in zip(models, loaded_models):
+            np.testing.assert_array_equal(loaded_model.predict(self.X), model.predict(self.X))
+        self.assertIsInstance(missing[0], FileNotFoundError)
+        self.assertIsInstance(lazy[0].estimators_, LazyMembers)
+        np.testing.assert_array_equal(lazy[0].predict(self.X), forest.predict(self.X))
+        for path in paths + ['aio-forest.json']:
+            os.remove(path)
+
+    def test_cancel(self):
+        model = RandomForestClassifier(n_estimators=200, random_state=0).fit(self.X, self.y)
+
+        async def write_cancelled():
+            task = asyncio.ensure_future(ml2json.ato_json(model, 'aio-cancelled.json'))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            # The worker stops at its next check, removing the incomplete file
+            for _ in range(100):
+                if not os.path.exists('aio-cancelled.json'):
+                    break
+                await asyncio.sleep(0.05)
+
+        asyncio.run(write_cancelled())
+        self.assertFalse(os.path.exists('aio-cancelled.json'))
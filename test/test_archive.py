@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import zipfile
+import unittest
+
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.neighbors import KNeighborsClassifier, NearestNeighbors
+
+from src import ml2json
+
+
+class TestAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.y = load_iris(return_X_y=True)
+
+    def check_model(self, model, model_name, **kwargs):
+        expected_predictions = model.fit(self.X, self.y).predict(self.X)
+
+        ml2json.to_archive(model, model_name, **kwargs)
+        with zipfile.ZipFile(model_name) as archive:
+            manifest = json.loads(archive.read('model.json'))
+            members = archive.infolist()
+        deserialized_model = ml2json.from_archive(model_name)
+        os.remove(model_name)
+
+        np.testing.assert_array_equal(deserialized_model.predict(self.X), expected_predictions)
+        return manifest, members
+
+    def test_nearest_neighbors(self):
+        manifest, members = self.check_model(KNeighborsClassifier(), 'knn.zip')
+        self.assertEqual(manifest['meta'], 'nearest-neighbour-classifier')
+        self.assertRegex(manifest['_fit_X']['file'], r'^arrays/\d+\.npy$')
+        self.assertEqual(manifest['_fit_X']['shape'], list(self.X.shape))
+        # Members are not compressed by default
+        self.assertTrue(all(member.compress_type == zipfile.ZIP_STORED for member in members))
+
+    def test_random_forest(self):
+        _, members = self.check_model(RandomForestClassifier(n_estimators=10, random_state=0), 'rf.zip',
+                                         inline_threshold=0, compress=True)
+        self.assertGreater(len(members), 10)
+        self.assertTrue(all(member.compress_type == zipfile.ZIP_DEFLATED for member in members))
+
+    def test_inline_threshold(self):
+        manifest, members = self.check_model(KNeighborsClassifier(), 'knn.zip', inline_threshold=self.X.nbytes + 1)
+        self.assertEqual([member.filename for member in members], ['model.json'])
+        self.assertEqual(manifest['_fit_X'], self.X.tolist())
+
+    def test_single_thread(self):
+        model = RandomForestClassifier(n_estimators=5, random_state=0).fit(self.X, self.y)
+        ml2json.to_archive(model, 'rf.zip')
+        deserialized_model = ml2json.from_archive('rf.zip', n_jobs=1)
+        os.remove('rf.zip')
+        np.testing.assert_array_equal(deserialized_model.predict(self.X), model.predict(self.X))
+
+    def test_memory_mapping(self):
+        model = NearestNeighbors(algorithm='kd_tree').fit(self.X)
+        ml2json.to_archive(model, 'nn.zip')
+        deserialized_model = ml2json.from_archive('nn.zip', mmap_mode='r')
+
+        self.assertIsInstance(deserialized_model._fit_X, np.memmap)
+        self.assertFalse(deserialized_model._fit_X.flags.writeable)
+        np.testing.assert_array_equal(deserialized_model._fit_X, self.X)
+        np.testing.assert_array_equal(deserialized_model.kneighbors(self.X)[1], model.kneighbors(self.X)[1])
+        del deserialized_model
+        os.remove('nn.zip')
+
+    def test_memory_mapping_compressed(self):
+        model = NearestNeighbors().fit(self.X)
+        ml2json.to_archive(model, 'nn.zip', compress=True)
+        deserialized_model = ml2json.from_archive('nn.zip', mmap_mode='r')
+        with self.assertRaises(ValueError):
+            ml2json.from_archive('nn.zip', mmap_mode='w+')
+        os.remove('nn.zip')
+
+        # Compressed members are read into memory
+        self.assertNotIsInstance(deserialized_model._fit_X, np.memmap)
+        np.testing.assert_array_equal(deserialized_model._fit_X, self.X)
+
+    def test_reference_outside_archive(self):
+        model = KNeighborsClassifier().fit(self.X, self.y)
+        ml2json.to_archive(model, 'knn.zip')
+        with zipfile.ZipFile('knn.zip') as archive:
+            manifest = json.loads(archive.read('model.json'))
+        os.remove('knn.zip')
+        with self.assertRaises(ValueError):
+            ml2json.from_dict(manifest)
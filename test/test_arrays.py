@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import unittest
+
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.cluster import DBSCAN
+from sklearn.ensemble import (BaggingClassifier, BaggingRegressor, ExtraTreesClassifier, ExtraTreesRegressor,
+                              RandomForestClassifier, RandomForestRegressor)
+from sklearn.svm import SVC
+
+from src import ml2json
+from src.ml2json.utils.arrays import encode_array, decode_array
+from src.ml2json.utils.boosters import encode_bytes, decode_bytes
+
+
+class TestAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.y = load_iris(return_X_y=True)
+
+    def test_default_encoding(self):
+        array = np.arange(6, dtype=np.int32).reshape(2, 3)
+        self.assertEqual(ml2json.get_config()['array_encoding'], 'list')
+        self.assertEqual(encode_array(array), [[0, 1, 2], [3, 4, 5]])
+        np.testing.assert_array_equal(decode_array(encode_array(array)), array)
+
+    def test_base64_encoding(self):
+        arrays = [np.random.rand(3, 4).astype(np.float32),
+                  np.arange(10, dtype=np.int32),
+                  np.array([True, False]),
+                  np.array([[1 + 2j]]),
+                  np.empty((0, 3)),
+                  np.arange(8, dtype='>i4'),
+                  np.asfortranarray(np.random.rand(3, 2)),
+                  np.array([(1, 2.5), (3, 4.5)], dtype=[('a', np.int64), ('b', np.float64)])]
+        with ml2json.config_context(array_encoding='base64'):
+            for array in arrays:
+                encoded = json.loads(json.dumps(encode_array(array)))
+                self.assertEqual(encoded['meta'], 'ndarray')
+                decoded = decode_array(encoded)
+                self.assertEqual(decoded.dtype, array.dtype.newbyteorder('='))
+                np.testing.assert_array_equal(decoded, array)
+                self.assertTrue(decoded.flags.writeable)
+            # Non-numeric arrays are kept as lists
+            self.assertEqual(encode_array(np.array(['a', 'b'])), ['a', 'b'])
+        self.assertEqual(ml2json.get_config()['array_encoding'], 'list')
+
+    def test_bytes(self):
+        data = bytes(range(256)) * 3
+        # Bytes are encoded in base64 whatever the array encoding
+        encoded = json.loads(json.dumps(encode_bytes(data)))
+        self.assertEqual(encoded['dtype'], '|u1')
+        self.assertEqual(decode_bytes(encoded), data)
+        with self.assertRaises(ValueError):
+            ml2json.set_config(booster_format='ubj')
+
+    def test_invalid_encoding(self):
+        with self.assertRaises(ValueError):
+            ml2json.set_config(array_encoding='hex')
+
+    def check_model(self, model, model_name):
+        expected_predictions = model.fit(self.X, self.y).predict(self.X)
+
+        with ml2json.config_context(array_encoding='base64'):
+            ml2json.to_json(model, model_name)
+        # Arrays are detected when reading, whatever the current configuration
+        deserialized_model = ml2json.from_json(model_name)
+        os.remove(model_name)
+
+        np.testing.assert_array_equal(deserialized_model.predict(self.X), expected_predictions)
+        return deserialized_model
+
+    def test_svm(self):
+        model = self.check_model(SVC(), 'svm-base64.json')
+        self.assertEqual(model.support_.dtype, np.int32)
+        self.assertEqual(model.support_vectors_.dtype, np.float64)
+
+    def test_random_forest(self):
+        self.check_model(RandomForestClassifier(n_estimators=5, random_state=0), 'rf-base64.json')
+
+    def test_fitted_arrays(self):
+        # Arrays that predictions do not depend on are decoded as well
+        models = [(RandomForestClassifier(n_estimators=5, oob_score=True, random_state=0), 'oob_decision_function_'),
+                  (ExtraTreesClassifier(n_estimators=5, bootstrap=True, oob_score=True, random_state=0),
+                   'oob_decision_function_'),
+                  (BaggingClassifier(n_estimators=5, oob_score=True, random_state=0), 'oob_decision_function_'),
+                  (RandomForestRegressor(n_estimators=5, oob_score=True, random_state=0), 'oob_prediction_'),
+                  (ExtraTreesRegressor(n_estimators=5, bootstrap=True, oob_score=True, random_state=0),
+                   'oob_prediction_'),
+                  (BaggingRegressor(n_estimators=5, oob_score=True, random_state=0), 'oob_prediction_'),
+                  (DBSCAN(), 'core_sample_indices_')]
+        for model, attribute in models:
+            model.fit(self.X, self.y)
+            with ml2json.config_context(array_encoding='base64'):
+                ml2json.to_json(model, 'fitted-base64.json')
+            deserialized_model = ml2json.from_json('fitted-base64.json')
+            os.remove('fitted-base64.json')
+            self.assertIsInstance(getattr(deserialized_model, attribute), np.ndarray)
+            np.testing.assert_array_equal(getattr(deserialized_model, attribute), getattr(model, attribute))
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import os
+import unittest
+
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.linear_model import LogisticRegression
+from sklearn.tree import DecisionTreeClassifier
+
+from src import ml2json
+
+
+class TestAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.y = load_iris(return_X_y=True)
+        self.models = [LogisticRegression(C=c).fit(self.X, self.y) for c in (0.1, 1.0)]
+        self.models.append(DecisionTreeClassifier(random_state=0).fit(self.X, self.y))
+        self.paths = [f'batch-{i}.json' for i in range(len(self.models))]
+
+    def tearDown(self):
+        for path in self.paths + ['batch-missing.json']:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_batch(self):
+        for backend in ('process', 'thread'):
+            results = list(ml2json.to_json_many(zip(self.models, self.paths), n_jobs=2, backend=backend))
+            self.assertEqual(sorted(result.path for result in results), self.paths)
+            self.assertTrue(all(result.error is None for result in results))
+
+            results = {result.path: result for result in ml2json.from_json_many(self.paths, n_jobs=2, backend=backend)}
+            for model, path in zip(self.models, self.paths):
+                self.assertIsNone(results[path].error)
+                np.testing.assert_array_equal(results[path].model.predict(self.X), model.predict(self.X))
+
+    def test_errors(self):
+        ml2json.to_json(self.models[0], self.paths[0])
+        results = list(ml2json.from_json_many([self.paths[0], 'batch-missing.json'], backend='thread'))
+        errors = {result.path: result.error for result in results}
+        self.assertIsNone(errors[self.paths[0]])
+        self.assertIsInstance(errors['batch-missing.json'], FileNotFoundError)
+        with self.assertRaises(ValueError):
+            ml2json.from_json_many(self.paths, backend='gpu')
+        with self.assertRaises(ValueError):
+            ml2json.to_json_many(zip(self.models, self.paths), n_jobs=0)
+        with self.assertRaises(ValueError):
+            ml2json.from_json_many(self.paths, n_jobs=0)
+
+    def test_priority(self):
+        list(ml2json.to_json_many(zip(self.models, self.paths), n_jobs=1, backend='thread'))
+        # With a single worker, files are read in order of priority
+        results = ml2json.from_json_many(self.paths, n_jobs=1, backend='thread', priority=self.paths.index)
+        self.assertEqual([result.path for result in results], self.paths[::-1])
+
+    def test_config(self):
+        with ml2json.config_context(array_encoding='base64'):
+            list(ml2json.to_json_many([(self.models[0], self.paths[0])], n_jobs=1))
+        with open(self.paths[0]) as file:
+            self.assertIn('"data"', file.read())
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+import os
+import time
+import shutil
+import unittest
+import threading
+from unittest import mock
+
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+
+from src import ml2json
+from src.ml2json.utils.cache import estimate_size
+
+
+class TestAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.y = load_iris(return_X_y=True)
+        self.forest = RandomForestClassifier(n_estimators=10, random_state=0).fit(self.X, self.y)
+        self.linear = LogisticRegression(max_iter=1000).fit(self.X, self.y)
+        ml2json.to_json(self.forest, 'forest-cache.json')
+        ml2json.to_json(self.linear, 'linear-cache.json')
+
+    def tearDown(self):
+        for path in ('forest-cache.json', 'linear-cache.json', 'copy-cache.json'):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_hits(self):
+        cache = ml2json.ModelCache()
+        model = cache.from_json('forest-cache.json')
+        self.assertIs(cache.from_json('forest-cache.json'), model)
+        np.testing.assert_array_equal(model.predict(self.X), self.forest.predict(self.X))
+        info = cache.cache_info()
+        self.assertEqual((info.hits, info.misses, info.evictions, info.n_models), (1, 1, 0, 1))
+        self.assertEqual(info.n_bytes, estimate_size(model))
+
+        # The model is loaded again once its file changes
+        ml2json.to_json(self.linear, 'forest-cache.json')
+        os.utime('forest-cache.json', ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+        self.assertIsInstance(cache.from_json('forest-cache.json'), LogisticRegression)
+
+    def test_content_hash(self):
+        shutil.copy('forest-cache.json', 'copy-cache.json')
+        cache = ml2json.ModelCache(key='hash')
+        self.assertIs(cache.from_json('forest-cache.json'), cache.from_json('copy-cache.json'))
+        with self.assertRaises(ValueError):
+            ml2json.ModelCache(key='path')
+
+    def test_eviction(self):
+        cache = ml2json.ModelCache(max_models=1)
+        cache.from_json('forest-cache.json')
+        cache.from_json('linear-cache.json')
+        cache.from_json('forest-cache.json')
+        self.assertEqual(cache.cache_info()[:4], (0, 3, 2, 1))
+
+        # Models larger than the memory budget are not kept
+        linear_size = estimate_size(ml2json.from_json('linear-cache.json'))
+        self.assertLess(linear_size, estimate_size(self.forest))
+        cache = ml2json.ModelCache(max_bytes=2 * linear_size)
+        model = cache.from_json('linear-cache.json')
+        cache.from_json('forest-cache.json')
+        self.assertIs(cache.from_json('linear-cache.json'), model)
+        self.assertEqual(cache.cache_info()[:4], (1, 2, 0, 1))
+
+    def test_single_flight(self):
+        cache = ml2json.ModelCache()
+        models = []
+        load = lambda *args: time.sleep(0.2) or self.linear
+        with mock.patch('src.ml2json.ml2json.from_json', side_effect=load) as loader:
+            threads = [threading.Thread(target=lambda: models.append(cache.from_json('linear-cache.json')))
+                       for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(loader.call_count, 1)
+        self.assertEqual(models, [self.linear] * 4)
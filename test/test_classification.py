@@ -40,6 +40,7 @@ except:
     pass
 
 from src import ml2json
+from src.ml2json.utils.arrays import encode_array
 
 
 class TestAPI(unittest.TestCase):
@@ -200,6 +201,26 @@ class TestAPI(unittest.TestCase):
         self.check_model(DecisionTreeClassifier(), 'dt.json')
         self.check_sparse_model(DecisionTreeClassifier(), 'dt.json')
 
+    def test_decision_tree_nodes(self):
+        model = DecisionTreeClassifier(random_state=0).fit(self.X, self.y)
+        nodes = model.tree_.__getstate__()['nodes']
+
+        # Nodes stored column-wise, thresholds exactly whatever the precision of floats
+        with ml2json.config_context(float_precision=3):
+            serialized_model = ml2json.to_dict(model)
+        self.assertEqual(list(serialized_model['tree_']['nodes']), list(nodes.dtype.names))
+        deserialized_model = ml2json.from_dict(serialized_model)
+        for name in nodes.dtype.names:
+            np.testing.assert_array_equal(deserialized_model.tree_.__getstate__()['nodes'][name], nodes[name])
+
+        # Nodes stored as a structured array by earlier versions
+        for array_encoding in ('list', 'base64'):
+            with ml2json.config_context(array_encoding=array_encoding):
+                serialized_model = ml2json.to_dict(model)
+                serialized_model['tree_']['nodes'] = encode_array(nodes)
+            deserialized_model = ml2json.from_dict(serialized_model)
+            np.testing.assert_array_equal(deserialized_model.predict(self.X), model.predict(self.X))
+
     def test_extra_tree(self):
         self.check_model(ExtraTreeClassifier(), 'extra-tree.json')
         self.check_sparse_model(ExtraTreeClassifier(), 'extra-tree.json')
@@ -225,6 +246,12 @@ class TestAPI(unittest.TestCase):
         if 'XGBClassifier' in __optionals__:
             self.check_model(XGBClassifier(), 'xgb_classifier.json')
 
+    def test_xgboost_classifier_native(self):
+        if 'XGBClassifier' in __optionals__:
+            with ml2json.config_context(booster_format='native'):
+                self.check_model(XGBClassifier(), 'xgb_classifier_native.json')
+                self.assertEqual(ml2json.to_dict(XGBClassifier().fit(self.X, self.y))['booster_format'], 'ubj')
+
     def test_xgboost_rf_classifier(self):
         if 'XGBRFClassifier' in __optionals__:
             self.check_model(XGBRFClassifier(), 'xgb_rf_classifier.json')
@@ -264,6 +291,11 @@ class TestAPI(unittest.TestCase):
         if 'CatBoostClassifier' in __optionals__:
             self.check_model(CatBoostClassifier(allow_writing_files=False, verbose=False), 'catboost-cls.json')
 
+    def test_catboost_classifier_native(self):
+        if 'CatBoostClassifier' in __optionals__:
+            with ml2json.config_context(booster_format='native'):
+                self.check_model(CatBoostClassifier(allow_writing_files=False, verbose=False), 'catboost-cls-native.json')
+
     def test_adaboost_classifier(self):
         self.check_model(AdaBoostClassifier(n_estimators=25, learning_rate=1.0), 'adaboost-cls.json')
         self.check_sparse_model(AdaBoostClassifier(n_estimators=25, learning_rate=1.0), 'adaboost-cls.json')
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import unittest
+import importlib.util
+
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+
+from src import ml2json
+from src.ml2json.utils.compression import detect_compression
+
+__compressions__ = {'gzip': '.gz', 'bz2': '.bz2', 'xz': '.xz'}
+if importlib.util.find_spec('zstandard') is not None:
+    __compressions__['zstd'] = '.zst'
+
+
+class TestAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.y = load_iris(return_X_y=True)
+        self.model = RandomForestClassifier(n_estimators=5, random_state=0).fit(self.X, self.y)
+
+    def test_inferred_compression(self):
+        for backend in ('json', 'orjson') if importlib.util.find_spec('orjson') is not None else ('json',):
+            with ml2json.config_context(json_backend=backend):
+                for compression, extension in __compressions__.items():
+                    model_name = f'rf-compressed.json{extension}'
+                    ml2json.to_json(self.model, model_name)
+                    detected_compression = detect_compression(model_name)
+                    deserialized_model = ml2json.from_json(model_name)
+                    os.remove(model_name)
+
+                    self.assertEqual(detected_compression, compression)
+                    np.testing.assert_array_equal(deserialized_model.predict(self.X), self.model.predict(self.X))
+
+    def test_explicit_compression(self):
+        for compression in __compressions__:
+            ml2json.to_json(self.model, 'rf-compressed.json', compression=compression, compression_level=1)
+            detected_compression = detect_compression('rf-compressed.json')
+            model_dict = ml2json.json_to_dict('rf-compressed.json')
+            os.remove('rf-compressed.json')
+
+            self.assertEqual(detected_compression, compression)
+            self.assertEqual(json.dumps(model_dict), json.dumps(ml2json.to_dict(self.model)))
+        ml2json.to_json(self.model, 'rf-uncompressed.json.gz', compression=None)
+        detected_compression = detect_compression('rf-uncompressed.json.gz')
+        os.remove('rf-uncompressed.json.gz')
+        self.assertIsNone(detected_compression)
+
+    def test_compression_level(self):
+        sizes = []
+        for compression_level in (1, 9):
+            ml2json.dict_to_json(ml2json.to_dict(self.model), 'rf-level.json.gz', compression_level=compression_level)
+            sizes.append(os.path.getsize('rf-level.json.gz'))
+            os.remove('rf-level.json.gz')
+        self.assertGreater(sizes[0], sizes[1])
+
+    def test_invalid_compression(self):
+        with self.assertRaises(ValueError):
+            ml2json.to_json(self.model, 'rf-invalid.json', compression='zip')
+        self.assertFalse(os.path.exists('rf-invalid.json'))
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import unittest
+
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+
+from src import ml2json
+
+
+class TestAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.y = load_iris(return_X_y=True)
+        self.model = RandomForestClassifier(n_estimators=5, random_state=0).fit(self.X, self.y)
+
+    def test_bytes_io(self):
+        for compression in (None, 'gzip', 'xz'):
+            buffer = io.BytesIO()
+            ml2json.to_json(self.model, buffer, compression=compression)
+            self.assertFalse(buffer.closed)
+            buffer.seek(0)
+            model = ml2json.from_json(buffer)
+            np.testing.assert_array_equal(model.predict(self.X), self.model.predict(self.X))
+            buffer.seek(0)
+            self.assertEqual(ml2json.peek(buffer)['meta'], 'rf')
+
+    def test_text_io(self):
+        buffer = io.StringIO()
+        ml2json.to_json(self.model, buffer)
+        buffer.seek(0)
+        np.testing.assert_array_equal(ml2json.from_json(buffer, lazy=True).predict(self.X),
+                                      self.model.predict(self.X))
+        with self.assertRaises(ValueError):
+            ml2json.to_json(self.model, io.StringIO(), compression='gzip')
+
+    def test_named_file(self):
+        # The codec is inferred from the name of files opened by the caller
+        with open('file-object.json.gz', 'wb') as file:
+            ml2json.to_json(self.model, file)
+        with open('file-object.json.gz', 'rb') as file:
+            self.assertEqual(file.read(2), b'\x1f\x8b')
+            file.seek(0)
+            model = ml2json.from_json(file)
+        np.testing.assert_array_equal(model.predict(self.X), self.model.predict(self.X))
+        os.remove('file-object.json.gz')
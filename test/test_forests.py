@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+import os
+import unittest
+
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.ensemble import (BaggingClassifier, GradientBoostingRegressor, IsolationForest, RandomForestClassifier,
+                              RandomTreesEmbedding)
+from sklearn.linear_model import LogisticRegression
+
+from src import ml2json
+from src.ml2json.utils.arrays import decode_array
+from src.ml2json.utils.lazy import LazyMembers
+from src.ml2json.utils.trees import PACKED_META
+
+
+class TestAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.y = load_iris(return_X_y=True)
+
+    def check_packed(self, model, method='predict'):
+        for array_encoding in ('list', 'base64'):
+            with ml2json.config_context(forest_format='packed', array_encoding=array_encoding):
+                serialized_model = ml2json.to_dict(model)
+                ml2json.to_json(model, 'packed.json')
+            self.assertEqual(serialized_model['estimators_']['meta'], PACKED_META)
+            for deserialized_model in (ml2json.from_dict(serialized_model), ml2json.from_json('packed.json')):
+                expected, actual = getattr(model, method)(self.X), getattr(deserialized_model, method)(self.X)
+                if method == 'transform':
+                    expected, actual = expected.toarray(), actual.toarray()
+                np.testing.assert_array_equal(actual, expected)
+            os.remove('packed.json')
+        return serialized_model
+
+    def test_packed_random_forest(self):
+        model = RandomForestClassifier(n_estimators=10, random_state=0).fit(self.X, self.y)
+        trees = self.check_packed(model)['estimators_']
+
+        # Fields shared by the trees are stored once, the random states of the trees other than the first as overrides
+        self.assertEqual(trees['shared']['meta'], 'decision-tree')
+        self.assertEqual(trees['shared']['params']['random_state'], model.estimators_[0].random_state)
+        self.assertNotIn('feature_importances_', trees['shared'])
+        self.assertEqual(trees['overrides'][0], {})
+        self.assertEqual([tree['params']['random_state'] for tree in trees['overrides'][1:]],
+                         [tree.random_state for tree in model.estimators_[1:]])
+        offsets = decode_array(trees['node_offsets'])
+        np.testing.assert_array_equal(np.diff(offsets), [tree.tree_.node_count for tree in model.estimators_])
+
+    def test_packed_ensembles(self):
+        self.check_packed(GradientBoostingRegressor(n_estimators=10, random_state=0).fit(self.X, self.y))
+        self.check_packed(IsolationForest(n_estimators=10, random_state=0).fit(self.X))
+        self.check_packed(RandomTreesEmbedding(n_estimators=5, random_state=0).fit(self.X), method='transform')
+        self.check_packed(BaggingClassifier(n_estimators=5, random_state=0).fit(self.X, self.y))
+
+    def test_packed_lazy(self):
+        model = RandomForestClassifier(n_estimators=10, random_state=0).fit(self.X, self.y)
+        with ml2json.config_context(forest_format='packed'):
+            ml2json.to_json(model, 'packed-lazy.json')
+        lazy_model = ml2json.from_json('packed-lazy.json', lazy=True)
+        os.remove('packed-lazy.json')
+        self.assertIsInstance(lazy_model.estimators_, LazyMembers)
+        np.testing.assert_array_equal(lazy_model.estimators_[3].predict(self.X), model.estimators_[3].predict(self.X))
+        self.assertEqual(lazy_model.estimators_.n_loaded, 1)
+        np.testing.assert_array_equal(lazy_model.predict_proba(self.X), model.predict_proba(self.X))
+
+    def test_unpacked(self):
+        # Ensembles of other models are serialized tree by tree
+        model = BaggingClassifier(LogisticRegression(), n_estimators=3, random_state=0).fit(self.X, self.y)
+        with ml2json.config_context(forest_format='packed'):
+            self.assertIsInstance(ml2json.to_dict(model)['estimators_'], list)
+
+        # Forests serialized tree by tree still load, whatever the option
+        model = RandomForestClassifier(n_estimators=5, random_state=0).fit(self.X, self.y)
+        serialized_model = ml2json.to_dict(model)
+        self.assertIsInstance(serialized_model['estimators_'], list)
+        with ml2json.config_context(forest_format='packed'):
+            deserialized_model = ml2json.from_dict(serialized_model)
+        np.testing.assert_array_equal(deserialized_model.predict(self.X), model.predict(self.X))
+
+        with self.assertRaises(ValueError):
+            ml2json.set_config(forest_format='columns')
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import subprocess
+import unittest
+
+# Libraries only required by some of the supported models
+HEAVY_BACKENDS = ['sklearn', 'xgboost', 'lightgbm', 'catboost', 'umap', 'openTSNE', 'hdbscan', 'pynndescent',
+                  'kmodes', 'imblearn', 'mlchemad']
+# Upper bound on the cumulative time taken by `import ml2json` (in microseconds)
+IMPORT_TIME_BUDGET = 500_000
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(code, *options):
+    """Run Python code in a fresh interpreter from the root of the repository."""
+    return subprocess.run([sys.executable, *options, '-c', code], cwd=ROOT_DIR,
+                          capture_output=True, text=True, check=True)
+
+
+class TestImport(unittest.TestCase):
+
+    def test_import_time(self):
+        result = run_python('from src import ml2json', '-X', 'importtime')
+        timings = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            _, cumulative, module = line.split('|')
+            timings[module.strip()] = int(cumulative)
+
+        imported_backends = [module for module in timings if module.split('.')[0] in HEAVY_BACKENDS]
+        self.assertEqual(imported_backends, [])
+        self.assertLess(timings['src.ml2json'], IMPORT_TIME_BUDGET)
+
+    def test_backends_imported_on_demand(self):
+        result = run_python('import sys\n'
+                            'from sklearn.datasets import make_classification\n'
+                            'from sklearn.linear_model import LogisticRegression\n'
+                            'from src import ml2json\n'
+                            'X, y = make_classification(random_state=0)\n'
+                            'model = ml2json.from_dict(ml2json.to_dict(LogisticRegression().fit(X, y)))\n'
+                            'print(" ".join(sorted({name.split(".")[0] for name in sys.modules})))')
+        imported = result.stdout.split()
+        self.assertIn('sklearn', imported)
+        for backend in HEAVY_BACKENDS[1:]:
+            self.assertNotIn(backend, imported)
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import subprocess
+import sys
+import unittest
+from contextlib import redirect_stdout
+
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src import ml2json
+from src.ml2json.__main__ import EXIT_BROKEN_PIPE, main
+from src.ml2json.utils.inspection import inspect_file
+
+
+class TestAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.y = load_iris(return_X_y=True)
+
+    def test_forest(self):
+        model = RandomForestClassifier(n_estimators=10, random_state=0).fit(self.X, self.y)
+        ml2json.to_json(model, 'inspected.json')
+        report = inspect_file('inspected.json')
+        self.assertEqual(report.n_bytes, os.path.getsize('inspected.json'))
+        self.assertEqual(report.paths['estimators_[*]'].count, 10)
+        self.assertEqual(report.paths['estimators_[*].tree_.values'].parent, 'estimators_[*].tree_')
+        fields = {path: reason for path, _, reason in report.redundant_fields()}
+        self.assertIn('estimators_[*].feature_importances_', fields)
+        self.assertIn('identical in all 10 items', fields['estimators_[*].classes_'])
+        self.assertNotIn('estimators_[*].tree_.nodes', fields)
+        self.assertEqual(set(report.compressed_sizes), {'gzip', 'zstd'})
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(main(['inspect', 'inspected.json', '--depth', '3']), 0)
+        self.assertIn('estimators_[*].tree_', output.getvalue())
+        self.assertIn("binary array encoding (array_encoding='base64')", output.getvalue())
+        os.remove('inspected.json')
+
+    def test_broken_pipe(self):
+        # As with `ml2json inspect model.json | head`, the output is closed before the report is written
+        model = RandomForestClassifier(n_estimators=10, random_state=0).fit(self.X, self.y)
+        ml2json.to_json(model, 'inspected-pipe.json')
+        process = subprocess.Popen([sys.executable, '-m', 'src.ml2json', 'inspect', 'inspected-pipe.json'],
+                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        process.stdout.close()
+        stderr = process.stderr.read()
+        self.assertEqual(process.wait(), EXIT_BROKEN_PIPE)
+        self.assertEqual(stderr, b'')
+        os.remove('inspected-pipe.json')
+
+    def test_binary_savings(self):
+        model = KNeighborsClassifier().fit(self.X, self.y)
+        ml2json.to_json(model, 'inspected-knn.json')
+        with ml2json.config_context(array_encoding='base64'):
+            ml2json.to_json(model, 'inspected-knn-base64.json')
+        report = inspect_file('inspected-knn.json')
+        saved = os.path.getsize('inspected-knn.json') - os.path.getsize('inspected-knn-base64.json')
+        self.assertLess(abs(report.binary_savings - saved), 0.1 * abs(saved))
+        self.assertEqual(inspect_file('inspected-knn-base64.json').binary_savings, 0)
+        os.remove('inspected-knn.json')
+        os.remove('inspected-knn-base64.json')
+
+    def test_archive(self):
+        model = Pipeline([('scaler', StandardScaler()), ('knn', KNeighborsClassifier())]).fit(self.X, self.y)
+        ml2json.to_archive(model, 'inspected.zip')
+        report = inspect_file('inspected.zip')
+        self.assertEqual(report.compression, 'zip')
+        # Arrays stored as separate members count towards the paths referring to them
+        self.assertGreater(report.n_bytes, self.X.nbytes)
+        self.assertIn('named_steps', [path for path, _, _ in report.redundant_fields()])
+        os.remove('inspected.zip')
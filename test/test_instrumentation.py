@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+import os
+import unittest
+
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier, StackingClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src import ml2json
+
+
+class TestAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.y = load_iris(return_X_y=True)
+
+    def test_events(self):
+        model = Pipeline([
+            ('scaler', StandardScaler()),
+            ('stacking', StackingClassifier([('rf', RandomForestClassifier(n_estimators=10, random_state=0)),
+                                             ('lr', LogisticRegression())])),
+        ]).fit(self.X, self.y)
+        events = []
+        with ml2json.instrument(events.append):
+            ml2json.to_json(model, 'instrumented.json')
+
+        self.assertEqual(events[0].kind, 'start')
+        self.assertEqual((events[0].meta, events[0].path), ('pipeline', ()))
+        ends = {event.path: event for event in events if event.kind == 'end'}
+        # Paths are the keys and indices of sub-models within the models holding them
+        self.assertEqual(ends[('params.steps[1][1]', 'estimators_[0]')].meta, 'rf')
+        self.assertEqual(ends[('params.steps[0][1]',)].meta, 'standard-scaler')
+        self.assertTrue(all(event.operation == 'serialize' for event in events))
+        # The arrays of sub-models count towards the models holding them
+        self.assertGreater(ends[('params.steps[1][1]', 'estimators_[0]')].array_bytes, 0)
+        self.assertGreaterEqual(ends[()].array_bytes, ends[('params.steps[1][1]',)].array_bytes)
+        self.assertGreaterEqual(ends[()].elapsed, ends[('params.steps[0][1]',)].elapsed)
+
+        # Sub-models are found at the same paths when deserializing the model
+        events = []
+        with ml2json.instrument(events.append):
+            ml2json.from_json('instrumented.json', n_jobs=2)
+        os.remove('instrumented.json')
+        self.assertEqual({event.path for event in events if event.kind == 'end'}, set(ends))
+
+    def test_progress(self):
+        model = RandomForestClassifier(n_estimators=20, random_state=0).fit(self.X, self.y)
+        ml2json.to_json(model, 'progress.json')
+        for n_jobs in (None, 2):
+            events = []
+            with ml2json.instrument(events.append):
+                ml2json.from_json('progress.json', n_jobs=n_jobs)
+            progress = [event for event in events if event.kind == 'progress']
+            self.assertEqual([event.done for event in progress], list(range(1, 21)))
+            self.assertTrue(all(event.total == 20 and event.meta == 'rf' and event.path == () for event in progress))
+        os.remove('progress.json')
+
+    def test_timing_profile(self):
+        model = StackingClassifier([('rf', RandomForestClassifier(n_estimators=5, random_state=0)),
+                                    ('lr', LogisticRegression())]).fit(self.X, self.y)
+        profile = ml2json.TimingProfile()
+        with ml2json.instrument(profile):
+            model_dict = ml2json.to_dict(model)
+            ml2json.from_dict(model_dict)
+        report = profile.report()
+        self.assertIn('serialize', report)
+        self.assertIn('deserialize', report)
+        self.assertIn('    estimators_[0] (rf)', report)
+        # Estimators of the same type are told apart
+        calls, _, _, meta = profile.entries[('deserialize', ('estimators_[1]',))]
+        self.assertEqual((calls, meta), (1, 'lr'))
+        self.assertEqual(profile.entries[('deserialize', ('final_estimator_',))][0], 1)
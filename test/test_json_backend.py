@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import inspect
+import unittest
+import importlib.util
+
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.svm import SVC
+
+from src import ml2json
+from src.ml2json.utils import json_backend
+
+__orjson__ = importlib.util.find_spec('orjson') is not None
+
+
+class TestAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.y = load_iris(return_X_y=True)
+
+    def test_invalid_backend(self):
+        with self.assertRaises(ValueError):
+            ml2json.set_config(json_backend='simplejson')
+
+    def test_json_backend(self):
+        with ml2json.config_context(json_backend='json'):
+            self.assertEqual(json_backend.get_json_backend(), 'json')
+            value = {'a': np.arange(3), 'b': [1.5, float('nan')]}
+            self.assertEqual(json_backend.dumps(value), json.dumps({'a': [0, 1, 2], 'b': [1.5, float('nan')]}).encode())
+        with ml2json.config_context(json_backend='auto'):
+            self.assertEqual(json_backend.get_json_backend(), 'orjson' if __orjson__ else 'json')
+
+    @unittest.skipIf(not __orjson__, 'orjson not installed.')
+    def test_orjson_fallback(self):
+        with ml2json.config_context(json_backend='orjson'):
+            # orjson encodes NaN as null and does not support integers of more than 64 bits
+            for value in ({'a': [1.5, float('nan')]}, {'a': np.float32('inf')}, {'a': 2 ** 70}):
+                text = json_backend.dumps(value)
+                self.assertEqual(text, json.dumps(value, default=float).encode())
+                self.assertEqual(json.dumps(json_backend.loads(text)), text.decode())
+
+    @unittest.skipIf(not __orjson__, 'orjson not installed.')
+    def test_native_arrays(self):
+        # Arrays, whether they are encoded natively, and whether they hold NaN or infinite values
+        arrays = [(np.arange(3), True, False),
+                  (np.random.rand(2, 3), True, False),
+                  (np.array([1.0, np.nan]), True, True),
+                  (np.random.rand(3).astype(np.float32), False, False),
+                  (np.array(['a', 'b']), False, False),
+                  (np.array([(1, np.inf)], dtype=[('a', np.int64), ('b', np.float64)]), False, True)]
+        with ml2json.config_context(json_backend='orjson'):
+            for array, native, non_finite in arrays:
+                writer = json_backend.NativeArrayWriter()
+                self.assertTrue(writer.accepts(array))
+                value = writer.add(array)
+                self.assertIs(value is array, native)
+                self.assertIs(writer.non_finite, non_finite)
+                if not non_finite:
+                    self.assertEqual(json.loads(json_backend.dumps([value])), [array.tolist()])
+            with ml2json.config_context(array_encoding='base64'):
+                self.assertFalse(json_backend.NativeArrayWriter().accepts(np.arange(3)))
+
+    def check_model(self, model, model_name):
+        model.fit(self.X, self.y)
+        expected_dict = json.loads(json.dumps(ml2json.to_dict(model)))
+        for backend in ('json', 'orjson') if __orjson__ else ('json',):
+            with ml2json.config_context(json_backend=backend):
+                ml2json.to_json(model, model_name)
+                model_dict = ml2json.json_to_dict(model_name)
+            deserialized_model = ml2json.from_json(model_name)
+            os.remove(model_name)
+
+            self.assertEqual(json.dumps(model_dict), json.dumps(expected_dict))
+            if hasattr(model, 'predict'):
+                np.testing.assert_array_equal(deserialized_model.predict(self.X), model.predict(self.X))
+            else:
+                np.testing.assert_array_equal(deserialized_model.transform(self.X), model.transform(self.X))
+
+    def test_random_forest(self):
+        self.check_model(RandomForestClassifier(n_estimators=5, random_state=0), 'rf-backend.json')
+
+    def test_svc(self):
+        self.check_model(SVC(), 'svc-backend.json')
+
+    def test_non_finite(self):
+        model_dict = {'meta': 'test', 'a': [1.5, float('nan')], 'b': [float('-inf')], 'c': 2 ** 70}
+        expected = json.dumps(model_dict)
+        for backend in ('json', 'orjson') if __orjson__ else ('json',):
+            with ml2json.config_context(json_backend=backend):
+                ml2json.dict_to_json(model_dict, 'non-finite.json')
+                with open('non-finite.json') as model_json:
+                    text = model_json.read()
+                loaded_dict = ml2json.json_to_dict('non-finite.json')
+            os.remove('non-finite.json')
+
+            self.assertEqual(text, expected)
+            self.assertEqual(json.dumps(loaded_dict), expected)
+
+    @unittest.skipIf(not __orjson__, 'orjson not installed.')
+    def test_streaming_threshold(self):
+        models = [RandomForestClassifier(n_estimators=5, random_state=0).fit(self.X, self.y), SVC().fit(self.X, self.y)]
+        default_threshold = json_backend.STREAMING_THRESHOLD
+        for model in models:
+            for n_jobs in (None, 2):
+                with ml2json.config_context(json_backend='json'):
+                    ml2json.to_json(model, 'streamed.json', n_jobs=n_jobs)
+                with open('streamed.json', 'rb') as model_json:
+                    expected = model_json.read()
+                with ml2json.config_context(json_backend='orjson'):
+                    self.assertEqual(len(list(json_backend.dump_model(lambda: ml2json.to_dict(model)))), 1)
+                    # Models with arrays larger than the threshold are written incrementally, as with the json module
+                    # (members encoded by workers being those encoded by orjson)
+                    json_backend.STREAMING_THRESHOLD = 0
+                    try:
+                        chunks = json_backend.dump_model(lambda: ml2json.to_dict(model, n_jobs=n_jobs))
+                        self.assertTrue(inspect.isgenerator(chunks))
+                        chunks = list(chunks)
+                        ml2json.to_json(model, 'streamed.json', n_jobs=n_jobs)
+                    finally:
+                        json_backend.STREAMING_THRESHOLD = default_threshold
+                with open('streamed.json', 'rb') as model_json:
+                    text = model_json.read()
+                self.assertEqual(b''.join(chunks), text)
+                if n_jobs is None:
+                    self.assertEqual(text, expected)
+                self.assertEqual(json.loads(text), json.loads(expected))
+                os.remove('streamed.json')
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+import os
+import pickle
+import unittest
+
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.ensemble import ExtraTreesRegressor, GradientBoostingClassifier, RandomForestClassifier
+
+from src import ml2json
+from src.ml2json.utils.lazy import FileMember, LazyMembers
+
+
+class TestAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.y = load_iris(return_X_y=True)
+
+    def test_lazy_forest(self):
+        model = RandomForestClassifier(n_estimators=10, random_state=0).fit(self.X, self.y)
+        for path in ('lazy.json', 'lazy.json.gz'):
+            ml2json.to_json(model, path)
+            lazy_model = ml2json.from_json(path, lazy=True)
+            self.assertIsInstance(lazy_model.estimators_, LazyMembers)
+            # Trees of uncompressed files are read again from the file
+            self.assertEqual(isinstance(lazy_model.estimators_.members[0], FileMember), path == 'lazy.json')
+            self.assertEqual(lazy_model.estimators_.n_loaded, 0)
+
+            first_trees = lazy_model.estimators_[:3]
+            self.assertEqual(lazy_model.estimators_.n_loaded, 3)
+            self.assertIs(first_trees[0], lazy_model.estimators_[0])
+            np.testing.assert_array_equal(first_trees[2].predict(self.X), model.estimators_[2].predict(self.X))
+            np.testing.assert_array_equal(lazy_model.predict_proba(self.X), model.predict_proba(self.X))
+            self.assertEqual(lazy_model.estimators_.n_loaded, 10)
+            os.remove(path)
+
+            unpickled_model = pickle.loads(pickle.dumps(lazy_model))
+            self.assertIsInstance(unpickled_model.estimators_, list)
+            np.testing.assert_array_equal(unpickled_model.predict(self.X), model.predict(self.X))
+
+    def test_lazy_extratrees(self):
+        model = ExtraTreesRegressor(n_estimators=5, random_state=0).fit(self.X, self.y)
+        with ml2json.config_context(array_encoding='base64'):
+            ml2json.to_json(model, 'lazy-extratrees.json')
+        lazy_model = ml2json.from_json('lazy-extratrees.json', lazy=True)
+        np.testing.assert_array_equal(lazy_model.predict(self.X), model.predict(self.X))
+        os.remove('lazy-extratrees.json')
+
+    def test_eager_gradient_boosting(self):
+        # Gradient boosting predicts with an array of all its trees
+        model = GradientBoostingClassifier(n_estimators=5, random_state=0).fit(self.X, self.y)
+        ml2json.to_json(model, 'lazy-gb.json')
+        lazy_model = ml2json.from_json('lazy-gb.json', lazy=True)
+        os.remove('lazy-gb.json')
+        self.assertIsInstance(lazy_model.estimators_, np.ndarray)
+        np.testing.assert_array_equal(lazy_model.predict(self.X), model.predict(self.X))
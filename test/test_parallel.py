@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import json
+import unittest
+import importlib.util
+
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.ensemble import BaggingClassifier, GradientBoostingRegressor, RandomForestClassifier, StackingClassifier
+from sklearn.linear_model import LogisticRegression
+
+from src import ml2json
+from src.ml2json.classification import serialize_decision_tree
+from src.ml2json.utils.json_backend import dumps
+from src.ml2json.utils import streaming
+from src.ml2json.utils.parallel import EncodedMember, UnparsedMember, n_workers
+
+__backends__ = ['json', 'orjson'] if importlib.util.find_spec('orjson') is not None else ['json']
+
+
+class TestAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.y = load_iris(return_X_y=True)
+        self.models = [RandomForestClassifier(n_estimators=10, random_state=0).fit(self.X, self.y),
+                       GradientBoostingRegressor(n_estimators=5, random_state=0).fit(self.X, self.y),
+                       BaggingClassifier(n_estimators=4, random_state=0).fit(self.X, self.y)]
+
+    def test_to_json(self):
+        for backend in __backends__:
+            for model in self.models:
+                with ml2json.config_context(json_backend=backend):
+                    ml2json.to_json(model, 'sequential.json')
+                    ml2json.to_json(model, 'parallel.json', n_jobs=2)
+                with open('sequential.json', 'rb') as sequential, open('parallel.json', 'rb') as parallel:
+                    self.assertEqual(sequential.read(), parallel.read())
+                deserialized_model = ml2json.from_json('parallel.json')
+                os.remove('sequential.json')
+                os.remove('parallel.json')
+                np.testing.assert_array_equal(deserialized_model.predict(self.X), model.predict(self.X))
+
+    def test_to_dict(self):
+        for model in self.models:
+            self.assertEqual(json.dumps(ml2json.to_dict(model, n_jobs=-1)), json.dumps(ml2json.to_dict(model)))
+        with ml2json.config_context(array_encoding='base64'):
+            self.assertEqual(''.join(ml2json.iter_json(self.models[0], n_jobs=2)),
+                             ''.join(ml2json.iter_json(self.models[0])))
+
+    def test_non_finite_fallback(self):
+        # Encoded members are serialized again when the model is encoded with the json module
+        tree = self.models[0].estimators_[0]
+        value = {'estimators_': [EncodedMember(b'{}', serialize_decision_tree, tree)], 'score': float('nan')}
+        self.assertEqual(dumps(value), json.dumps({'estimators_': [serialize_decision_tree(tree)],
+                                                   'score': float('nan')}).encode('utf-8'))
+
+    def test_from_json(self):
+        for backend in __backends__:
+            for model in self.models:
+                with ml2json.config_context(json_backend=backend):
+                    ml2json.to_json(model, 'parallel.json')
+                    deserialized_model = ml2json.from_json('parallel.json', n_jobs=2)
+                os.remove('parallel.json')
+                np.testing.assert_array_equal(deserialized_model.predict(self.X), model.predict(self.X))
+
+    def test_from_dict(self):
+        for model in self.models:
+            deserialized_model = ml2json.from_dict(json.loads(json.dumps(ml2json.to_dict(model))), n_jobs=2)
+            np.testing.assert_array_equal(deserialized_model.predict(self.X), model.predict(self.X))
+
+    def test_shared_objects(self):
+        # Members referring to objects shared with the rest of the model are deserialized along with it
+        estimators = [('rf', RandomForestClassifier(n_estimators=5, random_state=0)),
+                      ('lr', LogisticRegression(max_iter=1000))]
+        model = StackingClassifier(estimators).fit(self.X, self.y)
+        ml2json.to_json(model, 'stacking-parallel.json')
+        deserialized_model = ml2json.from_json('stacking-parallel.json', n_jobs=2)
+        os.remove('stacking-parallel.json')
+        self.assertIs(deserialized_model.estimators_[0], deserialized_model.named_estimators_['rf'])
+        np.testing.assert_array_equal(deserialized_model.predict_proba(self.X), model.predict_proba(self.X))
+
+    def test_unparsed_members(self):
+        members = [{'name': 'a}"{', 'data': [[1, 2], [3, 4]]}, {'name': '\\"}\\', 'nested': {'value': None}}, 3]
+        text = json.dumps({'estimators_': members, 'name': '}'})
+        default_read_size = streaming.READ_SIZE
+        for read_size in (3, 100, default_read_size):
+            streaming.READ_SIZE = read_size
+            try:
+                obj_dict = streaming.read_json(io.StringIO(text), defer_members=True)
+            finally:
+                streaming.READ_SIZE = default_read_size
+            self.assertEqual(obj_dict['name'], '}')
+            self.assertIsInstance(obj_dict['estimators_'][0], UnparsedMember)
+            self.assertEqual([member.parse() if isinstance(member, UnparsedMember) else member
+                              for member in obj_dict['estimators_']], members)
+
+    def test_n_jobs(self):
+        cpu_count = os.cpu_count()
+        self.assertEqual(n_workers(3), 3)
+        self.assertEqual(n_workers(-1), cpu_count)
+        self.assertEqual(n_workers(-cpu_count), 1)
+        for n_jobs in (0, -cpu_count - 1, 1.5, True):
+            with self.assertRaises(ValueError):
+                n_workers(n_jobs)
+
+        # Invalid values are rejected before any file is written or read
+        model = RandomForestClassifier(n_estimators=3, random_state=0).fit(self.X, self.y)
+        with self.assertRaises(ValueError):
+            ml2json.to_dict(model, n_jobs=0)
+        with self.assertRaises(ValueError):
+            ml2json.to_json(model, 'n-jobs.json', n_jobs=0)
+        self.assertFalse(os.path.exists('n-jobs.json'))
+        with self.assertRaises(ValueError):
+            ml2json.from_json('n-jobs-missing.json', n_jobs=0)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import unittest
+
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+
+from src import ml2json
+
+
+class TestAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.y = load_iris(return_X_y=True)
+        self.model = RandomForestClassifier(n_estimators=5, random_state=0).fit(self.X, self.y)
+        self.model.feature_names_in_ = np.array(['sepal length', 'sepal width', 'petal length', 'petal width'],
+                                                dtype=object)
+
+    def test_header_first(self):
+        model_dict = ml2json.to_dict(self.model)
+        self.assertEqual(list(model_dict)[:5], ['meta', 'versions', 'n_features_in_', 'feature_names_in_', 'params'])
+        unfitted_dict = ml2json.to_dict(LogisticRegression())
+        self.assertEqual(list(unfitted_dict)[:4], ['meta', 'unfitted', 'versions', 'params'])
+
+    def test_peek(self):
+        for path in ('peek.json', 'peek.json.gz', 'peek.zip'):
+            if path.endswith('.zip'):
+                ml2json.to_archive(self.model, path)
+            else:
+                ml2json.to_json(self.model, path)
+            header = ml2json.peek(path)
+            os.remove(path)
+            self.assertEqual(list(header), ['meta', 'versions', 'n_features_in_', 'feature_names_in_', 'params'])
+            self.assertEqual(header['meta'], 'rf')
+            self.assertEqual(header['n_features_in_'], 4)
+            self.assertEqual(header['feature_names_in_'], self.model.feature_names_in_.tolist())
+            self.assertEqual(header['params'], self.model.get_params())
+
+    def test_header_last(self):
+        # Values preceding the header are skipped, whatever the strings they hold
+        model_dict = {'meta': 'rf', 'estimators_': [{'name': ']}"{'}], 'classes_': [0, 1], 'params': {},
+                      'versions': ['sklearn', '1.4.0'], 'n_features_in_': 4}
+        with open('peek.json', 'w') as model_json:
+            json.dump(model_dict, model_json)
+        header = ml2json.peek('peek.json')
+        os.remove('peek.json')
+        self.assertEqual(header, {'meta': 'rf', 'params': {}, 'versions': ['sklearn', '1.4.0'], 'n_features_in_': 4})
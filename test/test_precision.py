@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import unittest
+
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.neural_network import MLPClassifier
+from sklearn.svm import SVC
+
+from src import ml2json
+from src.ml2json.utils.arrays import encode_array, decode_array
+
+
+class TestAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.y = load_iris(return_X_y=True)
+        self.values = np.random.RandomState(0).normal(scale=100, size=(50, 4))
+        self.values[0, :] = [0, np.nan, -np.inf, 1e-310]
+
+    def test_invalid_precision(self):
+        for float_precision in ('float16', 0, 18, 2.5, True, {'coefs_': 'half'}):
+            with self.assertRaises(ValueError):
+                ml2json.set_config(float_precision=float_precision)
+        self.assertEqual(ml2json.get_config()['float_precision'], 'float64')
+
+    def test_float32(self):
+        with ml2json.config_context(float_precision='float32'):
+            encoded = encode_array(self.values)
+            with ml2json.config_context(array_encoding='base64'):
+                binary_encoded = encode_array(self.values)
+        # Lists hold the shortest decimals read back as the same float32
+        np.testing.assert_array_equal(np.array(encoded, dtype=np.float32), self.values.astype(np.float32))
+        self.assertLess(len(json.dumps(encoded)), len(json.dumps(self.values.tolist())))
+        # Raw bytes are those of float32, cast back to the original dtype when decoded
+        self.assertEqual(binary_encoded['dtype'], '<f4')
+        binary_decoded = decode_array(binary_encoded)
+        self.assertEqual(binary_decoded.dtype, np.float64)
+        np.testing.assert_array_equal(binary_decoded, self.values.astype(np.float32))
+
+    def test_significant_digits(self):
+        with ml2json.config_context(float_precision=3):
+            encoded = encode_array(self.values)
+        np.testing.assert_allclose(encoded, self.values, rtol=5e-3)
+        for value in np.ravel(encoded)[4:]:
+            self.assertEqual(float(f'{value:.3g}'), value)
+
+    def test_binary_storage(self):
+        model = MLPClassifier(hidden_layer_sizes=(100, 100), max_iter=20, random_state=0).fit(self.X, self.y)
+        paths = ['mlp-binary.json', 'mlp-binary-float32.json', 'mlp-binary-6.json', 'mlp-binary.zip',
+                 'mlp-binary-float32.zip']
+        for backend in ('json', 'orjson'):
+            with ml2json.config_context(array_encoding='base64', json_backend=backend):
+                ml2json.to_json(model, paths[0])
+                with ml2json.config_context(float_precision='float32'):
+                    ml2json.to_json(model, paths[1])
+                    ml2json.to_archive(model, paths[3], inline_threshold=0)
+                with ml2json.config_context(float_precision=6):
+                    ml2json.to_json(model, paths[2])
+            ml2json.to_archive(model, paths[4], inline_threshold=0)
+            # Floats rounded to the precision of float32, or to 6 digits, are stored as float32
+            self.assertLess(os.path.getsize(paths[1]), 0.6 * os.path.getsize(paths[0]))
+            self.assertLess(os.path.getsize(paths[2]), 0.6 * os.path.getsize(paths[0]))
+            self.assertLess(os.path.getsize(paths[3]), 0.6 * os.path.getsize(paths[4]))
+
+            for deserialized_model in (ml2json.from_json(paths[1]), ml2json.from_archive(paths[3])):
+                for coefs, deserialized_coefs in zip(model.coefs_, deserialized_model.coefs_):
+                    self.assertEqual(deserialized_coefs.dtype, np.float64)
+                    np.testing.assert_array_equal(deserialized_coefs, coefs.astype(np.float32))
+            for coefs, deserialized_coefs in zip(model.coefs_, ml2json.from_json(paths[2]).coefs_):
+                np.testing.assert_allclose(deserialized_coefs, coefs, rtol=1e-5)
+        for path in paths:
+            os.remove(path)
+
+    def test_attribute_precision(self):
+        model = SVC().fit(self.X, self.y)
+        with ml2json.config_context(float_precision={'support_vectors_': 1}):
+            model_dict = ml2json.to_dict(model)
+        np.testing.assert_array_equal(model_dict['dual_coef_'], model.dual_coef_)
+        np.testing.assert_allclose(model_dict['support_vectors_'], model.support_vectors_, rtol=0.5)
+        self.assertFalse(np.array_equal(model_dict['support_vectors_'], model.support_vectors_))
+
+    def test_to_json(self):
+        model = MLPClassifier(max_iter=20, random_state=0).fit(self.X, self.y)
+        with ml2json.config_context(float_precision='float32'):
+            ml2json.to_json(model, 'mlp-float32.json')
+        deserialized_model = ml2json.from_json('mlp-float32.json')
+        os.remove('mlp-float32.json')
+
+        for coefs, deserialized_coefs in zip(model.coefs_, deserialized_model.coefs_):
+            np.testing.assert_array_equal(deserialized_coefs.astype(np.float32), coefs.astype(np.float32))
+        np.testing.assert_allclose(deserialized_model.predict_proba(self.X), model.predict_proba(self.X), atol=1e-6)
+
+    def test_verify_precision(self):
+        model = SVC().fit(self.X, self.y)
+        report = ml2json.verify_precision(model, self.X, float_precision=4)
+        self.assertEqual(report['method'], 'decision_function')
+        self.assertLess(report['max_deviation'], 1e-2)
+        self.assertLess(report['size'], report['full_size'])
+        with ml2json.config_context(array_encoding='base64'):
+            report = ml2json.verify_precision(model, self.X, float_precision='float32')
+        self.assertLess(report['size'], 0.8 * report['full_size'])
+        report = ml2json.verify_precision(model, self.X, float_precision='float64', method='predict')
+        self.assertEqual(report['max_deviation'], 0)
+        self.assertEqual(report['n_different'], 0)
+        self.assertEqual(report['size'], report['full_size'])
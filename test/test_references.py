@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import unittest
+
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier, StackingClassifier, VotingClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src import ml2json
+
+
+class TestAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.y = load_iris(return_X_y=True)
+        self.estimators = [('rf', RandomForestClassifier(n_estimators=5, random_state=0)),
+                           ('lr', LogisticRegression(max_iter=1000))]
+
+    def test_pipeline(self):
+        model = Pipeline([('scaler', StandardScaler()), ('rf', RandomForestClassifier(n_estimators=5))]).fit(self.X, self.y)
+        model_dict = ml2json.to_dict(model)
+        # Steps are serialized once, in the table, and referenced in both the steps and the named steps
+        self.assertEqual(len(model_dict['shared_objects']), 2)
+        self.assertEqual(model_dict['params']['steps'][1][1], {'meta': 'reference', 'id': '1'})
+        self.assertEqual(model_dict['named_steps']['items']['rf'], {'meta': 'reference', 'id': '1'})
+        self.assertEqual(model_dict['shared_objects']['1']['meta'], 'rf')
+
+        deserialized_model = ml2json.from_dict(json.loads(json.dumps(model_dict)))
+        np.testing.assert_array_equal(deserialized_model.predict(self.X), model.predict(self.X))
+
+    def test_stacking(self):
+        model = StackingClassifier(self.estimators).fit(self.X, self.y)
+        ml2json.to_json(model, 'stacking-shared.json')
+        deserialized_model = ml2json.from_json('stacking-shared.json')
+        os.remove('stacking-shared.json')
+
+        # Fitted estimators are the same instances, as in the original model
+        for estimator, named_estimator in zip(deserialized_model.estimators_,
+                                              deserialized_model.named_estimators_.values()):
+            self.assertIs(estimator, named_estimator)
+        np.testing.assert_array_equal(deserialized_model.predict_proba(self.X), model.predict_proba(self.X))
+
+    def test_voting_archive(self):
+        model = VotingClassifier(self.estimators, voting='soft').fit(self.X, self.y)
+        ml2json.to_archive(model, 'voting-shared.zip', inline_threshold=0)
+        deserialized_model = ml2json.from_archive('voting-shared.zip')
+        os.remove('voting-shared.zip')
+
+        self.assertIs(deserialized_model.estimators_[0], deserialized_model.named_estimators_['rf'])
+        np.testing.assert_array_equal(deserialized_model.predict_proba(self.X), model.predict_proba(self.X))
+
+    def test_unshared(self):
+        model_dict = ml2json.to_dict(RandomForestClassifier(n_estimators=5).fit(self.X, self.y))
+        self.assertNotIn('shared_objects', model_dict)
+        with self.assertRaises(ValueError):
+            ml2json.from_dict({'meta': 'reference', 'id': '0'})
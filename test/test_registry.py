@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+import importlib.util
+
+import numpy as np
+from sklearn.base import BaseEstimator, RegressorMixin
+from sklearn.datasets import make_regression
+from sklearn.linear_model import LogisticRegression, LogisticRegressionCV
+from sklearn.tree import ExtraTreeClassifier, ExtraTreeRegressor
+
+from src import ml2json
+from src.ml2json.utils.registry import registered_metas
+
+
+class MeanRegressor(RegressorMixin, BaseEstimator):
+
+    def fit(self, X, y):
+        self.mean_ = float(np.mean(y))
+        self.n_features_in_ = X.shape[1]
+        return self
+
+    def predict(self, X):
+        return np.full(X.shape[0], self.mean_)
+
+
+class UnsupportedRegressor(RegressorMixin, BaseEstimator):
+
+    def fit(self, X, y):
+        self.mean_ = float(np.mean(y))
+        return self
+
+
+def serialize_mean_regressor(model):
+    return {'meta': 'mean-regressor', 'mean_': model.mean_, 'n_features_in_': model.n_features_in_}
+
+
+def deserialize_mean_regressor(model_dict):
+    model = MeanRegressor()
+    model.mean_ = model_dict['mean_']
+    model.n_features_in_ = model_dict['n_features_in_']
+    return model
+
+
+class TestRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.y = make_regression(n_samples=50, n_features=3, random_state=0)
+
+    def test_unsupported_model(self):
+        model = UnsupportedRegressor().fit(self.X, self.y)
+        with self.assertRaises(ml2json.ml2json.ModelNotSupported):
+            ml2json.to_dict(model)
+
+    def test_register(self):
+        ml2json.register(MeanRegressor, 'mean-regressor', serialize_mean_regressor, deserialize_mean_regressor)
+        model = MeanRegressor().fit(self.X, self.y)
+
+        serialized_model = ml2json.to_dict(model)
+        deserialized_model = ml2json.from_dict(serialized_model)
+
+        self.assertEqual(serialized_model['meta'], 'mean-regressor')
+        self.assertIn('mean-regressor', registered_metas())
+        np.testing.assert_array_equal(model.predict(self.X), deserialized_model.predict(self.X))
+
+    def test_subclass_dispatch(self):
+        model = LogisticRegressionCV(cv=2).fit(self.X, self.y > 0)
+
+        serialized_model = ml2json.to_dict(model)
+
+        self.assertEqual(serialized_model['meta'], 'lr')
+        self.assertIsInstance(ml2json.from_dict(serialized_model), LogisticRegression)
+
+    def test_most_specific_class(self):
+        # Subclasses of registered models are serialized by the serializer of their own class, if registered
+        # (ExtraTreeClassifier was serialized as 'decision-tree' before dispatch went through the registry)
+        model = ExtraTreeClassifier(random_state=0).fit(self.X, self.y > 0)
+        serialized_model = ml2json.to_dict(model)
+        self.assertEqual(serialized_model['meta'], 'extra-tree-cls')
+        self.assertIsInstance(ml2json.from_dict(serialized_model), ExtraTreeClassifier)
+
+        model = ExtraTreeRegressor(random_state=0).fit(self.X, self.y)
+        self.assertEqual(ml2json.to_dict(model)['meta'], 'extra-tree-reg')
+
+    @unittest.skipIf(importlib.util.find_spec('xgboost') is None, 'xgboost is not installed')
+    def test_xgboost_rf_dispatch(self):
+        from xgboost import XGBRFClassifier, XGBRFRegressor
+
+        # XGBRF models subclass XGBClassifier and XGBRegressor, but have serializers of their own
+        model = XGBRFClassifier(n_estimators=3).fit(self.X, self.y > 0)
+        serialized_model = ml2json.to_dict(model)
+        self.assertEqual(serialized_model['meta'], 'xgboost-rf-classifier')
+        self.assertIsInstance(ml2json.from_dict(serialized_model), XGBRFClassifier)
+
+        model = XGBRFRegressor(n_estimators=3).fit(self.X, self.y)
+        self.assertEqual(ml2json.to_dict(model)['meta'], 'xgboost-rf-regressor')
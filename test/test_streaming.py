@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import json
+import unittest
+
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.neighbors import KNeighborsClassifier
+
+from src import ml2json
+from src.ml2json.utils import streaming
+
+
+class TestAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.y = load_iris(return_X_y=True)
+        self.models = [RandomForestClassifier(n_estimators=5, random_state=0).fit(self.X, self.y),
+                       KNeighborsClassifier(algorithm='kd_tree').fit(self.X, self.y)]
+
+    def test_iter_json(self):
+        for model in self.models:
+            for array_encoding in ('list', 'base64'):
+                with ml2json.config_context(array_encoding=array_encoding):
+                    expected = json.dumps(ml2json.to_dict(model))
+                    self.assertEqual(''.join(ml2json.iter_json(model)), expected)
+
+    def test_chunked_arrays(self):
+        chunk_size = streaming.CHUNK_SIZE
+        streaming.CHUNK_SIZE = 10
+        try:
+            model = self.models[1]
+            for array_encoding in ('list', 'base64'):
+                with ml2json.config_context(array_encoding=array_encoding):
+                    expected = json.dumps(ml2json.to_dict(model))
+                    chunks = list(streaming.iter_model_json(lambda: ml2json.to_dict(model)))
+                    self.assertEqual(''.join(chunks), expected)
+        finally:
+            streaming.CHUNK_SIZE = chunk_size
+
+    def test_iter_encode(self):
+        model_dict = {'meta': 'test', 1: [1.5, None, True], None: {'a': [[1, 2], []]}, 'b': ('c', {}), 'd': float('nan')}
+        self.assertEqual(''.join(streaming.iter_encode(model_dict, chunk_size=4)), json.dumps(model_dict))
+        with self.assertRaises(TypeError):
+            ''.join(streaming.iter_encode({'a': np.int64(1)}))
+
+    def test_to_json(self):
+        model = self.models[0]
+        with ml2json.config_context(json_backend='json'):
+            ml2json.to_json(model, 'rf-stream.json')
+        with open('rf-stream.json') as model_json:
+            text = model_json.read()
+        deserialized_model = ml2json.from_json('rf-stream.json')
+        os.remove('rf-stream.json')
+
+        self.assertEqual(text, json.dumps(ml2json.to_dict(model)))
+        np.testing.assert_array_equal(deserialized_model.predict(self.X), model.predict(self.X))
+
+    def test_read_json(self):
+        value = {'floats': np.linspace(-1, 1, 600).reshape(200, 3).tolist(), 'ints': list(range(-500, 500)),
+                 'ragged': [list(range(400)), list(range(300))], 'small': [1, 2.5], 'mixed': [1.5] * 400 + ['a'],
+                 'nested': {'a': [True, None, 'b\\"c'], 'b': float('inf')}}
+        text = json.dumps(value)
+        for read_size in (7, 100, streaming.READ_SIZE):
+            with self.subTest(read_size=read_size):
+                default_read_size = streaming.READ_SIZE
+                streaming.READ_SIZE = read_size
+                try:
+                    parsed = streaming.read_json(io.StringIO(text))
+                finally:
+                    streaming.READ_SIZE = default_read_size
+
+                self.assertEqual(parsed.keys(), value.keys())
+                self.assertIsInstance(parsed['floats'], np.ndarray)
+                self.assertEqual(parsed['floats'].dtype, np.float64)
+                np.testing.assert_array_equal(parsed['floats'], value['floats'])
+                self.assertIsInstance(parsed['ints'], np.ndarray)
+                self.assertEqual(parsed['ints'].dtype, np.int64)
+                np.testing.assert_array_equal(parsed['ints'], value['ints'])
+                # Lists holding other values are kept as lists, whose large numeric items are arrays
+                self.assertIsInstance(parsed['ragged'], list)
+                self.assertIsInstance(parsed['ragged'][0], np.ndarray)
+                self.assertIsInstance(parsed['mixed'], list)
+                for key in ('ragged', 'small', 'mixed', 'nested'):
+                    self.assertEqual(json.dumps(parsed[key], default=np.ndarray.tolist), json.dumps(value[key]))
+        with self.assertRaises(json.JSONDecodeError):
+            streaming.read_json(io.StringIO(text[:-1]))
+
+    def test_from_json(self):
+        X = np.random.RandomState(0).normal(size=(500, 4))
+        model = KNeighborsClassifier().fit(X, X[:, 0] > 0)
+        ml2json.to_json(model, 'knn-stream.json')
+        deserialized_model = ml2json.from_json('knn-stream.json')
+        os.remove('knn-stream.json')
+
+        np.testing.assert_array_equal(deserialized_model._fit_X, model._fit_X)
+        np.testing.assert_array_equal(deserialized_model.predict(X), model.predict(X))